@@ -1,14 +1,19 @@
 """
 Workflows SDK for Bifrost.
 
-Provides Python API for workflow operations (list, execute, get status).
+Provides Python API for workflow operations (list, execute, batch launch, get status).
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from shared.handlers.workflows_logic import get_workflow_status_logic, list_workflows_logic
+from shared.handlers.workflows_logic import (
+    get_workflow_batch_logic,
+    get_workflow_status_logic,
+    launch_workflow_batch_logic,
+    list_workflows_logic,
+)
 
 from ._internal import get_context
 
@@ -60,6 +65,78 @@ class workflows:
 
         return result
 
+    @staticmethod
+    async def execute_batch(
+        workflow_name: str,
+        targets: list[str | dict[str, Any]],
+        parameters: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Queue a workflow for many organizations in one call.
+
+        Requires platform admin privileges. Must be awaited.
+
+        Args:
+            workflow_name: Name of workflow to execute
+            targets: Organization IDs, or dicts with "orgId" and optional
+                "inputData" (per-organization parameters)
+            parameters: Parameters shared by every execution (optional)
+
+        Returns:
+            dict: Batch details (batchId, executions, rejected)
+
+        Raises:
+            PermissionError: If user is not platform admin
+            ValueError: If workflow not found or targets are invalid
+            RuntimeError: If no execution context
+
+        Example:
+            >>> from bifrost import workflows, organizations
+            >>> orgs = await organizations.list()
+            >>> batch = await workflows.execute_batch("sync_licenses", [org.id for org in orgs])
+            >>> progress = await workflows.get_batch(batch["batchId"])
+        """
+        context = get_context()
+
+        normalized = [
+            {"orgId": target} if isinstance(target, str) else target
+            for target in targets
+        ]
+
+        return await launch_workflow_batch_logic(context, workflow_name, normalized, parameters)
+
+    @staticmethod
+    async def get_batch(batch_id: str) -> dict[str, Any]:
+        """
+        Get aggregated progress of a batch launch.
+
+        Requires platform admin privileges. Must be awaited.
+
+        Args:
+            batch_id: Batch ID returned by execute_batch
+
+        Returns:
+            dict: Progress (total, completed, statusCounts, isComplete, executions)
+
+        Raises:
+            PermissionError: If user is not platform admin
+            ValueError: If batch not found
+            RuntimeError: If no execution context
+
+        Example:
+            >>> from bifrost import workflows
+            >>> progress = await workflows.get_batch("batch-123")
+            >>> print(f"{progress['completed']}/{progress['total']}")
+        """
+        context = get_context()
+
+        progress = await get_workflow_batch_logic(context, batch_id)
+
+        if not progress:
+            raise ValueError(f"Batch not found: {batch_id}")
+
+        return progress
+
     @staticmethod
     def list() -> list[dict[str, Any]]:
         """
@@ -9,38 +9,6 @@ warnings.filterwarnings('ignore', message='Unclosed connector')
 
 # Suppress verbose Azure SDK HTTP logging
 logging.getLogger('azure.core.pipeline.policies.http_logging_policy').setLevel(logging.WARNING)
-from functions.queue.poison_queue_handler import bp as poison_queue_handler_bp
-from functions.queue.worker import bp as worker_bp
-from functions.queue.package_worker import bp as package_worker_bp
-from functions.queue.git_sync_worker import bp as git_sync_worker_bp
-from functions.timer.execution_cleanup import bp as execution_cleanup_timer_bp
-from functions.timer.schedule_processor import bp as schedule_processor_bp
-from functions.timer.oauth_refresh_timer import bp as oauth_refresh_timer_bp
-from functions.http.schedules import bp as schedules_bp
-from functions.http.workflow_keys import bp as workflow_keys_bp
-from functions.http.workflows import bp as workflows_bp
-from functions.http.secrets import bp as secrets_bp
-from functions.http.webpubsub import bp as webpubsub_bp
-from functions.http.roles_source import bp as roles_source_bp
-from functions.http.roles import bp as roles_bp
-from functions.http.permissions import bp as permissions_bp
-from functions.http.organizations import bp as organizations_bp
-from functions.http.org_config import bp as org_config_bp
-from functions.http.openapi import bp as openapi_bp
-from functions.http.oauth_api import bp as oauth_api_bp
-from functions.http.metrics import bp as metrics_bp
-from functions.http.health import bp as health_bp
-from functions.http.forms import bp as forms_bp
-from functions.http.file_uploads import bp as file_uploads_bp
-from functions.http.execution_cleanup import bp as execution_cleanup_http_bp
-from functions.http.executions import bp as executions_bp
-from functions.http.endpoints import bp as endpoints_bp
-from functions.http.editor_files import bp as editor_files_bp
-from functions.http.data_providers import bp as data_providers_bp
-from functions.http.branding import bp as branding_bp
-from functions.http.logs import bp as logs_bp
-from functions.http.packages import bp as packages_bp
-from functions.http.github_integration import bp as github_integration_bp
 import importlib.util
 import os
 import sys
@@ -54,10 +22,9 @@ import azure.functions as func
 if os.environ.get("AzureWebJobsStorage") == "UseDevelopmentStorage=true":
     os.environ["AzureWebJobsStorage"] = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://localhost:10000/devstoreaccount1;QueueEndpoint=http://localhost:10001/devstoreaccount1;TableEndpoint=http://localhost:10002/devstoreaccount1;"
 
-# CRITICAL: Initialize queues BEFORE importing queue blueprints
-# Queue triggers bind immediately when imported, so queues must exist first
-from shared.init_tables import init_tables
-from shared.queue_init import init_queues
+# CRITICAL: Create tables and queues BEFORE registering blueprints
+# Queue triggers bind as soon as the host indexes them, so queues must exist first
+from shared.storage_bootstrap import bootstrap_storage
 
 # Suppress aiohttp unclosed client session warnings (common in Azure SDK)
 # These are resource warnings that don't affect functionality
@@ -66,25 +33,30 @@ warnings.filterwarnings("ignore", message="Unclosed client session")
 warnings.filterwarnings("ignore", message="Unclosed connector")
 
 print("="*60)
-print("PRE-IMPORT QUEUE INITIALIZATION")
+print("STORAGE BOOTSTRAP")
 print("="*60)
 
+# Tables and queues are created concurrently, and skipped entirely when the
+# marker row shows this schema version was already bootstrapped
 try:
-    queue_results = init_queues()
-    if queue_results["created"]:
-        print(f"✓ Created {len(queue_results['created'])} queues")
-    if queue_results["already_exists"]:
-        print(
-            f"✓ {len(queue_results['already_exists'])} queues already exist")
-    if queue_results["failed"]:
-        print(
-            f"✗ Failed to create {len(queue_results['failed'])} queues")
+    bootstrap_results = bootstrap_storage()
+    if bootstrap_results["skipped"]:
+        print("✓ Tables and queues already bootstrapped for this schema version")
+    else:
+        for kind in ("tables", "queues"):
+            kind_results = bootstrap_results[kind]
+            if kind_results["created"]:
+                print(f"✓ Created {len(kind_results['created'])} {kind}")
+            if kind_results["already_exists"]:
+                print(f"✓ {len(kind_results['already_exists'])} {kind} already exist")
+            if kind_results["failed"]:
+                print(f"✗ Failed to create {len(kind_results['failed'])} {kind} - some features may not work")
 except Exception as e:
-    print(f"Queue initialization failed: {e}")
+    print(f"Storage bootstrap failed: {e} - continuing without storage initialization")
 
 print("="*60 + "\n")
 
-# Now safe to import queue blueprints
+# Now safe to register queue blueprints
 # ruff: noqa: E402
 
 # ==================== DEBUGPY INITIALIZATION ====================
@@ -175,29 +147,8 @@ for workspace_root in get_workspace_paths():
 # /platform code can import from shared.* (needs handlers)
 install_import_restrictions(get_workspace_paths(), home_path=get_home_path())
 
-# ==================== TABLE INITIALIZATION ====================
-# T007: Initialize Azure Table Storage tables at startup
-
-try:
-    print("Initializing Azure Table Storage tables...")
-    results = init_tables()
-
-    if results["created"]:
-        print(
-            f"Created {len(results['created'])} tables: {', '.join(results['created'])}")
-    if results["already_exists"]:
-        print(f"{len(results['already_exists'])} tables already exist")
-    if results["failed"]:
-        print(
-            f"Failed to create {len(results['failed'])} tables - some features may not work")
-
-except Exception as e:
-    print(
-        f"Table initialization failed: {e} - continuing without table initialization")
-
-# ==================== QUEUE INITIALIZATION ====================
-# Queue initialization moved to TOP of file (before blueprint imports)
-# See lines 9-33 for queue initialization code
+# ==================== STORAGE INITIALIZATION ====================
+# Tables and queues are bootstrapped at the TOP of file (before blueprint registration)
 
 # ==================== DYNAMIC DISCOVERY ====================
 # Workflows, data providers, and forms are now discovered dynamically
@@ -210,63 +161,14 @@ print("=" * 60)
 print("Workflows and data providers will be discovered dynamically on each API call.")
 print("No startup registration needed - code changes take effect immediately.")
 
-# ==================== BLUEPRINT IMPORTS ====================
-# API Management Blueprints
+# ==================== BLUEPRINT REGISTRATION ====================
+# Blueprint modules are listed in functions/blueprints.py and imported as
+# they are registered; timer blueprints are not imported in Testing
 
-# Workflow Engine Blueprints (unified in functions/)
+from functions.blueprints import register_blueprints
 
 app = func.FunctionApp(http_auth_level=func.AuthLevel.ANONYMOUS)
 
-# Register blueprints - API Management
-app.register_functions(organizations_bp)
-app.register_functions(org_config_bp)
-app.register_functions(permissions_bp)
-app.register_functions(forms_bp)
-# File upload SAS URL generation (User Story 2)
-app.register_functions(file_uploads_bp)
-# Platform branding configuration (User Story 7)
-app.register_functions(branding_bp)
-app.register_functions(roles_bp)
-app.register_functions(executions_bp)  # Workflow execution history
-# Stuck execution cleanup HTTP API
-app.register_functions(execution_cleanup_http_bp)
-app.register_functions(roles_source_bp)  # SWA roles source
-app.register_functions(openapi_bp)  # OpenAPI/Swagger endpoints
-app.register_functions(secrets_bp)  # Secret management endpoints
-app.register_functions(health_bp)  # Health monitoring endpoints
-app.register_functions(metrics_bp)  # System metrics endpoints
-app.register_functions(oauth_api_bp)  # OAuth connection management endpoints
-# Web PubSub real-time connection negotiation
-app.register_functions(webpubsub_bp)
-app.register_functions(logs_bp)  # System logs viewing (admin-only)
-# Browser-based code editor file operations
-app.register_functions(editor_files_bp)
-# Package management for workspace
-app.register_functions(packages_bp)
-# GitHub integration for workspace sync
-app.register_functions(github_integration_bp)
-
-if (os.getenv('AZURE_FUNCTIONS_ENVIRONMENT') != 'Testing'):
-    app.register_functions(oauth_refresh_timer_bp)  # OAuth token refresh timer
-    # CRON schedule processor timer (User Story 5)
-    app.register_functions(schedule_processor_bp)
-    # Execution cleanup timer (timeout stuck executions)
-    app.register_functions(execution_cleanup_timer_bp)
-
-# Register blueprints - Workflow Engine (unified in functions/)
-app.register_functions(workflows_bp)  # Workflow list and execution
-app.register_functions(data_providers_bp)  # Data providers list
-app.register_functions(endpoints_bp)  # Workflow HTTP endpoints (API key auth)
-# Workflow API key management (User Story 3)
-app.register_functions(workflow_keys_bp)
-# Scheduled workflows viewer (User Story 5)
-app.register_functions(schedules_bp)
-# Async workflow execution worker (User Story 4)
-app.register_functions(worker_bp)
-# Package installation worker
-app.register_functions(package_worker_bp)
-# Git sync worker
-app.register_functions(git_sync_worker_bp)
-# Poison queue handler for failed executions
-app.register_functions(poison_queue_handler_bp)
+register_blueprints(app, include_timers=os.getenv('AZURE_FUNCTIONS_ENVIRONMENT') != 'Testing')
+
 print("Function app initialization complete!")
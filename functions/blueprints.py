@@ -0,0 +1,81 @@
+"""
+Blueprint manifest
+Modules whose `bp` blueprint is registered on the function app, in registration order
+
+Blueprints are imported when they are registered, so a host that skips a
+group (timers in the Testing environment) never imports those modules.
+"""
+
+import importlib
+
+import azure.functions as func
+
+# API Management
+API_BLUEPRINTS = [
+    "functions.http.organizations",
+    "functions.http.org_config",
+    "functions.http.permissions",
+    "functions.http.forms",
+    "functions.http.file_uploads",        # File upload SAS URL generation
+    "functions.http.branding",            # Platform branding configuration
+    "functions.http.roles",
+    "functions.http.executions",          # Workflow execution history
+    "functions.http.execution_cleanup",   # Stuck execution cleanup HTTP API
+    "functions.http.roles_source",        # SWA roles source
+    "functions.http.openapi",             # OpenAPI/Swagger endpoints
+    "functions.http.secrets",             # Secret management endpoints
+    "functions.http.health",              # Health monitoring endpoints
+    "functions.http.metrics",             # System metrics endpoints
+    "functions.http.oauth_api",           # OAuth connection management endpoints
+    "functions.http.webpubsub",           # Web PubSub real-time connection negotiation
+    "functions.http.logs",                # System logs viewing (admin-only)
+    "functions.http.editor_files",        # Browser-based code editor file operations
+    "functions.http.packages",            # Package management for workspace
+    "functions.http.github_integration",  # GitHub integration for workspace sync
+]
+
+# Timers (not registered in the Testing environment)
+TIMER_BLUEPRINTS = [
+    "functions.timer.oauth_refresh_timer",  # OAuth token refresh
+    "functions.timer.schedule_processor",   # CRON schedule processor
+    "functions.timer.execution_cleanup",    # Timeout stuck executions
+    "functions.timer.temp_cleanup",         # Temp space cleanup (age and quota based)
+]
+
+# Workflow Engine
+ENGINE_BLUEPRINTS = [
+    "functions.http.workflows",            # Workflow list and execution
+    "functions.http.data_providers",       # Data providers list
+    "functions.http.endpoints",            # Workflow HTTP endpoints (API key auth)
+    "functions.http.workflow_keys",        # Workflow API key management
+    "functions.http.schedules",            # Scheduled workflows viewer
+    "functions.queue.worker",              # Async workflow execution worker
+    "functions.queue.package_worker",      # Package installation worker
+    "functions.queue.git_sync_worker",     # Git sync worker
+    "functions.queue.poison_queue_handler",  # Poison queue handler for failed executions
+]
+
+
+def blueprint_modules(include_timers: bool = True) -> list[str]:
+    """
+    Blueprint modules to register, in order.
+
+    Args:
+        include_timers: Whether to include timer trigger blueprints
+
+    Returns:
+        Module names
+    """
+    return API_BLUEPRINTS + (TIMER_BLUEPRINTS if include_timers else []) + ENGINE_BLUEPRINTS
+
+
+def register_blueprints(app: func.FunctionApp, include_timers: bool = True) -> None:
+    """
+    Import each blueprint module and register its `bp` on the app.
+
+    Args:
+        app: Function app to register on
+        include_timers: Whether to register timer trigger blueprints
+    """
+    for module_name in blueprint_modules(include_timers):
+        app.register_functions(importlib.import_module(module_name).bp)
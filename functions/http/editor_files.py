@@ -11,11 +11,13 @@ import logging
 import azure.functions as func
 
 from shared.editor.file_operations import (
+    get_file_etag,
     list_directory,
     read_file,
     write_file,
 )
 from shared.editor.search import search_files
+from shared.handlers.response_helpers import etag_matches
 from shared.models import (
     FileMetadata,
     FileContentRequest,
@@ -31,6 +33,17 @@ logger = logging.getLogger(__name__)
 bp = func.Blueprint()
 
 
+def _int_param(req: func.HttpRequest, name: str) -> int | None:
+    """Parse an optional integer query parameter."""
+    value = req.params.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid '{name}' parameter: must be an integer")
+
+
 @bp.route(route="editor/files", methods=["GET"])
 @bp.function_name("editor_list_files")
 @openapi_endpoint(
@@ -45,23 +58,38 @@ bp = func.Blueprint()
             "description": "Relative path to directory (empty = root)",
             "schema": {"type": "string"},
             "required": False,
-        }
+        },
+        "recursive": {
+            "description": "Include the contents of all subfolders (file tree mode)",
+            "schema": {"type": "boolean"},
+            "required": False,
+        },
+        "depth": {
+            "description": "Maximum folder depth when recursive (default: unlimited)",
+            "schema": {"type": "integer", "minimum": 1},
+            "required": False,
+        },
     },
 )
 async def editor_list_files(req: func.HttpRequest) -> func.HttpResponse:
     """
     List files and folders in a directory.
 
+    With recursive=true, returns the whole tree below the directory in one
+    response (each folder followed by its contents).
+
     Returns FileMetadata array with file/folder information.
     """
     try:
         path = req.params.get("path", "")
+        recursive = req.params.get("recursive", "false").lower() == "true"
+        depth = _int_param(req, "depth")
 
-        logger.info(f"Listing files, path: {path}")
+        logger.info(f"Listing files, path: {path}, recursive: {recursive}")
 
-        # list_directory is synchronous (stat operations are fast for local disk)
-        # Only file read/write operations are async
-        files = list_directory(path)
+        # Run blocking directory scans in thread pool to avoid blocking event loop
+        loop = asyncio.get_event_loop()
+        files = await loop.run_in_executor(None, list_directory, path, recursive, depth)
 
         # Convert to JSON
         files_json = [f.model_dump() for f in files]
@@ -104,7 +132,11 @@ async def editor_list_files(req: func.HttpRequest) -> func.HttpResponse:
     path="/editor/files/content",
     method="GET",
     summary="Read file content",
-    description="Read content of a file in /home directory (platform admin resource)",
+    description=(
+        "Read content of a file in /home directory (platform admin resource). "
+        "Supports If-None-Match (returns 304 when unchanged) and byte or line range reads. "
+        "If-None-Match is ignored for range reads."
+    ),
     tags=["Editor"],
     response_model=FileContentResponse,
     query_params={
@@ -112,14 +144,36 @@ async def editor_list_files(req: func.HttpRequest) -> func.HttpResponse:
             "description": "Relative path to file",
             "schema": {"type": "string"},
             "required": True,
-        }
+        },
+        "offset": {
+            "description": "Byte offset to start reading from (byte-range read)",
+            "schema": {"type": "integer", "minimum": 0},
+            "required": False,
+        },
+        "length": {
+            "description": "Maximum number of bytes to return (byte-range read)",
+            "schema": {"type": "integer", "minimum": 0},
+            "required": False,
+        },
+        "startLine": {
+            "description": "First line to return, 1-indexed (line-range read)",
+            "schema": {"type": "integer", "minimum": 1},
+            "required": False,
+        },
+        "endLine": {
+            "description": "Last line to return, inclusive (line-range read)",
+            "schema": {"type": "integer", "minimum": 1},
+            "required": False,
+        },
     },
 )
 async def editor_read_file(req: func.HttpRequest) -> func.HttpResponse:
     """
     Read file content.
 
-    Returns FileContentResponse with content and metadata.
+    Returns FileContentResponse with content and metadata, or 304 Not Modified
+    when the If-None-Match header matches the current etag. The etag is that of
+    the whole file, so range reads always return the requested range.
     """
     try:
         path = req.params.get("path")
@@ -133,13 +187,36 @@ async def editor_read_file(req: func.HttpRequest) -> func.HttpResponse:
 
         logger.info(f"Reading file, path: {path}")
 
-        # read_file is now async
-        response = await read_file(path)
+        offset = _int_param(req, "offset")
+        length = _int_param(req, "length")
+        start_line = _int_param(req, "startLine")
+        end_line = _int_param(req, "endLine")
+
+        # Conditional GET - answered from the etag validator cache without reading content.
+        # A client holding the whole file's etag may not have this range cached.
+        ranged = any(value is not None for value in (offset, length, start_line, end_line))
+        if_none_match = req.headers.get("If-None-Match")
+        if if_none_match and not ranged:
+            etag = await get_file_etag(path)
+            if etag_matches(if_none_match, etag):
+                return func.HttpResponse(
+                    status_code=304,
+                    headers={"ETag": f'"{etag}"'},
+                )
+
+        response = await read_file(
+            path,
+            offset=offset,
+            length=length,
+            start_line=start_line,
+            end_line=end_line,
+        )
 
         return func.HttpResponse(
             body=response.model_dump_json(),
             status_code=200,
             mimetype="application/json",
+            headers={"ETag": f'"{response.etag}"'},
         )
 
     except FileNotFoundError as e:
@@ -223,10 +300,10 @@ async def editor_write_file(req: func.HttpRequest) -> func.HttpResponse:
                     mimetype="application/json",
                 )
 
-            # File exists - check if etag matches
+            # File exists - check if etag matches (cached validator, no content read)
             try:
-                current_file = await read_file(write_request.path)
-                if current_file.etag != write_request.expected_etag:
+                current_etag = await get_file_etag(write_request.path)
+                if current_etag != write_request.expected_etag:
                     # Content changed on server
                     from shared.models import FileConflictResponse
                     conflict = FileConflictResponse(
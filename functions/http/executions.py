@@ -24,6 +24,9 @@ from shared.openapi_decorators import openapi_endpoint
 
 logger = logging.getLogger(__name__)
 
+# Largest ?tail= accepted by the logs endpoint (the full log is capped at 5000 entries)
+MAX_LOG_TAIL = 5000
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
@@ -297,11 +300,23 @@ async def get_execution_result(req: func.HttpRequest) -> func.HttpResponse:
             "description": "Execution ID (UUID)",
             "schema": {"type": "string", "format": "uuid"}
         }
+    },
+    query_params={
+        "tail": {
+            "description": f"Return only the latest N log entries (max: {MAX_LOG_TAIL})",
+            "schema": {"type": "integer", "minimum": 1, "maximum": MAX_LOG_TAIL},
+            "required": False
+        }
     }
 )
 @with_request_context
 async def get_execution_logs(req: func.HttpRequest) -> func.HttpResponse:
-    """GET /api/executions/{executionId}/logs"""
+    """
+    GET /api/executions/{executionId}/logs
+
+    Query parameters:
+    - tail: Return only the latest N entries (optional)
+    """
     request_context = req.context  # type: ignore[attr-defined]
     execution_id = req.route_params.get("executionId")
 
@@ -312,8 +327,19 @@ async def get_execution_logs(req: func.HttpRequest) -> func.HttpResponse:
             mimetype='application/json'
         )
 
+    tail = req.params.get("tail")
+    if tail is not None:
+        if not tail.isdigit() or not 1 <= int(tail) <= MAX_LOG_TAIL:
+            return func.HttpResponse(
+                json.dumps({"error": "BadRequest", "message": f"'tail' must be an integer from 1 to {MAX_LOG_TAIL}"}),
+                status_code=400,
+                mimetype='application/json'
+            )
+
     try:
-        logs, error_msg = await get_execution_logs_handler(request_context, execution_id)
+        logs, error_msg = await get_execution_logs_handler(
+            request_context, execution_id, tail=int(tail) if tail is not None else None
+        )
 
         if error_msg:
             status_codes = {
@@ -90,6 +90,10 @@ async def keyvault_health(req: func.HttpRequest) -> func.HttpResponse:
 
     Check the health status of Azure Key Vault integration.
 
+    Query Parameters:
+        deep: "true" to enumerate every secret for an exact secretCount
+              (default: quick probe of the first page, cached briefly)
+
     Returns:
         200: KeyVaultHealthResponse with health status
         403: Permission denied (not platform admin)
@@ -127,7 +131,8 @@ async def keyvault_health(req: func.HttpRequest) -> func.HttpResponse:
 
         # Perform health check (get KV manager on demand)
         kv_manager = get_kv_manager()
-        response = await perform_keyvault_health_check(kv_manager)
+        deep = req.params.get("deep", "").lower() == "true"
+        response = await perform_keyvault_health_check(kv_manager, deep=deep)
 
         return func.HttpResponse(
             json.dumps(response.model_dump(mode="json")),
@@ -9,8 +9,8 @@ import logging
 import azure.functions as func
 
 from shared.decorators import with_request_context
-from shared.handlers.metrics_handlers import get_dashboard_metrics
-from shared.models import DashboardMetricsResponse, ErrorResponse
+from shared.handlers.metrics_handlers import get_dashboard_metrics, get_queue_metrics
+from shared.models import DashboardMetricsResponse, ErrorResponse, QueueMetricsResponse
 from shared.openapi_decorators import openapi_endpoint
 
 logger = logging.getLogger(__name__)
@@ -63,3 +63,51 @@ async def get_metrics(req: func.HttpRequest) -> func.HttpResponse:
             status_code=500,
             mimetype="application/json"
         )
+
+
+@bp.function_name("get_queue_metrics")
+@bp.route(route="metrics/queues", methods=["GET"])
+@openapi_endpoint(
+    path="/metrics/queues",
+    method="GET",
+    summary="Get execution queue metrics",
+    description="Get queue depth, running/deferred counts and wait-time percentiles for each execution lane (interactive, scheduled, bulk). Platform admin only.",
+    tags=["Metrics"],
+    response_model=QueueMetricsResponse
+)
+@with_request_context
+async def get_queue_metrics_endpoint(req: func.HttpRequest) -> func.HttpResponse:
+    """
+    GET /api/metrics/queues
+
+    Returns per-lane queue metrics (platform admin only).
+    """
+    context = req.context  # type: ignore[attr-defined]
+
+    try:
+        metrics = await get_queue_metrics(context)
+        return func.HttpResponse(
+            json.dumps(metrics),
+            status_code=200,
+            mimetype="application/json"
+        )
+
+    except PermissionError as e:
+        error = ErrorResponse(error="Forbidden", message=str(e))
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=403,
+            mimetype="application/json"
+        )
+
+    except Exception as e:
+        logger.error(f"Error retrieving queue metrics: {str(e)}", exc_info=True)
+        error = ErrorResponse(
+            error="InternalServerError",
+            message="Failed to retrieve queue metrics"
+        )
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=500,
+            mimetype="application/json"
+        )
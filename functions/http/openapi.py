@@ -6,33 +6,45 @@ Also provides Swagger UI at /api/docs
 HTTP handlers that delegate to shared handlers for business logic.
 """
 
-import json
-
 import azure.functions as func
-import yaml
-
-from shared.handlers.openapi_handlers import generate_openapi_spec
 
 bp = func.Blueprint()
 
 
+def generate_openapi_spec() -> dict:
+    """Complete OpenAPI spec (see shared.handlers.openapi_handlers.generate_openapi_spec)"""
+    from shared.handlers.openapi_handlers import generate_openapi_spec as generate
+    return generate()
+
+
+def _spec_response(req: func.HttpRequest, fmt: str, mimetype: str) -> func.HttpResponse:
+    """Cached spec body, or 304 if the client's If-None-Match is current"""
+    # Schema generation machinery (all models, yaml) loads on the first spec request
+    from shared.handlers.openapi_handlers import render_openapi_spec
+    from shared.handlers.response_helpers import etag_matches
+
+    body, etag = render_openapi_spec(fmt)  # type: ignore[arg-type]
+    headers = {
+        "Access-Control-Allow-Origin": "*",  # Allow CORS for local dev
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+    }
+
+    if etag_matches(req.headers.get("If-None-Match"), etag):
+        return func.HttpResponse(status_code=304, headers=headers)
+
+    return func.HttpResponse(body, status_code=200, mimetype=mimetype, headers=headers)
+
+
 @bp.route(route="openapi.json", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
 def get_openapi_json(req: func.HttpRequest) -> func.HttpResponse:
     """
     Get OpenAPI spec as JSON
 
     Usage: GET /api/openapi.json
+    Supports If-None-Match (304 when the spec is unchanged)
     """
-    spec = generate_openapi_spec()
-
-    return func.HttpResponse(
-        json.dumps(spec, indent=2),
-        status_code=200,
-        mimetype="application/json",
-        headers={
-            "Access-Control-Allow-Origin": "*",  # Allow CORS for local dev
-        }
-    )
+    return _spec_response(req, "json", "application/json")
 
 
 @bp.route(route="openapi.yaml", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
@@ -41,24 +53,9 @@ def get_openapi_yaml(req: func.HttpRequest) -> func.HttpResponse:
     Get OpenAPI spec as YAML
 
     Usage: GET /api/openapi.yaml
+    Supports If-None-Match (304 when the spec is unchanged)
     """
-    spec = generate_openapi_spec()
-    yaml_output = yaml.dump(
-        spec,
-        sort_keys=False,
-        default_flow_style=False,
-        allow_unicode=True,
-        width=120
-    )
-
-    return func.HttpResponse(
-        yaml_output,
-        status_code=200,
-        mimetype="application/x-yaml",
-        headers={
-            "Access-Control-Allow-Origin": "*",  # Allow CORS for local dev
-        }
-    )
+    return _spec_response(req, "yaml", "application/x-yaml")
 
 
 @bp.route(route="docs", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
@@ -20,6 +20,7 @@ from shared.models import (
 )
 from shared.openapi_decorators import openapi_endpoint
 from shared.workflows.cron_parser import (
+    TIMER_INTERVAL_MINUTES,
     cron_to_human_readable,
     validate_cron_expression,
 )
@@ -114,11 +115,10 @@ async def validate_cron_endpoint(req: func.HttpRequest) -> func.HttpResponse:
         second_run = cron_interval.get_next(datetime)
         interval_seconds = int((second_run - first_run).total_seconds())
 
-        # Check if too frequent
+        # Check if more frequent than the schedule processor timer
         warning = None
-        if interval_seconds < 300:
-            minutes = interval_seconds / 60
-            warning = f"Runs every {minutes:.0f} minute{'s' if minutes != 1 else ''} (< 5 min recommended)"
+        if interval_seconds < TIMER_INTERVAL_MINUTES * 60:
+            warning = f"Runs more often than the {TIMER_INTERVAL_MINUTES} minute scheduler interval"
 
         # Get human-readable description
         human_readable = cron_to_human_readable(expression)
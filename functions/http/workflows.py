@@ -13,9 +13,17 @@ import azure.functions as func
 from shared.decorators import require_platform_admin, with_request_context
 from shared.discovery import scan_all_workflows, scan_all_data_providers, scan_all_forms
 from shared.handlers.discovery_handlers import convert_workflow_metadata_to_model
-from shared.handlers.workflows_handlers import execute_workflow_handler, validate_workflow_file
+from shared.handlers.workflows_handlers import (
+    execute_workflow_handler,
+    get_workflow_batch_handler,
+    launch_workflow_batch_handler,
+    validate_workflow_file,
+)
 from shared.middleware import with_org_context
 from shared.models import (
+    BatchExecutionProgress,
+    BatchExecutionRequest,
+    BatchExecutionResponse,
     FileScanRequest,
     WorkflowExecutionRequest,
     WorkflowExecutionResponse,
@@ -123,6 +131,49 @@ async def execute_workflow(req: func.HttpRequest) -> func.HttpResponse:
     return await execute_workflow_handler(req)
 
 
+@bp.route(route="workflows/batch", methods=["POST"])
+@bp.function_name("launch_workflow_batch")
+@openapi_endpoint(
+    path="/workflows/batch",
+    method="POST",
+    summary="Launch a workflow for many organizations",
+    description="Queue one workflow for each target organization in a single call and return a batch ID for tracking progress (Platform admin only)",
+    tags=["Workflows"],
+    request_model=BatchExecutionRequest,
+    response_model=BatchExecutionResponse,
+)
+@with_request_context
+@with_org_context
+@require_platform_admin
+async def launch_workflow_batch(req: func.HttpRequest) -> func.HttpResponse:
+    """Queue a workflow for every target organization"""
+    return await launch_workflow_batch_handler(req)
+
+
+@bp.route(route="workflows/batch/{batchId}", methods=["GET"])
+@bp.function_name("get_workflow_batch")
+@openapi_endpoint(
+    path="/workflows/batch/{batchId}",
+    method="GET",
+    summary="Get batch launch progress",
+    description="Returns aggregated status counts and per-organization executions for a batch launch (Platform admin only)",
+    tags=["Workflows"],
+    response_model=BatchExecutionProgress,
+    path_params={
+        "batchId": {
+            "description": "Batch ID returned by POST /workflows/batch",
+            "schema": {"type": "string"}
+        }
+    }
+)
+@with_request_context
+@with_org_context
+@require_platform_admin
+async def get_workflow_batch(req: func.HttpRequest) -> func.HttpResponse:
+    """Get aggregated progress of a batch launch"""
+    return await get_workflow_batch_handler(req)
+
+
 @bp.route(route="workflows/validate", methods=["POST"])
 @bp.function_name("validate_workflow")
 @openapi_endpoint(
@@ -227,7 +278,8 @@ async def scan_workspace(req: func.HttpRequest) -> func.HttpResponse:
         scanner = SDKUsageScanner(workspace_path)
         file_usages = scanner.scan_workspace()
         scanned_count = len(file_usages)
-        sdk_issues = await scanner.validate_workspace(context)
+        # Explicit rescan: don't trust stored keys cached by this or another instance
+        sdk_issues = await scanner.validate_workspace(context, file_usages, refresh=True)
 
         # 2. Scan for forms (dynamic discovery)
         forms = scan_all_forms()
@@ -238,7 +290,8 @@ async def scan_workspace(req: func.HttpRequest) -> func.HttpResponse:
             scanned_files=scanned_count,
             form_issues=[],  # Form validation now happens on-demand
             scanned_forms=form_count,
-            valid_forms=form_count  # All loaded forms are valid by definition
+            valid_forms=form_count,  # All loaded forms are valid by definition
+            unavailable_sources=scanner.unavailable_sources
         )
 
         logger.info(
@@ -313,7 +366,8 @@ async def scan_file(req: func.HttpRequest) -> func.HttpResponse:
 
         response = WorkspaceScanResponse(
             issues=issues,
-            scanned_files=1
+            scanned_files=1,
+            unavailable_sources=scanner.unavailable_sources
         )
 
         logger.info(f"File scan complete: {scan_request.file_path}, {len(issues)} issues")
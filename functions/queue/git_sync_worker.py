@@ -3,19 +3,89 @@ Git Sync Worker - Dedicated queue worker for git sync operations
 Processes git sync messages from Azure Storage Queue
 """
 
+import asyncio
 import json
 import logging
+import os
 
 import azure.functions as func
 
 from shared.services.git_integration_service import GitIntegrationService
-from shared.webpubsub_broadcaster import WebPubSubBroadcaster
+from shared.webpubsub_broadcaster import get_publisher
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint for git sync worker function
 bp = func.Blueprint()
 
+# Upper bound for a single pull/push/refresh, enforced caller-side. On timeout the
+# running git operation is cancelled at its next checkpoint (before the working tree
+# is modified) and the workspace lock is held until its thread has finished; stalled
+# network calls are bounded separately by GIT_NETWORK_TIMEOUT_SECONDS in the service.
+GIT_OPERATION_TIMEOUT_SECONDS = float(os.environ.get("GIT_OPERATION_TIMEOUT_SECONDS", "600"))
+
+# How long a finished job waits for its terminal messages to be sent
+PUBLISH_FLUSH_TIMEOUT_SECONDS = 5
+
+
+async def _run_with_timeout(operation, name: str):
+    """
+    Await a git service call, cancelling it if it exceeds the operation timeout.
+
+    The timeout is caller-side only: cancellation waits for the git thread to
+    reach a checkpoint or finish, so this can return later than the timeout.
+
+    Args:
+        operation: Awaitable git service call
+        name: Operation name for the error message
+
+    Returns:
+        Result of the operation
+
+    Raises:
+        Exception: If the operation timed out (after the git work has stopped)
+    """
+    try:
+        return await asyncio.wait_for(operation, timeout=GIT_OPERATION_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise Exception(f"{name} timed out after {GIT_OPERATION_TIMEOUT_SECONDS:.0f}s and was cancelled")
+
+
+def _terminal_sender(connection_id: str | None):
+    """
+    Log and completion senders for a job's WebPubSub terminal.
+
+    Messages are queued on the process-wide publisher and sent in the
+    background, so git work never waits on WebPubSub HTTP calls.
+
+    Args:
+        connection_id: WebPubSub connection to stream to (None = nothing is sent)
+
+    Returns:
+        Tuple of (async send_log(message, level), send_complete(status, message, **extra))
+    """
+    publisher = get_publisher()
+
+    async def send_log(message: str, level: str = "info"):
+        """Send log message to WebPubSub terminal"""
+        if connection_id:
+            publisher.publish(
+                {"type": "log", "level": level, "message": message},
+                connection_id=connection_id
+            )
+
+    def send_complete(status: str, message: str, **extra) -> None:
+        """Send the completion message so the frontend stops loading"""
+        if not connection_id:
+            logger.warning(f"Cannot send {status} completion message - no connection_id provided")
+            return
+        publisher.publish(
+            {"type": "complete", "status": status, "message": message, **extra},
+            connection_id=connection_id
+        )
+
+    return send_log, send_complete
+
 
 @bp.function_name("git_sync_worker")
 @bp.queue_trigger(
@@ -95,24 +165,8 @@ async def handle_git_sync(message_data: dict) -> None:
         }
     )
 
-    # Initialize broadcaster for streaming logs to terminal
-    broadcaster = WebPubSubBroadcaster()
-
-    async def send_log(message: str, level: str = "info"):
-        """Send log message to WebPubSub terminal"""
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "log",
-                        "level": level,
-                        "message": message
-                    },
-                    content_type="application/json"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to send log to WebPubSub: {e}")
+    # Stream logs to the terminal
+    send_log, send_complete = _terminal_sender(connection_id)
 
     completion_sent = False
 
@@ -132,7 +186,9 @@ async def handle_git_sync(message_data: dict) -> None:
 
         # Step 1: Pull from remote
         await send_log("Starting sync: pulling changes from GitHub...")
-        pull_result = await git_service.pull(context, connection_id=connection_id)
+        pull_result = await _run_with_timeout(
+            git_service.pull(context, connection_id=connection_id), "Pull"
+        )
 
         # Check if pull was successful
         if not pull_result.get("success"):
@@ -151,22 +207,11 @@ async def handle_git_sync(message_data: dict) -> None:
             )
 
             # Send completion message with conflicts
-            if connection_id and broadcaster.enabled and broadcaster.client:
-                try:
-                    broadcaster.client.send_to_connection(
-                        connection_id=connection_id,
-                        message={
-                            "type": "complete",
-                            "status": "conflict",
-                            "conflicts": conflicts,
-                            "message": f"Sync stopped due to {conflict_count} conflict(s)"
-                        },
-                        content_type="application/json"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to send conflict completion message: {e}")
-            else:
-                logger.warning(f"Cannot send completion message - connection_id: {connection_id}, enabled: {broadcaster.enabled}, has_client: {broadcaster.client is not None}")
+            send_complete(
+                "conflict",
+                f"Sync stopped due to {conflict_count} conflict(s)",
+                conflicts=conflicts
+            )
 
             completion_sent = True
             logger.info(
@@ -183,7 +228,9 @@ async def handle_git_sync(message_data: dict) -> None:
 
         # Step 3: Push to remote (if no conflicts)
         await send_log("No conflicts detected, pushing changes to GitHub...")
-        push_result = await git_service.push(context, connection_id=connection_id)
+        push_result = await _run_with_timeout(
+            git_service.push(context, connection_id=connection_id), "Push"
+        )
 
         # Check if push was successful
         if not push_result.get("success"):
@@ -203,23 +250,7 @@ async def handle_git_sync(message_data: dict) -> None:
         await send_log(success_msg, "success")
 
         # Send completion message
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "complete",
-                        "status": "success",
-                        "message": success_msg,
-                        "updated_files": files_updated,
-                        "commits_pushed": commits_pushed
-                    },
-                    content_type="application/json"
-                )
-            except Exception as e:
-                logger.error(f"Failed to send success completion message: {e}")
-        else:
-            logger.warning(f"Cannot send completion message - connection_id: {connection_id}, enabled: {broadcaster.enabled}, has_client: {broadcaster.client is not None}")
+        send_complete("success", success_msg, updated_files=files_updated, commits_pushed=commits_pushed)
 
         completion_sent = True
         logger.info(
@@ -243,21 +274,7 @@ async def handle_git_sync(message_data: dict) -> None:
         # else: pull/push already sent the error via WebPubSub, don't duplicate
 
         # Always send completion message so frontend stops loading
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "complete",
-                        "status": "error",
-                        "message": error_msg
-                    },
-                    content_type="application/json"
-                )
-            except Exception as pubsub_error:
-                logger.error(f"Failed to send error completion to WebPubSub: {pubsub_error}")
-        else:
-            logger.warning(f"Cannot send error completion - connection_id: {connection_id}, enabled: {broadcaster.enabled}, has_client: {broadcaster.client is not None}")
+        send_complete("error", error_msg)
 
         completion_sent = True
 
@@ -275,20 +292,10 @@ async def handle_git_sync(message_data: dict) -> None:
 
     finally:
         # Safety net: ensure completion message is sent even if something went wrong
-        if not completion_sent and connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                logger.warning(f"Completion message not sent, sending fallback message for job {job_id}")
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "complete",
-                        "status": "error",
-                        "message": "Sync operation interrupted"
-                    },
-                    content_type="application/json"
-                )
-            except Exception as fallback_error:
-                logger.error(f"Failed to send fallback completion message: {fallback_error}")
+        if not completion_sent:
+            logger.warning(f"Completion message not sent, sending fallback message for job {job_id}")
+            send_complete("error", "Sync operation interrupted")
+        await get_publisher().flush(PUBLISH_FLUSH_TIMEOUT_SECONDS)
 
 
 async def handle_git_refresh(message_data: dict) -> None:
@@ -310,24 +317,8 @@ async def handle_git_refresh(message_data: dict) -> None:
         }
     )
 
-    # Initialize broadcaster for streaming logs to terminal
-    broadcaster = WebPubSubBroadcaster()
-
-    async def send_log(message: str, level: str = "info"):
-        """Send log message to WebPubSub terminal"""
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "log",
-                        "level": level,
-                        "message": message
-                    },
-                    content_type="application/json"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to send log to WebPubSub: {e}")
+    # Stream logs to the terminal
+    send_log, send_complete = _terminal_sender(connection_id)
 
     completion_sent = False
 
@@ -347,7 +338,7 @@ async def handle_git_refresh(message_data: dict) -> None:
 
         # Perform refresh (fetch + status)
         await send_log("Fetching latest changes from GitHub...")
-        result = await git_service.refresh_status(context)
+        result = await _run_with_timeout(git_service.refresh_status(context), "Refresh")
 
         if result.get("success"):
             await send_log("✓ Status refreshed successfully", "success")
@@ -359,17 +350,7 @@ async def handle_git_refresh(message_data: dict) -> None:
             await send_log("Discovery complete")
 
             # Send completion message with status data
-            if connection_id and broadcaster.enabled and broadcaster.client:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "complete",
-                        "status": "success",
-                        "message": "Status refreshed",
-                        "data": result
-                    },
-                    content_type="application/json"
-                )
+            send_complete("success", "Status refreshed", data=result)
 
             completion_sent = True
             logger.info(
@@ -387,29 +368,8 @@ async def handle_git_refresh(message_data: dict) -> None:
         await send_log(f"✗ {error_msg}", "error")
 
         # Always send completion message so frontend stops loading
-        logger.info(f"Attempting to send error completion. connection_id={connection_id}, enabled={broadcaster.enabled}, has_client={broadcaster.client is not None}")
-
-        if not connection_id:
-            logger.error("Cannot send completion - no connection_id provided")
-        elif not broadcaster.enabled:
-            logger.error("Cannot send completion - WebPubSub not enabled")
-        elif not broadcaster.client:
-            logger.error("Cannot send completion - WebPubSub client not initialized")
-        else:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "complete",
-                        "status": "error",
-                        "message": error_msg
-                    },
-                    content_type="application/json"
-                )
-                completion_sent = True
-                logger.info("Error completion message sent successfully")
-            except Exception as pubsub_error:
-                logger.error(f"Failed to send error completion to WebPubSub: {pubsub_error}", exc_info=True)
+        send_complete("error", error_msg)
+        completion_sent = True
 
         logger.error(
             f"Git refresh error: {job_id}",
@@ -424,21 +384,6 @@ async def handle_git_refresh(message_data: dict) -> None:
     finally:
         # Safety net: ensure completion message is sent even if something went wrong
         if not completion_sent:
-            logger.warning(f"Completion message not sent yet for job {job_id}, attempting fallback")
-
-            if connection_id and broadcaster.enabled and broadcaster.client:
-                try:
-                    broadcaster.client.send_to_connection(
-                        connection_id=connection_id,
-                        message={
-                            "type": "complete",
-                            "status": "error",
-                            "message": "Refresh operation interrupted"
-                        },
-                        content_type="application/json"
-                    )
-                    logger.info("Fallback completion message sent successfully")
-                except Exception as fallback_error:
-                    logger.error(f"Failed to send fallback completion message: {fallback_error}", exc_info=True)
-            else:
-                logger.error(f"Cannot send fallback - connection_id={connection_id}, enabled={broadcaster.enabled}, has_client={broadcaster.client is not None}")
+            logger.warning(f"Completion message not sent yet for job {job_id}, sending fallback")
+            send_complete("error", "Refresh operation interrupted")
+        await get_publisher().flush(PUBLISH_FLUSH_TIMEOUT_SECONDS)
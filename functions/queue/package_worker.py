@@ -3,6 +3,7 @@ Package Installation Worker - Dedicated queue worker for package installations
 Processes package installation messages from Azure Storage Queue
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -11,13 +12,103 @@ from pathlib import Path
 import azure.functions as func
 
 from shared.package_manager import WorkspacePackageManager
-from shared.webpubsub_broadcaster import WebPubSubBroadcaster
+from shared.webpubsub_broadcaster import NoOpPublisher, WebPubSubPublisher, get_publisher
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint for package worker function
 bp = func.Blueprint()
 
+# pip output is forwarded in batches: whichever comes first
+LOG_FLUSH_INTERVAL_SECONDS = 0.25
+LOG_FLUSH_MAX_LINES = 50
+
+# How long a finished install waits for its terminal messages to be sent
+PUBLISH_FLUSH_TIMEOUT_SECONDS = 5
+
+# One install at a time per workspace (they share .packages and requirements.txt)
+_workspace_locks: dict[str, asyncio.Lock] = {}
+
+# Installs in progress: (workspace, package, version) -> install task
+_in_flight_installs: dict[tuple[str, str | None, str | None], asyncio.Task] = {}
+
+
+class BatchedLogSender:
+    """
+    Forwards log lines to one Web PubSub connection in batches.
+
+    Lines are buffered and sent as a single message every
+    LOG_FLUSH_INTERVAL_SECONDS or LOG_FLUSH_MAX_LINES lines. Messages are
+    queued on the process-wide publisher, so the event loop never waits on
+    the HTTP round-trip.
+    """
+
+    def __init__(
+        self,
+        publisher: WebPubSubPublisher | NoOpPublisher,
+        connection_id: str | None,
+        interval_seconds: float = LOG_FLUSH_INTERVAL_SECONDS,
+        max_lines: int = LOG_FLUSH_MAX_LINES
+    ):
+        self.publisher = publisher
+        self.connection_id = connection_id
+        self.interval_seconds = interval_seconds
+        self.max_lines = max_lines
+        self._lines: list[str] = []
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.connection_id and self.publisher.enabled)
+
+    async def log(self, message: str) -> None:
+        """Buffer a log line (log_callback for the package manager)"""
+        if not self.enabled or self._closed:
+            return
+
+        self._lines.append(message)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if len(self._lines) >= self.max_lines:
+            self._wake.set()
+
+    def send(self, message: dict) -> None:
+        """Queue one message for the connection, after any already queued"""
+        if self.enabled:
+            self.publisher.publish(message, connection_id=self.connection_id)
+
+    async def close(self) -> None:
+        """Flush buffered lines and stop the background sender"""
+        self._closed = True
+        if self._task is not None:
+            self._wake.set()
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self._flush()
+            if self._closed:
+                await self._flush()
+                return
+
+    async def _flush(self) -> None:
+        while self._lines:
+            lines, self._lines = self._lines[:self.max_lines], self._lines[self.max_lines:]
+            self.send({
+                "type": "log",
+                "level": "info",
+                "message": "\n".join(lines),
+                "lines": lines
+            })
+
 
 @bp.function_name("package_installation_worker")
 @bp.queue_trigger(
@@ -69,6 +160,10 @@ async def handle_package_install(message_data: dict) -> None:
     """
     Handle package installation message.
 
+    Installs for the same workspace run one at a time. A request for a
+    package/version that is already being installed waits for that install
+    instead of starting another one.
+
     Args:
         message_data: Queue message data containing package installation details
     """
@@ -86,24 +181,8 @@ async def handle_package_install(message_data: dict) -> None:
         }
     )
 
-    # Initialize broadcaster for streaming logs to terminal
-    broadcaster = WebPubSubBroadcaster()
-
-    async def send_log(message: str):
-        """Send log message to WebPubSub terminal"""
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            try:
-                broadcaster.client.send_to_connection(
-                    connection_id=connection_id,
-                    message={
-                        "type": "log",
-                        "level": "info",
-                        "message": message
-                    },
-                    content_type="application/json"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to send log to WebPubSub: {e}")
+    # Batched sender for streaming logs to the terminal
+    sender = BatchedLogSender(get_publisher(), connection_id)
 
     try:
         # Get workspace path
@@ -111,35 +190,28 @@ async def handle_package_install(message_data: dict) -> None:
             'BIFROST_WORKSPACE_LOCATION', '/mounts/workspace')
         workspace_path = Path(workspace_location)
 
-        pkg_manager = WorkspacePackageManager(workspace_path)
+        install_key = (str(workspace_path), package.lower() if package else None, version)
+        install = _in_flight_installs.get(install_key)
 
-        if package:
-            # Install specific package
-            await send_log(f"Installing package: {package}{f'=={version}' if version else ''}")
-            await pkg_manager.install_package(
-                package_name=package,
-                version=version,
-                log_callback=send_log,
-                append_to_requirements=True
+        if install is not None:
+            await sender.log(
+                f"{package or 'requirements.txt'} is already being installed, waiting for it to finish"
             )
         else:
-            # Install from requirements.txt
-            await send_log("Installing packages from requirements.txt")
-            await pkg_manager.install_requirements_streaming(
-                log_callback=send_log
-            )
+            install = asyncio.create_task(_install(workspace_path, package, version, sender.log))
+            _in_flight_installs[install_key] = install
+            install.add_done_callback(lambda task: _forget_install(install_key, task))
 
-        # Send completion message
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            broadcaster.client.send_to_connection(
-                connection_id=connection_id,
-                message={
-                    "type": "complete",
-                    "status": "success",
-                    "message": "Package installation completed successfully"
-                },
-                content_type="application/json"
-            )
+        # Shielded so a cancelled duplicate doesn't cancel the shared install
+        await asyncio.shield(install)
+
+        # Send completion message after the buffered logs
+        await sender.close()
+        sender.send({
+            "type": "complete",
+            "status": "success",
+            "message": "Package installation completed successfully"
+        })
 
         logger.info(
             f"Package installation completed: {package or 'requirements.txt'}",
@@ -149,18 +221,14 @@ async def handle_package_install(message_data: dict) -> None:
     except Exception as e:
         # Send error message
         error_msg = f"Package installation failed: {str(e)}"
-        await send_log(f"✗ {error_msg}")
-
-        if connection_id and broadcaster.enabled and broadcaster.client:
-            broadcaster.client.send_to_connection(
-                connection_id=connection_id,
-                message={
-                    "type": "complete",
-                    "status": "error",
-                    "message": error_msg
-                },
-                content_type="application/json"
-            )
+        await sender.log(f"✗ {error_msg}")
+        await sender.close()
+
+        sender.send({
+            "type": "complete",
+            "status": "error",
+            "message": error_msg
+        })
 
         logger.error(
             f"Package installation error: {job_id}",
@@ -172,3 +240,38 @@ async def handle_package_install(message_data: dict) -> None:
             exc_info=True
         )
         raise  # Re-raise to trigger retry/poison queue
+
+    finally:
+        await sender.close()
+        await sender.publisher.flush(PUBLISH_FLUSH_TIMEOUT_SECONDS)
+
+
+async def _install(workspace_path: Path, package: str | None, version: str | None, send_log) -> None:
+    """Run one install while holding the workspace lock"""
+    lock = _workspace_locks.setdefault(str(workspace_path), asyncio.Lock())
+    if lock.locked():
+        await send_log("Waiting for another package installation in this workspace to finish...")
+
+    async with lock:
+        pkg_manager = WorkspacePackageManager(workspace_path)
+
+        if package:
+            # Install specific package
+            await send_log(f"Installing package: {package}{f'=={version}' if version else ''}")
+            await pkg_manager.install_package(
+                package_name=package,
+                version=version,
+                log_callback=send_log,
+                append_to_requirements=True
+            )
+        else:
+            # Install from requirements.txt
+            await send_log("Installing packages from requirements.txt")
+            await pkg_manager.install_requirements_streaming(
+                log_callback=send_log
+            )
+
+
+def _forget_install(install_key: tuple, task: asyncio.Task) -> None:
+    if _in_flight_installs.get(install_key) is task:
+        del _in_flight_installs[install_key]
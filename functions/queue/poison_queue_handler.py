@@ -2,8 +2,8 @@
 Poison Queue Handler
 Processes messages that failed multiple times and were moved to the poison queue
 
-Has two triggers:
-1. Queue trigger - processes messages as they arrive
+Has two kinds of triggers:
+1. Queue triggers - process messages as they arrive (one per execution lane's poison queue)
 2. Timer trigger - backup processor that runs every 5 minutes to catch missed messages
 """
 
@@ -13,6 +13,7 @@ import logging
 import azure.functions as func
 from azure.storage.queue import QueueServiceClient
 
+from shared.execution_lanes import LANE_BULK, LANE_INTERACTIVE, LANE_QUEUES, LANE_SCHEDULED
 from shared.execution_logger import get_execution_logger
 from shared.models import ExecutionStatus
 
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Create blueprint for poison queue handler
 bp = func.Blueprint()
 
+# Poison queues created by the Functions host for each lane queue
+POISON_QUEUES = [f"{queue_name}-poison" for queue_name in LANE_QUEUES.values()]
+
 
 async def _process_poison_message(message_data: dict, dequeue_count: int) -> None:
     """
@@ -69,7 +73,7 @@ async def _process_poison_message(message_data: dict, dequeue_count: int) -> Non
 @bp.function_name("workflow_execution_poison_handler")
 @bp.queue_trigger(
     arg_name="msg",
-    queue_name="workflow-executions-poison",
+    queue_name=f"{LANE_QUEUES[LANE_INTERACTIVE]}-poison",
     connection="AzureWebJobsStorage"
 )
 async def workflow_execution_poison_handler(msg: func.QueueMessage) -> None:
@@ -83,6 +87,33 @@ async def workflow_execution_poison_handler(msg: func.QueueMessage) -> None:
 
     These messages are NOT retried - they represent permanent failures.
     """
+    await _handle_poison_queue_message(msg)
+
+
+@bp.function_name("workflow_execution_poison_handler_scheduled")
+@bp.queue_trigger(
+    arg_name="msg",
+    queue_name=f"{LANE_QUEUES[LANE_SCHEDULED]}-poison",
+    connection="AzureWebJobsStorage"
+)
+async def workflow_execution_poison_handler_scheduled(msg: func.QueueMessage) -> None:
+    """Queue trigger: Process poison messages from the scheduled lane"""
+    await _handle_poison_queue_message(msg)
+
+
+@bp.function_name("workflow_execution_poison_handler_bulk")
+@bp.queue_trigger(
+    arg_name="msg",
+    queue_name=f"{LANE_QUEUES[LANE_BULK]}-poison",
+    connection="AzureWebJobsStorage"
+)
+async def workflow_execution_poison_handler_bulk(msg: func.QueueMessage) -> None:
+    """Queue trigger: Process poison messages from the bulk lane"""
+    await _handle_poison_queue_message(msg)
+
+
+async def _handle_poison_queue_message(msg: func.QueueMessage) -> None:
+    """Parse and process a poison message delivered by a queue trigger"""
     try:
         # Parse queue message
         message_body = msg.get_body().decode('utf-8')
@@ -125,36 +156,42 @@ async def workflow_execution_poison_timer(timer: func.TimerRequest) -> None:
         # Get queue client
         connection_str = os.environ.get("AzureWebJobsStorage", "UseDevelopmentStorage=true")
         queue_service = QueueServiceClient.from_connection_string(connection_str)
-        queue_client = queue_service.get_queue_client("workflow-executions-poison")
 
         processed = 0
         failed = 0
 
-        # Process up to 32 messages per timer execution (Azure Queue batch limit)
-        messages = queue_client.receive_messages(max_messages=32, visibility_timeout=300)
+        for poison_queue in POISON_QUEUES:
+            queue_client = queue_service.get_queue_client(poison_queue)
 
-        for msg in messages:
+            # Process up to 32 messages per queue per timer execution (Azure Queue batch limit)
             try:
-                # Parse message
-                message_data = json.loads(msg.content)
-
-                # Process using shared logic
-                dequeue_count = msg.dequeue_count if msg.dequeue_count is not None else 1
-                await _process_poison_message(message_data, dequeue_count)
-
-                # Delete message after successful processing
-                queue_client.delete_message(msg)
-                processed += 1
-
+                messages = list(queue_client.receive_messages(max_messages=32, visibility_timeout=300))
             except Exception as e:
-                logger.error(
-                    "Error processing poison message in timer",
-                    extra={"error": str(e)},
-                    exc_info=True
-                )
-                # Delete message anyway to prevent infinite loop
-                queue_client.delete_message(msg)
-                failed += 1
+                logger.warning(f"Could not read poison queue {poison_queue}: {e}")
+                continue
+
+            for msg in messages:
+                try:
+                    # Parse message
+                    message_data = json.loads(msg.content)
+
+                    # Process using shared logic
+                    dequeue_count = msg.dequeue_count if msg.dequeue_count is not None else 1
+                    await _process_poison_message(message_data, dequeue_count)
+
+                    # Delete message after successful processing
+                    queue_client.delete_message(msg)
+                    processed += 1
+
+                except Exception as e:
+                    logger.error(
+                        "Error processing poison message in timer",
+                        extra={"error": str(e), "queue": poison_queue},
+                        exc_info=True
+                    )
+                    # Delete message anyway to prevent infinite loop
+                    queue_client.delete_message(msg)
+                    failed += 1
 
         if processed > 0 or failed > 0:
             logger.warning(
@@ -9,23 +9,57 @@ CANCELLATION BEHAVIOR:
 - Workflows should use 'await asyncio.sleep()' instead of 'time.sleep()' for cancellable delays
 - Long-running synchronous operations will complete before cancellation takes effect
 - If workflow code doesn't have await points, it cannot be cancelled until completion
+- Workflows declared with @workflow(isolation="process") run in a separate worker
+  process instead; cancellation and timeouts kill that process, so they apply
+  even to blocking code
+
+RETRIES:
+- Workflows declared with @workflow(retry_policy=...) are retried on failure by
+  re-sending the queue message with a visibility delay (exponential backoff with
+  jitter). The execution goes back to Pending between attempts and each attempt
+  is recorded in its attempt history, with references to its own logs and
+  variables blobs. Timeouts and cancellations are not retried.
+
+LANES:
+- Interactive, scheduled and bulk executions arrive on separate queues (see
+  shared.execution_lanes), each with its own trigger below. Executions over
+  their organization's per-lane cap are deferred back to their queue.
+
+CONCURRENCY LIMITS:
+- Workflows declaring max_concurrency or integrations with a configured limit
+  (see shared.concurrency_governor) take a lease before running. If a limit is
+  full, the message is deferred back to its queue instead of waiting in a slot.
 """
 
 import asyncio
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import azure.functions as func
 
+from shared.concurrency_governor import defer_delay_seconds, get_concurrency_governor, limits_for_workflow
 from shared.context import Caller, Organization
-from shared.discovery import load_workflow
+from shared.discovery import get_workflow_cache_stats, load_workflow
 from shared.engine import ExecutionRequest, execute
+from shared.execution_lanes import (
+    FAIR_SHARE_DEFER_SECONDS,
+    LANE_BULK,
+    LANE_INTERACTIVE,
+    LANE_QUEUES,
+    LANE_SCHEDULED,
+    record_start,
+    release_org_slot,
+    try_acquire_org_slot,
+)
 from shared.execution_logger import get_execution_logger
 from shared.middleware import load_config_for_partition
 from shared.models import ExecutionStatus
 from shared.repositories.executions import ExecutionRepository
+from shared.retry_policy import WorkflowRetryPolicy, parse_retry_policy
+from shared.services.temp_file_service import get_temp_file_service
 from shared.storage import get_organization_async
+from shared.workflow_process_pool import execute_in_process
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +70,12 @@ bp = func.Blueprint()
 @bp.function_name("workflow_execution_worker")
 @bp.queue_trigger(
     arg_name="msg",
-    queue_name="workflow-executions",
+    queue_name=LANE_QUEUES[LANE_INTERACTIVE],
     connection="AzureWebJobsStorage"
 )
 async def workflow_execution_worker(msg: func.QueueMessage) -> None:
     """
-    Process workflow execution messages from queue.
+    Process workflow execution messages from the interactive lane queue.
 
     Message format:
     {
@@ -52,10 +86,40 @@ async def workflow_execution_worker(msg: func.QueueMessage) -> None:
         "user_name": "User Name",
         "user_email": "user@example.com",
         "parameters": {},
-        "code": "base64-encoded-script" (optional, for inline scripts)
+        "code": "base64-encoded-script" (optional, for inline scripts),
+        "lane": "interactive" | "scheduled" | "bulk",
+        "enqueued_at": "ISO timestamp" (for lane wait-time metrics),
+        "attempt": 2 (optional, set on retries)
     }
     """
-    logger.info("Workflow execution worker invoked")
+    await _process_queue_message(msg, LANE_INTERACTIVE)
+
+
+@bp.function_name("workflow_execution_worker_scheduled")
+@bp.queue_trigger(
+    arg_name="msg",
+    queue_name=LANE_QUEUES[LANE_SCHEDULED],
+    connection="AzureWebJobsStorage"
+)
+async def workflow_execution_worker_scheduled(msg: func.QueueMessage) -> None:
+    """Process workflow execution messages from the scheduled lane queue"""
+    await _process_queue_message(msg, LANE_SCHEDULED)
+
+
+@bp.function_name("workflow_execution_worker_bulk")
+@bp.queue_trigger(
+    arg_name="msg",
+    queue_name=LANE_QUEUES[LANE_BULK],
+    connection="AzureWebJobsStorage"
+)
+async def workflow_execution_worker_bulk(msg: func.QueueMessage) -> None:
+    """Process workflow execution messages from the bulk lane queue"""
+    await _process_queue_message(msg, LANE_BULK)
+
+
+async def _process_queue_message(msg: func.QueueMessage, lane: str) -> None:
+    """Parse a lane queue message and handle it"""
+    logger.info(f"Workflow execution worker invoked ({lane} lane)")
     try:
         # Parse queue message
         message_body = msg.get_body().decode('utf-8')
@@ -63,6 +127,9 @@ async def workflow_execution_worker(msg: func.QueueMessage) -> None:
         message_data = json.loads(message_body)
         logger.info(f"Parsed message data: {message_data}")
 
+        # Messages enqueued before lanes existed carry no lane
+        message_data.setdefault("lane", lane)
+
         await handle_workflow_execution(message_data)
 
     except Exception as e:
@@ -83,12 +150,82 @@ async def handle_workflow_execution(message_data: dict) -> None:
     """
     Handle workflow execution message.
 
+    Claims a per-organization slot in the message's lane first. If the
+    organization is at its cap, the message is sent back to its lane with a
+    short visibility delay so other organizations' work runs in the meantime.
+    Workflow and integration concurrency limits are applied the same way.
+
+    Args:
+        message_data: Queue message data containing execution details
+    """
+    lane = message_data.get("lane") or LANE_INTERACTIVE
+    org_id = message_data.get("org_id")
+
+    if not try_acquire_org_slot(lane, org_id):
+        from shared.async_executor import requeue_workflow_execution
+
+        await requeue_workflow_execution(
+            message_data, int(message_data.get("attempt", 1)), FAIR_SHARE_DEFER_SECONDS
+        )
+        logger.info(
+            f"Deferred execution {message_data.get('execution_id')}: "
+            f"organization at its {lane} lane concurrency cap",
+            extra={"execution_id": message_data.get("execution_id"), "lane": lane, "org_id": org_id}
+        )
+        return
+
+    lease = None
+    try:
+        limits = _concurrency_limits(message_data)
+        if limits:
+            lease = await get_concurrency_governor().try_acquire(limits, message_data["execution_id"])
+            if lease is None:
+                from shared.async_executor import requeue_workflow_execution
+
+                await requeue_workflow_execution(
+                    message_data, int(message_data.get("attempt", 1)), defer_delay_seconds()
+                )
+                logger.info(
+                    f"Deferred execution {message_data.get('execution_id')}: concurrency limit reached",
+                    extra={
+                        "execution_id": message_data.get("execution_id"),
+                        "limits": [item.key for item in limits]
+                    }
+                )
+                return
+
+        record_start(lane, message_data.get("enqueued_at"))
+        await _run_workflow_execution(message_data)
+    finally:
+        if lease:
+            await lease.release()
+        release_org_slot(lane, org_id)
+
+
+def _concurrency_limits(message_data: dict) -> list:
+    """Concurrency limits for a queued workflow (scripts and unloadable workflows have none)"""
+    if message_data.get("code"):
+        return []
+    try:
+        loaded = load_workflow(message_data["workflow_name"])
+    except Exception:
+        # Load errors are reported by the execution itself
+        return []
+    return limits_for_workflow(loaded[1]) if loaded else []
+
+
+async def _run_workflow_execution(message_data: dict) -> None:
+    """
+    Run a queued workflow execution and record its outcome.
+
     Args:
         message_data: Queue message data containing execution details
     """
     execution_id: str = ""
     org_id: str | None = None
     user_id: str = ""
+    retry_policy: WorkflowRetryPolicy | None = None
+    attempt = int(message_data.get("attempt", 1))
     start_time = datetime.utcnow()
 
     exec_logger = get_execution_logger()
@@ -134,8 +271,6 @@ async def handle_workflow_execution(message_data: dict) -> None:
                     duration_ms=0,
                     webpubsub_broadcaster=broadcaster
                 )
-                # Close broadcaster before early return
-                broadcaster.close()
                 return
         finally:
             await exec_repo_check.close()
@@ -199,7 +334,6 @@ async def handle_workflow_execution(message_data: dict) -> None:
                         duration_ms=duration_ms,
                         webpubsub_broadcaster=broadcaster
                     )
-                    broadcaster.close()
                     return
 
                 workflow_func, metadata = result
@@ -222,10 +356,10 @@ async def handle_workflow_execution(message_data: dict) -> None:
                     duration_ms=duration_ms,
                     webpubsub_broadcaster=broadcaster
                 )
-                broadcaster.close()
                 return
 
         timeout_seconds = metadata.timeout_seconds if metadata else 1800  # Default 30 min
+        retry_policy = parse_retry_policy(metadata.retry_policy) if metadata else None
 
         # Build execution request for engine (reuse broadcaster initialized earlier)
         request = ExecutionRequest(
@@ -244,8 +378,13 @@ async def handle_workflow_execution(message_data: dict) -> None:
             broadcaster=broadcaster  # Pass Web PubSub broadcaster for real-time log streaming
         )
 
-        # Create execution task (not awaiting directly - monitoring loop will wait for it)
-        execution_task = asyncio.create_task(execute(request))
+        # Create execution task (not awaiting directly - monitoring loop will wait for it).
+        # Workflows declared with isolation="process" run in the worker process pool,
+        # where cancelling the task kills the process.
+        if metadata and metadata.isolation == "process":
+            execution_task = asyncio.create_task(execute_in_process(request))
+        else:
+            execution_task = asyncio.create_task(execute(request))
 
         # Monitoring loop for cancellation and timeout
         check_interval = 1.0  # Check every second
@@ -271,8 +410,6 @@ async def handle_workflow_execution(message_data: dict) -> None:
                     )
 
                     logger.info(f"Execution {execution_id} cancelled successfully")
-                    # Close broadcaster before early return
-                    broadcaster.close()
                     return
 
                 # Check for timeout
@@ -295,8 +432,6 @@ async def handle_workflow_execution(message_data: dict) -> None:
                     )
 
                     logger.info(f"Execution {execution_id} timed out")
-                    # Close broadcaster before early return
-                    broadcaster.close()
                     return
 
                 # Sleep before next check
@@ -305,6 +440,24 @@ async def handle_workflow_execution(message_data: dict) -> None:
             # Execution completed normally - get the result
             result = await execution_task
 
+            attempt_record = None
+            if retry_policy:
+                if (
+                    result.status == ExecutionStatus.FAILED
+                    and retry_policy.should_retry(attempt, result.error_type)
+                ):
+                    await _schedule_retry(
+                        message_data, retry_policy, attempt,
+                        result.error_type, result.error_message, result.duration_ms,
+                        broadcaster,
+                        logs=result.logs if result.logs else None,
+                        variables=result.variables if result.variables else None
+                    )
+                    return
+                attempt_record = _attempt_record(
+                    attempt, result.status, result.error_type, result.error_message
+                )
+
             # Update execution with result
             # NOTE: Broadcasts to both execution details and history are handled by update_execution
             await exec_logger.update_execution(
@@ -319,7 +472,8 @@ async def handle_workflow_execution(message_data: dict) -> None:
                 integration_calls=result.integration_calls,
                 logs=result.logs if result.logs else None,
                 variables=result.variables if result.variables else None,
-                webpubsub_broadcaster=broadcaster
+                webpubsub_broadcaster=broadcaster,
+                attempt=attempt_record
             )
 
             logger.info(
@@ -327,7 +481,9 @@ async def handle_workflow_execution(message_data: dict) -> None:
                 extra={
                     "execution_id": execution_id,
                     "status": result.status.value,
-                    "duration_ms": result.duration_ms
+                    "duration_ms": result.duration_ms,
+                    "lane": message_data.get("lane"),
+                    "workflow_cache": get_workflow_cache_stats()
                 }
             )
 
@@ -345,6 +501,18 @@ async def handle_workflow_execution(message_data: dict) -> None:
         end_time = datetime.utcnow()
         duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
+        # Transient failures outside the workflow (storage, config) follow the retry policy too
+        if retry_policy and retry_policy.should_retry(attempt, type(e).__name__):
+            try:
+                await _schedule_retry(
+                    message_data, retry_policy, attempt,
+                    type(e).__name__, str(e), duration_ms,
+                    broadcaster if 'broadcaster' in locals() else None
+                )
+                return
+            except Exception as retry_error:
+                logger.error(f"Failed to schedule retry for {execution_id}: {retry_error}")
+
         # Pass broadcaster if available for real-time UI updates
         await exec_logger.update_execution(
             execution_id=execution_id,
@@ -368,10 +536,86 @@ async def handle_workflow_execution(message_data: dict) -> None:
         )
 
     finally:
-        # Close broadcaster to prevent resource leaks
-        if 'broadcaster' in locals():
+        # The engine removes the execution's temp directory when it finishes; this
+        # covers process-isolated runs whose child was killed before it could
+        if execution_id:
             try:
-                broadcaster.close()
-                logger.debug(f"Closed broadcaster for execution {execution_id}")
+                await asyncio.to_thread(get_temp_file_service().remove_execution_directory, execution_id)
             except Exception as e:
-                logger.warning(f"Error closing broadcaster: {e}")
+                logger.warning(f"Error removing temp directory for execution {execution_id}: {e}")
+
+
+def _attempt_record(
+    attempt: int,
+    status: ExecutionStatus,
+    error_type: str | None,
+    error_message: str | None,
+    retry_delay_seconds: int | None = None
+) -> dict:
+    """Entry appended to an execution's attempt history"""
+    return {
+        "attempt": attempt,
+        "status": status.value,
+        "errorType": error_type,
+        "errorMessage": error_message,
+        "finishedAt": datetime.utcnow().isoformat(),
+        "retryDelaySeconds": retry_delay_seconds
+    }
+
+
+async def _schedule_retry(
+    message_data: dict,
+    policy: WorkflowRetryPolicy,
+    attempt: int,
+    error_type: str | None,
+    error_message: str | None,
+    duration_ms: int,
+    broadcaster,
+    logs: list | None = None,
+    variables: dict | None = None
+) -> None:
+    """
+    Re-queue a failed attempt with backoff and put the execution back to Pending.
+
+    The message is sent first so a failed status write cannot strand the
+    execution without a queued retry. The attempt's logs and variables are
+    stored in blobs of their own and referenced from its attempt record.
+    """
+    from shared.async_executor import requeue_workflow_execution
+
+    delay_seconds = policy.backoff_delay(attempt)
+    # Lane wait time for the retry counts from when it becomes visible
+    visible_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+    await requeue_workflow_execution(
+        {**message_data, "enqueued_at": visible_at.isoformat()}, attempt + 1, delay_seconds
+    )
+
+    await get_execution_logger().update_execution(
+        execution_id=message_data["execution_id"],
+        org_id=message_data["org_id"],
+        user_id=message_data["user_id"],
+        status=ExecutionStatus.PENDING,
+        error_message=(
+            f"Attempt {attempt} of {policy.max_attempts} failed: {error_message}. "
+            f"Retrying in {delay_seconds}s"
+        ),
+        error_type=error_type,
+        duration_ms=duration_ms,
+        logs=logs,
+        variables=variables,
+        webpubsub_broadcaster=broadcaster,
+        attempt=_attempt_record(
+            attempt, ExecutionStatus.FAILED, error_type, error_message, delay_seconds
+        )
+    )
+
+    logger.warning(
+        f"Execution {message_data['execution_id']} attempt {attempt} failed, "
+        f"retrying in {delay_seconds}s",
+        extra={
+            "execution_id": message_data["execution_id"],
+            "attempt": attempt,
+            "max_attempts": policy.max_attempts,
+            "error_type": error_type
+        }
+    )
@@ -0,0 +1,91 @@
+"""
+Temp Space Cleanup Timer
+Reclaims space under BIFROST_TEMP_LOCATION by age and size quota
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+
+import azure.functions as func
+
+from shared.services.temp_file_service import EXECUTIONS_DIR_NAME, TempFileService, get_temp_file_service
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint for temp cleanup timer
+bp = func.Blueprint()
+
+# Entries untouched for this long are deleted
+TEMP_MAX_AGE_HOURS = float(os.environ.get("BIFROST_TEMP_MAX_AGE_HOURS", "24"))
+# Size quota for BIFROST_TEMP_LOCATION; oldest entries are evicted above it
+TEMP_QUOTA_MB = int(os.environ.get("BIFROST_TEMP_QUOTA_MB", "10240"))
+# Maximum run time, so a huge tree cannot stall the timer
+TEMP_CLEANUP_TIME_BUDGET_SECONDS = 120
+
+
+def reclaim_temp_space() -> dict:
+    """
+    Reclaim temp space (blocking; run in a thread).
+
+    BIFROST_TEMP_LOCATION is reclaimed by age and quota. Execution directories
+    in the temp file service's own directory are reclaimed by age only, which
+    catches directories left behind by crashed workers.
+
+    Returns:
+        Dict of ReclaimStats per reclaimed directory
+    """
+    results = {}
+
+    temp_location = os.environ.get("BIFROST_TEMP_LOCATION")
+    if temp_location and os.path.isdir(temp_location):
+        results[temp_location] = TempFileService(temp_location).reclaim(
+            max_age_hours=TEMP_MAX_AGE_HOURS,
+            max_bytes=TEMP_QUOTA_MB * 1024 * 1024,
+            time_budget_seconds=TEMP_CLEANUP_TIME_BUDGET_SECONDS
+        )
+
+    executions_dir = get_temp_file_service().tmp_path / EXECUTIONS_DIR_NAME
+    is_covered = temp_location and executions_dir.is_relative_to(temp_location)
+    if executions_dir.is_dir() and not is_covered:
+        results[str(executions_dir)] = TempFileService(str(executions_dir)).reclaim(
+            max_age_hours=TEMP_MAX_AGE_HOURS,
+            time_budget_seconds=TEMP_CLEANUP_TIME_BUDGET_SECONDS
+        )
+
+    return results
+
+
+@bp.function_name("temp_cleanup")
+@bp.timer_trigger(schedule="0 */15 * * * *", arg_name="timer", run_on_startup=False)
+async def temp_cleanup(timer: func.TimerRequest) -> None:
+    """
+    Reclaim temp space every 15 minutes.
+
+    Deletes entries older than BIFROST_TEMP_MAX_AGE_HOURS, then evicts the
+    oldest entries until BIFROST_TEMP_LOCATION is under BIFROST_TEMP_QUOTA_MB.
+    """
+    start_time = datetime.utcnow()
+
+    try:
+        results = await asyncio.to_thread(reclaim_temp_space)
+
+        for path, stats in results.items():
+            logger.info(
+                f"Temp cleanup of {path}: deleted {stats.deleted} of {stats.scanned} entries, "
+                f"reclaimed {stats.bytes_reclaimed} bytes, {stats.bytes_remaining} bytes remaining"
+                f"{' (time budget reached)' if stats.timed_out else ''}",
+                extra={
+                    "temp_path": path,
+                    "entries_scanned": stats.scanned,
+                    "entries_deleted": stats.deleted,
+                    "bytes_reclaimed": stats.bytes_reclaimed,
+                    "bytes_remaining": stats.bytes_remaining,
+                    "timed_out": stats.timed_out,
+                    "duration_seconds": (datetime.utcnow() - start_time).total_seconds()
+                }
+            )
+
+    except Exception as e:
+        logger.error(f"Temp cleanup failed: {str(e)}", exc_info=True)
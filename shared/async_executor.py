@@ -3,29 +3,57 @@ Async Workflow Execution
 Handles queueing and execution of long-running workflows
 """
 
+import asyncio
 import json
 import logging
 import os
 import uuid
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
-from azure.storage.queue.aio import QueueServiceClient  # type: ignore[import-untyped]
+from azure.storage.queue.aio import QueueClient, QueueServiceClient  # type: ignore[import-untyped]
 from azure.storage.queue import TextBase64EncodePolicy  # type: ignore[import-untyped]
 
+from shared.execution_lanes import LANE_INTERACTIVE, queue_for_lane
 from shared.execution_logger import get_execution_logger
 from shared.models import ExecutionStatus
 from shared.context import ExecutionContext
 
 logger = logging.getLogger(__name__)
 
+# Interactive lane queue (see shared.execution_lanes for the other lanes)
 QUEUE_NAME = "workflow-executions"
 
+# Concurrent send_message calls per bulk enqueue (Azure Queues have no batch send)
+BULK_SEND_CONCURRENCY = 32
+
+# Long-lived queue clients: (connection string, queue) -> (event loop, client).
+# aio clients hold an HTTP session bound to the loop that created them.
+_shared_queue_clients: dict[tuple[str, str], tuple[asyncio.AbstractEventLoop, QueueClient]] = {}
+
+# Queues already created (or confirmed to exist) by this process
+_ensured_queues: set[tuple[str, str]] = set()
+
+
+@dataclass
+class ExecutionRequest:
+    """A single workflow execution to enqueue"""
+    context: ExecutionContext
+    workflow_name: str
+    parameters: dict[str, Any]
+    form_id: str | None = None
+    code_base64: str | None = None
+    batch_id: str | None = None
+    lane: str = LANE_INTERACTIVE
+
 
 class QueueClientContextManager:
     """Async context manager for Azure Storage Queue client"""
 
-    def __init__(self, connection_str: str):
+    def __init__(self, connection_str: str, queue_name: str = QUEUE_NAME):
         self.connection_str = connection_str
+        self.queue_name = queue_name
         self.queue_service = None
         self.queue_client = None
 
@@ -35,18 +63,18 @@ class QueueClientContextManager:
 
         # Use TextBase64EncodePolicy for proper Azure Functions queue compatibility
         self.queue_client = self.queue_service.get_queue_client(
-            QUEUE_NAME,
+            self.queue_name,
             message_encode_policy=TextBase64EncodePolicy()
         )
 
         # Auto-create queue if it doesn't exist
         try:
             await self.queue_client.create_queue()
-            logger.info(f"Created queue: {QUEUE_NAME}")
+            logger.info(f"Created queue: {self.queue_name}")
         except Exception as e:
             # Queue might already exist, that's fine
             if "QueueAlreadyExists" not in str(e):
-                logger.debug(f"Queue {QUEUE_NAME} status: {e}")
+                logger.debug(f"Queue {self.queue_name} status: {e}")
 
         return self.queue_client
 
@@ -57,10 +85,104 @@ class QueueClientContextManager:
         return False
 
 
-def get_queue_client():
-    """Get Azure Storage Queue client context manager for workflow executions"""
+class SharedQueueClientContextManager:
+    """
+    Async context manager handing out the process-wide queue client.
+
+    The client (and its connection pool) is created once per event loop and
+    the queue is only created on first use, so an enqueue is a single
+    send_message round trip. Exiting the context does not close the client.
+    """
+
+    def __init__(self, connection_str: str, queue_name: str = QUEUE_NAME):
+        self.connection_str = connection_str
+        self.queue_name = queue_name
+
+    async def __aenter__(self):
+        """Return the shared queue client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        key = (self.connection_str, self.queue_name)
+        cached = _shared_queue_clients.get(key)
+        if cached is not None and cached[0] is loop:
+            return cached[1]
+
+        if cached is not None:
+            # The previous loop's client can't be reused; release its transport
+            try:
+                await cached[1].close()
+            except Exception as e:
+                logger.debug(f"Error closing stale queue client: {e}")
+
+        queue_client = QueueClient.from_connection_string(
+            self.connection_str,
+            self.queue_name,
+            message_encode_policy=TextBase64EncodePolicy()
+        )
+
+        if key not in _ensured_queues:
+            try:
+                await queue_client.create_queue()
+                logger.info(f"Created queue: {self.queue_name}")
+            except Exception as e:
+                # Queue might already exist, that's fine
+                if "QueueAlreadyExists" not in str(e):
+                    logger.debug(f"Queue {self.queue_name} status: {e}")
+            _ensured_queues.add(key)
+
+        _shared_queue_clients[key] = (loop, queue_client)
+        return queue_client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Keep the shared client open for the next enqueue"""
+        return False
+
+
+def get_queue_client(shared: bool = False, queue_name: str = QUEUE_NAME):
+    """
+    Get Azure Storage Queue client context manager for workflow executions
+
+    Args:
+        shared: Reuse the long-lived process-wide client instead of opening
+            (and closing) a dedicated one
+        queue_name: Lane queue (defaults to the interactive lane)
+
+    Returns:
+        Async context manager yielding a queue client
+    """
     connection_str = os.environ.get("AzureWebJobsStorage", "UseDevelopmentStorage=true")
-    return QueueClientContextManager(connection_str)
+    if shared:
+        return SharedQueueClientContextManager(connection_str, queue_name)
+    return QueueClientContextManager(connection_str, queue_name)
+
+
+async def close_shared_queue_clients() -> None:
+    """Close long-lived queue clients (for shutdown and tests)"""
+    clients = list(_shared_queue_clients.values())
+    _shared_queue_clients.clear()
+    for _loop, queue_client in clients:
+        try:
+            await queue_client.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared queue client: {e}")
+
+
+def _build_queue_message(execution_id: str, request: ExecutionRequest) -> str:
+    """Serialize the queue message consumed by functions/queue/worker.py"""
+    context = request.context
+    return json.dumps({
+        "execution_id": execution_id,
+        "workflow_name": request.workflow_name,
+        "org_id": context.org_id,
+        "user_id": context.user_id,
+        "user_name": context.name,
+        "user_email": context.email,
+        "parameters": request.parameters,
+        "form_id": request.form_id,
+        "code": request.code_base64,  # Optional: for inline scripts
+        "lane": request.lane,
+        "enqueued_at": datetime.utcnow().isoformat()
+        # "attempt" is added by requeue_workflow_execution (absent = first attempt)
+    })
 
 
 async def enqueue_workflow_execution(
@@ -68,7 +190,8 @@ async def enqueue_workflow_execution(
     workflow_name: str,
     parameters: dict[str, Any],
     form_id: str | None = None,
-    code_base64: str | None = None
+    code_base64: str | None = None,
+    lane: str = LANE_INTERACTIVE
 ) -> str:
     """
     Enqueue a workflow or script for async execution.
@@ -82,20 +205,27 @@ async def enqueue_workflow_execution(
         parameters: Workflow/script parameters
         form_id: Optional form ID if triggered by form
         code_base64: Optional base64-encoded inline script code
+        lane: Priority lane ("interactive", "scheduled" or "bulk")
 
     Returns:
         execution_id: UUID of the queued execution
+
+    Raises:
+        ValueError: If the lane is unknown
     """
+    queue_name = queue_for_lane(lane)
+
     # Generate execution ID
     execution_id = str(uuid.uuid4())
 
-    # Create execution record with PENDING status
     exec_logger = get_execution_logger()
 
     # Initialize Web PubSub broadcaster for real-time updates
     from shared.webpubsub_broadcaster import WebPubSubBroadcaster
     broadcaster = WebPubSubBroadcaster()
 
+    # Write the execution and its indexes once, directly as PENDING (queued).
+    # Broadcasts the new execution to the history page.
     await exec_logger.create_execution(
         execution_id=execution_id,
         org_id=context.org_id,
@@ -104,42 +234,131 @@ async def enqueue_workflow_execution(
         workflow_name=workflow_name,
         input_data=parameters,
         form_id=form_id,
-        webpubsub_broadcaster=broadcaster
-    )
-
-    # Update status to PENDING (queued) - will broadcast to history page
-    await exec_logger.update_execution(
-        execution_id=execution_id,
-        org_id=context.org_id,
-        user_id=context.user_id,
-        status=ExecutionStatus.PENDING,
-        webpubsub_broadcaster=broadcaster
+        webpubsub_broadcaster=broadcaster,
+        status=ExecutionStatus.PENDING
     )
 
-    # Prepare queue message
-    message = {
-        "execution_id": execution_id,
-        "workflow_name": workflow_name,
-        "org_id": context.org_id,
-        "user_id": context.user_id,
-        "user_name": context.name,
-        "user_email": context.email,
-        "parameters": parameters,
-        "form_id": form_id,
-        "code": code_base64  # Optional: for inline scripts
-    }
+    message = _build_queue_message(execution_id, ExecutionRequest(
+        context=context,
+        workflow_name=workflow_name,
+        parameters=parameters,
+        form_id=form_id,
+        code_base64=code_base64,
+        lane=lane
+    ))
 
-    # Enqueue message with automatic cleanup
-    async with get_queue_client() as queue_client:
-        await queue_client.send_message(json.dumps(message))
+    # Enqueue on the long-lived client
+    async with get_queue_client(shared=True, queue_name=queue_name) as queue_client:
+        await queue_client.send_message(message)
 
     logger.info(
         f"Enqueued async workflow execution: {workflow_name}",
         extra={
             "execution_id": execution_id,
             "workflow_name": workflow_name,
-            "org_id": context.org_id
+            "org_id": context.org_id,
+            "lane": lane
         }
     )
 
     return execution_id
+
+
+async def enqueue_workflow_executions(requests: list[ExecutionRequest]) -> list[str]:
+    """
+    Enqueue many workflow executions in one call.
+
+    Execution records and indexes are written with per-partition batch
+    transactions, then queue messages are sent concurrently on the shared
+    queue client of each request's lane.
+
+    Args:
+        requests: Executions to enqueue (may span organizations and lanes)
+
+    Returns:
+        Execution IDs in request order
+
+    Raises:
+        ValueError: If a request's lane is unknown
+    """
+    if not requests:
+        return []
+
+    queue_names = {request.lane: queue_for_lane(request.lane) for request in requests}
+
+    execution_ids = [str(uuid.uuid4()) for _ in requests]
+
+    exec_logger = get_execution_logger()
+
+    from shared.webpubsub_broadcaster import WebPubSubBroadcaster
+    broadcaster = WebPubSubBroadcaster()
+
+    await exec_logger.create_executions(
+        [
+            {
+                "execution_id": execution_id,
+                "org_id": request.context.org_id,
+                "user_id": request.context.user_id,
+                "user_name": request.context.name,
+                "workflow_name": request.workflow_name,
+                "input_data": request.parameters,
+                "form_id": request.form_id,
+                "batch_id": request.batch_id,
+            }
+            for execution_id, request in zip(execution_ids, requests)
+        ],
+        webpubsub_broadcaster=broadcaster
+    )
+
+    semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+
+    async def send(execution_id: str, request: ExecutionRequest):
+        async with semaphore:
+            async with get_queue_client(shared=True, queue_name=queue_names[request.lane]) as queue_client:
+                await queue_client.send_message(_build_queue_message(execution_id, request))
+
+    await asyncio.gather(*(
+        send(execution_id, request) for execution_id, request in zip(execution_ids, requests)
+    ))
+
+    logger.info(
+        f"Enqueued {len(requests)} async workflow executions",
+        extra={"execution_count": len(requests)}
+    )
+
+    return execution_ids
+
+
+async def requeue_workflow_execution(
+    message_data: dict[str, Any],
+    attempt: int,
+    delay_seconds: int
+) -> None:
+    """
+    Re-send an execution's queue message for another attempt.
+
+    The message goes back to its lane's queue and stays invisible for
+    delay_seconds, so retry backoff and fair-share deferral cost no worker
+    time. The execution record is reused (same execution ID).
+
+    Args:
+        message_data: Original queue message (as consumed by the worker)
+        attempt: Number of the attempt the message will run (1-based)
+        delay_seconds: Visibility delay before a worker can pick it up
+    """
+    message = json.dumps({**message_data, "attempt": attempt})
+    queue_name = queue_for_lane(message_data.get("lane") or LANE_INTERACTIVE)
+
+    async with get_queue_client(shared=True, queue_name=queue_name) as queue_client:
+        await queue_client.send_message(message, visibility_timeout=delay_seconds)
+
+    logger.info(
+        f"Requeued workflow execution {message_data.get('execution_id')} "
+        f"for attempt {attempt} in {delay_seconds}s",
+        extra={
+            "execution_id": message_data.get("execution_id"),
+            "workflow_name": message_data.get("workflow_name"),
+            "attempt": attempt,
+            "delay_seconds": delay_seconds
+        }
+    )
@@ -3,6 +3,8 @@ Async Table Storage Service for Bifrost Integrations
 Provides async wrappers around Azure Table Storage operations with context-aware scoping
 """
 
+import asyncio
+import json
 import logging
 import os
 from datetime import datetime
@@ -25,6 +27,44 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Azure Table Storage entity group transactions: max 100 operations and 4 MiB
+# of payload, single partition
+MAX_BATCH_OPERATIONS = 100
+MAX_BATCH_PAYLOAD_BYTES = 4 * 1024 * 1024
+
+# Payload budget per transaction, leaving room for the multipart envelope
+# (estimated at _BATCH_OPERATION_OVERHEAD_BYTES per operation)
+_BATCH_PAYLOAD_BUDGET_BYTES = MAX_BATCH_PAYLOAD_BYTES - 64 * 1024
+_BATCH_OPERATION_OVERHEAD_BYTES = 1024
+
+# Transactions in flight at once per insert_entities_batch call
+MAX_CONCURRENT_TRANSACTIONS = 8
+
+
+def _chunk_transaction_entities(entities: list[dict]) -> list[list[dict]]:
+    """
+    Split one partition's entities into transactions within the operation and payload limits.
+
+    Args:
+        entities: Serialized entities of a single partition
+
+    Returns:
+        Entity lists, one per transaction, in input order
+    """
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    current_bytes = 0
+    for entity in entities:
+        size = len(json.dumps(entity, default=str).encode("utf-8")) + _BATCH_OPERATION_OVERHEAD_BYTES
+        if current and (len(current) >= MAX_BATCH_OPERATIONS or current_bytes + size > _BATCH_PAYLOAD_BUDGET_BYTES):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(entity)
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class AsyncTableStorageService:
     """
@@ -562,21 +602,31 @@ class AsyncTableStorageService:
             logger.error(f"Failed to query entities (paged): {str(e)}")
             raise
 
-    async def delete_entity(self, partition_key: str, row_key: str) -> bool:
+    async def delete_entity(self, partition_key: str, row_key: str, etag: str | None = None) -> bool:
         """
         Delete an entity
 
         Args:
             partition_key: The partition key
             row_key: The row key
+            etag: Only delete if the entity still has this ETag (from get_entity)
 
         Returns:
             True if deleted, False if not found
+
+        Raises:
+            ResourceModifiedError: If etag is given and the entity was modified since read
         """
         try:
-            await self.table_client.delete_entity(
-                partition_key=partition_key, row_key=row_key
-            )
+            if etag is not None:
+                await self.table_client.delete_entity(
+                    partition_key=partition_key, row_key=row_key,
+                    etag=etag, match_condition=MatchConditions.IfNotModified
+                )
+            else:
+                await self.table_client.delete_entity(
+                    partition_key=partition_key, row_key=row_key
+                )
 
             logger.info(
                 f"Deleted entity: {self.table_name} PK={partition_key} RK={row_key}"
@@ -591,10 +641,74 @@ class AsyncTableStorageService:
             )
             return False
 
+        except ResourceModifiedError:
+            logger.warning(
+                f"Entity was modified by another process (ETag mismatch): {self.table_name} "
+                f"PK={partition_key} RK={row_key}"
+            )
+            raise
+
         except Exception as e:
             logger.error(f"Failed to delete entity: {str(e)}")
             raise
 
+    async def insert_entities_batch(self, entities: list[dict]) -> list[dict]:
+        """
+        Insert many entities using entity group transactions.
+
+        Entities are grouped by PartitionKey and sent in transactions of up to
+        MAX_BATCH_OPERATIONS entities and MAX_BATCH_PAYLOAD_BYTES, so N rows in
+        one partition cost about ceil(N/100) round trips instead of N. Each
+        transaction is atomic; transactions for different partitions/chunks are
+        independent and sent concurrently, at most MAX_CONCURRENT_TRANSACTIONS
+        at a time.
+
+        Args:
+            entities: Entity dictionaries with RowKey (PartitionKey auto-applied if context provided)
+
+        Returns:
+            The inserted entities
+
+        Raises:
+            TableTransactionError: If any operation in a transaction fails
+            ValueError: If PartitionKey or RowKey is missing
+        """
+        partitions: dict[str, list[dict]] = {}
+        prepared = []
+        for entity in entities:
+            entity = self._apply_partition_key(entity)
+            if "PartitionKey" not in entity or "RowKey" not in entity:
+                raise ValueError("Entity must have PartitionKey and RowKey")
+            entity = self._serialize_datetime_fields(entity)
+            partitions.setdefault(entity["PartitionKey"], []).append(entity)
+            prepared.append(entity)
+
+        transactions = [
+            [("create", entity) for entity in chunk]
+            for partition_entities in partitions.values()
+            for chunk in _chunk_transaction_entities(partition_entities)
+        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSACTIONS)
+
+        async def submit(operations: list) -> None:
+            async with semaphore:
+                await self.table_client.submit_transaction(operations)
+
+        try:
+            # Independent transactions (different partitions/chunks) go out concurrently
+            await asyncio.gather(*(submit(operations) for operations in transactions))
+
+            logger.info(
+                f"Batch inserted {len(prepared)} entities: {self.table_name} "
+                f"({len(partitions)} partition(s), {len(transactions)} transaction(s))"
+            )
+
+            return prepared
+
+        except Exception as e:
+            logger.error(f"Failed to batch insert entities: {str(e)}")
+            raise
+
     # Helper methods
 
     async def query_by_org(
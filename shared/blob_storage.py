@@ -4,17 +4,29 @@ Handles large execution data (logs, results, snapshots) that exceed Table Storag
 """
 
 import asyncio
+import gzip
 import json
 import logging
+import math
 import os
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
-from azure.core.exceptions import ResourceExistsError
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ResourceNotModifiedError,
+)
 from azure.storage.blob.aio import BlobServiceClient, ContainerClient
 from azure.storage.blob import BlobSasPermissions, ContentSettings, generate_blob_sas
 
+from shared.json_codec import dumps_bytes
+
 logger = logging.getLogger(__name__)
 
 # Container for execution-related data
@@ -24,6 +36,121 @@ EXECUTION_CONTAINER = "execution-data"
 _container_locks: dict[str, asyncio.Lock] = {}
 _container_locks_lock = asyncio.Lock()
 
+# Execution log and variable blobs: gzip-compressed NDJSON, plus the legacy JSON documents
+LOGS_BLOB = "logs.ndjson.gz"
+VARIABLES_BLOB = "variables.ndjson.gz"
+LEGACY_LOGS_BLOB = "logs.json"
+LEGACY_VARIABLES_BLOB = "variables.json"
+NDJSON_FORMAT = "ndjson+gzip"
+
+# Lines per independently decodable gzip chunk (raised for huge blobs so the
+# chunk index stays within NDJSON_MAX_CHUNKS offsets of blob metadata)
+NDJSON_CHUNK_LINES = 200
+NDJSON_MAX_CHUNKS = 256
+
+# Raw blob bytes kept for conditional (If-None-Match) re-reads
+BLOB_READ_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_blob_read_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+
+def _execution_blob_path(execution_id: str, name: str, attempt: int | None = None) -> str:
+    """Blob path of an execution's data (attempts that were retried keep their own folder)"""
+    if attempt is None:
+        return f"{execution_id}/{name}"
+    return f"{execution_id}/attempts/{attempt}/{name}"
+
+
+@dataclass
+class _NdjsonIndex:
+    """Chunk index of an NDJSON blob, stored in its metadata"""
+    lines: int
+    chunk_lines: int
+    offsets: list[int]
+
+    def to_metadata(self) -> dict[str, str]:
+        return {
+            "format": NDJSON_FORMAT,
+            "lines": str(self.lines),
+            "chunklines": str(self.chunk_lines),
+            "offsets": ",".join(str(offset) for offset in self.offsets)
+        }
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, str]) -> "_NdjsonIndex":
+        offsets = metadata.get("offsets") or ""
+        return cls(
+            lines=int(metadata.get("lines") or 0),
+            chunk_lines=int(metadata.get("chunklines") or NDJSON_CHUNK_LINES),
+            offsets=[int(offset) for offset in offsets.split(",") if offset]
+        )
+
+
+def _encode_ndjson(records: list[Any]) -> tuple[bytes, _NdjsonIndex]:
+    """Encode records as concatenated gzip members of NDJSON lines"""
+    chunk_lines = max(NDJSON_CHUNK_LINES, math.ceil(len(records) / NDJSON_MAX_CHUNKS))
+    members: list[bytes] = []
+    offsets: list[int] = []
+    position = 0
+
+    for start in range(0, len(records), chunk_lines):
+        body = b"".join(dumps_bytes(record) + b"\n" for record in records[start:start + chunk_lines])
+        member = gzip.compress(body, mtime=0)
+        offsets.append(position)
+        position += len(member)
+        members.append(member)
+
+    if not members:
+        members.append(gzip.compress(b"", mtime=0))
+
+    return b"".join(members), _NdjsonIndex(len(records), chunk_lines, offsets)
+
+
+def _decode_ndjson(data: bytes) -> list[Any]:
+    """Decode gzip-compressed NDJSON (any run of whole members from a blob)"""
+    return [json.loads(line) for line in gzip.decompress(data).splitlines() if line]
+
+
+async def _download_cached(blob_client: Any, blob_path: str) -> bytes | None:
+    """
+    Download a blob, revalidating a cached copy with If-None-Match.
+
+    Returns:
+        Blob bytes, or None if the blob does not exist
+    """
+    cached = _blob_read_cache.get(blob_path)
+    conditions = {"etag": cached[0], "match_condition": MatchConditions.IfModified} if cached else {}
+
+    try:
+        download_stream = await blob_client.download_blob(**conditions)
+        data = await download_stream.readall()
+    except ResourceNotFoundError:
+        _forget_cached_blob(blob_path)
+        return None
+    except HttpResponseError as e:
+        # The storage SDK surfaces 304 Not Modified as a plain HttpResponseError
+        if not cached or (e.status_code != 304 and not isinstance(e, ResourceNotModifiedError)):
+            raise
+        _blob_read_cache.move_to_end(blob_path)
+        return cached[1]
+
+    etag = download_stream.properties.etag
+    if etag and len(data) <= BLOB_READ_CACHE_MAX_BYTES:
+        _blob_read_cache[blob_path] = (etag, data)
+        _blob_read_cache.move_to_end(blob_path)
+        while sum(len(value) for _, value in _blob_read_cache.values()) > BLOB_READ_CACHE_MAX_BYTES:
+            _blob_read_cache.popitem(last=False)
+
+    return data
+
+
+def _forget_cached_blob(blob_path: str) -> None:
+    _blob_read_cache.pop(blob_path, None)
+
+
+def clear_blob_read_cache() -> None:
+    """Drop cached blob copies (used in tests)"""
+    _blob_read_cache.clear()
+
 
 class BlobStorageService:
     """
@@ -126,28 +253,28 @@ class BlobStorageService:
 
         return container_client
 
-    async def upload_logs(self, execution_id: str, logs: list[dict[str, Any]]) -> str:
+    async def upload_logs(
+        self, execution_id: str, logs: list[dict[str, Any]], attempt: int | None = None
+    ) -> str:
         """
-        Upload execution logs to blob storage
+        Upload execution logs to blob storage as compressed NDJSON
+
+        One log entry per line, gzip-compressed in independently decodable
+        chunks; the chunk offsets are kept in the blob metadata so the
+        latest lines can be read with a single range request (see get_logs_tail).
 
         Args:
             execution_id: Execution ID (UUID)
             logs: List of log entries (each with timestamp, level, message, data)
+            attempt: Store as this retried attempt's logs instead of the execution's
 
         Returns:
-            Blob path (e.g., "abc-123/logs.json")
+            Blob path (e.g., "abc-123/logs.ndjson.gz" or "abc-123/attempts/1/logs.ndjson.gz")
         """
-        blob_path = f"{execution_id}/logs.json"
+        blob_path = _execution_blob_path(execution_id, LOGS_BLOB, attempt)
 
         try:
-            await self._ensure_container_exists(EXECUTION_CONTAINER)
-            container_client = self.blob_service_client.get_container_client(
-                EXECUTION_CONTAINER)
-            blob_client = container_client.get_blob_client(blob_path)
-
-            # Upload as JSON
-            logs_json = json.dumps(logs, indent=2)
-            await blob_client.upload_blob(logs_json, overwrite=True)
+            await self._upload_ndjson(blob_path, logs)
 
             logger.info(
                 f"Uploaded logs to blob storage: {blob_path}",
@@ -164,36 +291,31 @@ class BlobStorageService:
             )
             raise
 
-    async def get_logs(self, execution_id: str) -> list[dict[str, Any]] | None:
+    async def get_logs(self, execution_id: str, attempt: int | None = None) -> list[dict[str, Any]] | None:
         """
         Retrieve execution logs from blob storage
 
+        Reads the compressed NDJSON blob, falling back to the legacy
+        logs.json document for executions stored before it.
+
         Args:
             execution_id: Execution ID (UUID)
+            attempt: Read a retried attempt's logs instead of the execution's
 
         Returns:
             List of log entries or None if not found
         """
-        blob_path = f"{execution_id}/logs.json"
-
         try:
-            await self._ensure_container_exists(EXECUTION_CONTAINER)
-            container_client = self.blob_service_client.get_container_client(
-                EXECUTION_CONTAINER)
-            blob_client = container_client.get_blob_client(blob_path)
-
-            exists = await blob_client.exists()
-            if not exists:
-                logger.debug(f"Logs blob not found: {blob_path}")
+            logs = await self._read_blob(
+                _execution_blob_path(execution_id, LOGS_BLOB, attempt),
+                _execution_blob_path(execution_id, LEGACY_LOGS_BLOB, attempt)
+            )
+            if logs is None:
+                logger.debug(f"Logs blob not found for execution {execution_id}")
                 return None
 
-            # Download and parse JSON
-            download_stream = await blob_client.download_blob()
-            blob_data = await download_stream.readall()
-            logs = json.loads(blob_data)
-
             logger.debug(
-                f"Retrieved logs from blob storage: {blob_path}",
+                f"Retrieved logs from blob storage for execution {execution_id}",
                 extra={"execution_id": execution_id, "log_count": len(logs)}
             )
 
@@ -207,13 +329,68 @@ class BlobStorageService:
             )
             return None
 
-    async def upload_result(self, execution_id: str, result: dict[str, Any] | list[Any] | str) -> str:
+    async def get_logs_tail(self, execution_id: str, count: int) -> list[dict[str, Any]] | None:
+        """
+        Retrieve the latest log entries without downloading the whole blob
+
+        Uses the chunk index in the blob metadata to download only the
+        chunks holding the last `count` lines (legacy logs.json blobs are
+        downloaded in full).
+
+        Args:
+            execution_id: Execution ID (UUID)
+            count: Number of entries to return
+
+        Returns:
+            Up to `count` most recent log entries, or None if not found
+        """
+        blob_path = f"{execution_id}/{LOGS_BLOB}"
+
+        try:
+            container_client = await self._ensure_container_exists(EXECUTION_CONTAINER)
+            blob_client = container_client.get_blob_client(blob_path)
+
+            try:
+                properties = await blob_client.get_blob_properties()
+            except ResourceNotFoundError:
+                logs = await self.get_logs(execution_id)
+                return logs[max(len(logs) - count, 0):] if logs is not None else None
+
+            index = _NdjsonIndex.from_metadata(properties.metadata)
+            first_line = max(index.lines - count, 0)
+            chunk = min(first_line // index.chunk_lines, len(index.offsets) - 1)
+            offset = index.offsets[chunk] if index.offsets else 0
+
+            download_stream = await blob_client.download_blob(
+                offset=offset,
+                etag=properties.etag,
+                match_condition=MatchConditions.IfNotModified
+            )
+            lines = _decode_ndjson(await download_stream.readall())
+            return lines[max(len(lines) - count, 0):]
+
+        except Exception as e:
+            logger.error(
+                f"Failed to retrieve log tail from blob storage: {str(e)}",
+                extra={"execution_id": execution_id},
+                exc_info=True
+            )
+            return None
+
+    async def upload_result(
+        self,
+        execution_id: str,
+        result: dict[str, Any] | list[Any] | str,
+        encoded: bytes | None = None
+    ) -> str:
         """
         Upload execution result to blob storage
 
         Args:
             execution_id: Execution ID (UUID)
             result: Result data (dict/list for JSON, str for HTML/text)
+            encoded: Result already encoded to bytes (UTF-8 text or compact
+                JSON), uploaded as-is instead of encoding it again
 
         Returns:
             Blob path (e.g., "abc-123/result.json" or "abc-123/result.html")
@@ -223,13 +400,12 @@ class BlobStorageService:
             # Check if it looks like HTML
             if result.strip().startswith('<') and '>' in result:
                 blob_path = f"{execution_id}/result.html"
-                content = result
             else:
                 blob_path = f"{execution_id}/result.txt"
-                content = result
+            content = encoded if encoded is not None else result
         else:
             blob_path = f"{execution_id}/result.json"
-            content = json.dumps(result, indent=2)
+            content = encoded if encoded is not None else dumps_bytes(result)
 
         try:
             await self._ensure_container_exists(EXECUTION_CONTAINER)
@@ -331,8 +507,7 @@ class BlobStorageService:
             blob_client = container_client.get_blob_client(blob_path)
 
             # Upload as JSON
-            snapshot_json = json.dumps(snapshot, indent=2)
-            await blob_client.upload_blob(snapshot_json, overwrite=True)
+            await blob_client.upload_blob(dumps_bytes(snapshot), overwrite=True)
 
             logger.info(
                 f"Uploaded snapshot to blob storage: {blob_path}",
@@ -392,28 +567,26 @@ class BlobStorageService:
             )
             return None
 
-    async def upload_variables(self, execution_id: str, variables: dict[str, Any]) -> str:
+    async def upload_variables(
+        self, execution_id: str, variables: dict[str, Any], attempt: int | None = None
+    ) -> str:
         """
-        Upload execution variables to blob storage
+        Upload execution variables to blob storage as compressed NDJSON
+
+        Each line is a [name, value] pair.
 
         Args:
             execution_id: Execution ID (UUID)
             variables: Dictionary of captured variables
+            attempt: Store as this retried attempt's variables instead of the execution's
 
         Returns:
-            Blob path (e.g., "abc-123/variables.json")
+            Blob path (e.g., "abc-123/variables.ndjson.gz" or "abc-123/attempts/1/variables.ndjson.gz")
         """
-        blob_path = f"{execution_id}/variables.json"
+        blob_path = _execution_blob_path(execution_id, VARIABLES_BLOB, attempt)
 
         try:
-            await self._ensure_container_exists(EXECUTION_CONTAINER)
-            container_client = self.blob_service_client.get_container_client(
-                EXECUTION_CONTAINER)
-            blob_client = container_client.get_blob_client(blob_path)
-
-            # Upload as JSON
-            variables_json = json.dumps(variables, indent=2)
-            await blob_client.upload_blob(variables_json, overwrite=True)
+            await self._upload_ndjson(blob_path, [[name, value] for name, value in variables.items()])
 
             logger.info(
                 f"Uploaded variables to blob storage: {blob_path}",
@@ -431,36 +604,34 @@ class BlobStorageService:
             )
             raise
 
-    async def get_variables(self, execution_id: str) -> dict[str, Any] | None:
+    async def get_variables(self, execution_id: str, attempt: int | None = None) -> dict[str, Any] | None:
         """
         Retrieve execution variables from blob storage
 
+        Reads the compressed NDJSON blob, falling back to the legacy
+        variables.json document for executions stored before it.
+
         Args:
             execution_id: Execution ID (UUID)
+            attempt: Read a retried attempt's variables instead of the execution's
 
         Returns:
             Dictionary of variables or None if not found
         """
-        blob_path = f"{execution_id}/variables.json"
-
         try:
-            await self._ensure_container_exists(EXECUTION_CONTAINER)
-            container_client = self.blob_service_client.get_container_client(
-                EXECUTION_CONTAINER)
-            blob_client = container_client.get_blob_client(blob_path)
-
-            exists = await blob_client.exists()
-            if not exists:
-                logger.debug(f"Variables blob not found: {blob_path}")
+            variables = await self._read_blob(
+                _execution_blob_path(execution_id, VARIABLES_BLOB, attempt),
+                _execution_blob_path(execution_id, LEGACY_VARIABLES_BLOB, attempt)
+            )
+            if variables is None:
+                logger.debug(f"Variables blob not found for execution {execution_id}")
                 return None
 
-            # Download and parse JSON
-            download_stream = await blob_client.download_blob()
-            blob_data = await download_stream.readall()
-            variables = json.loads(blob_data)
+            if isinstance(variables, list):
+                variables = {name: value for name, value in variables}
 
             logger.debug(
-                f"Retrieved variables from blob storage: {blob_path}",
+                f"Retrieved variables from blob storage for execution {execution_id}",
                 extra={"execution_id": execution_id,
                        "variable_count": len(variables)}
             )
@@ -475,6 +646,43 @@ class BlobStorageService:
             )
             return None
 
+    async def _upload_ndjson(self, blob_path: str, records: list[Any]) -> None:
+        """Upload records as chunked, gzip-compressed NDJSON with the chunk index in metadata"""
+        container_client = await self._ensure_container_exists(EXECUTION_CONTAINER)
+        blob_client = container_client.get_blob_client(blob_path)
+
+        data, index = _encode_ndjson(records)
+        await blob_client.upload_blob(
+            data,
+            overwrite=True,
+            metadata=index.to_metadata(),
+            content_settings=ContentSettings(content_type="application/x-ndjson")
+        )
+        _forget_cached_blob(blob_path)
+
+    async def _read_blob(self, blob_path: str, legacy_path: str) -> Any | None:
+        """
+        Read an NDJSON blob, or its legacy JSON document if it does not exist.
+
+        Downloads are conditional (If-None-Match) on a cached copy, so
+        re-reading an unchanged blob costs a 304 instead of a download, and
+        a missing blob costs one failed GET instead of an exists() probe.
+
+        Returns:
+            List of NDJSON records, the decoded legacy document, or None if neither exists
+        """
+        container_client = await self._ensure_container_exists(EXECUTION_CONTAINER)
+
+        data = await _download_cached(container_client.get_blob_client(blob_path), blob_path)
+        if data is not None:
+            return _decode_ndjson(data)
+
+        data = await _download_cached(container_client.get_blob_client(legacy_path), legacy_path)
+        if data is not None:
+            return json.loads(data)
+
+        return None
+
     async def generate_upload_url(
         self,
         file_name: str,
@@ -0,0 +1,309 @@
+"""
+Concurrency Governor
+Declarative concurrency limits for queued workflow executions.
+
+Limits come from two places:
+- @workflow(max_concurrency=N): executions of that workflow running at once
+- @workflow(integrations=["halopsa"]) together with INTEGRATION_CONCURRENCY_LIMITS
+  (e.g. "halopsa=5,msgraph=20"): executions of any workflow calling that
+  integration running at once
+
+The queue worker asks the governor for a lease covering all of an execution's
+limits before running it. If any limit is full, nothing is held and the
+message is deferred back to its lane queue with a visibility delay, so excess
+work waits in the queue instead of occupying worker slots.
+
+Two backends (WORKFLOW_CONCURRENCY_MODE):
+- "process" (default): counters in this worker process
+- "table": leases in table storage shared by every worker instance. Each
+  limit has N slot rows; a slot is claimed by inserting its row (or taking
+  over an expired one with an ETag match) and renewed while the execution
+  runs, so slots held by a crashed worker expire after LEASE_SECONDS.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_MODE = os.environ.get("WORKFLOW_CONCURRENCY_MODE", "process")
+
+# Base visibility delay for executions deferred by a full limit (jitter is added)
+CONCURRENCY_DEFER_SECONDS = int(os.environ.get("WORKFLOW_CONCURRENCY_DEFER_SECONDS", "10"))
+
+# Table-storage lease duration; leases are renewed at a third of this interval
+LEASE_SECONDS = int(os.environ.get("WORKFLOW_CONCURRENCY_LEASE_SECONDS", "60"))
+
+LEASE_TABLE = "Config"
+LEASE_PARTITION = "CONCURRENCY"
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimit:
+    """A named limit (e.g. "workflow:sync_users" or "integration:halopsa")"""
+    key: str
+    limit: int
+
+
+def parse_integration_limits(value: str | None) -> dict[str, int]:
+    """
+    Parse INTEGRATION_CONCURRENCY_LIMITS ("name=limit,name=limit").
+
+    Args:
+        value: Setting value (None or empty = no integration limits)
+
+    Returns:
+        Lowercased integration name -> limit
+
+    Raises:
+        ValueError: If an entry is malformed or a limit is below 1
+    """
+    limits: dict[str, int] = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, limit = entry.partition("=")
+        if not sep or not name.strip() or not limit.strip().isdigit() or int(limit) < 1:
+            raise ValueError(f"Invalid INTEGRATION_CONCURRENCY_LIMITS entry '{entry}' (expected name=limit)")
+        limits[name.strip().lower()] = int(limit)
+    return limits
+
+
+INTEGRATION_LIMITS = parse_integration_limits(os.environ.get("INTEGRATION_CONCURRENCY_LIMITS"))
+
+
+def limits_for_workflow(metadata: Any) -> list[ConcurrencyLimit]:
+    """
+    Concurrency limits that apply to a workflow's executions.
+
+    Args:
+        metadata: WorkflowMetadata from discovery
+
+    Returns:
+        Limits sorted by key (the order leases are acquired in)
+    """
+    limits = []
+    max_concurrency = getattr(metadata, "max_concurrency", None)
+    if max_concurrency:
+        limits.append(ConcurrencyLimit(f"workflow:{metadata.name}", max_concurrency))
+    for integration in getattr(metadata, "integrations", None) or []:
+        limit = INTEGRATION_LIMITS.get(integration.lower())
+        if limit:
+            limits.append(ConcurrencyLimit(f"integration:{integration.lower()}", limit))
+    return sorted(limits, key=lambda item: item.key)
+
+
+def defer_delay_seconds() -> int:
+    """Visibility delay for a deferred execution (jittered so deferred work does not return in lockstep)"""
+    return CONCURRENCY_DEFER_SECONDS + random.randint(0, max(1, CONCURRENCY_DEFER_SECONDS // 2))
+
+
+class ConcurrencyLease:
+    """Slots held for one execution; release() frees all of them"""
+
+    def __init__(self, governor: "ProcessConcurrencyGovernor | TableConcurrencyGovernor", holder: str, slots: list[Any]):
+        self._governor = governor
+        self.holder = holder
+        self.slots = slots
+        self._released = False
+
+    async def release(self) -> None:
+        """Release every slot (idempotent)"""
+        if self._released:
+            return
+        self._released = True
+        await self._governor._release(self)
+
+
+class ProcessConcurrencyGovernor:
+    """Limits enforced with counters in this worker process"""
+
+    def __init__(self):
+        self._in_use: dict[str, int] = {}
+        self.deferred = 0
+
+    async def try_acquire(self, limits: list[ConcurrencyLimit], holder: str) -> ConcurrencyLease | None:
+        """
+        Claim one slot under every limit, or nothing.
+
+        Args:
+            limits: Limits for the execution
+            holder: Execution ID
+
+        Returns:
+            ConcurrencyLease, or None if any limit is full
+        """
+        if any(self._in_use.get(item.key, 0) >= item.limit for item in limits):
+            self.deferred += 1
+            return None
+        for item in limits:
+            self._in_use[item.key] = self._in_use.get(item.key, 0) + 1
+        return ConcurrencyLease(self, holder, [item.key for item in limits])
+
+    async def _release(self, lease: ConcurrencyLease) -> None:
+        for key in lease.slots:
+            remaining = self._in_use.get(key, 0) - 1
+            if remaining > 0:
+                self._in_use[key] = remaining
+            else:
+                self._in_use.pop(key, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """In-use counts per limit key and total deferrals"""
+        return {"mode": "process", "inUse": dict(self._in_use), "deferred": self.deferred}
+
+
+class TableConcurrencyGovernor:
+    """Limits enforced with lease rows in table storage (shared by all worker instances)"""
+
+    def __init__(self, lease_seconds: int = LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+        self.deferred = 0
+        self._renewals: dict[int, asyncio.Task] = {}
+
+    def _service(self):
+        from shared.async_storage import get_async_table_storage_service
+        return get_async_table_storage_service(LEASE_TABLE)
+
+    async def _claim_slot(self, item: ConcurrencyLimit, holder: str) -> str | None:
+        """Claim a free or expired slot row for a limit; returns its RowKey"""
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+        service = self._service()
+        now = datetime.utcnow()
+        expires_at = (now + timedelta(seconds=self.lease_seconds)).isoformat()
+
+        # Start at a random slot so concurrent claimers spread out
+        start = random.randrange(item.limit)
+        for offset in range(item.limit):
+            row_key = f"lease:{item.key}:{(start + offset) % item.limit}"
+            entity = await service.get_entity(LEASE_PARTITION, row_key)
+            try:
+                if entity is None:
+                    await service.insert_entity({
+                        "PartitionKey": LEASE_PARTITION,
+                        "RowKey": row_key,
+                        "Holder": holder,
+                        "ExpiresAt": expires_at
+                    })
+                    return row_key
+                if entity.get("ExpiresAt", "") < now.isoformat():
+                    entity["Holder"] = holder
+                    entity["ExpiresAt"] = expires_at
+                    await service.update_entity_with_etag(entity)
+                    return row_key
+            except (ResourceExistsError, ResourceModifiedError):
+                continue
+        return None
+
+    async def try_acquire(self, limits: list[ConcurrencyLimit], holder: str) -> ConcurrencyLease | None:
+        """
+        Claim one lease slot under every limit, or nothing.
+
+        Args:
+            limits: Limits for the execution (claimed in key order)
+            holder: Execution ID
+
+        Returns:
+            ConcurrencyLease (renewed in the background until released), or None if any limit is full
+        """
+        claimed: list[str] = []
+        for item in limits:
+            row_key = await self._claim_slot(item, holder)
+            if row_key is None:
+                lease = ConcurrencyLease(self, holder, claimed)
+                await lease.release()
+                self.deferred += 1
+                return None
+            claimed.append(row_key)
+
+        lease = ConcurrencyLease(self, holder, claimed)
+        if claimed:
+            self._renewals[id(lease)] = asyncio.create_task(self._renew(lease))
+        return lease
+
+    async def _renew(self, lease: ConcurrencyLease) -> None:
+        """Extend the lease rows until the lease is released"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await self._renew_once(lease)
+
+    async def _renew_once(self, lease: ConcurrencyLease) -> None:
+        """
+        Extend each slot row still held by the lease (ETag read-modify-write).
+
+        A slot whose row is gone, has another holder or changes between the
+        read and the write was taken over after expiring; it is dropped from
+        the lease so it is neither renewed nor released again.
+        """
+        from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
+
+        service = self._service()
+        expires_at = (datetime.utcnow() + timedelta(seconds=self.lease_seconds)).isoformat()
+        for row_key in list(lease.slots):
+            try:
+                entity = await service.get_entity(LEASE_PARTITION, row_key)
+                held = entity is not None and entity.get("Holder") == lease.holder
+                if held:
+                    entity["ExpiresAt"] = expires_at
+                    await service.update_entity_with_etag(entity)
+            except (ResourceModifiedError, ResourceNotFoundError):
+                held = False
+            except Exception as e:
+                logger.warning(f"Failed to renew concurrency lease {row_key} for {lease.holder}: {e}")
+                continue
+
+            if not held:
+                lease.slots.remove(row_key)
+                logger.warning(f"Lost concurrency lease {row_key} for {lease.holder} (taken over after expiring)")
+
+    async def _release(self, lease: ConcurrencyLease) -> None:
+        from azure.core.exceptions import ResourceModifiedError
+
+        task = self._renewals.pop(id(lease), None)
+        if task:
+            task.cancel()
+
+        service = self._service()
+        for row_key in lease.slots:
+            try:
+                entity = await service.get_entity(LEASE_PARTITION, row_key)
+                if entity and entity.get("Holder") == lease.holder:
+                    await service.delete_entity(LEASE_PARTITION, row_key, etag=entity.get("etag"))
+            except ResourceModifiedError:
+                # Taken over after expiring between the read and the delete - no longer ours
+                logger.info(f"Concurrency lease {row_key} for {lease.holder} was taken over before release")
+            except Exception as e:
+                # The lease expires on its own
+                logger.warning(f"Failed to release concurrency lease {row_key} for {lease.holder}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Leases held by this process and total deferrals"""
+        return {"mode": "table", "heldLeases": len(self._renewals), "deferred": self.deferred}
+
+
+_governor: ProcessConcurrencyGovernor | TableConcurrencyGovernor | None = None
+
+
+def get_concurrency_governor() -> ProcessConcurrencyGovernor | TableConcurrencyGovernor:
+    """
+    Get the process-wide governor for WORKFLOW_CONCURRENCY_MODE.
+
+    Raises:
+        ValueError: If the mode is not "process" or "table"
+    """
+    global _governor
+    if _governor is None:
+        if CONCURRENCY_MODE == "process":
+            _governor = ProcessConcurrencyGovernor()
+        elif CONCURRENCY_MODE == "table":
+            _governor = TableConcurrencyGovernor()
+        else:
+            raise ValueError(f"Invalid WORKFLOW_CONCURRENCY_MODE '{CONCURRENCY_MODE}' (expected 'process' or 'table')")
+    return _governor
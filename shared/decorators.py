@@ -10,12 +10,16 @@ from collections.abc import Callable
 from typing import Any, Literal
 
 from .discovery import DataProviderMetadata, WorkflowMetadata, WorkflowParameter
+from .retry_policy import parse_retry_policy
 
 logger = logging.getLogger(__name__)
 
 # Valid parameter types
 VALID_PARAM_TYPES = {"string", "int", "bool", "float", "json", "list", "email"}
 
+# Valid workflow isolation modes
+VALID_ISOLATION_MODES = {"none", "process"}
+
 
 def workflow(
     # Identity
@@ -27,6 +31,11 @@ def workflow(
     # Execution
     execution_mode: Literal["sync", "async"] | None = None,
     timeout_seconds: int = 1800,  # Default 30 minutes
+    isolation: Literal["none", "process"] = "none",
+
+    # Concurrency
+    max_concurrency: int | None = None,
+    integrations: list[str] | None = None,
 
     # Retry
     retry_policy: dict[str, Any] | None = None,
@@ -73,7 +82,20 @@ def workflow(
             - "sync": Execute synchronously, return result immediately
             - "async": Enqueue for async execution, return 202 + execution_id
         timeout_seconds: Max execution time in seconds (default: 1800, max: 7200)
-        retry_policy: Dict with retry config (e.g., {"max_attempts": 3, "backoff": 2})
+        isolation: "none" | "process" (default: "none")
+            - "none": Run on the queue worker's event loop
+            - "process": Run in a warm pool of worker processes (for CPU-bound or
+              blocking code). Timeouts and cancellation kill the process.
+              Only applies to queued (async) executions.
+        max_concurrency: Max queued executions of this workflow running at once
+            (default: None = unlimited). Excess executions are deferred back to the queue.
+        integrations: Integration names this workflow calls (e.g. ["halopsa"]).
+            Executions share each integration's concurrency limit
+            (INTEGRATION_CONCURRENCY_LIMITS, see shared.concurrency_governor).
+        retry_policy: Dict with retry config for queued executions, e.g.
+            {"max_attempts": 3, "backoff_seconds": 2, "max_backoff_seconds": 60,
+             "retry_on": [TimeoutError, "HTTPError"]}. Failed attempts are
+            re-queued with exponential backoff and jitter (see shared.retry_policy).
         schedule: Cron expression for scheduled workflows (e.g., "0 9 * * *")
         endpoint_enabled: Whether to expose as HTTP endpoint at /api/endpoints/{name} (default: False)
         allowed_methods: HTTP methods allowed for endpoint (default: ["POST"])
@@ -88,6 +110,20 @@ def workflow(
     if allowed_methods is None:
         allowed_methods = ["POST"]
 
+    if integrations is None:
+        integrations = []
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if isolation not in VALID_ISOLATION_MODES:
+        raise ValueError(
+            f"Invalid isolation '{isolation}'. Must be one of: {', '.join(sorted(VALID_ISOLATION_MODES))}"
+        )
+
+    # Validate and normalize (exception classes in retry_on become type names)
+    policy = parse_retry_policy(retry_policy)
+    if policy:
+        retry_policy = policy.to_dict()
+
     # Apply execution mode defaults
     if execution_mode is not None:
         # Explicit value provided, use it
@@ -130,6 +166,9 @@ def workflow(
             tags=tags,
             execution_mode=execution_mode,
             timeout_seconds=timeout_seconds,
+            isolation=isolation,
+            max_concurrency=max_concurrency,
+            integrations=[integration.lower() for integration in integrations],
             retry_policy=retry_policy,
             schedule=schedule,
             endpoint_enabled=endpoint_enabled,
@@ -147,7 +186,7 @@ def workflow(
 
         logger.debug(
             f"Workflow decorator applied: {name} "
-            f"({len(pending_params)} params, execution_mode={execution_mode})"
+            f"({len(pending_params)} params, execution_mode={execution_mode}, isolation={isolation})"
         )
 
         # Return function unchanged (for normal Python execution)
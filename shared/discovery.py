@@ -1,15 +1,19 @@
 """
 Dynamic Discovery Module
 Pure functions for discovering and loading workflows, data providers, and forms.
-No singletons, no caching - always fresh imports.
+Scans always import fresh. load_workflow() keeps a per-process warm cache of
+loaded workflows that is reused until the source of the workflow's module or
+any of its workspace imports changes.
 """
 
+import hashlib
 import importlib
 import importlib.util
 import json
 import logging
 import os
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -48,8 +52,13 @@ class WorkflowMetadata:
     # Execution
     execution_mode: Literal["sync", "async"] = "sync"
     timeout_seconds: int = 1800  # Default 30 minutes
+    isolation: Literal["none", "process"] = "none"  # "process" runs in the worker process pool
 
-    # Retry (for future use)
+    # Concurrency (queued executions, see shared.concurrency_governor)
+    max_concurrency: int | None = None
+    integrations: list[str] = field(default_factory=list)
+
+    # Retry (queued executions, see shared.retry_policy)
     retry_policy: dict[str, Any] | None = None
 
     # Scheduling (for future use)
@@ -266,6 +275,184 @@ def import_module_fresh(file_path: Path) -> ModuleType:
 reload_single_module = import_module_fresh
 
 
+# ==================== WARM WORKFLOW CACHE ====================
+
+# Files modified this recently may change again within the same mtime tick,
+# so their stat data is not trusted and they are always re-hashed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _CachedWorkflow:
+    """A loaded workflow and the sources it was built from"""
+    function: Callable
+    metadata: WorkflowMetadata
+    file_path: Path
+    # Workspace roots in effect when it was loaded
+    workspace_paths: tuple[Path, ...]
+    # Module file and its transitive workspace imports: path -> source hash
+    dependencies: dict[str, str]
+
+
+# Loaded workflows by name
+_workflow_cache: dict[str, _CachedWorkflow] = {}
+
+# Source hashes: path -> (mtime_ns, size, sha256)
+_source_hashes: dict[str, tuple[int, int, str]] = {}
+
+_workflow_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _source_hash(path: str) -> str | None:
+    """SHA-256 of a source file, re-read only when its stat changed (None if missing)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    cached = _source_hashes.get(path)
+    racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+    if cached is not None and not racy and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    try:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+    _source_hashes[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _loaded_workspace_sources(workspace_paths: Sequence[Path]) -> dict[str, str]:
+    """
+    Source hashes of every workspace module currently in sys.modules.
+
+    Called right after import_module_fresh(), which starts from a clean slate,
+    so this is the imported module plus its transitive workspace imports.
+    """
+    roots = tuple(
+        {str(wp) for wp in workspace_paths} | {str(wp.resolve()) for wp in workspace_paths}
+    )
+    sources: dict[str, str] = {}
+
+    for mod in list(sys.modules.values()):
+        mod_file = getattr(mod, '__file__', None)
+        if not mod_file or not mod_file.startswith(roots) or '.packages' in mod_file:
+            continue
+        digest = _source_hash(mod_file)
+        if digest is not None:
+            sources[mod_file] = digest
+
+    return sources
+
+
+def _is_current(entry: _CachedWorkflow, workspace_paths: Sequence[Path]) -> bool:
+    """Whether the workspace is the same and none of a cached workflow's sources changed"""
+    return entry.workspace_paths == tuple(workspace_paths) and all(
+        _source_hash(path) == digest for path, digest in entry.dependencies.items()
+    )
+
+
+def _cache_module_workflows(module: ModuleType, py_file: Path, workspace_paths: Sequence[Path]) -> None:
+    """Remember every workflow defined in a freshly imported module"""
+    sources: dict[str, str] | None = None
+
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if not (callable(attr) and hasattr(attr, '_workflow_metadata')):
+            continue
+
+        metadata = attr._workflow_metadata
+        if not hasattr(metadata, 'name'):
+            continue
+        if not isinstance(metadata, WorkflowMetadata):
+            metadata = _convert_workflow_metadata(metadata)
+
+        if sources is None:
+            sources = _loaded_workspace_sources(workspace_paths)
+
+        _workflow_cache[metadata.name] = _CachedWorkflow(
+            function=attr,
+            metadata=metadata,
+            file_path=py_file,
+            workspace_paths=tuple(workspace_paths),
+            dependencies=sources
+        )
+
+
+def get_workflow_cache_stats() -> dict[str, int]:
+    """
+    Warm workflow cache counters for this process.
+
+    Returns:
+        Dict with hits, misses and size (cached workflows)
+    """
+    return {**_workflow_cache_stats, "size": len(_workflow_cache)}
+
+
+def clear_workflow_cache() -> None:
+    """Drop all cached workflows and the workflow index (the next load imports fresh)"""
+    global _workflow_index
+    _workflow_cache.clear()
+    _source_hashes.clear()
+    _workflow_index = None
+
+
+# ==================== CACHED WORKFLOW INDEX ====================
+
+# Last full scan: (workspace fingerprint, workflow metadata)
+_workflow_index: tuple[str, list[WorkflowMetadata]] | None = None
+
+
+def get_workspace_fingerprint(workspace_paths: Sequence[Path] | None = None) -> str:
+    """
+    Fingerprint of every workspace source file (paths and content hashes).
+
+    Content is only re-hashed for files whose stat changed, so this costs
+    one stat per file when nothing changed.
+
+    Args:
+        workspace_paths: Workspace roots (default: get_workspace_paths())
+
+    Returns:
+        SHA-256 hex digest
+    """
+    if workspace_paths is None:
+        workspace_paths = get_workspace_paths()
+
+    digest = hashlib.sha256()
+    for workspace_path in workspace_paths:
+        for py_file in sorted(workspace_path.rglob("*.py")):
+            if ".packages" in py_file.parts:
+                continue
+            digest.update(str(py_file).encode())
+            digest.update((_source_hash(str(py_file)) or "").encode())
+    return digest.hexdigest()
+
+
+def get_workflow_index() -> tuple[str, list[WorkflowMetadata]]:
+    """
+    Workflow metadata for the whole workspace, rescanned only when a source file changed.
+
+    Use this instead of scan_all_workflows() when only metadata is needed
+    (schedules, listings); it avoids importing the workspace on every call.
+
+    Returns:
+        Tuple of (workspace fingerprint, list of WorkflowMetadata)
+    """
+    global _workflow_index
+
+    workspace_paths = get_workspace_paths()
+    fingerprint = get_workspace_fingerprint(workspace_paths)
+
+    if _workflow_index is None or _workflow_index[0] != fingerprint:
+        _workflow_index = (fingerprint, scan_all_workflows())
+
+    return _workflow_index
+
+
 # ==================== WORKFLOW DISCOVERY ====================
 
 
@@ -321,15 +508,18 @@ def scan_all_workflows() -> list[WorkflowMetadata]:
     return workflows
 
 
-def load_workflow(name: str) -> tuple[Callable, WorkflowMetadata] | None:
+def load_workflow(name: str, use_cache: bool = True) -> tuple[Callable, WorkflowMetadata] | None:
     """
     Find and load a specific workflow by name.
 
-    Scans workspace directories, imports fresh, and returns the
-    function and metadata for the named workflow.
+    Returns the cached function while the source hashes of its module and
+    that module's transitive workspace imports are unchanged. Otherwise scans
+    workspace directories (starting with the file it was last found in),
+    imports fresh, and caches every workflow in the imported modules.
 
     Args:
         name: Workflow name to find
+        use_cache: Whether a cached workflow may be returned
 
     Returns:
         Tuple of (function, metadata) or None if not found
@@ -339,33 +529,45 @@ def load_workflow(name: str) -> tuple[Callable, WorkflowMetadata] | None:
     if not workspace_paths:
         return None
 
+    cached = _workflow_cache.get(name)
+    if use_cache and cached is not None and _is_current(cached, workspace_paths):
+        _workflow_cache_stats["hits"] += 1
+        return (cached.function, cached.metadata)
+
+    _workflow_cache_stats["misses"] += 1
+    _workflow_cache.pop(name, None)
+
     # Clear everything for fresh imports
     _clear_workspace_modules(workspace_paths)
     _clear_all_workspace_pyc(workspace_paths)
     importlib.invalidate_caches()
 
+    # The workflow most likely still lives where it was last found
+    candidates: list[Path] = []
+    if cached is not None and cached.file_path.exists():
+        candidates.append(cached.file_path)
+
     for workspace_path in workspace_paths:
         for py_file in workspace_path.rglob("*.py"):
             if py_file.name.startswith("_"):
                 continue
             if ".packages" in py_file.parts:
                 continue
+            if candidates and py_file == candidates[0]:
+                continue
+            candidates.append(py_file)
 
-            try:
-                module = import_module_fresh(py_file)
-
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if callable(attr) and hasattr(attr, '_workflow_metadata'):
-                        metadata = attr._workflow_metadata
-                        if hasattr(metadata, 'name') and metadata.name == name:
-                            if isinstance(metadata, WorkflowMetadata):
-                                return (attr, metadata)
-                            else:
-                                return (attr, _convert_workflow_metadata(metadata))
+    for py_file in candidates:
+        try:
+            module = import_module_fresh(py_file)
+            _cache_module_workflows(module, py_file, workspace_paths)
+        except Exception as e:
+            logger.debug(f"Error scanning {py_file} for workflow '{name}': {e}")
+            continue
 
-            except Exception as e:
-                logger.debug(f"Error scanning {py_file} for workflow '{name}': {e}")
+        loaded = _workflow_cache.get(name)
+        if loaded is not None and loaded.file_path == py_file:
+            return (loaded.function, loaded.metadata)
 
     return None
 
@@ -619,6 +821,9 @@ def _convert_workflow_metadata(old_metadata: Any) -> WorkflowMetadata:
         tags=getattr(old_metadata, 'tags', []),
         execution_mode=getattr(old_metadata, 'execution_mode', 'sync'),
         timeout_seconds=getattr(old_metadata, 'timeout_seconds', 1800),
+        isolation=getattr(old_metadata, 'isolation', 'none'),
+        max_concurrency=getattr(old_metadata, 'max_concurrency', None),
+        integrations=getattr(old_metadata, 'integrations', []),
         retry_policy=getattr(old_metadata, 'retry_policy', None),
         schedule=getattr(old_metadata, 'schedule', None),
         endpoint_enabled=getattr(old_metadata, 'endpoint_enabled', False),
@@ -6,13 +6,18 @@ Platform admin resource - no org scoping.
 
 from pathlib import Path
 from typing import List
+import asyncio
+import base64
 import hashlib
 import os
-from datetime import datetime, UTC
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
 import aiofiles
 import aiofiles.os
 
 from shared.models import FileMetadata, FileContentResponse, FileType
+from shared.utils.file_operations import bump_workspace_generation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -48,26 +53,44 @@ HIDDEN_EXTENSIONS = {'.pyc', '.pyo'}
 # Prefixes that indicate hidden/metadata files
 HIDDEN_PREFIXES = ('._',)  # AppleDouble metadata files
 
+# ETag validator cache: absolute path -> ((mtime_ns, size, inode), etag)
+# Lets conditional reads answer "unchanged" from a single stat() instead of
+# re-reading and re-hashing the file on every editor open.
+_etag_cache: dict[str, tuple[tuple[int, int, int], str]] = {}
+_ETAG_CACHE_MAX_ENTRIES = 4096
 
-def _is_real_file(path: Path) -> bool:
+# Chunk size used when hashing or scanning large files
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Directory listing cache: absolute dir path -> (dir mtime_ns, cached_at, entries)
+# Entries are reused while the directory's own mtime is unchanged and the entry is
+# younger than the TTL (file size/mtime changes don't touch the directory mtime).
+# Editor mutations invalidate affected directories immediately. Tree listings
+# fill it from worker threads, so every access holds _listing_cache_lock.
+_listing_cache: dict[str, tuple[int, datetime, list[FileMetadata]]] = {}
+_listing_cache_lock = threading.Lock()
+_listing_cache_ttl = timedelta(seconds=5)
+_LISTING_CACHE_MAX_ENTRIES = 2048
+
+# Parallelism for recursive tree listings (each directory is a round-trip on SMB)
+_TREE_MAX_WORKERS = 8
+
+
+def _is_visible_entry(name: str, is_dir: bool, is_file: bool) -> bool:
     """
-    Check if a path should be shown in the Code Editor file listing.
+    Check if a directory entry should be shown, using only its name and type.
 
-    Filters out:
-    - SMB/macOS metadata files (AppleDouble, .DS_Store, etc.)
-    - Development tool directories (.git, __pycache__, node_modules, etc.)
-    - IDE settings (.vscode, .idea)
-    - Virtual environments (.venv, venv, env)
-    - Generated/cache files (.pyc, .coverage, etc.)
+    Split out from _is_real_file so listings built on os.scandir can filter
+    using DirEntry type information without extra stat() calls.
 
     Args:
-        path: Path to check
+        name: Entry name
+        is_dir: Whether the entry is a directory
+        is_file: Whether the entry is a regular file
 
     Returns:
         False if this file/directory should be hidden, True otherwise
     """
-    name = path.name
-
     # Check hidden prefixes (AppleDouble files)
     for prefix in HIDDEN_PREFIXES:
         if name.startswith(prefix):
@@ -80,18 +103,38 @@ def _is_real_file(path: Path) -> bool:
         return False
 
     # Check directory names
-    if path.is_dir() and name in HIDDEN_DIRECTORIES:
+    if is_dir and name in HIDDEN_DIRECTORIES:
         logger.debug(f"Skipping hidden directory: {name}")
         return False
 
     # Check file extensions
-    if path.is_file() and path.suffix.lower() in HIDDEN_EXTENSIONS:
+    if is_file and os.path.splitext(name)[1].lower() in HIDDEN_EXTENSIONS:
         logger.debug(f"Skipping file with hidden extension: {name}")
         return False
 
     return True
 
 
+def _is_real_file(path: Path) -> bool:
+    """
+    Check if a path should be shown in the Code Editor file listing.
+
+    Filters out:
+    - SMB/macOS metadata files (AppleDouble, .DS_Store, etc.)
+    - Development tool directories (.git, __pycache__, node_modules, etc.)
+    - IDE settings (.vscode, .idea)
+    - Virtual environments (.venv, venv, env)
+    - Generated/cache files (.pyc, .coverage, etc.)
+
+    Args:
+        path: Path to check
+
+    Returns:
+        False if this file/directory should be hidden, True otherwise
+    """
+    return _is_visible_entry(path.name, path.is_dir(), path.is_file())
+
+
 def get_base_path() -> Path:
     """
     Get the workspace directory path from BIFROST_WORKSPACE_LOCATION env var.
@@ -139,12 +182,324 @@ def validate_and_resolve_path(relative_path: str) -> Path:
     return full_path
 
 
-def list_directory(relative_path: str = "") -> List[FileMetadata]:
+def _stat_validator(stat: os.stat_result) -> tuple[int, int, int]:
+    """Cheap change validator for a file: (mtime_ns, size, inode)."""
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _get_cached_etag(file_path: Path, stat: os.stat_result) -> str | None:
+    """
+    Return the cached etag for a file if its stat validator is unchanged.
+
+    Args:
+        file_path: Resolved absolute path
+        stat: Current stat result for the file
+
+    Returns:
+        Cached etag, or None if missing or stale
+    """
+    entry = _etag_cache.get(str(file_path))
+    if entry is None:
+        return None
+
+    validator, etag = entry
+    if validator != _stat_validator(stat):
+        return None
+
+    return etag
+
+
+def _remember_etag(file_path: Path, stat: os.stat_result, etag: str) -> None:
+    """Store an etag against the file's current stat validator."""
+    key = str(file_path)
+
+    # Evict oldest entries (dicts preserve insertion order)
+    if key not in _etag_cache and len(_etag_cache) >= _ETAG_CACHE_MAX_ENTRIES:
+        del _etag_cache[next(iter(_etag_cache))]
+
+    _etag_cache[key] = (_stat_validator(stat), etag)
+
+
+def invalidate_etag_cache(path: Path | None = None) -> None:
+    """
+    Drop cached etags for a path (and everything below it), or all entries.
+
+    Args:
+        path: Resolved absolute path to invalidate, or None to clear the cache
+    """
+    if path is None:
+        _etag_cache.clear()
+        return
+
+    key = str(path)
+    prefix = key.rstrip(os.sep) + os.sep
+    for cached_key in [k for k in _etag_cache if k == key or k.startswith(prefix)]:
+        del _etag_cache[cached_key]
+
+
+def _hash_file(file_path: Path) -> str:
+    """Compute the MD5 etag of a file by streaming it in chunks."""
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_content(content_bytes: bytes) -> tuple[str, str]:
+    """
+    Encode raw bytes for the editor.
+
+    Returns:
+        Tuple of (content, encoding) - UTF-8 text when decodable, base64 otherwise
+    """
+    try:
+        return content_bytes.decode('utf-8'), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content_bytes).decode('ascii'), "base64"
+
+
+def _read_byte_range(file_path: Path, offset: int, length: int | None) -> bytes:
+    """Read up to `length` bytes starting at `offset` (None = to end of file)."""
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        return f.read() if length is None else f.read(length)
+
+
+def _read_line_range(
+    file_path: Path,
+    start_line: int,
+    end_line: int | None
+) -> tuple[bytes, int, int]:
+    """
+    Read lines `start_line`..`end_line` (1-indexed, inclusive).
+
+    Stops reading as soon as `end_line` is reached, so tails of large
+    files are never loaded.
+
+    Returns:
+        Tuple of (content bytes, byte offset of first line, last line number returned)
+    """
+    chunks: list[bytes] = []
+    offset = 0
+    last_line = start_line - 1
+
+    with open(file_path, 'rb') as f:
+        for line_number, line in enumerate(f, start=1):
+            if line_number < start_line:
+                offset += len(line)
+                continue
+            chunks.append(line)
+            last_line = line_number
+            if end_line is not None and line_number >= end_line:
+                break
+
+    return b"".join(chunks), offset, last_line
+
+
+async def get_file_etag(relative_path: str) -> str:
+    """
+    Get a file's etag without returning its content.
+
+    Served from the validator cache when the file's (mtime, size, inode)
+    is unchanged, so conditional requests cost a single stat().
+
+    Args:
+        relative_path: Relative path to file
+
+    Returns:
+        MD5 etag of the file content
+
+    Raises:
+        ValueError: If path is invalid or not a file
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file cannot be read
+    """
+    file_path = validate_and_resolve_path(relative_path)
+
+    try:
+        stat = await aiofiles.os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {relative_path}")
+
+    if not file_path.is_file():
+        raise ValueError(f"Not a file: {relative_path}")
+
+    etag = _get_cached_etag(file_path, stat)
+    if etag is not None:
+        return etag
+
+    try:
+        loop = asyncio.get_event_loop()
+        etag = await loop.run_in_executor(None, _hash_file, file_path)
+    except PermissionError:
+        raise PermissionError(f"Permission denied: {relative_path}")
+
+    _remember_etag(file_path, stat, etag)
+    return etag
+
+
+def invalidate_listing_cache(path: Path | None = None) -> None:
+    """
+    Drop cached directory listings affected by a change to `path`.
+
+    Invalidates the path itself, its parent directory and everything below
+    it. Passing None clears the whole cache.
+
+    Args:
+        path: Resolved absolute path that was created, modified or removed
+    """
+    with _listing_cache_lock:
+        if path is None:
+            _listing_cache.clear()
+            return
+
+        key = str(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        stale = [
+            k for k in _listing_cache
+            if k == key or k == str(path.parent) or k.startswith(prefix)
+        ]
+        for cached_key in stale:
+            del _listing_cache[cached_key]
+
+
+def _invalidate_path_caches(path: Path) -> None:
+    """Invalidate etag, listing and workspace-derived caches after an editor mutation."""
+    invalidate_etag_cache(path)
+    invalidate_listing_cache(path)
+    bump_workspace_generation()
+
+
+def _scan_directory(dir_path: Path, relative_prefix: str) -> list[FileMetadata]:
+    """
+    List a single directory with os.scandir, reusing DirEntry type and stat data.
+
+    Results are cached per directory (see _listing_cache). Symlinks are not
+    listed, so listings and tree walks never leave the workspace or loop.
+
+    Args:
+        dir_path: Resolved absolute directory path
+        relative_prefix: Relative path of the directory from the workspace root
+            ("" for root, otherwise ending with "/")
+
+    Returns:
+        FileMetadata objects sorted by name
+    """
+    key = str(dir_path)
+    dir_mtime = os.stat(dir_path).st_mtime_ns
+
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+    if cached is not None:
+        cached_mtime, cached_at, entries = cached
+        if cached_mtime == dir_mtime and datetime.now(UTC) - cached_at < _listing_cache_ttl:
+            return list(entries)
+
+    results: list[FileMetadata] = []
+
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file(follow_symlinks=False)
+
+                # Skip symlinks and special files, then AppleDouble and other SMB metadata files
+                if not (is_dir or is_file) or not _is_visible_entry(entry.name, is_dir, is_file):
+                    continue
+
+                stat = entry.stat(follow_symlinks=False)
+                extension = os.path.splitext(entry.name)[1] if is_file else ""
+
+                results.append(FileMetadata(
+                    path=f"{relative_prefix}{entry.name}",
+                    name=entry.name,
+                    type=FileType.FOLDER if is_dir else FileType.FILE,
+                    size=stat.st_size if is_file else None,
+                    extension=extension or None,
+                    modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat(),
+                    isReadOnly=False  # TODO: Check actual permissions if needed
+                ))
+            except (PermissionError, OSError):
+                # Skip files we can't read
+                continue
+
+    results.sort(key=lambda f: f.name)
+
+    with _listing_cache_lock:
+        if key not in _listing_cache and len(_listing_cache) >= _LISTING_CACHE_MAX_ENTRIES:
+            del _listing_cache[next(iter(_listing_cache))]
+        _listing_cache[key] = (dir_mtime, datetime.now(UTC), results)
+
+    return list(results)
+
+
+def _scan_tree(dir_path: Path, relative_prefix: str, max_depth: int | None) -> list[FileMetadata]:
+    """
+    Recursively list a directory tree, scanning each level's folders in parallel.
+
+    Args:
+        dir_path: Resolved absolute directory path
+        relative_prefix: Relative path prefix of dir_path ("" for root)
+        max_depth: Maximum folder depth to descend (None = unlimited, 1 = dir_path only)
+
+    Returns:
+        FileMetadata for every visible entry, depth-first (each folder followed by its contents)
+    """
+    def scan(prefix: str) -> list[FileMetadata]:
+        try:
+            return _scan_directory(dir_path / prefix[len(relative_prefix):], prefix)
+        except (PermissionError, OSError):
+            # Skip folders we can't read
+            return []
+
+    listings: dict[str, list[FileMetadata]] = {relative_prefix: _scan_directory(dir_path, relative_prefix)}
+    level = [relative_prefix]
+    depth = 1
+
+    with ThreadPoolExecutor(max_workers=_TREE_MAX_WORKERS) as executor:
+        while level and (max_depth is None or depth < max_depth):
+            folders = [
+                f"{item.path}/"
+                for prefix in level
+                for item in listings[prefix]
+                if item.type == FileType.FOLDER
+            ]
+
+            for prefix, entries in zip(folders, executor.map(scan, folders)):
+                listings[prefix] = entries
+
+            level = folders
+            depth += 1
+
+    results: list[FileMetadata] = []
+
+    def flatten(prefix: str) -> None:
+        for item in listings.get(prefix, []):
+            results.append(item)
+            if item.type == FileType.FOLDER:
+                flatten(f"{item.path}/")
+
+    flatten(relative_prefix)
+    return results
+
+
+def list_directory(
+    relative_path: str = "",
+    recursive: bool = False,
+    max_depth: int | None = None
+) -> List[FileMetadata]:
     """
     List files and folders in a directory.
 
+    Built on os.scandir so each entry costs at most one stat() (none for
+    type checks), with a short-lived per-directory cache that editor
+    mutations invalidate.
+
     Args:
         relative_path: Relative path to directory (empty = root)
+        recursive: Include the contents of all subfolders (file tree mode)
+        max_depth: Maximum folder depth when recursive (None = unlimited)
 
     Returns:
         List of FileMetadata objects
@@ -153,6 +508,9 @@ def list_directory(relative_path: str = "") -> List[FileMetadata]:
         ValueError: If path is invalid or not a directory
         FileNotFoundError: If directory doesn't exist
     """
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+
     dir_path = validate_and_resolve_path(relative_path)
 
     if not dir_path.exists():
@@ -161,62 +519,58 @@ def list_directory(relative_path: str = "") -> List[FileMetadata]:
     if not dir_path.is_dir():
         raise ValueError(f"Not a directory: {relative_path}")
 
-    results: List[FileMetadata] = []
     base_path = get_base_path().resolve()
+    relative = dir_path.relative_to(base_path).as_posix()
+    relative_prefix = "" if relative == "." else f"{relative}/"
 
-    for item in sorted(dir_path.iterdir()):
-        # Skip AppleDouble and other SMB metadata files
-        if not _is_real_file(item):
-            continue
+    if recursive:
+        return _scan_tree(dir_path, relative_prefix, max_depth)
 
-        try:
-            stat = item.stat()
-            relative = str(item.resolve().relative_to(base_path))
-
-            # Determine type
-            file_type = FileType.FOLDER if item.is_dir() else FileType.FILE
-
-            # Get extension for files
-            extension = item.suffix if item.is_file() and item.suffix else None
-
-            # Size is None for folders
-            size = stat.st_size if item.is_file() else None
-
-            # Modified timestamp
-            modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
-
-            results.append(FileMetadata(
-                path=relative,
-                name=item.name,
-                type=file_type,
-                size=size,
-                extension=extension,
-                modified=modified,
-                isReadOnly=False  # TODO: Check actual permissions if needed
-            ))
-        except (PermissionError, OSError):
-            # Skip files we can't read
-            continue
+    return _scan_directory(dir_path, relative_prefix)
 
-    return results
 
-
-async def read_file(relative_path: str) -> FileContentResponse:
+async def read_file(
+    relative_path: str,
+    offset: int | None = None,
+    length: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+) -> FileContentResponse:
     """
     Read file content with metadata.
     Automatically detects binary files and returns them base64 encoded.
 
+    Supports partial reads of large files, either by byte range
+    (offset/length) or by line range (start_line/end_line, 1-indexed,
+    inclusive). The etag always describes the whole file.
+
     Args:
         relative_path: Relative path to file
+        offset: Byte offset to start reading from (byte-range read)
+        length: Maximum number of bytes to read (byte-range read)
+        start_line: First line to return (line-range read)
+        end_line: Last line to return (line-range read, None = to end of file)
 
     Returns:
         FileContentResponse with content and metadata
 
     Raises:
-        ValueError: If path is invalid or not a file
+        ValueError: If path is invalid, not a file, or the range is invalid
         FileNotFoundError: If file doesn't exist
         PermissionError: If file cannot be read
     """
+    byte_range = offset is not None or length is not None
+    line_range = start_line is not None or end_line is not None
+
+    if byte_range and line_range:
+        raise ValueError("Cannot combine byte range and line range")
+    if (offset is not None and offset < 0) or (length is not None and length < 0):
+        raise ValueError("Byte range offset and length must be non-negative")
+    if line_range:
+        start_line = start_line or 1
+        if start_line < 1 or (end_line is not None and end_line < start_line):
+            raise ValueError("Invalid line range")
+
     file_path = validate_and_resolve_path(relative_path)
 
     if not file_path.exists():
@@ -227,44 +581,60 @@ async def read_file(relative_path: str) -> FileContentResponse:
 
     # Get file stats
     stat = await aiofiles.os.stat(file_path)
+    etag = _get_cached_etag(file_path, stat)
+
+    loop = asyncio.get_event_loop()
+    range_start: int | None = None
+    range_end_line: int | None = None
 
-    # Try to read as UTF-8 text first
-    encoding = "utf-8"
     try:
-        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-            content = await f.read()
-        content_bytes = content.encode('utf-8')
-    except UnicodeDecodeError:
-        # File is binary, read as bytes and encode to base64
-        encoding = "base64"
-        try:
-            import base64
+        if byte_range:
+            range_start = offset or 0
+            content_bytes = await loop.run_in_executor(
+                None, _read_byte_range, file_path, range_start, length
+            )
+        elif line_range:
+            content_bytes, range_start, range_end_line = await loop.run_in_executor(
+                None, _read_line_range, file_path, start_line, end_line
+            )
+        else:
             async with aiofiles.open(file_path, 'rb') as f:
-                binary_content = await f.read()
-            content = base64.b64encode(binary_content).decode('ascii')
-            content_bytes = binary_content
-        except PermissionError:
-            raise PermissionError(f"Permission denied: {relative_path}")
-        except Exception as e:
-            raise ValueError(f"Error reading file: {str(e)}")
+                content_bytes = await f.read()
+
+        if etag is None:
+            if byte_range or line_range:
+                etag = await loop.run_in_executor(None, _hash_file, file_path)
+            else:
+                etag = hashlib.md5(content_bytes).hexdigest()
+            _remember_etag(file_path, stat, etag)
     except PermissionError:
         raise PermissionError(f"Permission denied: {relative_path}")
     except Exception as e:
         raise ValueError(f"Error reading file: {str(e)}")
 
-    # Generate etag from content
-    etag = hashlib.md5(content_bytes).hexdigest()
+    # Try UTF-8 first, fall back to base64 for binary content
+    content, encoding = _encode_content(content_bytes)
+
+    if line_range and encoding != "utf-8":
+        raise ValueError(f"Line ranges are not supported for binary files: {relative_path}")
 
     # Modified timestamp
     modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
 
+    is_partial = byte_range or line_range
+
     return FileContentResponse(
         path=relative_path,
         content=content,
         encoding=encoding,
         size=len(content_bytes),
         etag=etag,
-        modified=modified
+        modified=modified,
+        isPartial=is_partial,
+        totalSize=stat.st_size if is_partial else None,
+        offset=range_start,
+        startLine=start_line if line_range else None,
+        endLine=range_end_line,
     )
 
 
@@ -272,6 +642,9 @@ async def write_file(relative_path: str, content: str, encoding: str = "utf-8")
     """
     Write file content atomically.
 
+    The etag is computed from the bytes being written and seeded into the
+    validator cache, so the file is never read back.
+
     Args:
         relative_path: Relative path to file
         content: File content to write (plain text or base64 encoded)
@@ -299,17 +672,12 @@ async def write_file(relative_path: str, content: str, encoding: str = "utf-8")
     try:
         if encoding == "base64":
             # Decode base64 and write as binary
-            import base64
-            binary_content = base64.b64decode(content)
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(binary_content)
-            # For etag calculation
-            content_bytes = binary_content
+            content_bytes = base64.b64decode(content)
         else:
-            # Write as UTF-8 text
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(content)
             content_bytes = content.encode('utf-8')
+
+        async with aiofiles.open(file_path, 'wb') as f:
+            await f.write(content_bytes)
     except PermissionError:
         raise PermissionError(f"Permission denied: {relative_path}")
     except Exception as e:
@@ -318,8 +686,11 @@ async def write_file(relative_path: str, content: str, encoding: str = "utf-8")
     # Get updated file stats
     stat = await aiofiles.os.stat(file_path)
 
-    # Generate etag from content
+    # Generate etag from the bytes we just wrote
     etag = hashlib.md5(content_bytes).hexdigest()
+    invalidate_listing_cache(file_path)
+    bump_workspace_generation()
+    _remember_etag(file_path, stat, etag)
 
     # Modified timestamp
     modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
@@ -362,6 +733,9 @@ def create_folder(relative_path: str) -> FileMetadata:
     except Exception as e:
         raise ValueError(f"Error creating folder: {str(e)}")
 
+    invalidate_listing_cache(folder_path)
+    bump_workspace_generation()
+
     # Get folder stats
     stat = folder_path.stat()
     modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
@@ -406,6 +780,8 @@ def delete_path(relative_path: str) -> None:
         raise PermissionError(f"Permission denied: {relative_path}")
     except Exception as e:
         raise ValueError(f"Error deleting path: {str(e)}")
+    finally:
+        _invalidate_path_caches(path)
 
 
 async def rename_path(old_path: str, new_path: str) -> FileMetadata:
@@ -443,6 +819,9 @@ async def rename_path(old_path: str, new_path: str) -> FileMetadata:
     except Exception as e:
         raise ValueError(f"Error renaming path: {str(e)}")
 
+    _invalidate_path_caches(old_resolved)
+    invalidate_listing_cache(new_resolved)
+
     # Get stats of renamed item
     stat = await aiofiles.os.stat(new_resolved)
     modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
@@ -3,6 +3,7 @@ Unified Execution Engine
 Single source of truth for all code execution (workflows, scripts, data providers)
 """
 
+import asyncio
 import inspect
 import logging
 import os
@@ -19,6 +20,7 @@ from shared.error_handling import WorkflowError
 from shared.errors import UserError, WorkflowExecutionException
 from shared.models import ExecutionStatus
 from shared.repositories.execution_logs import get_execution_logs_repository
+from shared.services.temp_file_service import get_temp_file_service
 
 logger = logging.getLogger(__name__)
 
@@ -446,13 +448,12 @@ async def execute(request: ExecutionRequest) -> ExecutionResult:
             logger.debug(
                 f"Cleared bifrost execution context for execution {request.execution_id}")
 
-        # Close broadcaster to prevent resource leaks
-        if request.broadcaster is not None:
+        # Remove the execution's temp directory (new_temp_file/new_temp_directory)
+        if request.execution_id:
             try:
-                request.broadcaster.close()
-                logger.debug(f"Closed broadcaster for execution {request.execution_id}")
+                await asyncio.to_thread(get_temp_file_service().remove_execution_directory, request.execution_id)
             except Exception as e:
-                logger.warning(f"Error closing broadcaster: {e}")
+                logger.warning(f"Error removing temp directory for execution {request.execution_id}: {e}")
 
 
 def _script_to_callable(code: str, name: str):
@@ -666,30 +667,13 @@ async def _execute_workflow_with_trace(
                         source="workflow"
                     )
 
-                    # Fire off async broadcast in background thread (non-blocking)
-                    # Using threading.Thread instead of ThreadPoolExecutor to avoid blocking
-                    import asyncio
-
-                    def run_broadcast():
-                        """Run async broadcast in separate thread with its own event loop"""
-                        try:
-                            asyncio.run(
-                                broadcaster.broadcast_execution_update(
-                                    execution_id=execution_id,
-                                    status="Running",
-                                    executed_by=context.user_id,
-                                    scope=context.org_id or "GLOBAL",
-                                    latest_logs=[log_dict],
-                                    is_complete=False
-                                )
-                            )
-                        except Exception:
-                            # Silently ignore errors in background thread
-                            pass
-
-                    # Start daemon thread (won't block program exit)
-                    thread = threading.Thread(target=run_broadcast, daemon=True)
-                    thread.start()
+                    # Queue the update on the process-wide publisher (never blocks on HTTP)
+                    broadcaster.publish_execution_update(
+                        execution_id=execution_id,
+                        status="Running",
+                        latest_logs=[log_dict],
+                        is_complete=False
+                    )
                 except Exception as e:
                     # Log errors but don't fail workflow execution
                     # Real-time updates are non-critical
@@ -0,0 +1,195 @@
+"""
+Execution Lanes
+Priority lanes and per-organization fair scheduling for queued workflow executions.
+
+Each lane is its own Azure Storage Queue with its own queue trigger, so a flood
+of bulk or scheduled work never sits in front of interactive executions:
+
+- interactive: forms, HTTP/endpoint executions, manual triggers ("workflow-executions")
+- scheduled: cron schedules ("workflow-executions-scheduled")
+- bulk: batch launches across organizations ("workflow-executions-bulk")
+
+Within a lane, each worker instance caps how many executions a single
+organization may run at once. A message over its organization's cap is sent
+back to its lane with a short visibility delay instead of occupying a worker,
+so other organizations' messages behind it are dequeued first (fair share).
+
+Lane metrics (running, started, deferred, wait times) are kept per worker
+instance; queue depths are read from the queues themselves.
+"""
+
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LANE_INTERACTIVE = "interactive"
+LANE_SCHEDULED = "scheduled"
+LANE_BULK = "bulk"
+
+# Lane -> queue name (interactive keeps the original queue name)
+LANE_QUEUES: dict[str, str] = {
+    LANE_INTERACTIVE: "workflow-executions",
+    LANE_SCHEDULED: "workflow-executions-scheduled",
+    LANE_BULK: "workflow-executions-bulk",
+}
+
+# Concurrent executions per organization per worker instance (0 = unlimited)
+ORG_CONCURRENCY_LIMITS: dict[str, int] = {
+    LANE_INTERACTIVE: int(os.environ.get("WORKFLOW_ORG_CONCURRENCY_INTERACTIVE", "0")),
+    LANE_SCHEDULED: int(os.environ.get("WORKFLOW_ORG_CONCURRENCY_SCHEDULED", "10")),
+    LANE_BULK: int(os.environ.get("WORKFLOW_ORG_CONCURRENCY_BULK", "4")),
+}
+
+# Visibility delay for messages deferred because their organization is at its cap
+FAIR_SHARE_DEFER_SECONDS = int(os.environ.get("WORKFLOW_FAIR_SHARE_DEFER_SECONDS", "5"))
+
+# Wait-time samples kept per lane for percentiles
+_WAIT_SAMPLES = 512
+
+
+@dataclass
+class _LaneStats:
+    """Per-lane counters for this worker instance"""
+    started: int = 0
+    deferred: int = 0
+    max_wait_ms: int = 0
+    wait_samples: deque = field(default_factory=lambda: deque(maxlen=_WAIT_SAMPLES))
+
+
+# (lane, org scope) -> executions currently running in this process
+_running: dict[tuple[str, str], int] = {}
+
+_lane_stats: dict[str, _LaneStats] = {lane: _LaneStats() for lane in LANE_QUEUES}
+
+
+def queue_for_lane(lane: str) -> str:
+    """
+    Get the queue name for a lane.
+
+    Args:
+        lane: Lane name
+
+    Returns:
+        Queue name
+
+    Raises:
+        ValueError: If the lane is unknown
+    """
+    if lane not in LANE_QUEUES:
+        raise ValueError(f"Unknown execution lane '{lane}'. Valid lanes: {', '.join(LANE_QUEUES)}")
+    return LANE_QUEUES[lane]
+
+
+def try_acquire_org_slot(lane: str, org_id: str | None) -> bool:
+    """
+    Claim an execution slot for an organization in a lane.
+
+    Args:
+        lane: Lane the message was dequeued from
+        org_id: Organization ID (None for GLOBAL executions)
+
+    Returns:
+        True if the execution may run now; False if the organization is at its cap
+    """
+    key = (lane, org_id or "GLOBAL")
+    limit = ORG_CONCURRENCY_LIMITS.get(lane, 0)
+    if limit and _running.get(key, 0) >= limit:
+        _lane_stats[lane].deferred += 1
+        return False
+    _running[key] = _running.get(key, 0) + 1
+    return True
+
+
+def release_org_slot(lane: str, org_id: str | None) -> None:
+    """Release a slot claimed with try_acquire_org_slot"""
+    key = (lane, org_id or "GLOBAL")
+    remaining = _running.get(key, 0) - 1
+    if remaining > 0:
+        _running[key] = remaining
+    else:
+        _running.pop(key, None)
+
+
+def record_start(lane: str, enqueued_at: str | None) -> None:
+    """
+    Record an execution starting in a lane, with its queue wait time.
+
+    Args:
+        lane: Lane name
+        enqueued_at: ISO timestamp from the queue message (absent on old messages)
+    """
+    stats = _lane_stats[lane]
+    stats.started += 1
+    if not enqueued_at:
+        return
+    try:
+        wait_ms = int((datetime.utcnow() - datetime.fromisoformat(enqueued_at)).total_seconds() * 1000)
+    except ValueError:
+        return
+    wait_ms = max(0, wait_ms)
+    stats.wait_samples.append(wait_ms)
+    stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+
+
+def _percentile(samples: list[int], pct: float) -> int:
+    if not samples:
+        return 0
+    return samples[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+def get_lane_metrics() -> dict[str, dict[str, Any]]:
+    """
+    Snapshot of lane metrics for this worker instance.
+
+    Returns:
+        Lane name -> running/started/deferred counts and wait-time percentiles (ms)
+    """
+    metrics = {}
+    for lane, stats in _lane_stats.items():
+        samples = sorted(stats.wait_samples)
+        metrics[lane] = {
+            "queue": LANE_QUEUES[lane],
+            "running": sum(count for (running_lane, _), count in _running.items() if running_lane == lane),
+            "started": stats.started,
+            "deferred": stats.deferred,
+            "waitP50Ms": _percentile(samples, 0.5),
+            "waitP95Ms": _percentile(samples, 0.95),
+            "waitMaxMs": stats.max_wait_ms,
+        }
+    return metrics
+
+
+async def get_queue_depths() -> dict[str, int | None]:
+    """
+    Approximate number of messages waiting in each lane's queue.
+
+    Returns:
+        Lane name -> approximate message count (None if the queue could not be read)
+    """
+    import asyncio
+
+    from shared.async_executor import get_queue_client
+
+    async def depth(queue_name: str) -> int | None:
+        try:
+            async with get_queue_client(shared=True, queue_name=queue_name) as queue_client:
+                properties = await queue_client.get_queue_properties()
+                return properties.approximate_message_count
+        except Exception as e:
+            logger.warning(f"Failed to read depth of queue {queue_name}: {e}")
+            return None
+
+    depths = await asyncio.gather(*(depth(queue) for queue in LANE_QUEUES.values()))
+    return dict(zip(LANE_QUEUES, depths))
+
+
+def reset_lane_state() -> None:
+    """Clear slots and metrics (for tests)"""
+    _running.clear()
+    for lane in LANE_QUEUES:
+        _lane_stats[lane] = _LaneStats()
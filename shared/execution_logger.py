@@ -4,11 +4,11 @@ Logs workflow execution details using ExecutionRepository
 Large data (logs, results, snapshots) stored in Blob Storage to avoid size limits
 """
 
-import json
 import logging
 from typing import Any, TYPE_CHECKING
 
 from shared.blob_storage import get_blob_service
+from shared.json_codec import dumps_bytes
 from shared.models import ExecutionStatus
 from shared.repositories.executions import ExecutionRepository
 
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Size threshold for storing data in blob vs table (1KB)
 BLOB_THRESHOLD_BYTES = 1024
 
+# Leading bytes of the encoded result sent with the completion broadcast
+RESULT_PREVIEW_BYTES = 512
+
 
 class ExecutionLogger:
     """
@@ -42,7 +45,8 @@ class ExecutionLogger:
         workflow_name: str,
         input_data: dict[str, Any],
         form_id: str | None = None,
-        webpubsub_broadcaster: 'WebPubSubBroadcaster | None' = None
+        webpubsub_broadcaster: 'WebPubSubBroadcaster | None' = None,
+        status: ExecutionStatus = ExecutionStatus.RUNNING
     ) -> dict[str, Any]:
         """
         Create execution record with automatic index management.
@@ -61,6 +65,7 @@ class ExecutionLogger:
             workflow_name: Name of workflow
             input_data: Input parameters
             form_id: Optional form ID if triggered by form
+            status: Initial status (RUNNING for direct execution, PENDING when queued)
 
         Returns:
             Created execution entity (as dict for compatibility)
@@ -73,7 +78,8 @@ class ExecutionLogger:
             user_name=user_name,
             workflow_name=workflow_name,
             input_data=input_data,
-            form_id=form_id
+            form_id=form_id,
+            status=status
         )
 
         logger.info(
@@ -87,7 +93,7 @@ class ExecutionLogger:
             await webpubsub_broadcaster.broadcast_execution_to_history(
                 execution_id=execution_id,
                 workflow_name=workflow_name,
-                status=execution_model.status.value,  # Use actual DB status (RUNNING)
+                status=execution_model.status.value,  # Use actual DB status
                 executed_by=user_id,
                 executed_by_name=user_name,
                 scope=scope,
@@ -97,6 +103,42 @@ class ExecutionLogger:
         # Return as dict for compatibility with existing code
         return execution_model.model_dump()
 
+    async def create_executions(
+        self,
+        executions: list[dict[str, Any]],
+        webpubsub_broadcaster: 'WebPubSubBroadcaster | None' = None
+    ) -> list[dict[str, Any]]:
+        """
+        Create many PENDING execution records using batched storage writes.
+
+        Args:
+            executions: Dicts with execution_id, org_id, user_id, user_name,
+                workflow_name, input_data and optional form_id and batch_id
+            webpubsub_broadcaster: Optional broadcaster for history page updates
+
+        Returns:
+            Created execution entities (as dicts for compatibility)
+        """
+        execution_models = await self.repository.create_executions(
+            executions, status=ExecutionStatus.PENDING
+        )
+
+        logger.info(f"Created {len(execution_models)} queued executions via repository")
+
+        if webpubsub_broadcaster:
+            for execution, execution_model in zip(executions, execution_models):
+                await webpubsub_broadcaster.broadcast_execution_to_history(
+                    execution_id=execution_model.executionId,
+                    workflow_name=execution_model.workflowName,
+                    status=execution_model.status.value,
+                    executed_by=execution["user_id"],
+                    executed_by_name=execution["user_name"],
+                    scope=execution.get("org_id") or "GLOBAL",
+                    started_at=execution_model.startedAt
+                )
+
+        return [execution_model.model_dump() for execution_model in execution_models]
+
     async def update_execution(
         self,
         execution_id: str,
@@ -111,7 +153,8 @@ class ExecutionLogger:
         integration_calls: list | None = None,
         logs: list | None = None,
         variables: dict[str, Any] | None = None,
-        webpubsub_broadcaster: 'WebPubSubBroadcaster | None' = None
+        webpubsub_broadcaster: 'WebPubSubBroadcaster | None' = None,
+        attempt: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """
         Update execution record with results and automatic index updates.
@@ -132,42 +175,56 @@ class ExecutionLogger:
             integration_calls: Integration call tracking
             logs: Workflow logs
             variables: Workflow variables
+            attempt: Record of a finished attempt to append to the attempt history.
+                Its logs and variables blob paths are added to the record; an
+                attempt being retried (status Pending) gets its own blobs so the
+                next attempt does not overwrite them.
 
         Returns:
             Updated execution entity (as dict)
         """
-        # Handle result storage (blob for large, table for small)
+        # Encode the result once; the same bytes are measured, stored and previewed
         result_in_blob = False
+        result_preview = None
         if result is not None:
-            # Convert result to JSON string if it's not already a string
-            result_json = result if isinstance(result, str) else json.dumps(result)
-            result_size = len(result_json.encode('utf-8'))
+            encoded = result.encode('utf-8') if isinstance(result, str) else dumps_bytes(result)
+            result_size = len(encoded)
+            result_preview = encoded[:RESULT_PREVIEW_BYTES].decode('utf-8', errors='ignore')
 
             if result_size > BLOB_THRESHOLD_BYTES:
                 # Store in blob storage
-                await self.blob_service.upload_result(execution_id, result)
+                await self.blob_service.upload_result(execution_id, result, encoded=encoded)
                 result_in_blob = True
                 result = None  # Don't store inline
                 logger.info(
                     f"Stored large result in blob storage ({result_size} bytes)",
                     extra={"execution_id": execution_id}
                 )
+            elif result:
+                # Table Storage only holds strings - pass the encoded text through
+                result = encoded.decode('utf-8')
 
         # Store large data in blob storage
+        retried_attempt = attempt["attempt"] if attempt and status == ExecutionStatus.PENDING else None
+        logs_blob = None
         if logs:
-            await self.blob_service.upload_logs(execution_id, logs)
+            logs_blob = await self.blob_service.upload_logs(execution_id, logs, attempt=retried_attempt)
             logger.info(
                 f"Stored logs in blob storage ({len(logs)} entries)",
                 extra={"execution_id": execution_id}
             )
 
+        variables_blob = None
         if variables:
-            await self.blob_service.upload_variables(execution_id, variables)
+            variables_blob = await self.blob_service.upload_variables(execution_id, variables, attempt=retried_attempt)
             logger.info(
                 f"Stored variables in blob storage ({len(variables)} variables)",
                 extra={"execution_id": execution_id}
             )
 
+        if attempt is not None:
+            attempt = {**attempt, "logsBlob": logs_blob, "variablesBlob": variables_blob}
+
         # Delegate to repository (handles primary record + ALL indexes!)
         execution_model = await self.repository.update_execution(
             execution_id=execution_id,
@@ -177,7 +234,8 @@ class ExecutionLogger:
             result=result,
             error_message=error_message,
             duration_ms=duration_ms,
-            result_in_blob=result_in_blob
+            result_in_blob=result_in_blob,
+            attempt=attempt
         )
 
         logger.info(
@@ -203,7 +261,8 @@ class ExecutionLogger:
                 executed_by=user_id,
                 scope=scope,
                 latest_logs=None,  # Don't re-send logs (already streamed + in Table Storage)
-                is_complete=is_complete
+                is_complete=is_complete,
+                result_preview=result_preview if is_complete else None
             )
 
             # Broadcast to history page for ALL status changes (PENDING → RUNNING → completion)
@@ -1,25 +1,27 @@
-"""Handlers for business logic separation from HTTP endpoints."""
+"""Handlers for business logic separation from HTTP endpoints.
 
-from .health_handlers import (
-    check_api_health,
-    check_keyvault_health,
-    perform_general_health_check,
-    perform_keyvault_health_check,
-)
-from .secrets_handlers import (
-    handle_list_secrets,
-    handle_create_secret,
-    handle_update_secret,
-    handle_delete_secret,
-)
+The re-exported handlers are imported on first access, so importing one
+handler module does not load the others (and their Key Vault and SDK
+dependencies).
+"""
 
-__all__ = [
-    "check_api_health",
-    "check_keyvault_health",
-    "perform_general_health_check",
-    "perform_keyvault_health_check",
-    "handle_list_secrets",
-    "handle_create_secret",
-    "handle_update_secret",
-    "handle_delete_secret",
-]
+import importlib
+
+_EXPORTS = {
+    "check_api_health": "health_handlers",
+    "check_keyvault_health": "health_handlers",
+    "perform_general_health_check": "health_handlers",
+    "perform_keyvault_health_check": "health_handlers",
+    "handle_list_secrets": "secrets_handlers",
+    "handle_create_secret": "secrets_handlers",
+    "handle_update_secret": "secrets_handlers",
+    "handle_delete_secret": "secrets_handlers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
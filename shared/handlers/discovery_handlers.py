@@ -8,8 +8,9 @@ import logging
 from typing import Any, TYPE_CHECKING
 
 from pydantic import ValidationError
-from shared.models import DataProviderMetadata as DataProviderMetadataModel, FormDiscoveryMetadata, MetadataResponse, WorkflowMetadata as WorkflowMetadataModel
+from shared.models import DataProviderMetadata as DataProviderMetadataModel, FormDiscoveryMetadata, MetadataResponse, RetryPolicy, WorkflowMetadata as WorkflowMetadataModel
 from shared.discovery import scan_all_workflows, scan_all_data_providers, scan_all_forms
+from shared.retry_policy import parse_retry_policy
 
 if TYPE_CHECKING:
     from shared.context import ExecutionContext
@@ -56,6 +57,20 @@ def extract_relative_path(source_file_path: str | None) -> str | None:
     return None
 
 
+def _convert_retry_policy(retry_policy: dict[str, Any] | None) -> RetryPolicy | None:
+    """Convert a decorator retry_policy dict to the API model"""
+    policy = parse_retry_policy(retry_policy)
+    if not policy:
+        return None
+    return RetryPolicy(
+        maxAttempts=policy.max_attempts,
+        backoffSeconds=max(1, round(policy.backoff_seconds)),
+        maxBackoffSeconds=max(1, round(policy.max_backoff_seconds)),
+        retryOn=list(policy.retry_on),
+        jitter=policy.jitter
+    )
+
+
 def convert_workflow_metadata_to_model(
     workflow_metadata: Any,
 ) -> WorkflowMetadataModel:
@@ -100,7 +115,10 @@ def convert_workflow_metadata_to_model(
         parameters=parameters,
         executionMode=workflow_metadata.execution_mode,
         timeoutSeconds=workflow_metadata.timeout_seconds,
-        retryPolicy=workflow_metadata.retry_policy,
+        isolation=workflow_metadata.isolation,
+        maxConcurrency=workflow_metadata.max_concurrency,
+        integrations=workflow_metadata.integrations,
+        retryPolicy=_convert_retry_policy(workflow_metadata.retry_policy),
         schedule=workflow_metadata.schedule,
         endpointEnabled=workflow_metadata.endpoint_enabled,
         allowedMethods=workflow_metadata.allowed_methods,
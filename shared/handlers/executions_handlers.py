@@ -515,7 +515,8 @@ async def get_execution_result_handler(
 
 async def get_execution_logs_handler(
     context: ExecutionContext,
-    execution_id: str
+    execution_id: str,
+    tail: int | None = None
 ) -> tuple[list | None, str | None]:
     """
     Get only the logs of an execution (progressive loading).
@@ -524,9 +525,14 @@ async def get_execution_logs_handler(
     Regular users see INFO/WARNING/ERROR/CRITICAL logs only.
     Platform admins see all logs including DEBUG.
 
+    With tail set, only the latest `tail` entries are returned (before the
+    level filter). Finished executions are served from the compressed logs
+    blob with a ranged read; running ones from the ExecutionLogs tail rows.
+
     Args:
         context: ExecutionContext
         execution_id: Execution ID (UUID)
+        tail: Number of most recent entries to return (None for all)
 
     Returns:
         Tuple of (logs_list, error_message)
@@ -535,10 +541,29 @@ async def get_execution_logs_handler(
     if error or not execution_model:
         return None, error
 
-    # Fetch logs from ExecutionLogs table
     from shared.repositories.execution_logs import get_execution_logs_repository
     logs_repo = get_execution_logs_repository()
-    log_entities = await logs_repo.get_logs(execution_id=execution_id, limit=5000)
+
+    if tail is not None:
+        blob_logs = await get_blob_service().get_logs_tail(execution_id, tail)
+        if blob_logs is not None:
+            # Engine log entries: no per-entry ID, lower-case levels
+            logs = [
+                {
+                    "executionLogId": None,
+                    "timestamp": log.get("timestamp"),
+                    "level": str(log.get("level", "info")).upper(),
+                    "message": log.get("message", ""),
+                    "source": log.get("source", "workflow")
+                }
+                for log in blob_logs
+            ]
+            return [log for log in logs if context.is_platform_admin or log["level"] not in ["DEBUG", "TRACEBACK"]], None
+
+        log_entities = await logs_repo.get_latest_logs(execution_id, tail)
+    else:
+        # Fetch logs from ExecutionLogs table
+        log_entities = await logs_repo.get_logs(execution_id=execution_id, limit=5000)
 
     # Transform to camelCase format expected by UI
     # Filter out DEBUG logs and TRACEBACK logs for non-admin users
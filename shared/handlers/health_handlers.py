@@ -5,6 +5,8 @@ Extracted from functions/health.py for unit testability
 """
 
 import logging
+import os
+import time
 from datetime import datetime
 from typing import Literal, Optional
 
@@ -16,6 +18,39 @@ logger = logging.getLogger(__name__)
 # Type alias for health status
 HealthStatus = Literal["healthy", "degraded", "unhealthy"]
 
+# How long a Key Vault probe result is reused, so health endpoints can be polled
+# every few seconds without hitting Key Vault each time
+KEYVAULT_HEALTH_CACHE_TTL_SECONDS = float(os.environ.get("KEYVAULT_HEALTH_CACHE_TTL_SECONDS", "30"))
+
+# (vault_url, deep) -> (checked_at, health_check result)
+_keyvault_health_cache: dict[tuple[str | None, bool], tuple[float, dict]] = {}
+
+
+def clear_keyvault_health_cache() -> None:
+    """Drop cached Key Vault probe results"""
+    _keyvault_health_cache.clear()
+
+
+async def get_keyvault_health(kv_manager: KeyVaultClient, deep: bool = False) -> dict:
+    """
+    Key Vault health_check result, served from a short-TTL cache.
+
+    Args:
+        kv_manager: KeyVaultClient instance
+        deep: Enumerate all secrets (exact count) instead of the quick probe
+
+    Returns:
+        Result dict from KeyVaultClient.health_check
+    """
+    cache_key = (getattr(kv_manager, "vault_url", None), deep)
+    cached = _keyvault_health_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < KEYVAULT_HEALTH_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    result = await kv_manager.health_check(deep=deep)
+    _keyvault_health_cache[cache_key] = (time.monotonic(), result)
+    return result
+
 
 def perform_basic_health_check() -> BasicHealthResponse:
     """
@@ -75,7 +110,7 @@ async def check_keyvault_health(kv_manager: Optional[KeyVaultClient]) -> tuple[H
         ), "degraded"
 
     try:
-        health_result = await kv_manager.health_check()
+        health_result = await get_keyvault_health(kv_manager)
         kv_status = health_result.get("status", "unhealthy")
         kv_healthy = kv_status == "healthy"
 
@@ -94,7 +129,8 @@ async def check_keyvault_health(kv_manager: Optional[KeyVaultClient]) -> tuple[H
                 "canConnect": health_result.get("can_connect", False),
                 "canListSecrets": health_result.get("can_list_secrets", False),
                 "canGetSecrets": health_result.get("can_get_secrets", False),
-                "secretCount": health_result.get("secret_count")
+                "secretCount": health_result.get("secret_count"),
+                "secretCountTruncated": health_result.get("secret_count_truncated", False)
             }
         )
         return check, overall_status
@@ -153,12 +189,16 @@ async def perform_general_health_check(kv_manager: Optional[KeyVaultClient]) ->
     return response
 
 
-async def perform_keyvault_health_check(kv_manager: Optional[KeyVaultClient]) -> KeyVaultHealthResponse:
+async def perform_keyvault_health_check(
+    kv_manager: Optional[KeyVaultClient],
+    deep: bool = False
+) -> KeyVaultHealthResponse:
     """
     Perform a detailed Key Vault health check.
 
     Args:
         kv_manager: KeyVaultClient instance or None
+        deep: Enumerate every secret for an exact secretCount (slow on large vaults)
 
     Returns:
         KeyVaultHealthResponse: Detailed Key Vault health status
@@ -184,7 +224,7 @@ async def perform_keyvault_health_check(kv_manager: Optional[KeyVaultClient]) ->
 
     try:
         # Perform health check
-        health_result = await kv_manager.health_check()
+        health_result = await get_keyvault_health(kv_manager, deep=deep)
 
         # Extract results
         status = health_result.get("status", "unhealthy")
@@ -209,6 +249,7 @@ async def perform_keyvault_health_check(kv_manager: Optional[KeyVaultClient]) ->
             canListSecrets=can_list,
             canGetSecrets=can_get,
             secretCount=secret_count,
+            secretCountTruncated=health_result.get("secret_count_truncated", False),
             lastChecked=datetime.utcnow()
         )
 
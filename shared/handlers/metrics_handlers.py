@@ -4,16 +4,31 @@ Business logic for dashboard metrics and statistics
 Extracted from functions/metrics.py for unit testability
 """
 
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
-from shared.discovery import scan_all_workflows, scan_all_data_providers
+from shared.discovery import get_workflow_index, scan_all_data_providers
 from shared.async_storage import get_async_table_service
+from shared.metrics_rollups import (
+    BACKFILL_MARKER_ROW_KEY,
+    ROLLUP_PARTITION,
+    backfill_rollups,
+    get_rollups,
+    summarize_rollups,
+)
 
 logger = logging.getLogger(__name__)
 
+# Workspace fingerprint -> data provider count (providers are only rescanned when the workspace changes)
+_data_provider_counts: dict[str, int] = {}
+
+# Scope -> (cached at, active form count)
+_form_count_cache: dict[str, tuple[datetime, int]] = {}
+_FORM_COUNT_TTL = timedelta(seconds=60)
+
 
 def get_reverse_timestamp(dt: datetime) -> int:
     """
@@ -32,17 +47,21 @@ def get_reverse_timestamp(dt: datetime) -> int:
 
 def get_workflow_metadata() -> dict[str, int]:
     """
-    Get workflow and data provider counts via dynamic discovery.
+    Get workflow and data provider counts from the cached workflow index.
+
+    The workspace is only rescanned when its source fingerprint changed.
 
     Returns:
         Dict with workflowCount and dataProviderCount, defaults to 0 on error
     """
     try:
-        workflows = scan_all_workflows()
-        data_providers = scan_all_data_providers()
+        fingerprint, workflows = get_workflow_index()
+        if fingerprint not in _data_provider_counts:
+            _data_provider_counts.clear()
+            _data_provider_counts[fingerprint] = len(scan_all_data_providers())
         return {
             "workflowCount": len(workflows),
-            "dataProviderCount": len(data_providers)
+            "dataProviderCount": _data_provider_counts[fingerprint]
         }
     except Exception as e:
         logger.warning(f"Failed to fetch workflow metadata: {e}")
@@ -56,6 +75,8 @@ async def get_form_count(entities_service: Any) -> int:
     """
     Get count of active forms from Entities table.
 
+    Only RowKeys are fetched, since the count is all that is needed.
+
     Args:
         entities_service: Table service for Entities table
 
@@ -64,7 +85,8 @@ async def get_form_count(entities_service: Any) -> int:
     """
     try:
         form_entities = await entities_service.query_entities(
-            filter="RowKey ge 'form:' and RowKey lt 'form;' and IsActive eq true"
+            filter="RowKey ge 'form:' and RowKey lt 'form;' and IsActive eq true",
+            select=["RowKey"]
         )
         return len(form_entities)
     except Exception as e:
@@ -74,7 +96,10 @@ async def get_form_count(entities_service: Any) -> int:
 
 async def get_execution_statistics(entities_service: Any, days: int = 30) -> dict[str, Any]:
     """
-    Get execution statistics for the last N days.
+    Get execution statistics for the last N days by scanning execution rows.
+
+    The dashboard reads metrics rollups instead (get_rollup_statistics); this
+    scan is only used when the rollups cannot be read or hold no rows.
 
     Args:
         entities_service: Table service for Entities table
@@ -155,12 +180,110 @@ async def get_execution_statistics(entities_service: Any, days: int = 30) -> dic
         }
 
 
+async def _count_status_index(relationships_service: Any, status: str) -> int:
+    """Count executions currently in a status via the status index (RowKeys only)"""
+    rows = await relationships_service.query_entities(
+        filter=f"PartitionKey eq 'GLOBAL' and RowKey ge 'status:{status}:' and RowKey lt 'status:{status};'",
+        select=["RowKey"]
+    )
+    return len(rows)
+
+
+async def _backfill_rollups_once(entities_service: Any, rows: list[dict], window_start: datetime) -> bool:
+    """
+    Backfill the days before the first live rollup row from the execution rows.
+
+    Runs until the backfill marker row exists, so the execution scan happens
+    once per deployment rather than on every dashboard load.
+
+    Args:
+        entities_service: Table service for Entities table
+        rows: Rollup rows already in the window (time order)
+        window_start: Start of the dashboard window
+
+    Returns:
+        True if rollup rows were written
+    """
+    if await entities_service.get_entity(ROLLUP_PARTITION, BACKFILL_MARKER_ROW_KEY) is not None:
+        return False
+
+    # Live rollups cover the first rollup day onwards; with none yet, everything so far
+    before = datetime.strptime(rows[0]["RowKey"].split(":")[2], "%Y-%m-%d") if rows else datetime.utcnow()
+    executions = []
+    if before > window_start:
+        executions = await entities_service.query_entities(
+            filter=(
+                f"RowKey ge 'execution:{get_reverse_timestamp(before)}' and "
+                f"RowKey le 'execution:{get_reverse_timestamp(window_start)}_~'"
+            ),
+            select=["ExecutionId", "Status", "WorkflowName", "StartedAt", "CompletedAt", "ErrorMessage", "DurationMs"]
+        )
+    return await backfill_rollups(entities_service, executions, before) > 0
+
+
+async def get_rollup_statistics(
+    entities_service: Any,
+    relationships_service: Any,
+    days: int = 30
+) -> dict[str, Any] | None:
+    """
+    Get execution statistics for the last N days from metrics rollups.
+
+    Reads the shards of at most days + 1 daily rollups plus the Running/Pending
+    status indexes, instead of every execution row. Days before rollups were
+    recorded are backfilled on first use (see _backfill_rollups_once).
+
+    Args:
+        entities_service: Table service for Entities table
+        relationships_service: Table service for Relationships table
+        days: Number of days to look back (default 30)
+
+    Returns:
+        Dict with execution stats (as get_execution_statistics, plus p50/p95
+        durations), or None if no rollup rows exist in the window
+    """
+    now = datetime.utcnow()
+    window_start = now - timedelta(days=days)
+    rows = await get_rollups(entities_service, window_start, now)
+    if await _backfill_rollups_once(entities_service, rows, window_start):
+        rows = await get_rollups(entities_service, window_start, now)
+    if not rows:
+        return None
+
+    summary = summarize_rollups(rows)
+    counts = summary["statusCounts"]
+    running_count, pending_count = await asyncio.gather(
+        _count_status_index(relationships_service, "Running"),
+        _count_status_index(relationships_service, "Pending"),
+    )
+
+    success_count = counts["Success"]
+    failed_count = counts["Failed"]
+    completed_count = success_count + failed_count
+    success_rate = (success_count / completed_count * 100) if completed_count > 0 else 0.0
+
+    return {
+        "totalExecutions": sum(counts.values()) + running_count + pending_count,
+        "successCount": success_count,
+        "failedCount": failed_count,
+        "runningCount": running_count,
+        "pendingCount": pending_count,
+        "successRate": round(success_rate, 1),
+        "avgDurationSeconds": summary["avgDurationSeconds"],
+        "p50DurationSeconds": summary["p50DurationSeconds"],
+        "p95DurationSeconds": summary["p95DurationSeconds"],
+        "recentFailures": summary["recentFailures"]
+    }
+
+
 async def get_dashboard_metrics(context: Any) -> dict[str, Any]:
     """
     Aggregate all dashboard metrics into a single response.
 
     This is the main handler that orchestrates fetching workflow metadata,
-    form counts, and execution statistics.
+    form counts, and execution statistics. Execution statistics come from
+    metrics rollups; the 30-day execution scan is only a fallback for when
+    the rollups cannot be read or hold no rows.
 
     Args:
         context: ExecutionContext with user/org information
@@ -174,17 +297,30 @@ async def get_dashboard_metrics(context: Any) -> dict[str, Any]:
     try:
         metrics: dict[str, Any] = {}
 
-        # 1. Get workflow and data provider counts via dynamic discovery
+        # 1. Get workflow and data provider counts from the cached workflow index
         metadata = get_workflow_metadata()
         metrics.update(metadata)
 
         # 2. Get form count and execution statistics
-        # Use async context manager to ensure proper cleanup of TableClient connections
-        async with get_async_table_service("Entities", context) as entities_service:
-            metrics["formCount"] = await get_form_count(entities_service)
+        # Use async context managers to ensure proper cleanup of TableClient connections
+        async with get_async_table_service("Entities", context) as entities_service, \
+                get_async_table_service("Relationships", context) as relationships_service:
+            cached_form_count = _form_count_cache.get(context.scope)
+            if cached_form_count and datetime.utcnow() - cached_form_count[0] < _FORM_COUNT_TTL:
+                metrics["formCount"] = cached_form_count[1]
+            else:
+                metrics["formCount"] = await get_form_count(entities_service)
+                _form_count_cache[context.scope] = (datetime.utcnow(), metrics["formCount"])
 
             # 3. Get execution statistics (last 30 days)
-            execution_stats = await get_execution_statistics(entities_service, days=30)
+            try:
+                execution_stats = await get_rollup_statistics(entities_service, relationships_service, days=30)
+            except Exception as e:
+                logger.warning(f"Failed to read metrics rollups: {e}")
+                execution_stats = None
+            if execution_stats is None:
+                execution_stats = await get_execution_statistics(entities_service, days=30)
+
             metrics["executionStats"] = {
                 "totalExecutions": execution_stats["totalExecutions"],
                 "successCount": execution_stats["successCount"],
@@ -192,7 +328,9 @@ async def get_dashboard_metrics(context: Any) -> dict[str, Any]:
                 "runningCount": execution_stats["runningCount"],
                 "pendingCount": execution_stats["pendingCount"],
                 "successRate": execution_stats["successRate"],
-                "avgDurationSeconds": execution_stats["avgDurationSeconds"]
+                "avgDurationSeconds": execution_stats["avgDurationSeconds"],
+                "p50DurationSeconds": execution_stats.get("p50DurationSeconds"),
+                "p95DurationSeconds": execution_stats.get("p95DurationSeconds")
             }
             metrics["recentFailures"] = execution_stats["recentFailures"]
 
@@ -202,3 +340,37 @@ async def get_dashboard_metrics(context: Any) -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Error retrieving dashboard metrics: {str(e)}", exc_info=True)
         raise
+
+
+async def get_queue_metrics(context: Any) -> dict[str, Any]:
+    """
+    Queue depth and wait-time metrics for each execution lane.
+
+    Depths come from the lane queues; running/started/deferred counts and
+    wait-time percentiles are those of the worker instance serving the request.
+
+    Args:
+        context: ExecutionContext with user/org information
+
+    Returns:
+        Dict matching QueueMetricsResponse
+
+    Raises:
+        PermissionError: If the caller is not a platform admin
+    """
+    from shared.execution_lanes import ORG_CONCURRENCY_LIMITS, get_lane_metrics, get_queue_depths
+
+    if not context.is_platform_admin:
+        raise PermissionError("Only platform administrators can view queue metrics")
+
+    depths = await get_queue_depths()
+    lanes = [
+        {
+            "lane": lane,
+            "depth": depths.get(lane),
+            "orgConcurrencyLimit": ORG_CONCURRENCY_LIMITS.get(lane, 0),
+            **lane_metrics,
+        }
+        for lane, lane_metrics in get_lane_metrics().items()
+    ]
+    return {"lanes": lanes}
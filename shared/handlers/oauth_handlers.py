@@ -21,6 +21,7 @@ from shared.repositories.oauth import OAuthRepository
 from shared.keyvault import KeyVaultClient
 from shared.async_storage import AsyncTableStorageService
 from shared.custom_types import get_context, get_route_param
+from shared.services.sdk_usage_scanner import SOURCE_OAUTH, invalidate_stored_keys
 from shared.handlers.response_helpers import (
     success_response,
     not_found,
@@ -132,6 +133,8 @@ async def create_oauth_connection_handler(req: func.HttpRequest) -> func.HttpRes
                 if updated_connection:
                     connection = updated_connection
 
+        invalidate_stored_keys(SOURCE_OAUTH, org_id)
+
         detail = connection.to_detail() if connection else None
         if detail is None:
             return internal_error("Failed to retrieve created connection")
@@ -256,6 +259,7 @@ async def delete_oauth_connection_handler(req: func.HttpRequest) -> func.HttpRes
             return not_found("OAuth connection", name)
 
         await oauth_repo.delete_connection(name, org_id)
+        invalidate_stored_keys(SOURCE_OAUTH, org_id)
         logger.info(f"Deleted OAuth connection: {name}")
 
         return func.HttpResponse(status_code=204)
@@ -317,6 +321,7 @@ async def authorize_oauth_connection_handler(req: func.HttpRequest) -> func.Http
             status="waiting_callback",
             status_message=f"Waiting for OAuth callback (state: {state})"
         )
+        invalidate_stored_keys(SOURCE_OAUTH, org_id)
 
         logger.info(f"Generated authorization URL for {name}")
 
@@ -354,6 +359,7 @@ async def cancel_oauth_authorization_handler(req: func.HttpRequest) -> func.Http
             status="not_connected",
             status_message="Authorization canceled by user"
         )
+        invalidate_stored_keys(SOURCE_OAUTH, org_id)
 
         logger.info(f"Canceled OAuth authorization: {name}")
 
@@ -439,6 +445,7 @@ async def oauth_callback_handler(req: func.HttpRequest) -> func.HttpResponse:
             status="exchanging",
             status_message="Exchanging authorization code for access token"
         )
+        invalidate_stored_keys(SOURCE_OAUTH, connection.org_id)
 
         # Build full redirect URI (UI callback page URL) - must match authorize endpoint
         # req.url is like: https://domain.com/api/oauth/callback/connection_name
@@ -511,6 +518,7 @@ async def oauth_callback_handler(req: func.HttpRequest) -> func.HttpResponse:
             status="completed",
             status_message="Token exchange successful"
         )
+        invalidate_stored_keys(SOURCE_OAUTH, connection.org_id)
 
         logger.info(f"OAuth connection completed: {connection_name}")
 
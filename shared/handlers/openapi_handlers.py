@@ -6,13 +6,30 @@ Provides business logic for OpenAPI specification generation including:
 - Endpoint documentation from registry
 - Dynamic workflow endpoint generation
 - Security scheme configuration
+
+The spec is cached in two parts: the static part (model schemas, decorated
+endpoints, security schemes) keyed by a fingerprint of the models and the
+endpoint registry, and the full spec keyed by that plus the workflow index
+fingerprint. A workflow change only regenerates the /endpoints section.
 """
 
+import hashlib
+import json
+from typing import Literal
+
+import yaml
 from pydantic import BaseModel
-from shared.discovery import scan_all_workflows
-from shared.openapi_decorators import build_openapi_spec
+
+from shared.discovery import get_workflow_index
+from shared.openapi_decorators import build_openapi_spec, get_openapi_registry
 import shared.models as models_module
 
+# (model fingerprint, spec without workflow endpoints)
+_static_spec: tuple[str, dict] | None = None
+
+# (full fingerprint, spec, rendered bodies by format)
+_spec_cache: tuple[str, dict, dict[str, str]] | None = None
+
 
 def collect_pydantic_models() -> list[type[BaseModel]]:
     """
@@ -220,18 +237,20 @@ def build_workflow_operation(metadata, method: str) -> dict:
     return operation
 
 
-def generate_workflow_endpoints(spec: dict) -> None:
+def generate_workflow_endpoints(spec: dict, workflows: list | None = None) -> None:
     """
     Generate OpenAPI endpoint definitions for enabled workflows.
 
-    Dynamically scans workflows and adds endpoints to the spec.
-    Updates the spec in-place with /endpoints/{workflow_name} paths.
+    Adds endpoints to the spec in-place as /endpoints/{workflow_name} paths.
+    Path items that already exist are copied before being extended, so a spec
+    sharing path items with the cached static spec never modifies it.
 
     Args:
         spec: OpenAPI specification dict to update (modified in-place)
+        workflows: WorkflowMetadata list (default: the cached workflow index)
     """
-    # Dynamically scan all workflows (always fresh)
-    workflows = scan_all_workflows()
+    if workflows is None:
+        _, workflows = get_workflow_index()
 
     # Initialize paths if not present
     if "paths" not in spec:
@@ -247,10 +266,9 @@ def generate_workflow_endpoints(spec: dict) -> None:
         allowed_methods = metadata.allowed_methods or ['POST']
         workflow_name = metadata.name
 
-        # Create path entry if not already present (might be from decorator)
+        # Create path entry (copying one that might be from a decorator)
         path_key = f"/endpoints/{workflow_name}"
-        if path_key not in spec["paths"]:
-            spec["paths"][path_key] = {}
+        spec["paths"][path_key] = dict(spec["paths"].get(path_key, {}))
 
         # Add definition for each allowed HTTP method
         for method in allowed_methods:
@@ -284,18 +302,27 @@ def ensure_security_schemes(spec: dict) -> None:
     }
 
 
-def generate_openapi_spec() -> dict:
+def get_model_fingerprint() -> str:
     """
-    Generate complete OpenAPI 3.0 specification.
+    Fingerprint of the static spec inputs: exported models and decorated endpoints.
 
-    Combines:
-    1. Base spec generation from decorators and models
-    2. Dynamic workflow endpoint generation
-    3. Security scheme configuration
+    Model definitions only change with a deployment, but the endpoint registry
+    grows as blueprints are imported, so both are part of the key.
 
     Returns:
-        dict: Complete OpenAPI specification
+        SHA-256 hex digest
     """
+    digest = hashlib.sha256()
+    for name in models_module.__all__:
+        digest.update(name.encode())
+        digest.update(b"\0")
+    for endpoint in get_openapi_registry().get_endpoints():
+        digest.update(f"{endpoint.method} {endpoint.path}\0".encode())
+    return digest.hexdigest()
+
+
+def _build_static_spec() -> dict:
+    """Spec from models and decorated endpoints, without workflow endpoints"""
     # Collect all Pydantic models
     models = collect_pydantic_models()
 
@@ -326,10 +353,83 @@ def generate_openapi_spec() -> dict:
         models=models
     )
 
-    # Generate dynamic workflow endpoints
-    generate_workflow_endpoints(spec)
-
     # Ensure security schemes are configured
     ensure_security_schemes(spec)
 
     return spec
+
+
+def _get_cached_spec() -> tuple[str, dict, dict[str, str]]:
+    """Full spec for the current models and workflows, rebuilding only what changed"""
+    global _static_spec, _spec_cache
+
+    model_fingerprint = get_model_fingerprint()
+    workflow_fingerprint, workflows = get_workflow_index()
+    fingerprint = hashlib.sha256(f"{model_fingerprint}:{workflow_fingerprint}".encode()).hexdigest()
+
+    if _spec_cache is not None and _spec_cache[0] == fingerprint:
+        return _spec_cache
+
+    if _static_spec is None or _static_spec[0] != model_fingerprint:
+        _static_spec = (model_fingerprint, _build_static_spec())
+
+    # Shallow copy: workflow endpoints replace path items, never modify them
+    spec = {**_static_spec[1], "paths": dict(_static_spec[1].get("paths", {}))}
+    generate_workflow_endpoints(spec, workflows)
+
+    _spec_cache = (fingerprint, spec, {})
+    return _spec_cache
+
+
+def clear_openapi_cache() -> None:
+    """Drop the cached spec (rebuilt on the next request)"""
+    global _static_spec, _spec_cache
+    _static_spec = None
+    _spec_cache = None
+
+
+def generate_openapi_spec() -> dict:
+    """
+    Generate complete OpenAPI 3.0 specification.
+
+    Combines:
+    1. Base spec generation from decorators and models
+    2. Dynamic workflow endpoint generation
+    3. Security scheme configuration
+
+    The result is cached until the models, decorated endpoints or workflows
+    change, and shared between callers, so it must not be modified.
+
+    Returns:
+        dict: Complete OpenAPI specification
+    """
+    return _get_cached_spec()[1]
+
+
+def render_openapi_spec(fmt: Literal["json", "yaml"]) -> tuple[str, str]:
+    """
+    Serialized OpenAPI spec with its ETag.
+
+    Each format is serialized once per spec version.
+
+    Args:
+        fmt: "json" or "yaml"
+
+    Returns:
+        Tuple of (body, ETag header value)
+    """
+    fingerprint, spec, rendered = _get_cached_spec()
+
+    if fmt not in rendered:
+        if fmt == "yaml":
+            rendered[fmt] = yaml.dump(
+                spec,
+                sort_keys=False,
+                default_flow_style=False,
+                allow_unicode=True,
+                width=120
+            )
+        else:
+            rendered[fmt] = json.dumps(spec, indent=2)
+
+    return rendered[fmt], f'"{fingerprint[:32]}-{fmt}"'
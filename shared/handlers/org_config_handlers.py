@@ -22,6 +22,7 @@ from shared.secret_naming import (
     SecretNameTooLongError,
     InvalidSecretComponentError,
 )
+from shared.services.sdk_usage_scanner import SOURCE_CONFIG, invalidate_stored_keys
 from shared.system_logger import get_system_logger
 
 logger = logging.getLogger(__name__)
@@ -238,6 +239,7 @@ async def set_config_handler(req: func.HttpRequest) -> func.HttpResponse:
             f"{'Updated' if existing_config else 'Created'} config key '{set_request.key}' "
             f"in scope={context.scope}"
         )
+        invalidate_stored_keys(SOURCE_CONFIG, context.scope)
 
         # Log to system logger
         system_logger = get_system_logger()
@@ -357,6 +359,7 @@ async def delete_config_handler(req: func.HttpRequest) -> func.HttpResponse:
         config_repo = ConfigRepository(context)
         await config_repo.delete_config(key)
         logger.info(f"Deleted config key '{key}' (scope={context.scope})")
+        invalidate_stored_keys(SOURCE_CONFIG, context.scope)
 
         # Log to system logger
         system_logger = get_system_logger()
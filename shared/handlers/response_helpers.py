@@ -107,3 +107,28 @@ def internal_error(message: str = "An internal error occurred") -> func.HttpResp
 def service_unavailable(message: str) -> func.HttpResponse:
     """503 Service Unavailable response"""
     return error_response("ServiceUnavailable", message, 503)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag (weak comparison).
+
+    Candidates are compared by their opaque tag, ignoring a W/ prefix and
+    the surrounding quotes, so quoted and bare ETags compare equal. "*"
+    matches any current representation.
+
+    Args:
+        if_none_match: If-None-Match header value (None if absent)
+        etag: Current ETag, quoted or bare
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not isinstance(if_none_match, str) or not if_none_match.strip():
+        return False
+    current = etag.removeprefix("W/").strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/").strip('"') == current:
+            return True
+    return False
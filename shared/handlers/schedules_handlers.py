@@ -1,156 +1,166 @@
 """
 Schedules Handler
-Business logic for retrieving scheduled workflows
+Business logic for retrieving and running scheduled workflows
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import Any
 
 import azure.functions as func
-from croniter import croniter
 
-from shared.async_executor import enqueue_workflow_execution
+from shared.async_executor import ExecutionRequest, enqueue_workflow_execution, enqueue_workflow_executions
 from shared.context import ExecutionContext
-from shared.discovery import scan_all_workflows, load_workflow
+from shared.execution_lanes import LANE_SCHEDULED
+from shared.discovery import get_workflow_index, load_workflow
 from shared.models import ExecutionStatus, ProcessSchedulesResponse, ScheduleInfo, SchedulesListResponse, WorkflowExecutionResponse
-from shared.async_storage import AsyncTableStorageService
-from shared.workflows.cron_parser import calculate_next_run, cron_to_human_readable, is_cron_expression_valid
+from shared.repositories.schedules import ScheduleRepository
+from shared.workflows.cron_parser import TIMER_INTERVAL_MINUTES, calculate_next_run, cron_to_human_readable, is_cron_expression_valid
 
 logger = logging.getLogger(__name__)
 
+# Workspace fingerprint the schedule store was last synced against
+_synced_fingerprint: str | None = None
 
-async def process_due_schedules_handler(req: func.HttpRequest) -> func.HttpResponse:
+
+async def sync_schedules(repo: ScheduleRepository, now: datetime) -> dict[str, Any]:
     """
-    Process all schedules that are currently due to run.
+    Sync schedule state with the cached workflow index when the workspace changed.
 
-    This is the server-side implementation of "Run Scheduled Jobs Now".
-    It replicates the logic from schedule_processor timer but only processes
-    schedules where next_run_at <= now.
+    Args:
+        repo: Schedule repository
+        now: Current time
 
     Returns:
-        JSON response with execution results
+        Sync results (empty when the workspace is unchanged)
     """
-    logger.info("Processing all due schedules (manual trigger)")
+    global _synced_fingerprint
 
-    config_service = AsyncTableStorageService("Config")
-    context: ExecutionContext = req.context  # type: ignore[attr-defined]
+    fingerprint, workflows = get_workflow_index()
+    if fingerprint == _synced_fingerprint:
+        return {}
 
-    # Dynamically scan all workflows (always fresh)
-    all_workflows = scan_all_workflows()
-    scheduled_workflows = [w for w in all_workflows if w.schedule]
+    results = await repo.sync_schedules([w for w in workflows if w.schedule], now)
+    _synced_fingerprint = fingerprint
+    logger.info(
+        f"Synced schedules: Created={results['created']}, Updated={results['updated']}, "
+        f"Removed={results['removed']}, Invalid={len(results['errors'])}"
+    )
+    return results
 
-    now = datetime.utcnow()
-    results = {
-        "total_schedules": len(scheduled_workflows),
-        "due_schedules": 0,
-        "executed": 0,
-        "errors": []
-    }
 
-    # Process each scheduled workflow
-    for workflow_meta in scheduled_workflows:
-        try:
-            workflow_name = workflow_meta.name
-            cron_expression = workflow_meta.schedule
+async def run_due_schedules(context_factory: Any, now: datetime | None = None) -> dict[str, Any]:
+    """
+    Claim and enqueue every schedule that is due.
 
-            # Validate CRON expression using comprehensive validation
-            if cron_expression is None or not is_cron_expression_valid(cron_expression):
-                logger.warning(
-                    f"Skipping schedule with invalid CRON expression: {workflow_name} - {cron_expression}"
-                )
-                results["errors"].append({
-                    "workflow_name": workflow_name,
-                    "error": f"Invalid CRON expression: {cron_expression}"
-                })
-                continue
-
-            # Get schedule state
-            row_key = f"schedule:{workflow_name}"
-            schedule_state = await config_service.get_entity("GLOBAL", row_key)
-
-            if not schedule_state:
-                # Not initialized yet, skip
-                continue
-
-            # Check if it's due
-            next_run_at = datetime.fromisoformat(schedule_state.get("NextRunAt", now.isoformat()))
-
-            if next_run_at > now:
-                # Not due yet
-                continue
-
-            results["due_schedules"] += 1
-            logger.info(
-                f"Processing due schedule: {workflow_name}",
-                extra={
-                    "workflow_name": workflow_name,
-                    "next_run_at": next_run_at.isoformat(),
-                    "now": now.isoformat()
-                }
-            )
+    Due schedules come from one range query on the NextRunAt index. Each is
+    claimed with an ETag match (so concurrent schedulers never run the same
+    slot twice), then all claimed runs are enqueued on the scheduled lane in
+    one bulk call. If enqueueing fails the claims are released, so the runs
+    are picked up again on the next pass instead of being skipped.
 
-            try:
-                # Enqueue execution
-                execution_id = await enqueue_workflow_execution(
-                    context=context,
+    Args:
+        context_factory: Callable(workflow_name) -> ExecutionContext for each run
+        now: Current time (default: utcnow)
+
+    Returns:
+        Dict with due, executed and errors
+    """
+    now = now or datetime.utcnow()
+    repo = ScheduleRepository()
+    results: dict[str, Any] = {"due": 0, "executed": 0, "errors": []}
+
+    try:
+        sync_results = await sync_schedules(repo, now)
+        results["errors"].extend(sync_results.get("errors", []))
+
+        due = await repo.get_due(now)
+        results["due"] = len(due)
+        if not due:
+            return results
+
+        claims = await asyncio.gather(
+            *(repo.claim(entity["WorkflowName"], now, index_row_key=entity["RowKey"]) for entity in due),
+            return_exceptions=True
+        )
+
+        claimed: list[str] = []
+        claim_states: list[dict] = []
+        for entity, claim in zip(due, claims):
+            if isinstance(claim, BaseException):
+                results["errors"].append({"workflow_name": entity["WorkflowName"], "error": str(claim)})
+            elif claim is not None:
+                claimed.append(entity["WorkflowName"])
+                claim_states.append(claim)
+
+        if not claimed:
+            return results
+
+        try:
+            execution_ids = await enqueue_workflow_executions([
+                ExecutionRequest(
+                    context=context_factory(workflow_name),
                     workflow_name=workflow_name,
                     parameters={},
-                    form_id=None
+                    lane=LANE_SCHEDULED
                 )
+                for workflow_name in claimed
+            ])
+        except Exception as e:
+            logger.error(f"Failed to enqueue {len(claimed)} scheduled workflows: {e}", exc_info=True)
+            results["errors"].extend({"workflow_name": name, "error": str(e)} for name in claimed)
+            released = await asyncio.gather(
+                *(repo.release_claim(name, claim) for name, claim in zip(claimed, claim_states)),
+                return_exceptions=True
+            )
+            for name, outcome in zip(claimed, released):
+                if outcome is not True:
+                    logger.warning(f"Could not release schedule claim for {name}; this run is skipped: {outcome}")
+            return results
+
+        results["executed"] = len(execution_ids)
+        recorded = await asyncio.gather(
+            *(repo.record_run(name, execution_id, now) for name, execution_id in zip(claimed, execution_ids)),
+            return_exceptions=True
+        )
+        for name, outcome in zip(claimed, recorded):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to record scheduled run for {name}: {outcome}")
 
-                logger.info(
-                    f"Enqueued due schedule: {workflow_name}",
-                    extra={
-                        "workflow_name": workflow_name,
-                        "execution_id": execution_id
-                    }
-                )
+        logger.info(f"Enqueued {len(execution_ids)} scheduled workflows: {', '.join(claimed)}")
+        return results
+    finally:
+        await repo.close()
 
-                # Update schedule state
-                next_run_at = calculate_next_run(cron_expression or "", now)
-                schedule_state["LastRunAt"] = now.isoformat()
-                schedule_state["LastExecutionId"] = execution_id
-                schedule_state["ExecutionCount"] = int(
-                    schedule_state.get("ExecutionCount", 0)
-                ) + 1
-                schedule_state["NextRunAt"] = next_run_at.isoformat()
-                await config_service.upsert_entity(schedule_state)
-
-                results["executed"] += 1
-
-            except Exception as exec_error:
-                error_info = {
-                    "workflow_name": workflow_name,
-                    "error": str(exec_error)
-                }
-                results["errors"].append(error_info)
-                logger.error(
-                    f"Failed to execute due schedule: {workflow_name}",
-                    extra=error_info,
-                    exc_info=True
-                )
 
-        except Exception as workflow_error:
-            error_info = {
-                "workflow_name": getattr(workflow_meta, "name", "unknown"),
-                "error": str(workflow_error)
-            }
-            results["errors"].append(error_info)
-            logger.error(
-                "Error processing workflow schedule",
-                extra=error_info,
-                exc_info=True
-            )
+async def process_due_schedules_handler(req: func.HttpRequest) -> func.HttpResponse:
+    """
+    Process all schedules that are currently due to run.
+
+    This is the server-side implementation of "Run Scheduled Jobs Now".
+    It runs the same claim-and-enqueue pass as the schedule_processor timer.
+
+    Returns:
+        JSON response with execution results
+    """
+    logger.info("Processing all due schedules (manual trigger)")
+
+    context: ExecutionContext = req.context  # type: ignore[attr-defined]
+
+    _, workflows = get_workflow_index()
+    total = sum(1 for w in workflows if w.schedule)
+
+    results = await run_due_schedules(lambda workflow_name: context)
 
     logger.info(
-        f"Processed due schedules: Total={results['total_schedules']}, "
-        f"Due={results['due_schedules']}, Executed={results['executed']}, "
-        f"Errors={len(results['errors'])}"
+        f"Processed due schedules: Total={total}, Due={results['due']}, "
+        f"Executed={results['executed']}, Errors={len(results['errors'])}"
     )
 
     response = ProcessSchedulesResponse(
-        total=results['total_schedules'],
-        due=results['due_schedules'],
+        total=total,
+        due=results['due'],
         executed=results['executed'],
         failed=len(results['errors']),
         errors=results['errors']
@@ -167,121 +177,74 @@ async def get_schedules_handler(req: func.HttpRequest) -> func.HttpResponse:
     """
     Get all scheduled workflows with their CRON information and state.
 
-    Combines registry metadata with storage state to provide complete schedule information.
+    Combines the cached workflow index with schedule state (one range query)
+    to provide complete schedule information.
 
     Returns:
         JSON response with list of schedules and total count
     """
     logger.info("Retrieving scheduled workflows")
 
-    config_service = AsyncTableStorageService("Config")
-
-    # Dynamically scan all workflows (always fresh)
-    all_workflows = scan_all_workflows()
-    scheduled_workflows = [w for w in all_workflows if w.schedule]
+    _, workflows = get_workflow_index()
+    scheduled_workflows = [w for w in workflows if w.schedule]
 
     logger.info(f"Found {len(scheduled_workflows)} scheduled workflows")
 
+    repo = ScheduleRepository()
+    try:
+        states = await repo.list_states()
+    finally:
+        await repo.close()
+
+    # A schedule is only "overdue" once it has missed a timer tick plus queue/startup slack
+    overdue_buffer_seconds = TIMER_INTERVAL_MINUTES * 60 + 60
+    now = datetime.utcnow().replace(tzinfo=timezone.utc)
+
     schedules_list: list[ScheduleInfo] = []
 
     for workflow_meta in scheduled_workflows:
         try:
             workflow_name = workflow_meta.name
-            workflow_description = workflow_meta.description
-            cron_expression = workflow_meta.schedule
-
-            # Get schedule state from storage
-            row_key = f"schedule:{workflow_name}"
-            schedule_state = await config_service.get_entity("GLOBAL", row_key)
-
-            # Build schedule info from metadata and storage state
-            next_run_at = None
-            last_run_at = None
-            last_execution_id = None
-            execution_count = 0
-
-            if schedule_state:
-                # Parse LastRunAt timestamp from storage as UTC
-                # Storage contains naive datetimes that represent UTC
-                if "LastRunAt" in schedule_state:
-                    try:
-                        last_run_at = datetime.fromisoformat(schedule_state["LastRunAt"]).replace(tzinfo=timezone.utc)
-                    except (ValueError, TypeError):
-                        pass
-
-                last_execution_id = schedule_state.get("LastExecutionId")
-                execution_count = int(schedule_state.get("ExecutionCount", 0))
-
-                # Recalculate NextRunAt to ensure it's rounded to timer intervals
-                # Don't trust the stored value as it may be from before rounding was added
-                if "NextRunAt" in schedule_state:
-                    try:
-                        datetime.fromisoformat(schedule_state["NextRunAt"])
-                        # Recalculate from the CRON expression to ensure proper rounding
-                        next_run_at = calculate_next_run(cron_expression or "", datetime.utcnow()).replace(tzinfo=timezone.utc)
-                    except (ValueError, TypeError):
-                        pass
-
-            # Generate human-readable description
-            human_readable = cron_to_human_readable(cron_expression or "")
-
-            # Validate CRON expression and check for warnings
+            cron_expression = workflow_meta.schedule or ""
+            schedule_state = states.get(workflow_name) or {}
+
+            # Storage contains naive datetimes that represent UTC
+            next_run_at = ScheduleRepository._parse_datetime(schedule_state.get("NextRunAt"))
+            last_run_at = ScheduleRepository._parse_datetime(schedule_state.get("LastRunAt"))
+            if next_run_at:
+                next_run_at = next_run_at.replace(tzinfo=timezone.utc)
+            if last_run_at:
+                last_run_at = last_run_at.replace(tzinfo=timezone.utc)
+
             validation_status = "valid"
             validation_message = None
             is_overdue = False
 
-            # Check comprehensive CRON validation
-            if cron_expression is None or not is_cron_expression_valid(cron_expression):
+            if not is_cron_expression_valid(cron_expression):
                 validation_status = "error"
                 validation_message = "Invalid CRON expression"
                 # Clear next run for invalid schedules - they should never run
                 next_run_at = None
+            elif next_run_at is None:
+                # Not synced yet; show when it will first run
+                next_run_at = calculate_next_run(cron_expression).replace(tzinfo=timezone.utc)
             else:
-                # Check if schedule is too frequent (< 5 minutes)
-                # This is a warning - the schedule will still run but may not meet expectations
-                try:
-                    now = datetime.utcnow()
-                    cron = croniter(cron_expression or "", now)
-                    first_run = cron.get_next(datetime)
-                    second_run = cron.get_next(datetime)
-                    interval_seconds = (second_run - first_run).total_seconds()
-
-                    if interval_seconds < 300:  # Less than 5 minutes
-                        validation_status = "warning"
-                        minutes = int(interval_seconds / 60)
-                        validation_message = f"Schedule runs every {minutes} minute{'s' if minutes != 1 else ''} (< 5 min recommended)"
-                except Exception as e:
-                    logger.warning(f"Could not determine schedule interval for {workflow_name}: {e}")
-                    # Keep as valid if we can't determine interval
-
-                # Calculate overdue status (only for valid schedules)
-                # A schedule is only "overdue" if it's past due by more than 6 minutes
-                # This accounts for:
-                # - Timer runs every 5 minutes
-                # - Execution startup time
-                # - Queue processing delays
-                if next_run_at:
-                    now_with_tz = datetime.utcnow().replace(tzinfo=timezone.utc)
-                    overdue_buffer_seconds = 360  # 6 minutes
-                    time_past_due = (now_with_tz - next_run_at).total_seconds()
-                    is_overdue = time_past_due > overdue_buffer_seconds
-
-            schedule_info = ScheduleInfo(
+                is_overdue = (now - next_run_at).total_seconds() > overdue_buffer_seconds
+
+            schedules_list.append(ScheduleInfo(
                 workflowName=workflow_name,
-                workflowDescription=workflow_description,
-                cronExpression=cron_expression or "",
-                humanReadable=human_readable,
+                workflowDescription=workflow_meta.description,
+                cronExpression=cron_expression,
+                humanReadable=cron_to_human_readable(cron_expression),
                 nextRunAt=next_run_at,
                 lastRunAt=last_run_at,
-                lastExecutionId=last_execution_id,
-                executionCount=execution_count,
+                lastExecutionId=schedule_state.get("LastExecutionId"),
+                executionCount=int(schedule_state.get("ExecutionCount") or 0),
                 enabled=True,
                 validationStatus=validation_status,
                 validationMessage=validation_message,
                 isOverdue=is_overdue
-            )
-
-            schedules_list.append(schedule_info)
+            ))
 
         except Exception as e:
             logger.error(
@@ -327,8 +290,6 @@ async def trigger_schedule_handler(req: func.HttpRequest, workflow_name: str) ->
     """
     logger.info(f"Manually triggering scheduled workflow: {workflow_name}")
 
-    config_service = AsyncTableStorageService("Config")
-
     # Dynamically load workflow (always fresh)
     result = load_workflow(workflow_name)
     if not result:
@@ -376,21 +337,18 @@ async def trigger_schedule_handler(req: func.HttpRequest, workflow_name: str) ->
             }
         )
 
-        # Update schedule state (same as schedule processor)
-        row_key = f"schedule:{workflow_name}"
-        schedule_state = await config_service.get_entity("GLOBAL", row_key)
-
-        if schedule_state:
-            now = datetime.utcnow()
-            next_run_at = calculate_next_run(workflow_metadata.schedule, now)
-
-            schedule_state["LastRunAt"] = now.isoformat()
-            schedule_state["LastExecutionId"] = execution_id
-            schedule_state["ExecutionCount"] = int(
-                schedule_state.get("ExecutionCount", 0)
-            ) + 1
-            schedule_state["NextRunAt"] = next_run_at.isoformat()
-            await config_service.upsert_entity(schedule_state)
+        # Update schedule state and move its index row (same as schedule processor)
+        now = datetime.utcnow()
+        repo = ScheduleRepository()
+        try:
+            await repo.record_run(
+                workflow_name,
+                execution_id,
+                now,
+                next_run_at=calculate_next_run(workflow_metadata.schedule, now)
+            )
+        finally:
+            await repo.close()
 
         # Return execution response
         response = WorkflowExecutionResponse(
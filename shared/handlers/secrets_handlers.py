@@ -22,6 +22,7 @@ from shared.models import (
 from shared.context import ExecutionContext, Organization
 from shared.async_storage import get_async_table_service
 from shared.validation import check_key_vault_available
+from shared.services.sdk_usage_scanner import SOURCE_SECRET, invalidate_stored_keys
 from shared.system_logger import get_system_logger
 
 logger = logging.getLogger(__name__)
@@ -143,6 +144,8 @@ async def handle_create_secret(
         ref=secret_name,
         value=create_request.value,
     )
+    # Listings scope secrets by name prefix, not orgId, so drop every scope
+    invalidate_stored_keys(SOURCE_SECRET)
 
     # Build response
     response = SecretResponse(
@@ -216,6 +219,8 @@ async def handle_update_secret(
         if "not found" in str(e).lower():
             raise SecretNotFoundError(f"Secret '{secret_name}' not found")
         raise
+    # Secret names aren't parsed for their scope here, so drop every scope
+    invalidate_stored_keys(SOURCE_SECRET)
 
     # Build response
     response = SecretResponse(
@@ -398,6 +403,8 @@ async def handle_delete_secret(
         if "not found" in str(e).lower():
             raise SecretNotFoundError(f"Secret '{secret_name}' not found")
         raise
+    # Secret names aren't parsed for their scope here, so drop every scope
+    invalidate_stored_keys(SOURCE_SECRET)
 
     # Build response
     response = SecretResponse(
@@ -348,6 +348,118 @@ async def execute_workflow_handler(req: func.HttpRequest) -> func.HttpResponse:
     )
 
 
+async def launch_workflow_batch_handler(req: func.HttpRequest) -> func.HttpResponse:
+    """
+    Launch one workflow for many organizations.
+
+    Request Body: BatchExecutionRequest
+
+    Returns:
+        202: BatchExecutionResponse with batch ID and queued executions
+        400: Invalid request or unknown workflow
+        403: Caller is not a platform admin
+        500: Internal server error
+    """
+    from pydantic import ValidationError
+
+    from shared.handlers.workflows_logic import launch_workflow_batch_logic
+    from shared.models import BatchExecutionRequest, BatchExecutionResponse
+
+    context = req.org_context  # type: ignore[attr-defined]
+
+    try:
+        batch_request = BatchExecutionRequest(**(req.get_json() or {}))
+
+        result = await launch_workflow_batch_logic(
+            context=context,
+            workflow_name=batch_request.workflowName,
+            targets=[target.model_dump() for target in batch_request.targets],
+            parameters=batch_request.inputData
+        )
+
+        response = BatchExecutionResponse(**result)
+        return func.HttpResponse(
+            json.dumps(response.model_dump(mode="json")),
+            status_code=202,
+            mimetype="application/json"
+        )
+
+    except (ValidationError, ValueError, TypeError) as e:
+        error = ErrorResponse(error="BadRequest", message=str(e))
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=400,
+            mimetype="application/json"
+        )
+
+    except PermissionError as e:
+        error = ErrorResponse(error="Forbidden", message=str(e))
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=403,
+            mimetype="application/json"
+        )
+
+    except Exception as e:
+        logger.error(f"Error launching workflow batch: {e}", exc_info=True)
+        error = ErrorResponse(error="InternalServerError", message="Failed to launch workflow batch")
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=500,
+            mimetype="application/json"
+        )
+
+
+async def get_workflow_batch_handler(req: func.HttpRequest) -> func.HttpResponse:
+    """
+    Get aggregated progress of a batch launch.
+
+    Returns:
+        200: BatchExecutionProgress
+        403: Caller is not a platform admin
+        404: Batch not found
+        500: Internal server error
+    """
+    from shared.handlers.workflows_logic import get_workflow_batch_logic
+    from shared.models import BatchExecutionProgress
+
+    context = req.org_context  # type: ignore[attr-defined]
+    batch_id = req.route_params.get("batchId", "")
+
+    try:
+        progress = await get_workflow_batch_logic(context, batch_id)
+    except PermissionError as e:
+        error = ErrorResponse(error="Forbidden", message=str(e))
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=403,
+            mimetype="application/json"
+        )
+    except Exception as e:
+        logger.error(f"Error getting workflow batch {batch_id}: {e}", exc_info=True)
+        error = ErrorResponse(error="InternalServerError", message="Failed to get workflow batch")
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=500,
+            mimetype="application/json"
+        )
+
+    if progress is None:
+        error = ErrorResponse(error="NotFound", message=f"Batch '{batch_id}' not found")
+        return func.HttpResponse(
+            json.dumps(error.model_dump()),
+            status_code=404,
+            mimetype="application/json"
+        )
+
+    response = BatchExecutionProgress(**progress)
+    return func.HttpResponse(
+        json.dumps(response.model_dump(mode="json")),
+        status_code=200,
+        mimetype="application/json"
+    )
+
+
 async def validate_workflow_file(path: str, content: str | None = None):
     """
     Validate a workflow file for syntax errors, decorator issues, and Pydantic validation.
@@ -10,6 +10,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from shared.discovery import scan_all_workflows
+from shared.models import MAX_BATCH_TARGETS, ExecutionStatus
 
 if TYPE_CHECKING:
     from shared.context import ExecutionContext
@@ -80,3 +81,186 @@ async def get_workflow_status_logic(context: 'ExecutionContext', execution_id: s
         return None
 
     return execution
+
+
+# Statuses after which an execution will not change again
+_FINISHED_STATUSES = {
+    ExecutionStatus.SUCCESS.value,
+    ExecutionStatus.FAILED.value,
+    ExecutionStatus.TIMEOUT.value,
+    ExecutionStatus.COMPLETED_WITH_ERRORS.value,
+    ExecutionStatus.CANCELLED.value,
+}
+
+
+async def launch_workflow_batch_logic(
+    context: 'ExecutionContext',
+    workflow_name: str,
+    targets: list[dict[str, Any]],
+    parameters: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Launch one workflow for many organizations (business logic).
+
+    The workflow is resolved once and organizations are resolved with a single
+    query. Execution records are written with batched transactions and queue
+    messages are sent concurrently, so launching for hundreds of organizations
+    does not cost hundreds of sequential round-trip chains.
+
+    Args:
+        context: Request context with user info (must be a platform admin)
+        workflow_name: Name of workflow to execute
+        targets: Dicts with orgId and optional inputData (per-org parameters,
+            merged over the shared parameters)
+        parameters: Parameters shared by every execution
+
+    Returns:
+        dict: BatchExecutionResponse fields (batchId, executions, rejected, ...)
+
+    Raises:
+        PermissionError: If the caller is not a platform admin
+        ValueError: If the workflow is not found or targets are invalid
+    """
+    import uuid
+
+    from shared.async_executor import ExecutionRequest, enqueue_workflow_executions
+    from shared.context import ExecutionContext, Organization
+    from shared.discovery import load_workflow
+    from shared.execution_lanes import LANE_BULK
+    from shared.repositories.executions import ExecutionRepository
+    from shared.repositories.organizations import OrganizationRepository
+
+    if not context.is_platform_admin:
+        raise PermissionError("Only platform administrators can launch batch executions")
+
+    if not targets:
+        raise ValueError("At least one target organization is required")
+    if len(targets) > MAX_BATCH_TARGETS:
+        raise ValueError(f"A batch may target at most {MAX_BATCH_TARGETS} organizations")
+
+    # Resolve the workflow once for the whole batch
+    if not load_workflow(workflow_name):
+        raise ValueError(f"Workflow not found: {workflow_name}")
+
+    # Resolve every organization with one query
+    org_repo = OrganizationRepository()
+    organizations = {org.id: org for org in await org_repo.list_organizations(active_only=False)}
+
+    batch_id = str(uuid.uuid4())
+    requests: list[ExecutionRequest] = []
+    rejected: list[dict[str, str]] = []
+
+    for target in targets:
+        org_id = target.get("orgId")
+        org = organizations.get(org_id) if org_id else None
+
+        if org is None:
+            rejected.append({"orgId": org_id or "", "reason": "Organization not found"})
+            continue
+        if not org.isActive:
+            rejected.append({"orgId": org.id, "reason": "Organization is inactive"})
+            continue
+
+        org_context = ExecutionContext(
+            user_id=context.user_id,
+            email=context.email,
+            name=context.name,
+            scope=org.id,
+            organization=Organization(id=org.id, name=org.name, is_active=org.isActive),
+            is_platform_admin=context.is_platform_admin,
+            is_function_key=context.is_function_key,
+            execution_id=str(uuid.uuid4())
+        )
+        requests.append(ExecutionRequest(
+            context=org_context,
+            workflow_name=workflow_name,
+            parameters={**(parameters or {}), **(target.get("inputData") or {})},
+            batch_id=batch_id,
+            lane=LANE_BULK
+        ))
+
+    executions: list[dict[str, Any]] = []
+    if requests:
+        exec_repo = ExecutionRepository()
+        await exec_repo.create_batch(
+            batch_id=batch_id,
+            workflow_name=workflow_name,
+            user_id=context.user_id,
+            user_name=context.name,
+            total=len(requests)
+        )
+
+        execution_ids = await enqueue_workflow_executions(requests)
+        executions = [
+            {
+                "orgId": request.context.org_id,
+                "executionId": execution_id,
+                "status": ExecutionStatus.PENDING.value,
+            }
+            for request, execution_id in zip(requests, execution_ids)
+        ]
+
+    logger.info(
+        f"User {context.user_id} launched batch {batch_id} for {workflow_name}: "
+        f"{len(executions)} queued, {len(rejected)} rejected"
+    )
+
+    return {
+        "batchId": batch_id,
+        "workflowName": workflow_name,
+        "total": len(executions),
+        "executions": executions,
+        "rejected": rejected,
+    }
+
+
+async def get_workflow_batch_logic(context: 'ExecutionContext', batch_id: str) -> dict[str, Any] | None:
+    """
+    Get aggregated progress of a batch launch (business logic).
+
+    Args:
+        context: Request context with user info (must be a platform admin)
+        batch_id: Batch ID returned by launch_workflow_batch_logic
+
+    Returns:
+        dict | None: BatchExecutionProgress fields or None if not found
+
+    Raises:
+        PermissionError: If the caller is not a platform admin
+    """
+    from shared.repositories.executions import ExecutionRepository
+
+    if not context.is_platform_admin:
+        raise PermissionError("Only platform administrators can view batch executions")
+
+    exec_repo = ExecutionRepository()
+    batch, rows = await exec_repo.get_batch(batch_id)
+
+    if not batch:
+        return None
+
+    status_counts: dict[str, int] = {}
+    executions = []
+    for row in rows:
+        status = row.get("Status", ExecutionStatus.PENDING.value)
+        status_counts[status] = status_counts.get(status, 0) + 1
+        executions.append({
+            "orgId": row.get("OrganizationId"),
+            "executionId": row.get("ExecutionId"),
+            "status": status,
+            "errorMessage": row.get("ErrorMessage"),
+        })
+
+    total = batch.get("Total", len(rows))
+    completed = sum(count for status, count in status_counts.items() if status in _FINISHED_STATUSES)
+
+    return {
+        "batchId": batch_id,
+        "workflowName": batch.get("WorkflowName"),
+        "total": total,
+        "completed": completed,
+        "statusCounts": status_counts,
+        "isComplete": completed >= total,
+        "createdAt": batch.get("CreatedAt"),
+        "executions": executions,
+    }
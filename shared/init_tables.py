@@ -7,6 +7,7 @@ Run this script once during initial setup or after resetting Azurite
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from azure.core.exceptions import ResourceExistsError
 from azure.data.tables import TableServiceClient
@@ -69,29 +70,17 @@ def init_tables(connection_string: str | None = None) -> dict:
         "failed": []
     }
 
-    for table_name in REQUIRED_TABLES:
-        try:
-            # Check if table already exists
-            tables = list(service_client.query_tables(
-                f"TableName eq '{table_name}'"))
-
-            if tables:
-                logger.info(f"✓ Table '{table_name}' already exists")
-                results["already_exists"].append(table_name)
-            else:
-                # Create table
-                service_client.create_table(table_name)
-                logger.info(f"✓ Created table '{table_name}'")
-                results["created"].append(table_name)
-
-        except ResourceExistsError:
-            # Race condition - table was created between check and create
-            logger.info(f"✓ Table '{table_name}' already exists")
-            results["already_exists"].append(table_name)
+    # One create_table round-trip per table, all in flight at once
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_TABLES)) as executor:
+        outcomes = list(executor.map(lambda name: _create_table(service_client, name), REQUIRED_TABLES))
 
-        except Exception as e:
-            logger.error(f"✗ Failed to create table '{table_name}': {str(e)}")
-            results["failed"].append({"table": table_name, "error": str(e)})
+    for table_name, error in zip(REQUIRED_TABLES, outcomes):
+        if error is None:
+            results["created"].append(table_name)
+        elif isinstance(error, ResourceExistsError):
+            results["already_exists"].append(table_name)
+        else:
+            results["failed"].append({"table": table_name, "error": str(error)})
 
     # Summary
     logger.info("\n" + "="*60)
@@ -117,6 +106,20 @@ def init_tables(connection_string: str | None = None) -> dict:
     return results
 
 
+def _create_table(service_client: TableServiceClient, table_name: str) -> Exception | None:
+    """Create one table; returns the error (ResourceExistsError if it already exists)"""
+    try:
+        service_client.create_table(table_name)
+        logger.info(f"✓ Created table '{table_name}'")
+        return None
+    except ResourceExistsError as e:
+        logger.info(f"✓ Table '{table_name}' already exists")
+        return e
+    except Exception as e:
+        logger.error(f"✗ Failed to create table '{table_name}': {str(e)}")
+        return e
+
+
 def _mask_connection_string(conn_str: str) -> str:
     """Mask sensitive parts of connection string for logging"""
     if "UseDevelopmentStorage=true" in conn_str:
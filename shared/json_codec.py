@@ -0,0 +1,67 @@
+"""
+JSON Codec
+Compact JSON encoding to bytes, using orjson when it is installed
+
+Execution results, logs and variables can be several MB, so they are encoded
+once into bytes and the same buffer is measured, stored and uploaded.
+Without orjson (or for values it rejects, such as integers wider than 64
+bits) the stdlib encoder produces equivalent compact output.
+
+Both paths accept the same values: the stdlib encoder converts the types
+orjson serializes natively (datetimes, UUIDs, enums, dataclasses) the way
+orjson does, so whether a result can be stored doesn't depend on which
+encoder is installed.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Stdlib fallback for the non-JSON types orjson serializes natively"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        TypeError: If the value is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(value)
+
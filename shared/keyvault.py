@@ -21,6 +21,9 @@ from azure.keyvault.secrets.aio import SecretClient
 
 logger = logging.getLogger(__name__)
 
+# Page size for the default (quick) health probe, which reads a single page
+HEALTH_PROBE_MAX_SECRETS = 25
+
 
 class KeyVaultClient:
     """
@@ -195,22 +198,31 @@ class KeyVaultClient:
                 return []
             raise
 
-    async def health_check(self) -> dict:
+    async def health_check(self, deep: bool = False) -> dict:
         """
-        Perform a comprehensive health check on Key Vault connectivity and permissions.
+        Perform a health check on Key Vault connectivity and permissions.
 
         Tests:
         - Connection to Key Vault
         - List secrets permission
         - Get secret permission (test with dummy secret)
 
+        By default only the first HEALTH_PROBE_MAX_SECRETS secrets are listed, so
+        the probe costs one list page regardless of vault size. Deep mode pages
+        through every secret to report an exact count.
+
+        Args:
+            deep: Enumerate all secrets instead of the first page
+
         Returns:
             Dict with detailed health status including:
             - status: "healthy", "degraded", or "unhealthy"
             - can_connect: bool
             - can_list_secrets: bool
             - can_get_secrets: bool
-            - secret_count: int (if list permission available)
+            - secret_count: int (if list permission available; None if the
+              quick probe hit its cap)
+            - secret_count_truncated: bool (quick probe stopped at its cap)
             - error: str (if any errors)
         """
         result = {
@@ -218,6 +230,7 @@ class KeyVaultClient:
             "can_list_secrets": False,
             "can_get_secrets": False,
             "secret_count": None,
+            "secret_count_truncated": False,
             "status": "unhealthy",
             "error": None
         }
@@ -225,12 +238,25 @@ class KeyVaultClient:
         # Test 1: Connection + List secrets
         try:
             assert self._client is not None, "Key Vault client not initialized"
-            secrets_list = [prop async for prop in self._client.list_properties_of_secrets()]
+            secrets_list = []
+            if deep:
+                async for prop in self._client.list_properties_of_secrets():
+                    secrets_list.append(prop)
+            else:
+                # First page only: iterating items would fetch the next page
+                pages = self._client.list_properties_of_secrets(max_page_size=HEALTH_PROBE_MAX_SECRETS).by_page()
+                async for page in pages:
+                    secrets_list = [prop async for prop in page]
+                    break
+                result["secret_count_truncated"] = pages.continuation_token is not None
+
             result["can_connect"] = True
             result["can_list_secrets"] = True
-            result["secret_count"] = len(secrets_list)
+            if not result["secret_count_truncated"]:
+                result["secret_count"] = len(secrets_list)
             logger.info(
-                f"Key Vault connection successful, found {len(secrets_list)} secrets")
+                f"Key Vault connection successful, found "
+                f"{len(secrets_list)}{'+' if result['secret_count_truncated'] else ''} secrets")
 
             # Test 2: Get secret permission (try to get first secret if available)
             if secrets_list:
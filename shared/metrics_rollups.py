@@ -0,0 +1,351 @@
+"""
+Execution Metrics Rollups
+Pre-aggregated execution counters for the dashboard.
+
+When an execution reaches a terminal status, ExecutionRepository.update_execution
+increments a rollup row instead of the dashboard scanning every execution:
+
+    PartitionKey "ROLLUPS" (Entities table)
+    RowKey "all:day:{YYYY-MM-DD}:{shard}"     - every execution that day
+
+Each day is spread over ROLLUP_SHARDS rows so concurrent workers rarely
+contend for the same row; readers sum the shards. Days that finished before
+rollups were recorded are backfilled once from the execution rows into
+"all:day:{YYYY-MM-DD}:backfill" rows, and a "backfill" marker row records
+that this has happened. Each row holds a count per
+status (Count{Status}), duration totals, a DurationSketch for p50/p95 and the
+shard's most recent failures. Rows are updated with ETag read-modify-write,
+retried with jittered backoff on a fresh shard, so concurrent workers do not
+lose increments, and a 30-day dashboard reads at most 31 x ROLLUP_SHARDS rows.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+from datetime import datetime, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_PARTITION = "ROLLUPS"
+
+TERMINAL_STATUSES = ("Success", "Failed", "Timeout", "CompletedWithErrors", "Cancelled")
+
+# Failures kept per "all" day row (and shown on the dashboard)
+RECENT_FAILURES_LIMIT = 10
+
+# Rows each day's counts are spread over
+ROLLUP_SHARDS = 8
+
+# ETag conflicts tolerated before an increment is dropped
+_MAX_UPDATE_ATTEMPTS = 8
+
+# Upper bound of the first retry delay; doubles per attempt (full jitter)
+_RETRY_BASE_DELAY_SECONDS = 0.05
+
+# Marker row written once the days before rollups existed have been backfilled
+BACKFILL_MARKER_ROW_KEY = "backfill"
+
+
+class DurationSketch:
+    """
+    Mergeable log-bucketed histogram of durations (milliseconds).
+
+    Values are counted in buckets whose width grows geometrically, so any
+    quantile is returned within relative_accuracy of the true value and the
+    sketch stays a few hundred buckets at most for durations up to days.
+    Sketches from different rows merge by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value_ms: float, count: int = 1) -> None:
+        """Count a duration (values below 1ms count as zero)"""
+        if value_ms < 1:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value_ms) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: "DurationSketch") -> None:
+        """Add another sketch's counts into this one (same accuracy)"""
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Approximate quantile of the counted durations.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Duration in milliseconds, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(key-1), gamma^key] in relative terms
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def to_json(self) -> str:
+        """Compact JSON for a table property"""
+        return json.dumps(
+            {"a": self.relative_accuracy, "z": self.zero_count, "b": {str(k): v for k, v in self.buckets.items()}},
+            separators=(",", ":")
+        )
+
+    @classmethod
+    def from_json(cls, value: str | None) -> "DurationSketch":
+        """Load a sketch written by to_json (empty for None or malformed values)"""
+        if not value:
+            return cls()
+        try:
+            data = json.loads(value)
+            sketch = cls(data.get("a", 0.02))
+            sketch.zero_count = int(data.get("z", 0))
+            sketch.buckets = {int(k): int(v) for k, v in data.get("b", {}).items()}
+            sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+            return sketch
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed duration sketch: {e}")
+            return cls()
+
+
+def rollup_row_key(completed_at: datetime, shard: int) -> str:
+    """
+    Rollup row an execution counts towards.
+
+    Args:
+        completed_at: When the execution finished (UTC)
+        shard: Shard number (0 to ROLLUP_SHARDS - 1)
+
+    Returns:
+        RowKey in the ROLLUPS partition
+    """
+    return f"all:day:{completed_at.strftime('%Y-%m-%d')}:{shard:02d}"
+
+
+def backfill_row_key(day: str) -> str:
+    """Backfilled rollup row for a day (YYYY-MM-DD), next to the day's shards"""
+    return f"all:day:{day}:backfill"
+
+
+def _apply(entity: dict, status: str, duration_ms: int | None, failure: dict | None) -> None:
+    """Add one execution to a rollup entity in place"""
+    count_field = f"Count{status}"
+    entity[count_field] = int(entity.get(count_field) or 0) + 1
+
+    if duration_ms is not None:
+        sketch = DurationSketch.from_json(entity.get("DurationSketch"))
+        sketch.add(duration_ms)
+        entity["DurationSketch"] = sketch.to_json()
+        entity["DurationCount"] = int(entity.get("DurationCount") or 0) + 1
+        entity["DurationTotalMs"] = int(entity.get("DurationTotalMs") or 0) + int(duration_ms)
+
+    if failure is not None:
+        failures = json.loads(entity.get("RecentFailures") or "[]")
+        failures.insert(0, failure)
+        entity["RecentFailures"] = json.dumps(failures[:RECENT_FAILURES_LIMIT])
+
+    entity["UpdatedAt"] = datetime.utcnow().isoformat()
+
+
+async def record_execution_rollup(
+    service: Any,
+    status: str,
+    duration_ms: int | None,
+    completed_at: datetime,
+    failure: dict | None = None
+) -> None:
+    """
+    Count a finished execution in a rollup row.
+
+    ETag read-modify-write of a random shard of the day. On a conflict the
+    increment is retried on another shard after a jittered, doubling delay.
+
+    Args:
+        service: Table service for the Entities table
+        status: Terminal status value (e.g. "Success")
+        duration_ms: Execution duration, if known
+        completed_at: When the execution finished (UTC)
+        failure: For failed executions, {executionId, workflowName, errorMessage, startedAt}
+    """
+    from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+    for attempt in range(_MAX_UPDATE_ATTEMPTS):
+        row_key = rollup_row_key(completed_at, random.randrange(ROLLUP_SHARDS))
+        entity = await service.get_entity(ROLLUP_PARTITION, row_key)
+        try:
+            if entity is None:
+                entity = {"PartitionKey": ROLLUP_PARTITION, "RowKey": row_key}
+                _apply(entity, status, duration_ms, failure)
+                await service.insert_entity(entity)
+            else:
+                _apply(entity, status, duration_ms, failure)
+                await service.update_entity_with_etag(entity)
+            return
+        except (ResourceExistsError, ResourceModifiedError):
+            await asyncio.sleep(random.uniform(0, _RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+
+    logger.warning(
+        f"Dropped metrics rollup increment for {completed_at:%Y-%m-%d} after {_MAX_UPDATE_ATTEMPTS} conflicts"
+    )
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    """Table timestamp (datetime or ISO string) as a naive UTC datetime"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value.replace(tzinfo=None) if value.tzinfo is None else value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def backfill_rollups(service: Any, executions: list[dict], before: datetime) -> int:
+    """
+    Count executions that finished before rollups were recorded, then write the marker.
+
+    Executions are grouped by completion day into one backfill row per day;
+    only those that finished before `before` (the first day with live rollup
+    rows) are counted, so nothing is counted twice. Rows that already exist
+    (another instance backfilling at the same time) are left alone.
+
+    Args:
+        service: Table service for the Entities table
+        executions: Execution rows (Status, DurationMs, CompletedAt, StartedAt,
+            ExecutionId, WorkflowName, ErrorMessage)
+        before: Days from this point on are covered by live rollups (UTC)
+
+    Returns:
+        Number of executions counted
+    """
+    from azure.core.exceptions import ResourceExistsError
+
+    rows: dict[str, dict] = {}
+    failures: dict[str, list[dict]] = {}
+    counted = 0
+    for execution in executions:
+        status = execution.get("Status")
+        finished_at = _as_datetime(execution.get("CompletedAt")) or _as_datetime(execution.get("StartedAt"))
+        if status not in TERMINAL_STATUSES or finished_at is None or finished_at >= before:
+            continue
+
+        row_key = backfill_row_key(finished_at.strftime("%Y-%m-%d"))
+        entity = rows.setdefault(row_key, {"PartitionKey": ROLLUP_PARTITION, "RowKey": row_key})
+        _apply(entity, status, execution.get("DurationMs"), None)
+        counted += 1
+
+        if status == "Failed":
+            started_at = execution.get("StartedAt")
+            failures.setdefault(row_key, []).append({
+                "executionId": execution.get("ExecutionId"),
+                "workflowName": execution.get("WorkflowName"),
+                "errorMessage": (execution.get("ErrorMessage") or "")[:500] or None,
+                "startedAt": (started_at.isoformat() if isinstance(started_at, datetime) else started_at) or None
+            })
+
+    for row_key, entity in rows.items():
+        # Keep the newest failures of the day, as live rows do
+        day_failures = sorted(failures.get(row_key, []), key=lambda failure: failure["startedAt"] or "", reverse=True)
+        entity["RecentFailures"] = json.dumps(day_failures[:RECENT_FAILURES_LIMIT])
+        try:
+            await service.insert_entity(entity)
+        except ResourceExistsError:
+            pass
+
+    try:
+        await service.insert_entity({
+            "PartitionKey": ROLLUP_PARTITION,
+            "RowKey": BACKFILL_MARKER_ROW_KEY,
+            "BackfilledBefore": before.isoformat(),
+            "ExecutionCount": counted
+        })
+    except ResourceExistsError:
+        pass
+
+    logger.info(f"Backfilled metrics rollups with {counted} executions finished before {before:%Y-%m-%d}")
+    return counted
+
+
+async def get_rollups(service: Any, start: datetime, end: datetime) -> list[dict]:
+    """
+    Daily rollup rows (every shard) in a time range, as one RowKey range query.
+
+    Args:
+        service: Table service for the Entities table
+        start: Range start (UTC, inclusive)
+        end: Range end (UTC, inclusive)
+
+    Returns:
+        Rollup entities in time order
+    """
+    # ';' sorts right after ':', so the upper bound includes every shard of the end day
+    return await service.query_entities(
+        filter=(
+            f"PartitionKey eq '{ROLLUP_PARTITION}' and "
+            f"RowKey ge 'all:day:{start:%Y-%m-%d}' and RowKey lt 'all:day:{end:%Y-%m-%d};'"
+        )
+    )
+
+
+def summarize_rollups(rows: list[dict]) -> dict[str, Any]:
+    """
+    Combine rollup rows into dashboard statistics.
+
+    Args:
+        rows: Rollup entities, any number of shards per day (e.g. from get_rollups)
+
+    Returns:
+        Dict with statusCounts, avgDurationSeconds, p50DurationSeconds,
+        p95DurationSeconds and recentFailures (newest first)
+    """
+    status_counts = {status: 0 for status in TERMINAL_STATUSES}
+    sketch = DurationSketch()
+    duration_total_ms = 0
+    duration_count = 0
+    failures: list[dict] = []
+
+    for row in rows:
+        for status in TERMINAL_STATUSES:
+            status_counts[status] += int(row.get(f"Count{status}") or 0)
+        sketch.merge(DurationSketch.from_json(row.get("DurationSketch")))
+        duration_total_ms += int(row.get("DurationTotalMs") or 0)
+        duration_count += int(row.get("DurationCount") or 0)
+        failures.extend(json.loads(row.get("RecentFailures") or "[]"))
+
+    failures.sort(key=lambda failure: failure.get("startedAt") or "", reverse=True)
+
+    def seconds(value_ms: float | None) -> float | None:
+        return round(value_ms / 1000, 2) if value_ms is not None else None
+
+    return {
+        "statusCounts": status_counts,
+        "avgDurationSeconds": round(duration_total_ms / duration_count / 1000, 2) if duration_count else 0.0,
+        "p50DurationSeconds": seconds(sketch.quantile(0.5)),
+        "p95DurationSeconds": seconds(sketch.quantile(0.95)),
+        "recentFailures": failures[:RECENT_FAILURES_LIMIT],
+    }
+
@@ -74,6 +74,12 @@ __all__ = [
     'WorkflowExecutionResponse',
     'ExecutionsListResponse',
     'StuckExecutionsResponse',
+    'BatchExecutionTarget',
+    'BatchExecutionRequest',
+    'BatchExecutionItem',
+    'BatchExecutionRejection',
+    'BatchExecutionResponse',
+    'BatchExecutionProgress',
     'CleanupTriggeredResponse',
 
     # System Logs
@@ -114,6 +120,8 @@ __all__ = [
     'ExecutionStats',
     'RecentFailure',
     'DashboardMetricsResponse',
+    'ExecutionLaneMetrics',
+    'QueueMetricsResponse',
 
     # OAuth Connection models
     'OAuthFlowType',
@@ -226,6 +234,19 @@ __all__ = [
 ]
 
 
+# ==================== BASE MODEL ====================
+
+
+class _Model(BaseModel):
+    """
+    Base for all models in this module.
+
+    Validators and serializers are built on first use instead of at import,
+    which keeps importing this module cheap at function app cold start.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
 # ==================== ENUMS ====================
 
 class ConfigType(str, Enum):
@@ -249,11 +270,13 @@ class ExecutionStatus(str, Enum):
     CANCELLED = "Cancelled"
 
 
-class RetryPolicy(BaseModel):
+class RetryPolicy(_Model):
     """Retry policy configuration for workflow execution"""
     maxAttempts: int = Field(3, ge=1, le=10, description="Total attempts including initial execution")
     backoffSeconds: int = Field(2, ge=1, description="Initial backoff duration in seconds")
     maxBackoffSeconds: int = Field(60, ge=1, description="Maximum backoff cap in seconds")
+    retryOn: list[str] = Field(default_factory=list, description="Exception type names that are retried (empty = any error)")
+    jitter: bool = Field(True, description="Randomize backoff delays")
 
 
 class FormAccessLevel(str, Enum):
@@ -300,7 +323,7 @@ class UserType(str, Enum):
 
 # ==================== ORGANIZATION MODELS ====================
 
-class Organization(BaseModel):
+class Organization(_Model):
     """Organization entity (response model)"""
     id: str = Field(..., description="Organization ID (GUID)")
     name: str = Field(..., min_length=1, max_length=200)
@@ -314,7 +337,7 @@ class Organization(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CreateOrganizationRequest(BaseModel):
+class CreateOrganizationRequest(_Model):
     """Request model for creating an organization"""
     name: str = Field(..., min_length=1, max_length=200)
     domain: str | None = Field(
@@ -333,7 +356,7 @@ class CreateOrganizationRequest(BaseModel):
         return v
 
 
-class UpdateOrganizationRequest(BaseModel):
+class UpdateOrganizationRequest(_Model):
     """Request model for updating an organization"""
     name: str | None = Field(None, min_length=1, max_length=200)
     domain: str | None = Field(None, description="Email domain for auto-provisioning users")
@@ -354,7 +377,7 @@ class UpdateOrganizationRequest(BaseModel):
 
 # ==================== CONFIG MODELS ====================
 
-class Config(BaseModel):
+class Config(_Model):
     """Configuration entity (global or org-specific)"""
     key: str
     value: str
@@ -368,7 +391,7 @@ class Config(BaseModel):
     updatedBy: str
 
 
-class SetConfigRequest(BaseModel):
+class SetConfigRequest(_Model):
     """Request model for setting config"""
     key: str = Field(..., pattern=r"^[a-zA-Z0-9_]+$")
     value: str | None = Field(None, description="Config value (for non-secret types) or raw secret value to create/update in Key Vault")
@@ -401,7 +424,7 @@ class SetConfigRequest(BaseModel):
 
 # ==================== INTEGRATION CONFIG MODELS ====================
 
-class IntegrationConfig(BaseModel):
+class IntegrationConfig(_Model):
     """Integration configuration entity"""
     type: IntegrationType
     enabled: bool = Field(default=True)
@@ -411,7 +434,7 @@ class IntegrationConfig(BaseModel):
     updatedBy: str
 
 
-class SetIntegrationConfigRequest(BaseModel):
+class SetIntegrationConfigRequest(_Model):
     """Request model for setting integration config"""
     type: IntegrationType
     enabled: bool = Field(default=True)
@@ -440,7 +463,7 @@ class SetIntegrationConfigRequest(BaseModel):
 
 # ==================== USER MODELS ====================
 
-class User(BaseModel):
+class User(_Model):
     """User entity"""
     id: str = Field(..., description="User ID from Azure AD")
     email: str
@@ -469,7 +492,7 @@ class User(BaseModel):
         return v
 
 
-class CreateUserRequest(BaseModel):
+class CreateUserRequest(_Model):
     """Request model for creating a user"""
     email: str = Field(..., description="User email address")
     displayName: str = Field(..., min_length=1, max_length=200, description="User display name")
@@ -486,7 +509,7 @@ class CreateUserRequest(BaseModel):
         return self
 
 
-class UpdateUserRequest(BaseModel):
+class UpdateUserRequest(_Model):
     """Request model for updating a user"""
     displayName: str | None = Field(None, min_length=1, max_length=200, description="User display name")
     isActive: bool | None = Field(None, description="Whether user is active")
@@ -503,7 +526,7 @@ class UpdateUserRequest(BaseModel):
 
 # ==================== ROLE MODELS ====================
 
-class Role(BaseModel):
+class Role(_Model):
     """Role entity for organization users"""
     id: str = Field(..., description="Role ID (GUID)")
     name: str = Field(..., min_length=1, max_length=100)
@@ -514,19 +537,19 @@ class Role(BaseModel):
     updatedAt: datetime
 
 
-class CreateRoleRequest(BaseModel):
+class CreateRoleRequest(_Model):
     """Request model for creating a role"""
     name: str = Field(..., min_length=1, max_length=100)
     description: str | None = None
 
 
-class UpdateRoleRequest(BaseModel):
+class UpdateRoleRequest(_Model):
     """Request model for updating a role"""
     name: str | None = Field(None, min_length=1, max_length=100)
     description: str | None = None
 
 
-class UserRole(BaseModel):
+class UserRole(_Model):
     """User-to-Role assignment entity"""
     userId: str
     roleId: str
@@ -534,7 +557,7 @@ class UserRole(BaseModel):
     assignedAt: datetime
 
 
-class FormRole(BaseModel):
+class FormRole(_Model):
     """Form-to-Role access control entity"""
     formId: str
     roleId: str
@@ -542,31 +565,31 @@ class FormRole(BaseModel):
     assignedAt: datetime
 
 
-class AssignUsersToRoleRequest(BaseModel):
+class AssignUsersToRoleRequest(_Model):
     """Request model for assigning users to a role"""
     userIds: list[str] = Field(..., min_length=1,
                                description="List of user IDs to assign")
 
 
-class AssignFormsToRoleRequest(BaseModel):
+class AssignFormsToRoleRequest(_Model):
     """Request model for assigning forms to a role"""
     formIds: list[str] = Field(..., min_length=1,
                                description="List of form IDs to assign")
 
 
-class RoleUsersResponse(BaseModel):
+class RoleUsersResponse(_Model):
     """Response model for getting users assigned to a role"""
     userIds: list[str] = Field(..., description="List of user IDs assigned to the role")
 
 
-class RoleFormsResponse(BaseModel):
+class RoleFormsResponse(_Model):
     """Response model for getting forms assigned to a role"""
     formIds: list[str] = Field(..., description="List of form IDs assigned to the role")
 
 
 # ==================== PERMISSION MODELS ====================
 
-class UserPermission(BaseModel):
+class UserPermission(_Model):
     """User permission entity"""
     userId: str
     orgId: str
@@ -578,7 +601,7 @@ class UserPermission(BaseModel):
     grantedAt: datetime
 
 
-class PermissionsData(BaseModel):
+class PermissionsData(_Model):
     """Permissions data for grant request"""
     canExecuteWorkflows: bool
     canManageConfig: bool
@@ -586,19 +609,19 @@ class PermissionsData(BaseModel):
     canViewHistory: bool
 
 
-class GrantPermissionsRequest(BaseModel):
+class GrantPermissionsRequest(_Model):
     """Request model for granting permissions"""
     userId: str
     orgId: str
     permissions: PermissionsData
 
 
-class UserRolesResponse(BaseModel):
+class UserRolesResponse(_Model):
     """Response model for getting roles assigned to a user"""
     roleIds: list[str] = Field(..., description="List of role IDs assigned to the user")
 
 
-class UserFormsResponse(BaseModel):
+class UserFormsResponse(_Model):
     """Response model for getting forms accessible to a user"""
     userType: UserType = Field(..., description="User type (PLATFORM or ORG)")
     hasAccessToAllForms: bool = Field(..., description="Whether user has access to all forms")
@@ -607,7 +630,7 @@ class UserFormsResponse(BaseModel):
 
 # ==================== FORM MODELS ====================
 
-class FormFieldValidation(BaseModel):
+class FormFieldValidation(_Model):
     """Form field validation rules"""
     pattern: str | None = None
     min: float | None = None
@@ -615,7 +638,7 @@ class FormFieldValidation(BaseModel):
     message: str | None = None
 
 
-class DataProviderInputConfig(BaseModel):
+class DataProviderInputConfig(_Model):
     """Configuration for a single data provider input parameter (T006)"""
     mode: DataProviderInputMode
     value: str | None = None
@@ -643,7 +666,7 @@ class DataProviderInputConfig(BaseModel):
         return self
 
 
-class FormField(BaseModel):
+class FormField(_Model):
     """Form field definition"""
     name: str = Field(..., description="Parameter name for workflow")
     label: str | None = Field(
@@ -694,7 +717,7 @@ class FormField(BaseModel):
         return self
 
 
-class FormSchema(BaseModel):
+class FormSchema(_Model):
     """Form schema with field definitions"""
     fields: list[FormField] = Field(..., max_length=50,
                                     description="Max 50 fields per form")
@@ -709,7 +732,7 @@ class FormSchema(BaseModel):
         return v
 
 
-class Form(BaseModel):
+class Form(_Model):
     """Form entity (response model)"""
     id: str
     orgId: str = Field(..., description="Organization ID or 'GLOBAL'")
@@ -734,7 +757,7 @@ class Form(BaseModel):
         None, description="Default parameter values for launch workflow (used when not provided via query params or POST body)")
 
 
-class CreateFormRequest(BaseModel):
+class CreateFormRequest(_Model):
     """Request model for creating a form"""
     name: str = Field(..., min_length=1, max_length=200)
     description: str | None = None
@@ -753,7 +776,7 @@ class CreateFormRequest(BaseModel):
         None, description="Default parameter values for launch workflow (used when not provided via query params or POST body)")
 
 
-class UpdateFormRequest(BaseModel):
+class UpdateFormRequest(_Model):
     """Request model for updating a form"""
     name: str | None = Field(None, min_length=1, max_length=200)
     description: str | None = None
@@ -771,19 +794,19 @@ class UpdateFormRequest(BaseModel):
         None, description="Default parameter values for launch workflow (used when not provided via query params or POST body)")
 
 
-class FormExecuteRequest(BaseModel):
+class FormExecuteRequest(_Model):
     """Request model for executing a form"""
     form_data: dict[str, Any] = Field(..., description="Form field values")
 
 
-class FormStartupResponse(BaseModel):
+class FormStartupResponse(_Model):
     """Response model for form startup/launch workflow execution"""
     result: dict[str, Any] | list[Any] | str | None = Field(None, description="Workflow execution result")
 
 
 # ==================== WORKFLOW EXECUTION MODELS ====================
 
-class ExecutionLog(BaseModel):
+class ExecutionLog(_Model):
     """Single log entry from workflow execution"""
     timestamp: str
     level: str  # debug, info, warning, error
@@ -791,7 +814,7 @@ class ExecutionLog(BaseModel):
     data: dict[str, Any] | None = None
 
 
-class WorkflowExecution(BaseModel):
+class WorkflowExecution(_Model):
     """Workflow execution entity"""
     executionId: str
     workflowName: str
@@ -809,9 +832,11 @@ class WorkflowExecution(BaseModel):
     completedAt: datetime | None = None
     logs: list[dict[str, Any]] | None = None  # Structured logger output (replaces old ExecutionLog format)
     variables: dict[str, Any] | None = None  # Runtime variables captured from execution scope
+    attempts: int | None = None  # Attempts made so far (workflows with a retry policy)
+    attemptHistory: list[dict[str, Any]] | None = None  # Failed/final attempts with error, retry delay and log/variables blobs
 
 
-class WorkflowExecutionRequest(BaseModel):
+class WorkflowExecutionRequest(_Model):
     """Request model for executing a workflow"""
     workflowName: str | None = Field(None, description="Name of the workflow to execute (required if code not provided)")
     inputData: dict[str, Any] = Field(default_factory=dict, description="Workflow input parameters")
@@ -828,7 +853,7 @@ class WorkflowExecutionRequest(BaseModel):
         return self
 
 
-class WorkflowExecutionResponse(BaseModel):
+class WorkflowExecutionResponse(_Model):
     """Response model for workflow execution"""
     executionId: str
     status: ExecutionStatus
@@ -845,19 +870,71 @@ class WorkflowExecutionResponse(BaseModel):
     isTransient: bool = False  # Flag for editor executions (no DB persistence)
 
 
-class ExecutionsListResponse(BaseModel):
+class ExecutionsListResponse(_Model):
     """Response model for listing workflow executions with pagination"""
     executions: list[WorkflowExecution] = Field(..., description="List of workflow executions")
     continuationToken: str | None = Field(None, description="Continuation token for next page (opaque, base64-encoded). Presence of token indicates more results available.")
 
 
-class StuckExecutionsResponse(BaseModel):
+class StuckExecutionsResponse(_Model):
     """Response model for stuck executions query"""
     executions: list[WorkflowExecution] = Field(..., description="List of stuck executions")
     count: int = Field(..., description="Number of stuck executions found")
 
 
-class CleanupTriggeredResponse(BaseModel):
+# Maximum organizations per batch launch
+MAX_BATCH_TARGETS = 1000
+
+
+class BatchExecutionTarget(_Model):
+    """One organization to run a batch workflow for"""
+    orgId: str = Field(..., description="Organization ID to execute in")
+    inputData: dict[str, Any] = Field(default_factory=dict, description="Per-organization parameters (merged over the batch inputData)")
+
+
+class BatchExecutionRequest(_Model):
+    """Request model for launching one workflow across many organizations"""
+    workflowName: str = Field(..., description="Name of the workflow to execute")
+    inputData: dict[str, Any] = Field(default_factory=dict, description="Parameters shared by every execution")
+    targets: list[BatchExecutionTarget] = Field(..., min_length=1, max_length=MAX_BATCH_TARGETS, description="Organizations (and optional per-organization parameters) to execute for")
+
+
+class BatchExecutionItem(_Model):
+    """One execution within a batch"""
+    orgId: str
+    executionId: str
+    status: ExecutionStatus = ExecutionStatus.PENDING
+    errorMessage: str | None = None
+
+
+class BatchExecutionRejection(_Model):
+    """A batch target that was not launched"""
+    orgId: str
+    reason: str
+
+
+class BatchExecutionResponse(_Model):
+    """Response model for a batch launch"""
+    batchId: str
+    workflowName: str
+    total: int = Field(..., description="Number of executions queued")
+    executions: list[BatchExecutionItem]
+    rejected: list[BatchExecutionRejection] = Field(default_factory=list, description="Targets skipped (unknown or inactive organizations)")
+
+
+class BatchExecutionProgress(_Model):
+    """Aggregated progress of a batch launch"""
+    batchId: str
+    workflowName: str
+    total: int
+    completed: int = Field(..., description="Executions in a terminal status")
+    statusCounts: dict[str, int] = Field(default_factory=dict, description="Number of executions per status")
+    isComplete: bool
+    createdAt: datetime | None = None
+    executions: list[BatchExecutionItem] = Field(default_factory=list)
+
+
+class CleanupTriggeredResponse(_Model):
     """Response model for cleanup trigger operation"""
     cleaned: int = Field(..., description="Total number of executions cleaned up")
     pending: int = Field(..., description="Number of pending executions timed out")
@@ -867,7 +944,7 @@ class CleanupTriggeredResponse(BaseModel):
 
 # ==================== SYSTEM LOGS MODELS ====================
 
-class SystemLog(BaseModel):
+class SystemLog(_Model):
     """System log entry (platform events, not workflow executions)"""
     eventId: str = Field(..., description="Unique event ID (UUID)")
     timestamp: datetime = Field(..., description="When the event occurred (ISO 8601)")
@@ -879,7 +956,7 @@ class SystemLog(BaseModel):
     details: dict[str, Any] | None = Field(None, description="Additional event-specific data")
 
 
-class SystemLogsListResponse(BaseModel):
+class SystemLogsListResponse(_Model):
     """Response model for listing system logs with pagination"""
     logs: list[SystemLog] = Field(..., description="List of system log entries")
     continuationToken: str | None = Field(None, description="Continuation token for next page (opaque, base64-encoded)")
@@ -887,7 +964,7 @@ class SystemLogsListResponse(BaseModel):
 
 # ==================== METADATA MODELS ====================
 
-class WorkflowParameter(BaseModel):
+class WorkflowParameter(_Model):
     """Workflow parameter metadata"""
     name: str
     type: str  # string, int, bool, etc.
@@ -900,7 +977,7 @@ class WorkflowParameter(BaseModel):
     description: str | None = None
 
 
-class WorkflowMetadata(BaseModel):
+class WorkflowMetadata(_Model):
     """Workflow metadata for discovery API"""
     # Required fields
     name: str = Field(..., min_length=1, pattern=r"^[a-z0-9_]+$", description="Workflow name (snake_case)")
@@ -914,8 +991,11 @@ class WorkflowMetadata(BaseModel):
     # Execution configuration
     executionMode: Literal["sync", "async"] = Field("sync", description="Execution mode")
     timeoutSeconds: int = Field(1800, ge=1, le=7200, description="Max execution time in seconds (default 30 min, max 2 hours)")
+    isolation: Literal["none", "process"] = Field("none", description="Run queued executions in the worker process pool ('process') or on the worker event loop ('none')")
+    maxConcurrency: int | None = Field(None, ge=1, description="Max queued executions of this workflow running at once (None = unlimited)")
+    integrations: list[str] = Field(default_factory=list, description="Integrations whose shared concurrency limits apply to this workflow")
 
-    # Retry and scheduling (for future use)
+    # Retry and scheduling
     retryPolicy: RetryPolicy | None = Field(None, description="Retry configuration")
     schedule: str | None = Field(None, description="Cron expression for scheduled execution")
 
@@ -931,7 +1011,7 @@ class WorkflowMetadata(BaseModel):
     relativeFilePath: str | None = Field(None, description="Workspace-relative file path (e.g., 'workflows/my_workflow.py')")
 
 
-class DataProviderMetadata(BaseModel):
+class DataProviderMetadata(_Model):
     """Data provider metadata from @data_provider decorator (T008)"""
     name: str
     description: str
@@ -942,7 +1022,7 @@ class DataProviderMetadata(BaseModel):
     relativeFilePath: str | None = Field(None, description="Workspace-relative file path (e.g., 'data_providers/my_provider.py')")
 
 
-class FormDiscoveryMetadata(BaseModel):
+class FormDiscoveryMetadata(_Model):
     """Lightweight form metadata for discovery endpoint"""
     id: str
     name: str
@@ -956,7 +1036,7 @@ class FormDiscoveryMetadata(BaseModel):
     launchWorkflowId: str | None = None
 
 
-class MetadataResponse(BaseModel):
+class MetadataResponse(_Model):
     """Response model for /admin/workflow endpoint"""
     workflows: list[WorkflowMetadata] = Field(default_factory=list)
     dataProviders: list[DataProviderMetadata] = Field(default_factory=list)
@@ -967,20 +1047,20 @@ class MetadataResponse(BaseModel):
 
 # ==================== WORKFLOW VALIDATION MODELS ====================
 
-class ValidationIssue(BaseModel):
+class ValidationIssue(_Model):
     """A single validation error or warning"""
     line: int | None = Field(None, description="Line number where issue occurs (if applicable)")
     message: str = Field(..., description="Human-readable error or warning message")
     severity: Literal["error", "warning"] = Field(..., description="Severity level")
 
 
-class WorkflowValidationRequest(BaseModel):
+class WorkflowValidationRequest(_Model):
     """Request model for workflow validation endpoint"""
     path: str = Field(..., description="Relative workspace path to the workflow file")
     content: str | None = Field(None, description="File content to validate (if not provided, reads from disk)")
 
 
-class WorkflowValidationResponse(BaseModel):
+class WorkflowValidationResponse(_Model):
     """Response model for workflow validation endpoint"""
     valid: bool = Field(..., description="True if workflow is valid and will be discovered")
     issues: list[ValidationIssue] = Field(default_factory=list, description="List of errors and warnings")
@@ -989,21 +1069,21 @@ class WorkflowValidationResponse(BaseModel):
 
 # ==================== DATA PROVIDER RESPONSE MODELS ====================
 
-class DataProviderRequest(BaseModel):
+class DataProviderRequest(_Model):
     """Request model for data provider endpoint (T009)"""
     orgId: str | None = Field(None, description="Organization ID for org-scoped providers")
     inputs: dict[str, Any] | None = Field(None, description="Input parameter values for data provider")
     noCache: bool = Field(False, description="Bypass cache and fetch fresh data")
 
 
-class DataProviderOption(BaseModel):
+class DataProviderOption(_Model):
     """Data provider option item"""
     label: str
     value: str
     metadata: dict[str, Any] | None = None
 
 
-class DataProviderResponse(BaseModel):
+class DataProviderResponse(_Model):
     """Response model for data provider endpoint"""
     provider: str = Field(..., description="Name of the data provider")
     options: list[DataProviderOption] = Field(..., description="List of options returned by the provider")
@@ -1015,7 +1095,7 @@ class DataProviderResponse(BaseModel):
 
 # ==================== SECRET MODELS ====================
 
-class SecretListResponse(BaseModel):
+class SecretListResponse(_Model):
     """Response model for listing secrets"""
     secrets: list[str] = Field(...,
                                description="List of secret names available in Key Vault")
@@ -1024,7 +1104,7 @@ class SecretListResponse(BaseModel):
     count: int = Field(..., description="Total number of secrets returned")
 
 
-class SecretCreateRequest(BaseModel):
+class SecretCreateRequest(_Model):
     """Request model for creating a secret"""
     orgId: str = Field(...,
                        description="Organization ID or 'GLOBAL' for platform-wide")
@@ -1041,12 +1121,12 @@ class SecretCreateRequest(BaseModel):
         return v
 
 
-class SecretUpdateRequest(BaseModel):
+class SecretUpdateRequest(_Model):
     """Request model for updating a secret"""
     value: str = Field(..., min_length=1, description="New secret value")
 
 
-class SecretResponse(BaseModel):
+class SecretResponse(_Model):
     """Response model for secret operations"""
     name: str = Field(...,
                       description="Full secret name in Key Vault (e.g., org-123--api-key)")
@@ -1059,7 +1139,7 @@ class SecretResponse(BaseModel):
 
 # ==================== HEALTH MODELS ====================
 
-class HealthCheck(BaseModel):
+class HealthCheck(_Model):
     """Individual health check result"""
     service: str = Field(..., description="Display name of the service (e.g., 'API', 'Key Vault')")
     healthy: bool = Field(..., description="Whether the service is healthy")
@@ -1067,14 +1147,14 @@ class HealthCheck(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional service-specific metadata")
 
 
-class BasicHealthResponse(BaseModel):
+class BasicHealthResponse(_Model):
     """Basic health check response (liveness check)"""
     status: Literal["healthy"] = Field(default="healthy", description="Health status (always healthy if API responds)")
     service: str = Field(default="Bifrost Integrations API", description="Service name")
     timestamp: str = Field(..., description="Health check timestamp (ISO 8601)")
 
 
-class GeneralHealthResponse(BaseModel):
+class GeneralHealthResponse(_Model):
     """General health check response with multiple service checks"""
     status: Literal["healthy", "degraded", "unhealthy"] = Field(..., description="Overall system health status")
     service: str = Field(default="Bifrost Integrations API", description="Service name")
@@ -1082,7 +1162,7 @@ class GeneralHealthResponse(BaseModel):
     checks: list[HealthCheck] = Field(..., description="Individual service health checks")
 
 
-class KeyVaultHealthResponse(BaseModel):
+class KeyVaultHealthResponse(_Model):
     """Health check response for Azure Key Vault"""
     status: Literal["healthy", "degraded",
                     "unhealthy"] = Field(..., description="Health status")
@@ -1097,18 +1177,20 @@ class KeyVaultHealthResponse(BaseModel):
                                 description="Whether reading secrets is permitted")
     secretCount: int | None = Field(
         None, description="Number of secrets in Key Vault (if accessible)")
+    secretCountTruncated: bool = Field(
+        False, description="Quick probe stopped listing at its cap (use deep=true for an exact count)")
     lastChecked: datetime = Field(..., description="Timestamp of health check")
 
 
 # ==================== OAUTH MODELS ====================
 
-class OAuthCallbackRequest(BaseModel):
+class OAuthCallbackRequest(_Model):
     """Request model for OAuth callback endpoint"""
     code: str = Field(..., description="Authorization code from OAuth provider")
     state: str | None = Field(None, description="State parameter for CSRF protection")
 
 
-class OAuthCallbackResponse(BaseModel):
+class OAuthCallbackResponse(_Model):
     """Response model for OAuth callback endpoint"""
     success: bool = Field(..., description="Whether the OAuth connection was successful")
     message: str = Field(..., description="Status message")
@@ -1156,7 +1238,7 @@ class OAuthCredentials:
 
 # ==================== DASHBOARD MODELS ====================
 
-class ExecutionStats(BaseModel):
+class ExecutionStats(_Model):
     """Execution statistics for dashboard"""
     totalExecutions: int
     successCount: int
@@ -1165,9 +1247,11 @@ class ExecutionStats(BaseModel):
     pendingCount: int
     successRate: float
     avgDurationSeconds: float
+    p50DurationSeconds: float | None = None
+    p95DurationSeconds: float | None = None
 
 
-class RecentFailure(BaseModel):
+class RecentFailure(_Model):
     """Recent failed execution info"""
     executionId: str
     workflowName: str
@@ -1175,7 +1259,7 @@ class RecentFailure(BaseModel):
     startedAt: str | None
 
 
-class DashboardMetricsResponse(BaseModel):
+class DashboardMetricsResponse(_Model):
     """Dashboard metrics response"""
     workflowCount: int
     dataProviderCount: int
@@ -1184,6 +1268,25 @@ class DashboardMetricsResponse(BaseModel):
     recentFailures: list[RecentFailure]
 
 
+class ExecutionLaneMetrics(_Model):
+    """Metrics for one execution lane (counters and wait times are per worker instance)"""
+    lane: str
+    queue: str
+    depth: int | None = Field(None, description="Approximate messages waiting in the lane queue")
+    running: int
+    started: int
+    deferred: int = Field(..., description="Messages deferred because their organization was at its cap")
+    waitP50Ms: int
+    waitP95Ms: int
+    waitMaxMs: int
+    orgConcurrencyLimit: int = Field(..., description="Concurrent executions per organization (0 = unlimited)")
+
+
+class QueueMetricsResponse(_Model):
+    """Execution queue metrics per priority lane"""
+    lanes: list[ExecutionLaneMetrics]
+
+
 # ==================== LIST RESPONSE MODELS ====================
 
 # List Response Models removed - Deprecated in favor of returning bare arrays
@@ -1191,13 +1294,13 @@ class DashboardMetricsResponse(BaseModel):
 
 # ==================== MVP FILE UPLOAD MODELS (T027, T028) ====================
 
-class FileUploadRequest(BaseModel):
+class FileUploadRequest(_Model):
     """Request model for generating file upload SAS URL"""
     file_name: str = Field(..., description="Original file name")
     content_type: str = Field(..., description="MIME type of the file")
     file_size: int = Field(..., description="File size in bytes")
 
-class UploadedFileMetadata(BaseModel):
+class UploadedFileMetadata(_Model):
     """Metadata for uploaded file that workflows can use to access the file"""
     name: str = Field(..., description="Original file name")
     container: str = Field(..., description="Blob storage container name (e.g., 'uploads')")
@@ -1205,7 +1308,7 @@ class UploadedFileMetadata(BaseModel):
     content_type: str = Field(..., description="MIME type of the file")
     size: int = Field(..., description="File size in bytes")
 
-class FileUploadResponse(BaseModel):
+class FileUploadResponse(_Model):
     """Response model for file upload SAS URL generation"""
     upload_url: str = Field(..., description="SAS URL for direct upload to Blob Storage")
     blob_uri: str = Field(..., description="Final blob URI (without SAS token)")
@@ -1215,7 +1318,7 @@ class FileUploadResponse(BaseModel):
 
 # ==================== WORKFLOW API KEYS (T004, T032, T033, T034 - User Story 3) ====================
 
-class WorkflowKey(BaseModel):
+class WorkflowKey(_Model):
     """Workflow API Key for HTTP access without user authentication"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique key ID")
     hashedKey: str = Field(..., description="SHA-256 hash of the API key")
@@ -1230,14 +1333,14 @@ class WorkflowKey(BaseModel):
     description: str | None = Field(None, description="Optional key description")
     disableGlobalKey: bool = Field(default=False, description="If true, workflow opts out of global API keys")
 
-class WorkflowKeyCreateRequest(BaseModel):
+class WorkflowKeyCreateRequest(_Model):
     """Request model for creating a workflow API key"""
     workflowId: str | None = Field(None, description="Workflow-specific key, or None for global")
     expiresInDays: int | None = Field(None, description="Days until key expires (default: no expiration)")
     description: str | None = Field(None, description="Optional key description")
     disableGlobalKey: bool = Field(default=False, description="If true, workflow opts out of global API keys")
 
-class WorkflowKeyResponse(BaseModel):
+class WorkflowKeyResponse(_Model):
     """Response model for workflow key (includes raw key on creation only)"""
     id: str
     rawKey: str | None = Field(None, description="Raw API key (only returned on creation)")
@@ -1261,7 +1364,7 @@ class AsyncExecutionStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
-class AsyncExecution(BaseModel):
+class AsyncExecution(_Model):
     """Async workflow execution tracking"""
     executionId: str = Field(default_factory=lambda: str(uuid.uuid4()))
     workflowId: str = Field(..., description="Workflow name to execute")
@@ -1280,7 +1383,7 @@ class AsyncExecution(BaseModel):
 
 # ==================== CRON SCHEDULING (T004, T052, T053 - User Story 5) ====================
 
-class CronSchedule(BaseModel):
+class CronSchedule(_Model):
     """CRON schedule configuration for automatic workflow execution"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     workflowId: str = Field(..., description="Workflow name to execute on schedule")
@@ -1295,7 +1398,7 @@ class CronSchedule(BaseModel):
     createdAt: datetime = Field(default_factory=datetime.utcnow)
     updatedAt: datetime = Field(default_factory=datetime.utcnow)
 
-class CronScheduleCreateRequest(BaseModel):
+class CronScheduleCreateRequest(_Model):
     """Request model for creating a CRON schedule"""
     workflowId: str = Field(..., description="Workflow name to schedule")
     cronExpression: str = Field(..., description="CRON expression (e.g., '0 2 * * *' for 2am daily)")
@@ -1311,14 +1414,14 @@ class CronScheduleCreateRequest(BaseModel):
             raise ValueError(f"Invalid CRON expression: {v}")
         return v
 
-class CronScheduleUpdateRequest(BaseModel):
+class CronScheduleUpdateRequest(_Model):
     """Request model for updating a CRON schedule"""
     cronExpression: str | None = None
     parameters: dict[str, Any] | None = None
     enabled: bool | None = None
 
 
-class ScheduleInfo(BaseModel):
+class ScheduleInfo(_Model):
     """Information about a scheduled workflow for display"""
     workflowName: str = Field(..., description="Internal workflow name/identifier")
     workflowDescription: str = Field(..., description="Display name of the workflow")
@@ -1334,18 +1437,18 @@ class ScheduleInfo(BaseModel):
     isOverdue: bool = Field(False, description="Whether the schedule is overdue by more than 6 minutes")
 
 
-class SchedulesListResponse(BaseModel):
+class SchedulesListResponse(_Model):
     """Response model for listing scheduled workflows"""
     schedules: list[ScheduleInfo] = Field(..., description="List of scheduled workflows")
     totalCount: int = Field(..., description="Total number of scheduled workflows")
 
 
-class CronValidationRequest(BaseModel):
+class CronValidationRequest(_Model):
     """Request model for CRON validation"""
     expression: str = Field(..., description="CRON expression to validate")
 
 
-class CronValidationResponse(BaseModel):
+class CronValidationResponse(_Model):
     """Response model for CRON validation"""
     valid: bool = Field(..., description="Whether the CRON expression is valid")
     humanReadable: str = Field(..., description="Human-readable description")
@@ -1355,7 +1458,7 @@ class CronValidationResponse(BaseModel):
     error: str | None = Field(None, description="Error message for invalid expressions")
 
 
-class ProcessSchedulesResponse(BaseModel):
+class ProcessSchedulesResponse(_Model):
     """Response model for processing due schedules"""
     total: int = Field(..., description="Total number of scheduled workflows")
     due: int = Field(..., description="Number of schedules that were due")
@@ -1366,7 +1469,7 @@ class ProcessSchedulesResponse(BaseModel):
 
 # ==================== PLATFORM BRANDING (T004, T071 - User Story 7) ====================
 
-class BrandingSettings(BaseModel):
+class BrandingSettings(_Model):
     """Organization branding configuration"""
     orgId: str | None = Field(None, description="Organization ID or 'GLOBAL' for platform default")
     squareLogoUrl: str | None = Field(None, description="Square logo URL (for icons, 1:1 ratio)")
@@ -1389,7 +1492,7 @@ class BrandingSettings(BaseModel):
             raise ValueError("Primary color must be a valid hex color")
         return v
 
-class BrandingUpdateRequest(BaseModel):
+class BrandingUpdateRequest(_Model):
     """Request model for updating branding settings"""
     orgId: str | None = Field(None, description="Organization ID (defaults to current user's org)")
     squareLogoUrl: str | None = None
@@ -1399,7 +1502,7 @@ class BrandingUpdateRequest(BaseModel):
 
 # ==================== ERROR MODEL ====================
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_Model):
     """API error response"""
     error: str = Field(..., description="Error code or type")
     message: str = Field(..., description="Human-readable error message")
@@ -1549,7 +1652,7 @@ OAuthFlowType = Literal["authorization_code", "client_credentials", "refresh_tok
 OAuthStatus = Literal["not_connected", "waiting_callback", "testing", "completed", "failed"]
 
 
-class CreateOAuthConnectionRequest(BaseModel):
+class CreateOAuthConnectionRequest(_Model):
     """
     Request model for creating a new OAuth connection
     POST /api/oauth/connections
@@ -1633,7 +1736,7 @@ class CreateOAuthConnectionRequest(BaseModel):
         return self
 
 
-class UpdateOAuthConnectionRequest(BaseModel):
+class UpdateOAuthConnectionRequest(_Model):
     """
     Request model for updating an OAuth connection
     PUT /api/oauth/connections/{connection_name}
@@ -1645,7 +1748,7 @@ class UpdateOAuthConnectionRequest(BaseModel):
     scopes: str | None = None
 
 
-class OAuthConnectionSummary(BaseModel):
+class OAuthConnectionSummary(_Model):
     """
     Summary model for OAuth connections (used in list responses)
     GET /api/oauth/connections
@@ -1670,7 +1773,7 @@ class OAuthConnectionSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class OAuthConnectionDetail(BaseModel):
+class OAuthConnectionDetail(_Model):
     """
     Detailed model for OAuth connections (used in get/update responses)
     GET /api/oauth/connections/{connection_name}
@@ -1713,7 +1816,7 @@ class OAuthConnectionDetail(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class OAuthConnection(BaseModel):
+class OAuthConnection(_Model):
     """
     Internal model representing full OAuth connection data
     Used for storage operations and business logic
@@ -1836,7 +1939,7 @@ class OAuthConnection(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class OAuthCredentialsModel(BaseModel):
+class OAuthCredentialsModel(_Model):
     """
     OAuth credentials Pydantic model for API responses
     GET /api/oauth/credentials/{connection_name}
@@ -1877,7 +1980,7 @@ class OAuthCredentialsModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class OAuthCredentialsResponse(BaseModel):
+class OAuthCredentialsResponse(_Model):
     """
     Response wrapper for OAuth credentials endpoint
     Includes connection status and metadata
@@ -1909,7 +2012,7 @@ class FileType(str, Enum):
     FOLDER = "folder"
 
 
-class FileMetadata(BaseModel):
+class FileMetadata(_Model):
     """
     File or folder metadata
     Used in directory listing responses
@@ -1925,7 +2028,7 @@ class FileMetadata(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileContentRequest(BaseModel):
+class FileContentRequest(_Model):
     """Request to write file content"""
     path: str = Field(..., description="Relative path from /home/repo")
     content: str = Field(..., description="File content (plain text or base64 encoded)")
@@ -1935,7 +2038,7 @@ class FileContentRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileContentResponse(BaseModel):
+class FileContentResponse(_Model):
     """Response with file content"""
     path: str = Field(..., description="Relative path from /home/repo")
     content: str = Field(..., description="File content")
@@ -1943,11 +2046,16 @@ class FileContentResponse(BaseModel):
     size: int = Field(..., description="Content size in bytes")
     etag: str = Field(..., description="ETag for change detection")
     modified: str = Field(..., description="Last modified timestamp (ISO 8601)")
+    isPartial: bool = Field(default=False, description="Whether content is a byte or line range of the file")
+    totalSize: int | None = Field(default=None, description="Total file size in bytes (partial reads only)")
+    offset: int | None = Field(default=None, description="Byte offset of returned content (partial reads only)")
+    startLine: int | None = Field(default=None, description="First line returned, 1-indexed (line-range reads only)")
+    endLine: int | None = Field(default=None, description="Last line returned, 1-indexed (line-range reads only)")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileConflictResponse(BaseModel):
+class FileConflictResponse(_Model):
     """Response when file write encounters a conflict"""
     reason: Literal["content_changed", "path_not_found"] = Field(..., description="Type of conflict")
     message: str = Field(..., description="Human-readable conflict description")
@@ -1955,7 +2063,7 @@ class FileConflictResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class SearchRequest(BaseModel):
+class SearchRequest(_Model):
     """Search query request"""
     query: str = Field(..., min_length=1, description="Search text or regex pattern")
     caseSensitive: bool = Field(default=False, description="Case-sensitive matching")
@@ -1966,7 +2074,7 @@ class SearchRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class SearchResult(BaseModel):
+class SearchResult(_Model):
     """Single search match result"""
     filePath: str = Field(..., description="Relative path to file containing match")
     line: int = Field(..., ge=1, description="Line number (1-indexed)")
@@ -1978,7 +2086,7 @@ class SearchResult(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(_Model):
     """Search results response"""
     query: str = Field(..., description="Original search query")
     totalMatches: int = Field(..., description="Total matches found")
@@ -1992,7 +2100,7 @@ class SearchResponse(BaseModel):
 
 # ==================== PACKAGE MANAGEMENT MODELS ====================
 
-class InstallPackageRequest(BaseModel):
+class InstallPackageRequest(_Model):
     """Request model for installing a package"""
     package: str = Field(..., min_length=1, description="Package name to install")
     version: str | None = Field(None, description="Optional package version (e.g., '2.31.0')")
@@ -2000,7 +2108,7 @@ class InstallPackageRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class PackageInstallResponse(BaseModel):
+class PackageInstallResponse(_Model):
     """Response model for package installation"""
     job_id: str = Field(..., description="Job ID for tracking installation progress")
     status: Literal["queued"] = Field(default="queued", description="Installation status")
@@ -2008,7 +2116,7 @@ class PackageInstallResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class InstalledPackage(BaseModel):
+class InstalledPackage(_Model):
     """Installed package information"""
     name: str = Field(..., description="Package name")
     version: str = Field(..., description="Installed version")
@@ -2016,14 +2124,14 @@ class InstalledPackage(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class InstalledPackagesResponse(BaseModel):
+class InstalledPackagesResponse(_Model):
     """Response model for listing installed packages"""
     packages: list[InstalledPackage] = Field(..., description="List of installed packages")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class PackageUpdate(BaseModel):
+class PackageUpdate(_Model):
     """Package update information"""
     name: str = Field(..., description="Package name")
     current_version: str = Field(..., description="Currently installed version")
@@ -2032,7 +2140,7 @@ class PackageUpdate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class PackageUpdatesResponse(BaseModel):
+class PackageUpdatesResponse(_Model):
     """Response model for checking package updates"""
     updates: list[PackageUpdate] = Field(..., description="List of available updates")
 
@@ -2051,7 +2159,7 @@ class GitFileStatus(str, Enum):
     CONFLICTED = "C"    # File with merge conflicts
 
 
-class FileChange(BaseModel):
+class FileChange(_Model):
     """Represents a changed file in Git"""
     path: str = Field(..., description="Relative path from workspace root")
     status: GitFileStatus = Field(..., description="Git status of the file")
@@ -2061,7 +2169,7 @@ class FileChange(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ConflictInfo(BaseModel):
+class ConflictInfo(_Model):
     """Information about conflicts in a file (no markers written to disk)"""
     file_path: str = Field(..., description="Relative path to conflicted file")
     current_content: str = Field(..., description="Local version of the file")
@@ -2071,7 +2179,7 @@ class ConflictInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubConfigRequest(BaseModel):
+class GitHubConfigRequest(_Model):
     """Request to configure GitHub integration - will always replace workspace with remote"""
     repo_url: str = Field(..., min_length=1, description="GitHub repository URL (e.g., https://github.com/user/repo)")
     branch: str = Field(default="main", description="Branch to sync with")
@@ -2079,7 +2187,7 @@ class GitHubConfigRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubConfigResponse(BaseModel):
+class GitHubConfigResponse(_Model):
     """Response after configuring GitHub"""
     configured: bool = Field(..., description="Whether GitHub is fully configured")
     token_saved: bool = Field(default=False, description="Whether a GitHub token has been validated and saved")
@@ -2090,7 +2198,7 @@ class GitHubConfigResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubRepoInfo(BaseModel):
+class GitHubRepoInfo(_Model):
     """GitHub repository information"""
     name: str = Field(..., description="Repository name (owner/repo)")
     full_name: str = Field(..., description="Full repository name")
@@ -2101,14 +2209,14 @@ class GitHubRepoInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubReposResponse(BaseModel):
+class GitHubReposResponse(_Model):
     """Response with list of GitHub repositories"""
     repositories: list[GitHubRepoInfo] = Field(..., description="List of accessible repositories")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubBranchInfo(BaseModel):
+class GitHubBranchInfo(_Model):
     """GitHub branch information"""
     name: str = Field(..., description="Branch name")
     protected: bool = Field(..., description="Whether branch is protected")
@@ -2117,14 +2225,14 @@ class GitHubBranchInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubBranchesResponse(BaseModel):
+class GitHubBranchesResponse(_Model):
     """Response with list of branches"""
     branches: list[GitHubBranchInfo] = Field(..., description="List of branches in repository")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class WorkspaceAnalysisResponse(BaseModel):
+class WorkspaceAnalysisResponse(_Model):
     """Response with workspace analysis - simplified for replace-only strategy"""
     workspace_status: Literal["empty", "has_files_no_git", "is_git_repo", "is_different_git_repo"] = Field(
         ...,
@@ -2138,7 +2246,7 @@ class WorkspaceAnalysisResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CreateRepoRequest(BaseModel):
+class CreateRepoRequest(_Model):
     """Request to create a new GitHub repository"""
     name: str = Field(..., min_length=1, description="Repository name")
     description: str | None = Field(None, description="Repository description")
@@ -2148,7 +2256,7 @@ class CreateRepoRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubConfigEntity(BaseModel):
+class GitHubConfigEntity(_Model):
     """GitHub integration configuration stored in Config table"""
     status: Literal["disconnected", "token_saved", "configured"] = Field(
         ...,
@@ -2163,7 +2271,7 @@ class GitHubConfigEntity(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CreateRepoResponse(BaseModel):
+class CreateRepoResponse(_Model):
     """Response after creating a new repository"""
     full_name: str = Field(..., description="Full repository name (owner/repo)")
     url: str = Field(..., description="Repository URL")
@@ -2172,7 +2280,7 @@ class CreateRepoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FetchFromGitHubResponse(BaseModel):
+class FetchFromGitHubResponse(_Model):
     """Response after fetching from remote"""
     success: bool = Field(..., description="Whether fetch was successful")
     commits_ahead: int = Field(default=0, description="Number of local commits ahead of remote")
@@ -2182,14 +2290,14 @@ class FetchFromGitHubResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CommitAndPushRequest(BaseModel):
+class CommitAndPushRequest(_Model):
     """Request to commit and push changes"""
     message: str = Field(..., min_length=1, description="Commit message")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class CommitAndPushResponse(BaseModel):
+class CommitAndPushResponse(_Model):
     """Response after commit and push"""
     success: bool = Field(..., description="Whether operation succeeded")
     commit_sha: str | None = Field(None, description="SHA of created commit")
@@ -2199,14 +2307,14 @@ class CommitAndPushResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class PushToGitHubRequest(BaseModel):
+class PushToGitHubRequest(_Model):
     """Request to push to GitHub"""
     connection_id: str | None = Field(None, description="WebPubSub connection ID for streaming logs")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class PushToGitHubResponse(BaseModel):
+class PushToGitHubResponse(_Model):
     """Response after pushing to GitHub"""
     success: bool = Field(..., description="Whether push succeeded")
     error: str | None = Field(None, description="Error message if push failed")
@@ -2214,14 +2322,14 @@ class PushToGitHubResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class PullFromGitHubRequest(BaseModel):
+class PullFromGitHubRequest(_Model):
     """Request to pull from GitHub"""
     connection_id: str | None = Field(None, description="WebPubSub connection ID for streaming logs")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class PullFromGitHubResponse(BaseModel):
+class PullFromGitHubResponse(_Model):
     """Response after pulling from GitHub"""
     success: bool = Field(..., description="Whether pull succeeded")
     updated_files: list[str] = Field(default_factory=list, description="List of updated file paths")
@@ -2231,14 +2339,14 @@ class PullFromGitHubResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubSyncRequest(BaseModel):
+class GitHubSyncRequest(_Model):
     """Request to sync with GitHub (pull + push)"""
     connection_id: str | None = Field(None, description="WebPubSub connection ID for streaming logs")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitHubSyncResponse(BaseModel):
+class GitHubSyncResponse(_Model):
     """Response after queueing a git sync job"""
     job_id: str = Field(..., description="Job ID for tracking the sync operation")
     status: str = Field(..., description="Job status (queued, processing, completed, failed)")
@@ -2246,7 +2354,7 @@ class GitHubSyncResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GitRefreshStatusResponse(BaseModel):
+class GitRefreshStatusResponse(_Model):
     """
     Unified response after fetching and getting complete Git status.
     This combines fetch + status + commit history into a single response.
@@ -2275,7 +2383,7 @@ class GitRefreshStatusResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class DiscardUnpushedCommitsResponse(BaseModel):
+class DiscardUnpushedCommitsResponse(_Model):
     """Response after discarding unpushed commits"""
     success: bool = Field(..., description="Whether discard was successful")
     discarded_commits: list['CommitInfo'] = Field(default_factory=list, description="List of commits that were discarded")
@@ -2285,21 +2393,21 @@ class DiscardUnpushedCommitsResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class DiscardCommitRequest(BaseModel):
+class DiscardCommitRequest(_Model):
     """Request to discard a specific commit and all newer commits"""
     commit_sha: str = Field(..., min_length=1, description="SHA of the commit to discard (this commit and all newer commits will be discarded)")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileDiffRequest(BaseModel):
+class FileDiffRequest(_Model):
     """Request to get file diff"""
     file_path: str = Field(..., min_length=1, description="Relative path to file")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileDiffResponse(BaseModel):
+class FileDiffResponse(_Model):
     """Response with file diff information"""
     file_path: str = Field(..., description="Relative path to file")
     old_content: str | None = Field(None, description="Previous file content (None if new file)")
@@ -2310,7 +2418,7 @@ class FileDiffResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ResolveConflictRequest(BaseModel):
+class ResolveConflictRequest(_Model):
     """Request to resolve a conflict"""
     file_path: str = Field(..., min_length=1, description="Relative path to conflicted file")
     resolution: Literal["current", "incoming", "both", "manual"] = Field(..., description="How to resolve conflict")
@@ -2325,7 +2433,7 @@ class ResolveConflictRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ResolveConflictResponse(BaseModel):
+class ResolveConflictResponse(_Model):
     """Response after resolving conflict"""
     success: bool = Field(..., description="Whether resolution succeeded")
     file_path: str = Field(..., description="Path to resolved file")
@@ -2334,7 +2442,7 @@ class ResolveConflictResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CommitInfo(BaseModel):
+class CommitInfo(_Model):
     """Information about a single commit"""
     sha: str = Field(..., description="Commit SHA")
     message: str = Field(..., description="Commit message")
@@ -2345,7 +2453,7 @@ class CommitInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class CommitHistoryResponse(BaseModel):
+class CommitHistoryResponse(_Model):
     """Response with commit history and pagination"""
     commits: list[CommitInfo] = Field(default_factory=list, description="List of commits (newest first)")
     total_commits: int = Field(..., description="Total number of commits in the entire history")
@@ -2363,7 +2471,7 @@ class SDKUsageType(str, Enum):
     OAUTH = "oauth"
 
 
-class SDKUsageIssue(BaseModel):
+class SDKUsageIssue(_Model):
     """
     Represents a missing SDK dependency found in a workflow file.
 
@@ -2380,7 +2488,7 @@ class SDKUsageIssue(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class WorkspaceScanRequest(BaseModel):
+class WorkspaceScanRequest(_Model):
     """Request to scan workspace for SDK usage issues"""
     # No fields needed - scans entire workspace
     pass
@@ -2388,7 +2496,7 @@ class WorkspaceScanRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FileScanRequest(BaseModel):
+class FileScanRequest(_Model):
     """Request to scan a single file for SDK usage issues"""
     file_path: str = Field(..., min_length=1, description="Relative path to file in workspace")
     content: str | None = Field(None, description="Optional file content (if not provided, reads from disk)")
@@ -2396,7 +2504,7 @@ class FileScanRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class WorkspaceScanResponse(BaseModel):
+class WorkspaceScanResponse(_Model):
     """Response from scanning workspace for SDK usage and form validation issues"""
     issues: list[SDKUsageIssue] = Field(default_factory=list, description="List of SDK usage issues found")
     scanned_files: int = Field(..., description="Number of Python files scanned")
@@ -2405,13 +2513,17 @@ class WorkspaceScanResponse(BaseModel):
         default_factory=list, description="List of form validation issues found")
     scanned_forms: int = Field(default=0, description="Number of form files scanned")
     valid_forms: int = Field(default=0, description="Number of valid forms loaded")
+    unavailable_sources: list[str] = Field(
+        default_factory=list,
+        description="Stored-key sources (config, secret, oauth) that could not be checked; "
+                    "calls using them are not reported as issues")
 
     model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== FORM VALIDATION SCANNING ====================
 
-class FormValidationIssue(BaseModel):
+class FormValidationIssue(_Model):
     """
     Represents a validation error found when loading a form definition.
 
@@ -2428,7 +2540,7 @@ class FormValidationIssue(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FormScanResponse(BaseModel):
+class FormScanResponse(_Model):
     """Response from scanning workspace for form validation issues"""
     issues: list[FormValidationIssue] = Field(default_factory=list, description="List of form validation issues found")
     scanned_forms: int = Field(..., description="Number of form files scanned")
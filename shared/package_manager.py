@@ -4,23 +4,91 @@ Package Management for User Workspaces
 Provides package installation and management for user workspace Python environments.
 Packages are installed to workspace-specific .packages directories.
 
-Uses /tmp for pip installation then manual_copy_tree() to Azure Files for
+Uses local disk for pip installation then sync_tree() to Azure Files for
 compatibility with Azure Files SMB limitations.
+
+Installs are cached on local disk so repeat installs are cheap:
+- pip's wheel/HTTP cache is kept in a persistent local directory
+- fully pinned requirement sets are installed once into a content-addressed
+  package cache (keyed by the requirement set and Python version) and reused
+- only files that changed since the last sync are written to .packages,
+  tracked by a manifest of content hashes
 """
 
 import asyncio
+import csv
+import hashlib
 import json
 import logging
+import posixpath
+import shutil
 import sys
+import uuid
 from pathlib import Path
 from typing import Awaitable, Callable, Optional
 
 import aiohttp
 
-from shared.utils.file_operations import manual_copy_tree, get_system_tmp
+from shared.utils.file_operations import get_system_tmp, sync_tree, tree_matches_manifest
 
 logger = logging.getLogger(__name__)
 
+# Local (non-SMB) cache directories, shared by all workspaces on this host
+PACKAGE_CACHE_DIR_NAME = "bifrost_package_cache"
+PIP_CACHE_DIR_NAME = "bifrost_pip_cache"
+
+# Manifest of files synced into .packages (relative path -> sha256)
+MANIFEST_FILE_NAME = ".bifrost-manifest.json"
+
+# Number of resolved package sets kept in the local package cache
+MAX_CACHED_PACKAGE_SETS = 20
+
+# Marker written once a cached package set is fully installed
+_CACHE_COMPLETE_MARKER = ".complete"
+
+_EXCLUDE_PATTERNS = ['.DS_Store', '._*', _CACHE_COMPLETE_MARKER]
+
+
+def _is_pinned(specs: list[str]) -> bool:
+    """
+    Check if every requirement is pinned to an exact version.
+
+    Only pinned sets resolve to the same packages every time, so only they
+    can be served from the package cache.
+    """
+    if not specs:
+        return False
+
+    for spec in specs:
+        if spec.startswith("-") or "://" in spec or "==" not in spec:
+            return False
+        if any(op in spec for op in (">", "<", "~=", "!=", "*")):
+            return False
+
+    return True
+
+
+def _dist_info_project(dist_info_name: str) -> str:
+    """Normalized project name of a "<name>-<version>.dist-info" directory"""
+    return dist_info_name.removesuffix(".dist-info").rsplit("-", 1)[0].lower().replace("_", "-")
+
+
+def _cache_key(specs: list[str]) -> str:
+    """Content address for a requirement set on this Python version."""
+    normalized = sorted(spec.replace(" ", "").lower() for spec in specs)
+    key_source = "\n".join([f"py{sys.version_info.major}.{sys.version_info.minor}", sys.platform, *normalized])
+    return hashlib.sha256(key_source.encode()).hexdigest()[:32]
+
+
+def _parse_requirements(content: str) -> list[str]:
+    """Extract requirement specs from requirements.txt content (comments stripped)."""
+    specs = []
+    for line in content.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if line and not line.startswith("#"):
+            specs.append(line)
+    return specs
+
 
 class PackageNotFoundError(Exception):
     """Package not found on PyPI"""
@@ -54,6 +122,8 @@ class WorkspacePackageManager:
         self.workspace_path = workspace_path
         self.packages_dir = workspace_path / ".packages"
         self.requirements_file = workspace_path / "requirements.txt"
+        self.package_cache_dir = get_system_tmp() / PACKAGE_CACHE_DIR_NAME
+        self.pip_cache_dir = get_system_tmp() / PIP_CACHE_DIR_NAME
 
     async def get_package_info(self, package_name: str) -> PackageInfo:
         """
@@ -187,61 +257,8 @@ class WorkspacePackageManager:
         else:
             await log(f"Installing {package_spec}...")
 
-        # Create packages directory
-        self.packages_dir.mkdir(parents=True, exist_ok=True)
-
-        # Install to /tmp first, then copy to Azure Files
-        tmp_packages_dir = get_system_tmp() / f"bifrost_packages_{id(self)}"
-        tmp_packages_dir.mkdir(parents=True, exist_ok=True)
-
-        try:
-            await log("Installing to /tmp...")
-
-            # Install package to /tmp
-            process = await asyncio.create_subprocess_exec(
-                sys.executable, "-m", "pip", "install",
-                package_spec,
-                "--target", str(tmp_packages_dir),
-                "--upgrade",
-                "--no-warn-script-location",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT
-            )
-
-            # Stream output
-            try:
-                async with asyncio.timeout(timeout):
-                    if process.stdout:
-                        async for line in process.stdout:
-                            decoded = line.decode().strip()
-                            if decoded:
-                                await log(decoded)
-
-                    await process.wait()
-            except asyncio.TimeoutError:
-                process.kill()
-                await log(f"✗ Installation timed out after {timeout} seconds")
-                raise Exception(f"Package installation timed out after {timeout} seconds")
-
-            if process.returncode != 0:
-                await log("✗ Installation failed")
-                raise Exception("Package installation failed")
-
-            # Copy from /tmp to Azure Files
-            await log("Copying packages to workspace...")
-            manual_copy_tree(
-                tmp_packages_dir,
-                self.packages_dir,
-                exclude_patterns=['.DS_Store', '._*']
-            )
-
-            await log(f"✓ {package_spec} installed successfully")
-
-        finally:
-            # Clean up /tmp
-            import shutil
-            if tmp_packages_dir.exists():
-                shutil.rmtree(tmp_packages_dir, ignore_errors=True)
+        await self._install_and_sync([package_spec], [package_spec], log, timeout)
+        await log(f"✓ {package_spec} installed successfully")
 
         # Append to requirements.txt if requested and package is new or version changed
         if append_to_requirements and (not existing or version):
@@ -280,60 +297,304 @@ class WorkspacePackageManager:
             await log(f"✗ {requirements_file.name} not found")
             raise FileNotFoundError(f"Requirements file not found: {requirements_file}")
 
-        # Create packages directory
+        content = requirements_file.read_text()
+        specs = _parse_requirements(content)
+        requirements_hash = hashlib.sha256(content.encode()).hexdigest()
+
+        # Pinned requirements that were already synced need no install (e.g. cold start re-sync),
+        # but .packages may have been changed out of band since
+        manifest = self._load_manifest()
+        if _is_pinned(specs) and manifest.get("requirements") == requirements_hash:
+            repaired = await self._repair_unchanged_requirements(specs, requirements_hash, manifest)
+            if repaired:
+                await log(f"✓ Requirements unchanged since last install, repaired {repaired} changed files")
+                return
+            if repaired == 0:
+                await log("✓ Requirements unchanged since last install, nothing to do")
+                return
+            await log("Packages changed outside of installs, reinstalling...")
+
+        await self._install_and_sync(
+            ["-r", str(requirements_file)], specs, log, timeout, requirements_hash=requirements_hash
+        )
+        await log(f"✓ Packages installed successfully to {self.packages_dir}")
+
+    async def _repair_unchanged_requirements(
+        self,
+        specs: list[str],
+        requirements_hash: str,
+        manifest: dict
+    ) -> Optional[int]:
+        """
+        Bring .packages back in line with unchanged requirements without running pip.
+
+        Re-syncs from the local package cache when this instance still has it
+        (rewriting only deleted or edited files); otherwise just checks the
+        synced files against the manifest.
+
+        Returns:
+            Number of files repaired, or None if a full install is needed
+        """
+        loop = asyncio.get_event_loop()
+        cache_dir = self.package_cache_dir / _cache_key(specs)
+
+        if (cache_dir / _CACHE_COMPLETE_MARKER).exists():
+            cache_dir.touch()
+            written, _ = await loop.run_in_executor(
+                None, self._sync_to_workspace, cache_dir, requirements_hash
+            )
+            return written
+
+        in_sync = await loop.run_in_executor(
+            None, tree_matches_manifest, self.packages_dir, manifest.get("files", {})
+        )
+        return 0 if in_sync else None
+
+    async def _install_and_sync(
+        self,
+        pip_args: list[str],
+        specs: list[str],
+        log: Callable[[str], Awaitable[None]],
+        timeout: int,
+        requirements_hash: Optional[str] = None
+    ):
+        """
+        Install packages on local disk (or reuse a cached install) and sync to .packages.
+
+        Args:
+            pip_args: Requirement arguments for pip install
+            specs: Requirement specs, used to address the package cache
+            log: Async log callback
+            timeout: Installation timeout in seconds
+            requirements_hash: Hash of requirements.txt to record in the manifest
+
+        Raises:
+            Exception: If installation fails or times out
+        """
         self.packages_dir.mkdir(parents=True, exist_ok=True)
 
-        # Install to /tmp first, then copy to Azure Files
-        tmp_packages_dir = get_system_tmp() / f"bifrost_packages_{id(self)}"
-        tmp_packages_dir.mkdir(parents=True, exist_ok=True)
+        pinned = _is_pinned(specs)
+        cache_dir = self.package_cache_dir / _cache_key(specs)
+        staging_dir: Path | None = None
 
         try:
-            await log("Installing to /tmp...")
-
-            # Run pip with streaming output (to /tmp)
-            process = await asyncio.create_subprocess_exec(
-                sys.executable, "-m", "pip", "install",
-                "-r", str(requirements_file),
-                "--target", str(tmp_packages_dir),
-                "--upgrade",
-                "--no-warn-script-location",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT
+            if pinned and (cache_dir / _CACHE_COMPLETE_MARKER).exists():
+                await log("✓ Using cached packages (already resolved for this requirement set)")
+                cache_dir.touch()
+                source_dir = cache_dir
+            else:
+                # Install to local disk first, then copy to Azure Files
+                staging_dir = self.package_cache_dir / f"{cache_dir.name}.partial-{uuid.uuid4().hex[:8]}"
+                staging_dir.mkdir(parents=True, exist_ok=True)
+
+                await log("Installing to local package cache...")
+                await self._run_pip(pip_args, staging_dir, log, timeout)
+
+                source_dir = staging_dir
+                if pinned:
+                    source_dir = self._promote_to_cache(staging_dir, cache_dir)
+                    staging_dir = None if source_dir == cache_dir else staging_dir
+
+            await log("Syncing packages to workspace...")
+            loop = asyncio.get_event_loop()
+            written, total = await loop.run_in_executor(
+                None, self._sync_to_workspace, source_dir, requirements_hash
             )
+            await log(f"✓ Synced packages to workspace ({written} of {total} files changed)")
+
+        finally:
+            if staging_dir is not None and staging_dir.exists():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self._prune_package_cache()
+
+    async def _run_pip(
+        self,
+        pip_args: list[str],
+        target_dir: Path,
+        log: Callable[[str], Awaitable[None]],
+        timeout: int
+    ):
+        """
+        Run pip install --target with streaming output and the shared wheel cache.
+
+        Raises:
+            Exception: If installation fails or times out
+        """
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "pip", "install",
+            *pip_args,
+            "--target", str(target_dir),
+            "--upgrade",
+            "--no-warn-script-location",
+            "--cache-dir", str(self.pip_cache_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+
+        # Stream output line by line
+        try:
+            async with asyncio.timeout(timeout):
+                if process.stdout:
+                    async for line in process.stdout:
+                        decoded = line.decode().strip()
+                        if decoded:
+                            await log(decoded)
+
+                await process.wait()
+        except asyncio.TimeoutError:
+            process.kill()
+            await log(f"✗ Installation timed out after {timeout} seconds")
+            raise Exception(f"Package installation timed out after {timeout} seconds")
+
+        if process.returncode != 0:
+            await log("✗ Installation failed")
+            raise Exception("Package installation failed")
+
+    def _promote_to_cache(self, staging_dir: Path, cache_dir: Path) -> Path:
+        """
+        Move a finished install into its content-addressed cache slot.
+
+        Returns:
+            The directory to sync from (cache_dir, or staging_dir if another
+            install claimed the slot first)
+        """
+        (staging_dir / _CACHE_COMPLETE_MARKER).touch()
+        try:
+            staging_dir.rename(cache_dir)
+        except OSError:
+            # Another install populated this slot concurrently
+            return cache_dir if (cache_dir / _CACHE_COMPLETE_MARKER).exists() else staging_dir
+
+        return cache_dir
+
+    def _sync_to_workspace(self, source_dir: Path, requirements_hash: Optional[str]) -> tuple[int, int]:
+        """
+        Sync an installed package tree into .packages, writing only changed files.
+
+        Returns:
+            Tuple of (files written, files in source)
+        """
+        manifest = self._load_manifest()
+        files = manifest.get("files", {})
 
-            # Stream output line by line
+        if requirements_hash:
+            # A full requirements install is the whole environment - anything else previously synced goes
+            removable = set(files)
+        else:
+            # A single install only replaces its own packages; other packages may share
+            # top-level directories (azure/, google/, bin/), so only the replaced RECORDs are removable
+            removable = self._replaced_package_files(source_dir)
+
+        files = self._remove_superseded_dist_info(source_dir, files)
+
+        files, written = sync_tree(
+            source_dir,
+            self.packages_dir,
+            files,
+            exclude_patterns=_EXCLUDE_PATTERNS,
+            removable=removable
+        )
+
+        manifest["files"] = files
+        if requirements_hash:
+            manifest["requirements"] = requirements_hash
+        else:
+            # Individual installs change the environment; force the next requirements sync
+            manifest.pop("requirements", None)
+        self._save_manifest(manifest)
+
+        total = sum(
+            1 for path in source_dir.rglob("*")
+            if path.is_file() and path.name != _CACHE_COMPLETE_MARKER
+        )
+        return written, total
+
+    def _replaced_package_files(self, source_dir: Path) -> set[str]:
+        """
+        Files installed by the .packages versions of the packages being synced.
+
+        Read from each replaced package's dist-info RECORD (paths relative to
+        .packages; entries pointing outside it are ignored).
+
+        Returns:
+            Relative POSIX paths
+        """
+        incoming = {_dist_info_project(path.name) for path in source_dir.glob("*.dist-info")}
+        replaced: set[str] = set()
+        if not incoming or not self.packages_dir.exists():
+            return replaced
+
+        for existing in self.packages_dir.glob("*.dist-info"):
+            if _dist_info_project(existing.name) not in incoming:
+                continue
             try:
-                async with asyncio.timeout(timeout):
-                    if process.stdout:
-                        async for line in process.stdout:
-                            decoded = line.decode().strip()
-                            if decoded:
-                                await log(decoded)
-
-                    await process.wait()
-            except asyncio.TimeoutError:
-                process.kill()
-                await log(f"✗ Installation timed out after {timeout} seconds")
-                raise Exception(f"Package installation timed out after {timeout} seconds")
-
-            if process.returncode != 0:
-                await log("✗ Installation failed")
-                raise Exception("Package installation failed")
-
-            # Copy from /tmp to Azure Files
-            await log("Copying packages to workspace...")
-            manual_copy_tree(
-                tmp_packages_dir,
-                self.packages_dir,
-                exclude_patterns=['.DS_Store', '._*']
+                with open(existing / "RECORD", newline="") as f:
+                    for row in csv.reader(f):
+                        rel = posixpath.normpath(row[0]) if row else ""
+                        if rel and not rel.startswith("..") and not posixpath.isabs(rel):
+                            replaced.add(rel)
+            except OSError:
+                continue
+
+        return replaced
+
+    def _remove_superseded_dist_info(self, source_dir: Path, files: dict[str, str]) -> dict[str, str]:
+        """
+        Remove .dist-info directories for other versions of packages being synced.
+
+        Without this, upgrades leave the old version's metadata behind and
+        pip list reports both versions.
+
+        Returns:
+            Manifest files with entries for removed directories dropped
+        """
+        incoming = {
+            _dist_info_project(path.name): path.name
+            for path in source_dir.glob("*.dist-info")
+        }
+        if not incoming or not self.packages_dir.exists():
+            return files
+
+        for existing in self.packages_dir.glob("*.dist-info"):
+            name = _dist_info_project(existing.name)
+            if name in incoming and existing.name != incoming[name]:
+                logger.info(f"Removing superseded package metadata: {existing.name}")
+                shutil.rmtree(existing, ignore_errors=True)
+                prefix = f"{existing.name}/"
+                files = {rel: digest for rel, digest in files.items() if not rel.startswith(prefix)}
+
+        return files
+
+    def _load_manifest(self) -> dict:
+        """Load the .packages sync manifest (empty if missing or unreadable)."""
+        manifest_path = self.packages_dir / MANIFEST_FILE_NAME
+        try:
+            return json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict):
+        """Write the .packages sync manifest."""
+        manifest_path = self.packages_dir / MANIFEST_FILE_NAME
+        manifest_path.write_text(json.dumps(manifest))
+
+    def _prune_package_cache(self):
+        """Keep only the most recently used package sets in the local cache."""
+        if not self.package_cache_dir.exists():
+            return
+
+        try:
+            entries = sorted(
+                (p for p in self.package_cache_dir.iterdir() if p.is_dir() and ".partial-" not in p.name),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True
             )
-            await log(f"✓ Packages installed successfully to {self.packages_dir}")
+        except OSError:
+            return
 
-        finally:
-            # Clean up /tmp
-            import shutil
-            if tmp_packages_dir.exists():
-                shutil.rmtree(tmp_packages_dir, ignore_errors=True)
+        for stale in entries[MAX_CACHED_PACKAGE_SETS:]:
+            shutil.rmtree(stale, ignore_errors=True)
 
     async def _append_to_requirements(self, package_name: str, version: Optional[str] = None):
         """
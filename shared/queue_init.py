@@ -8,6 +8,7 @@ to prevent binding failures when queues don't exist yet.
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from azure.storage.queue import QueueServiceClient
 
@@ -15,8 +16,12 @@ logger = logging.getLogger(__name__)
 
 # Define all required queues
 REQUIRED_QUEUES = [
-    "workflow-executions",
+    "workflow-executions",  # Interactive lane (see shared.execution_lanes)
     "workflow-executions-poison",  # Poison queue for failed messages
+    "workflow-executions-scheduled",  # Scheduled lane
+    "workflow-executions-scheduled-poison",
+    "workflow-executions-bulk",  # Bulk lane
+    "workflow-executions-bulk-poison",
     "package-installations",
     "package-installations-poison",  # Poison queue for failed package installations
     "git-sync-jobs",
@@ -56,36 +61,15 @@ def init_queues(connection_string: str | None = None) -> dict:
             "failed": []
         }
 
-        for queue_name in REQUIRED_QUEUES:
-            try:
-                queue_client = queue_service.get_queue_client(queue_name)
-
-                # Try to create the queue
-                try:
-                    queue_client.create_queue()
-                    logger.info(f"✓ Created queue '{queue_name}'")
-                    results["created"].append(queue_name)
-                except Exception as e:
-                    # Check if queue already exists
-                    error_str = str(e)
-                    error_lower = error_str.lower()
-                    if ("QueueAlreadyExists" in error_str or
-                            "already exists" in error_lower):
-                        logger.info(f"✓ Queue '{queue_name}' already exists")
-                        results["already_exists"].append(queue_name)
-                    else:
-                        # Some other error occurred
-                        logger.error(
-                            f"✗ Failed to create queue '{queue_name}': "
-                            f"{error_str}")
-                        results["failed"].append(
-                            {"queue": queue_name, "error": error_str})
-
-            except Exception as e:
-                logger.error(
-                    f"✗ Unexpected error with queue '{queue_name}': {str(e)}")
-                results["failed"].append(
-                    {"queue": queue_name, "error": str(e)})
+        # One create_queue round-trip per queue, all in flight at once
+        with ThreadPoolExecutor(max_workers=len(REQUIRED_QUEUES)) as executor:
+            outcomes = list(executor.map(lambda name: _create_queue(queue_service, name), REQUIRED_QUEUES))
+
+        for queue_name, (status, error) in zip(REQUIRED_QUEUES, outcomes):
+            if status == "failed":
+                results["failed"].append({"queue": queue_name, "error": error})
+            else:
+                results[status].append(queue_name)
 
         # Summary
         logger.info("\n" + "="*60)
@@ -117,6 +101,27 @@ def init_queues(connection_string: str | None = None) -> dict:
         raise
 
 
+def _create_queue(queue_service: QueueServiceClient, queue_name: str) -> tuple[str, str | None]:
+    """
+    Create one queue.
+
+    Returns:
+        ("created" | "already_exists" | "failed", error message)
+    """
+    try:
+        queue_service.get_queue_client(queue_name).create_queue()
+        logger.info(f"✓ Created queue '{queue_name}'")
+        return "created", None
+    except Exception as e:
+        # Check if queue already exists
+        error_str = str(e)
+        if "QueueAlreadyExists" in error_str or "already exists" in error_str.lower():
+            logger.info(f"✓ Queue '{queue_name}' already exists")
+            return "already_exists", None
+        logger.error(f"✗ Failed to create queue '{queue_name}': {error_str}")
+        return "failed", error_str
+
+
 def _mask_connection_string(conn_str: str) -> str:
     """Mask sensitive parts of connection string for logging"""
     if "UseDevelopmentStorage=true" in conn_str:
@@ -36,8 +36,13 @@ class WorkflowMetadata:
     # Execution
     execution_mode: Literal["sync", "async"] = "sync"
     timeout_seconds: int = 1800  # Default 30 minutes
+    isolation: Literal["none", "process"] = "none"  # "process" runs in the worker process pool
 
-    # Retry (for future use)
+    # Concurrency (queued executions, see shared.concurrency_governor)
+    max_concurrency: int | None = None
+    integrations: list[str] = field(default_factory=list)
+
+    # Retry (queued executions, see shared.retry_policy)
     retry_policy: dict[str, Any] | None = None
 
     # Scheduling (for future use)
@@ -110,7 +115,7 @@ class FunctionMetadata:
     source: Literal["home", "platform", "workspace"] | None = None
     source_file_path: str | None = None  # File path for exec() approach
 
-    # Retry/scheduling (future use)
+    # Retry (see shared.retry_policy) / scheduling
     retry_policy: dict[str, Any] | None = None
     schedule: str | None = None
 
@@ -11,6 +11,7 @@ from .forms_file import FormsFileRepository
 from .oauth import OAuthRepository
 from .organizations import OrganizationRepository
 from .roles import RoleRepository
+from .schedules import ScheduleRepository
 from .scoped_repository import ScopedRepository
 from .users import UserRepository
 
@@ -25,4 +26,5 @@ __all__ = [
     "RoleRepository",
     "OAuthRepository",
     "ConfigRepository",
+    "ScheduleRepository",
 ]
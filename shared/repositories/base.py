@@ -108,6 +108,18 @@ class BaseRepository:
         """
         return await self._service.insert_entity(entity)
 
+    async def insert_batch(self, entities: list[dict]) -> list[dict]:
+        """
+        Insert many entities using per-partition batch transactions
+
+        Args:
+            entities: Entity dictionaries with PartitionKey and RowKey
+
+        Returns:
+            The inserted entities
+        """
+        return await self._service.insert_entities_batch(entities)
+
     async def update(self, entity: dict, mode: str = "merge") -> dict:
         """
         Update an existing entity
@@ -4,14 +4,35 @@ Stores real-time execution logs in Table Storage for reliable retrieval
 """
 
 import os
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
-from azure.data.tables import TableClient
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables import TableClient, TableErrorCode, TableTransactionError, UpdateMode
 from shared.async_storage import AsyncTableStorageService
 
 
+# Rows sorting after every timestamp RowKey ("~" > digits) hold per-execution metadata
+COUNTER_ROW_KEY = "~count"
+TAIL_ROW_PREFIX = "~tail:"
+
+# Latest logs kept in the tail ring (get_latest_logs for up to this many is one small query)
+TAIL_SIZE = 50
+
+# Executions whose next sequence number is tracked in memory (least recently used evicted)
+MAX_TRACKED_EXECUTIONS = 1000
+
+# Appends retried after another writer advanced the counter row first
+MAX_APPEND_ATTEMPTS = 10
+
+# Transaction failures meaning the counter row is not what this process expected
+_COUNTER_CONFLICT_CODES = {TableErrorCode.ENTITY_ALREADY_EXISTS, TableErrorCode.UPDATE_CONDITION_NOT_SATISFIED}
+
+
 class ExecutionLogsRepository:
     """
     Repository for execution logs.
@@ -21,6 +42,22 @@ class ExecutionLogsRepository:
 
     Each log entry has a unique ExecutionLogId for client-side deduplication.
 
+    Each append also maintains, in the same partition and the same entity
+    group transaction (one round trip):
+    - "~count": number of logs written (count_logs is one point read)
+    - "~tail:{slot}": ring of the latest TAIL_SIZE logs (get_latest_logs is
+      one query of at most TAIL_SIZE rows)
+
+    Executions written before the counter and tail rows existed fall back to
+    querying the log rows.
+
+    The counter row is the sequence allocator. Its write is conditional:
+    created for an execution's first log, then updated with the ETag from
+    this process's previous append. If another process (or thread) wrote it
+    in between, the transaction fails as a whole and the append retries
+    from the current counter, so sequences stay unique and the counter
+    never moves backwards. The first log costs no extra read.
+
     Uses dual clients:
     - Synchronous TableClient for append_log() (real-time, immediate writes)
     - Async AsyncTableStorageService for read operations (efficient async queries)
@@ -45,7 +82,9 @@ class ExecutionLogsRepository:
         except Exception:
             pass  # Table already exists
 
-        self._sequence_counters: dict[str, int] = {}  # In-memory sequence tracking
+        # Execution ID -> (last sequence, counter row ETag) seen by this process (LRU bounded)
+        self._sequence_counters: OrderedDict[str, tuple[int, str | None]] = OrderedDict()
+        self._sequence_lock = threading.Lock()
 
     async def close(self):
         """Close the underlying table service clients."""
@@ -77,44 +116,134 @@ class ExecutionLogsRepository:
         Returns:
             Created log entity with ExecutionLogId
         """
-        now = datetime.utcnow()
-        timestamp_iso = now.isoformat() + "Z"
+        log_id = str(uuid.uuid4())
 
-        # Generate sequence number for this execution (handles same-millisecond logs)
-        sequence = self._get_next_sequence(execution_id, timestamp_iso)
+        for _ in range(MAX_APPEND_ATTEMPTS):
+            now = datetime.utcnow()
+            timestamp_iso = now.isoformat() + "Z"
+
+            # Per-execution sequence (orders logs written in the same microsecond)
+            last, counter_etag = self._tracked_sequence(execution_id)
+            sequence = last + 1
+
+            # Row key format: timestamp + sequence (zero-padded for sorting)
+            # Example: "2025-01-28T19:11:04.123456Z-0001"
+            row_key = f"{timestamp_iso}-{sequence:04d}"
+
+            entity = {
+                "PartitionKey": execution_id,
+                "RowKey": row_key,
+                "ExecutionLogId": log_id,
+                "Timestamp": timestamp_iso,
+                "Level": level.upper(),
+                "Message": message,
+                "Source": source,
+                "CreatedAt": timestamp_iso
+            }
+
+            tail_entity = {
+                **entity,
+                "RowKey": f"{TAIL_ROW_PREFIX}{sequence % TAIL_SIZE:02d}",
+                "LogRowKey": row_key,
+                "Sequence": sequence
+            }
+            counter_entity = {"PartitionKey": execution_id, "RowKey": COUNTER_ROW_KEY, "Count": sequence}
+            if counter_etag is None:
+                counter_operation = ("create", counter_entity)
+            else:
+                counter_operation = ("update", counter_entity, {
+                    "mode": UpdateMode.MERGE,
+                    "etag": counter_etag,
+                    "match_condition": MatchConditions.IfNotModified
+                })
+
+            # Synchronous write for immediate persistence (real-time streaming);
+            # one transaction since all three rows share the execution's partition
+            try:
+                results = self.sync_table_client.submit_transaction([
+                    ("upsert", entity),
+                    ("upsert", tail_entity, {"mode": UpdateMode.REPLACE}),
+                    counter_operation,
+                ])
+            except TableTransactionError as e:
+                if e.error_code not in _COUNTER_CONFLICT_CODES:
+                    raise
+                # Another writer advanced the counter: continue from its value
+                self._reload_sequence(execution_id)
+                continue
+
+            self._track_sequence(execution_id, sequence, results[2].get("etag"))
+            return entity
+
+        raise RuntimeError(
+            f"Could not append log for execution {execution_id}: "
+            f"counter changed on each of {MAX_APPEND_ATTEMPTS} attempts"
+        )
 
-        # Row key format: timestamp + sequence (zero-padded for sorting)
-        # Example: "2025-01-28T19:11:04.123456Z-0001"
-        row_key = f"{timestamp_iso}-{sequence:04d}"
+    def _tracked_sequence(self, execution_id: str) -> tuple[int, str | None]:
+        """
+        Last sequence and counter row ETag known to this process.
 
-        log_id = str(uuid.uuid4())
+        Executions not tracked here (new, or evicted from the bounded cache)
+        start at (0, None): the append tries to create the counter row, and
+        an existing row is read only when that create conflicts.
+        """
+        with self._sequence_lock:
+            return self._sequence_counters.get(execution_id, (0, None))
+
+    def _track_sequence(self, execution_id: str, sequence: int, etag: str | None) -> None:
+        with self._sequence_lock:
+            current = self._sequence_counters.get(execution_id)
+            # A concurrent append in this process may already have moved further
+            if current is None or current[0] < sequence:
+                self._sequence_counters[execution_id] = (sequence, etag)
+            self._sequence_counters.move_to_end(execution_id)
+            while len(self._sequence_counters) > MAX_TRACKED_EXECUTIONS:
+                self._sequence_counters.popitem(last=False)
+
+    def _reload_sequence(self, execution_id: str) -> None:
+        """Re-read the counter row after a conflicting write"""
+        try:
+            counter = self.sync_table_client.get_entity(execution_id, COUNTER_ROW_KEY)
+        except ResourceNotFoundError:
+            with self._sequence_lock:
+                self._sequence_counters.pop(execution_id, None)
+            return
 
-        entity = {
-            "PartitionKey": execution_id,
-            "RowKey": row_key,
-            "ExecutionLogId": log_id,
-            "Timestamp": timestamp_iso,
-            "Level": level.upper(),
-            "Message": message,
-            "Source": source,
-            "CreatedAt": timestamp_iso
-        }
-
-        # Synchronous write for immediate persistence (real-time streaming)
-        self.sync_table_client.upsert_entity(entity)
-        return entity
-
-    def _get_next_sequence(self, execution_id: str, timestamp: str) -> int:
+        with self._sequence_lock:
+            self._sequence_counters[execution_id] = (int(counter.get("Count") or 0), counter.metadata.get("etag"))
+            self._sequence_counters.move_to_end(execution_id)
+
+    async def get_logs_page(
+        self,
+        execution_id: str,
+        since_timestamp: str | None = None,
+        page_size: int = 1000,
+        continuation_token: dict | str | None = None
+    ) -> tuple[list[dict[str, Any]], dict | str | None]:
         """
-        Generate sequence number for logs in same millisecond.
+        Get one page of logs for an execution (server-side paging).
+
+        Args:
+            execution_id: Execution ID
+            since_timestamp: Only fetch logs after this timestamp (ISO format)
+            page_size: Maximum logs in the page (max 1000)
+            continuation_token: Token from the previous page (None for the first page)
 
-        This prevents RowKey collisions when multiple logs occur in same millisecond.
+        Returns:
+            Tuple of (log entries sorted by timestamp ascending, next continuation token or None)
         """
-        key = f"{execution_id}:{timestamp}"
-        if key not in self._sequence_counters:
-            self._sequence_counters[key] = 0
-        self._sequence_counters[key] += 1
-        return self._sequence_counters[key]
+        # RowKey format is "timestamp-sequence", so ranges compare directly;
+        # metadata rows ("~...") sort after every log row
+        query = f"PartitionKey eq '{execution_id}' and RowKey lt '~'"
+        if since_timestamp:
+            query += f" and RowKey gt '{since_timestamp}'"
+
+        return await self.table_service.query_entities_paged(
+            filter=query,
+            results_per_page=page_size,
+            continuation_token=continuation_token
+        )
 
     async def get_logs(
         self,
@@ -125,6 +254,9 @@ class ExecutionLogsRepository:
         """
         Get logs for an execution.
 
+        Pages are fetched server-side until limit logs are read, so a long
+        log is never transferred in full just to be truncated.
+
         Args:
             execution_id: Execution ID
             since_timestamp: Only fetch logs after this timestamp (ISO format)
@@ -133,18 +265,17 @@ class ExecutionLogsRepository:
         Returns:
             List of log entries (sorted by timestamp ascending)
         """
-        if since_timestamp:
-            # Query range: RowKey > since_timestamp
-            # Since RowKey format is "timestamp-sequence", we can compare directly
-            query = f"PartitionKey eq '{execution_id}' and RowKey gt '{since_timestamp}'"
-        else:
-            # Get all logs for execution
-            query = f"PartitionKey eq '{execution_id}'"
+        results: list[dict[str, Any]] = []
+        token: dict | str | None = None
 
-        results = await self.table_service.query_entities(query)
+        while len(results) < limit:
+            page, token = await self.get_logs_page(
+                execution_id, since_timestamp, page_size=min(limit - len(results), 1000), continuation_token=token
+            )
+            results.extend(page)
+            if not token:
+                break
 
-        # Already sorted by RowKey (timestamp + sequence)
-        # Limit results
         return results[:limit]
 
     async def get_latest_logs(
@@ -155,31 +286,71 @@ class ExecutionLogsRepository:
         """
         Get the latest N logs for an execution.
 
+        Up to TAIL_SIZE logs come from the tail ring (one query of at most
+        TAIL_SIZE rows); larger counts and executions without tail rows page
+        through the log rows.
+
         Args:
             execution_id: Execution ID
             count: Number of latest logs to return
 
         Returns:
-            List of latest log entries (sorted by timestamp descending)
+            List of latest log entries (sorted by timestamp ascending)
         """
-        query = f"PartitionKey eq '{execution_id}'"
-        results = await self.table_service.query_entities(query)
-
-        # Return last N logs (already sorted by RowKey ascending)
-        return results[-count:] if len(results) > count else results
+        if count <= TAIL_SIZE:
+            tail = await self.table_service.query_entities(
+                f"PartitionKey eq '{execution_id}' and "
+                f"RowKey ge '{TAIL_ROW_PREFIX}' and RowKey lt '{TAIL_ROW_PREFIX[:-1]};'"
+            )
+            if tail:
+                tail.sort(key=lambda row: row.get("Sequence", 0))
+                return [
+                    {**{k: v for k, v in row.items() if k not in ("LogRowKey", "Sequence")}, "RowKey": row["LogRowKey"]}
+                    for row in tail[-count:]
+                ]
+
+        total = await self.count_logs(execution_id)
+        if total <= count:
+            return await self.get_logs(execution_id, limit=count)
+
+        # Page past the older logs (RowKeys only) to find where the tail starts
+        skipped = 0
+        token: dict | str | None = None
+        boundary: str | None = None
+        while skipped < total - count:
+            page, token = await self.table_service.query_entities_paged(
+                filter=f"PartitionKey eq '{execution_id}' and RowKey lt '~'",
+                select=["RowKey"],
+                results_per_page=min(total - count - skipped, 1000),
+                continuation_token=token
+            )
+            skipped += len(page)
+            if page:
+                boundary = page[-1]["RowKey"]
+            if not token:
+                break
+
+        return await self.get_logs(execution_id, since_timestamp=boundary, limit=count)
 
     async def count_logs(self, execution_id: str) -> int:
         """
         Count total logs for an execution.
 
+        Reads the counter row; executions without one are counted with a
+        RowKey-only query.
+
         Args:
             execution_id: Execution ID
 
         Returns:
             Total number of logs
         """
-        query = f"PartitionKey eq '{execution_id}'"
-        results = await self.table_service.query_entities(query)
+        counter = await self.table_service.get_entity(execution_id, COUNTER_ROW_KEY)
+        if counter:
+            return int(counter.get("Count") or 0)
+
+        query = f"PartitionKey eq '{execution_id}' and RowKey lt '~'"
+        results = await self.table_service.query_entities(query, select=["RowKey"])
         return len(results)
 
 
@@ -8,14 +8,20 @@ Indexes maintained:
 3. Workflow index: workflowexec:{workflow_name}:{org_id}:{execution_id} (Relationships table) - with display fields
 4. Form index: formexec:{form_id}:{execution_id} (Relationships table) - with display fields
 5. Status index: status:{status}:{execution_id} (Relationships table) - for cleanup queries
+6. Batch index: batchexec:{batch_id}:{execution_id} (Relationships table) - for batch progress
+
+Batch launches also store a header row batch:{batch_id} (Relationships table).
 """
 
 import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+
+from azure.core.exceptions import ResourceModifiedError
 
+from shared.metrics_rollups import TERMINAL_STATUSES, record_execution_rollup
 from shared.models import ExecutionStatus, WorkflowExecution
 from shared.async_storage import AsyncTableStorageService
 
@@ -26,6 +32,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ETag conflicts tolerated on the write that finishes an execution before it is
+# written unconditionally (and left out of the metrics rollups)
+_TERMINAL_WRITE_ATTEMPTS = 5
+
 
 class ExecutionRepository(BaseRepository):
     """
@@ -49,7 +59,7 @@ class ExecutionRepository(BaseRepository):
         await super().close()
         await self.relationships_service.close()
 
-    async def create_execution(
+    def _build_execution_entities(
         self,
         execution_id: str,
         org_id: str | None,
@@ -57,16 +67,13 @@ class ExecutionRepository(BaseRepository):
         user_name: str,
         workflow_name: str,
         input_data: dict,
-        form_id: str | None = None
-    ) -> WorkflowExecution:
+        form_id: str | None,
+        status: ExecutionStatus,
+        now: datetime,
+        batch_id: str | None = None
+    ) -> tuple[dict, list[dict]]:
         """
-        Create execution with ALL indexes atomically
-
-        Writes to:
-        1. Entities table (primary record with full data)
-        2. Relationships table (user index with display fields)
-        3. Relationships table (workflow index with display fields)
-        4. Relationships table (form index with display fields, if form_id provided)
+        Build the primary execution record and its index rows
 
         Args:
             execution_id: Unique execution ID (UUID)
@@ -76,14 +83,14 @@ class ExecutionRepository(BaseRepository):
             workflow_name: Name of workflow being executed
             input_data: Input parameters dict
             form_id: Optional form ID if triggered from form
+            status: Initial execution status
+            now: Creation timestamp
+            batch_id: Optional batch launch this execution belongs to
 
         Returns:
-            WorkflowExecution model
-
-        Raises:
-            Exception: If any index creation fails
+            Tuple of (primary entity, index entities). All index entities share
+            the GLOBAL partition of the Relationships table.
         """
-        now = datetime.utcnow()
         reverse_ts = self._reverse_timestamp(now)
         partition_key = org_id or "GLOBAL"
 
@@ -96,7 +103,7 @@ class ExecutionRepository(BaseRepository):
             "FormId": form_id,
             "ExecutedBy": user_id,
             "ExecutedByName": user_name,
-            "Status": ExecutionStatus.RUNNING.value,
+            "Status": status.value,
             "InputData": json.dumps(input_data),
             "StartedAt": now.isoformat(),
             "CompletedAt": None,
@@ -104,6 +111,7 @@ class ExecutionRepository(BaseRepository):
             "Result": None,
             "ResultInBlob": False,
             "ErrorMessage": None,
+            "BatchId": batch_id,
         }
 
         # 2. User index - with DISPLAY fields for table view
@@ -115,7 +123,7 @@ class ExecutionRepository(BaseRepository):
             # Display fields (avoid second fetch for table view)
             "WorkflowName": workflow_name,
             "FormId": form_id,
-            "Status": ExecutionStatus.RUNNING.value,
+            "Status": status.value,
             "StartedAt": now.isoformat(),
             "CompletedAt": None,
             "DurationMs": None,
@@ -133,17 +141,33 @@ class ExecutionRepository(BaseRepository):
             "ExecutedBy": user_id,
             "ExecutedByName": user_name,
             "FormId": form_id,
-            "Status": ExecutionStatus.RUNNING.value,
+            "Status": status.value,
             "StartedAt": now.isoformat(),
             "CompletedAt": None,
             "DurationMs": None,
             "ErrorMessage": None,
         }
 
-        # 4. Form index - with DISPLAY fields (only if form_id provided)
-        form_index_entity = None
+        # 4. Status index - for cleanup queries (Pending/Running only)
+        status_index_entity = {
+            "PartitionKey": "GLOBAL",
+            "RowKey": f"status:{status.value}:{execution_id}",
+            "ExecutionId": execution_id,
+            "OrganizationId": org_id,
+            # Display fields for cleanup UI
+            "WorkflowName": workflow_name,
+            "ExecutedBy": user_id,
+            "ExecutedByName": user_name,
+            "Status": status.value,
+            "StartedAt": now.isoformat(),
+            "UpdatedAt": now.isoformat(),
+        }
+
+        index_entities = [user_index_entity, workflow_index_entity, status_index_entity]
+
+        # 5. Form index - with DISPLAY fields (only if form_id provided)
         if form_id:
-            form_index_entity = {
+            index_entities.append({
                 "PartitionKey": "GLOBAL",
                 "RowKey": f"formexec:{form_id}:{execution_id}",
                 "ExecutionId": execution_id,
@@ -152,49 +176,79 @@ class ExecutionRepository(BaseRepository):
                 "WorkflowName": workflow_name,
                 "ExecutedBy": user_id,
                 "ExecutedByName": user_name,
-                "Status": ExecutionStatus.RUNNING.value,
+                "Status": status.value,
                 "StartedAt": now.isoformat(),
                 "CompletedAt": None,
                 "DurationMs": None,
                 "ErrorMessage": None,
-            }
+            })
 
-        # 5. Status index - for cleanup queries (Pending/Running only)
-        status_index_entity = {
-            "PartitionKey": "GLOBAL",
-            "RowKey": f"status:{ExecutionStatus.RUNNING.value}:{execution_id}",
-            "ExecutionId": execution_id,
-            "OrganizationId": org_id,
-            # Display fields for cleanup UI
-            "WorkflowName": workflow_name,
-            "ExecutedBy": user_id,
-            "ExecutedByName": user_name,
-            "Status": ExecutionStatus.RUNNING.value,
-            "StartedAt": now.isoformat(),
-            "UpdatedAt": now.isoformat(),
-        }
+        # 6. Batch index - with DISPLAY fields (only for batch launches)
+        if batch_id:
+            index_entities.append({
+                "PartitionKey": "GLOBAL",
+                "RowKey": f"batchexec:{batch_id}:{execution_id}",
+                "ExecutionId": execution_id,
+                "OrganizationId": org_id,
+                "WorkflowName": workflow_name,
+                "Status": status.value,
+                "StartedAt": now.isoformat(),
+                "CompletedAt": None,
+                "DurationMs": None,
+                "ErrorMessage": None,
+            })
 
-        # Write all atomically (best effort)
-        try:
-            # Primary record (must be first)
-            await self.insert(execution_entity)
+        return execution_entity, index_entities
+
+    async def create_execution(
+        self,
+        execution_id: str,
+        org_id: str | None,
+        user_id: str,
+        user_name: str,
+        workflow_name: str,
+        input_data: dict,
+        form_id: str | None = None,
+        status: ExecutionStatus = ExecutionStatus.RUNNING
+    ) -> WorkflowExecution:
+        """
+        Create execution with ALL indexes atomically
+
+        Writes to:
+        1. Entities table (primary record with full data)
+        2. Relationships table (user, workflow, status and form indexes with
+           display fields) - one entity group transaction, since they share
+           the GLOBAL partition
+
+        Args:
+            execution_id: Unique execution ID (UUID)
+            org_id: Organization ID or None for GLOBAL
+            user_id: User ID who executed the workflow
+            user_name: Display name of user
+            workflow_name: Name of workflow being executed
+            input_data: Input parameters dict
+            form_id: Optional form ID if triggered from form
+            status: Initial status (RUNNING for direct execution, PENDING when queued)
 
-            # Indexes in parallel (independent operations)
-            index_tasks = [
-                self.relationships_service.insert_entity(user_index_entity),
-                self.relationships_service.insert_entity(workflow_index_entity),
-                self.relationships_service.insert_entity(status_index_entity),
-            ]
+        Returns:
+            WorkflowExecution model
 
-            if form_index_entity:
-                index_tasks.append(self.relationships_service.insert_entity(form_index_entity))
+        Raises:
+            Exception: If any index creation fails
+        """
+        execution_entity, index_entities = self._build_execution_entities(
+            execution_id, org_id, user_id, user_name, workflow_name,
+            input_data, form_id, status, datetime.utcnow()
+        )
 
-            await asyncio.gather(*index_tasks)
+        try:
+            # Primary record first, so an index row never points at a missing execution
+            await self.insert(execution_entity)
+            await self.relationships_service.insert_entities_batch(index_entities)
 
-            index_count = 4 if form_id else 3
             logger.info(
-                f"Created execution {execution_id} with {index_count} indexes in parallel "
-                f"(workflow={workflow_name}, user={user_id}, form={form_id})"
+                f"Created execution {execution_id} with {len(index_entities)} indexes "
+                f"(status={status.value}, workflow={workflow_name}, user={user_id}, form={form_id})"
             )
 
             return self._entity_to_model(execution_entity)
@@ -207,6 +261,61 @@ class ExecutionRepository(BaseRepository):
             # TODO: Add cleanup/rollback logic
             raise
 
+    async def create_executions(
+        self,
+        executions: list[dict],
+        status: ExecutionStatus = ExecutionStatus.PENDING
+    ) -> list[WorkflowExecution]:
+        """
+        Create many executions and their indexes with batched writes
+
+        Primary records are batched per org partition of the Entities table and
+        all index rows go into the GLOBAL partition of the Relationships table,
+        so enqueueing N executions costs a handful of transactions instead of
+        4-5 writes each.
+
+        Args:
+            executions: Dicts with execution_id, org_id, user_id, user_name,
+                workflow_name, input_data and optional form_id and batch_id
+            status: Initial status for every execution (default: PENDING)
+
+        Returns:
+            WorkflowExecution models in input order
+        """
+        now = datetime.utcnow()
+        primary_entities = []
+        index_entities = []
+
+        for execution in executions:
+            execution_entity, indexes = self._build_execution_entities(
+                execution["execution_id"],
+                execution.get("org_id"),
+                execution["user_id"],
+                execution["user_name"],
+                execution["workflow_name"],
+                execution.get("input_data") or {},
+                execution.get("form_id"),
+                status,
+                now,
+                execution.get("batch_id")
+            )
+            primary_entities.append(execution_entity)
+            index_entities.extend(indexes)
+
+        if not primary_entities:
+            return []
+
+        # Primary records first, so an index row never points at a missing execution
+        await self.insert_batch(primary_entities)
+        await self.relationships_service.insert_entities_batch(index_entities)
+
+        logger.info(
+            f"Created {len(primary_entities)} executions with {len(index_entities)} indexes "
+            f"(status={status.value})"
+        )
+
+        return [self._entity_to_model(entity) for entity in primary_entities]
+
     async def update_execution(
         self,
         execution_id: str,
@@ -216,7 +325,8 @@ class ExecutionRepository(BaseRepository):
         result: dict | list | str | None = None,
         error_message: str | None = None,
         duration_ms: int | None = None,
-        result_in_blob: bool = False
+        result_in_blob: bool = False,
+        attempt: dict[str, Any] | None = None
     ) -> WorkflowExecution:
         """
         Update execution and ALL indexes with completion data
@@ -233,6 +343,8 @@ class ExecutionRepository(BaseRepository):
             error_message: Error message if failed
             duration_ms: Duration in milliseconds
             result_in_blob: Whether result is stored in blob storage
+            attempt: Record of a finished attempt (workflows with a retry policy).
+                Sets Attempts to its "attempt" number and appends it to AttemptHistory.
 
         Returns:
             Updated WorkflowExecution model
@@ -252,25 +364,65 @@ class ExecutionRepository(BaseRepository):
         # Extract metadata for index updates
         workflow_name = execution_entity.get("WorkflowName")
         form_id = execution_entity.get("FormId")
+        batch_id = execution_entity.get("BatchId")
         old_status = execution_entity.get("Status", "")  # Capture BEFORE updating
 
-        # Update primary record
-        execution_entity["Status"] = status.value
-
-        # Only set CompletedAt for terminal statuses (not Pending/Running)
-        if status not in [ExecutionStatus.PENDING, ExecutionStatus.RUNNING]:
-            execution_entity["CompletedAt"] = now.isoformat()
-            execution_entity["DurationMs"] = duration_ms
-
-        execution_entity["ErrorMessage"] = error_message
-        execution_entity["ResultInBlob"] = result_in_blob
+        def apply_update(entity: dict) -> None:
+            entity["Status"] = status.value
 
-        if result and not result_in_blob:
-            # Convert result to JSON string if it's not already a string
-            # Table Storage only supports primitive types (string, int, bool, etc.)
-            execution_entity["Result"] = result if isinstance(result, str) else json.dumps(result)
+            # Only set CompletedAt for terminal statuses (not Pending/Running)
+            if status not in [ExecutionStatus.PENDING, ExecutionStatus.RUNNING]:
+                entity["CompletedAt"] = now.isoformat()
+                entity["DurationMs"] = duration_ms
+
+            entity["ErrorMessage"] = error_message
+            entity["ResultInBlob"] = result_in_blob
+
+            if attempt:
+                history = json.loads(entity.get("AttemptHistory") or "[]")
+                history.append(attempt)
+                entity["Attempts"] = attempt["attempt"]
+                entity["AttemptHistory"] = json.dumps(history)
+
+            if result and not result_in_blob:
+                # Convert result to JSON string if it's not already a string
+                # Table Storage only supports primitive types (string, int, bool, etc.)
+                entity["Result"] = result if isinstance(result, str) else json.dumps(result)
+
+        # Finishing an execution is written with an ETag match, so when several
+        # updates race only the one that moves the row out of a non-terminal
+        # status counts it in the dashboard rollups; the others re-read, see the
+        # terminal status and update without counting
+        first_terminal = False
+        if status.value in TERMINAL_STATUSES and old_status not in TERMINAL_STATUSES:
+            for _ in range(_TERMINAL_WRITE_ATTEMPTS):
+                current = await self._service.get_entity(partition_key, execution_entity["RowKey"])
+                if current is None:
+                    break
+                execution_entity = current
+                old_status = current.get("Status", "")
+                if old_status in TERMINAL_STATUSES:
+                    break
+
+                candidate = dict(current)
+                apply_update(candidate)
+                try:
+                    await self._service.update_entity_with_etag(candidate)
+                except ResourceModifiedError:
+                    continue
+                candidate.pop("etag", None)
+                execution_entity = candidate
+                first_terminal = True
+                break
+            else:
+                logger.warning(
+                    f"Execution {execution_id} kept changing while finishing; not counted in metrics rollups"
+                )
 
-        await self.update(execution_entity)
+        if not first_terminal:
+            execution_entity.pop("etag", None)
+            apply_update(execution_entity)
+            await self.update(execution_entity)
 
         # Fetch all indexes in parallel
         fetch_tasks = [
@@ -279,6 +431,8 @@ class ExecutionRepository(BaseRepository):
         ]
         if form_id:
             fetch_tasks.append(self.relationships_service.get_entity("GLOBAL", f"formexec:{form_id}:{execution_id}"))
+        if batch_id:
+            fetch_tasks.append(self.relationships_service.get_entity("GLOBAL", f"batchexec:{batch_id}:{execution_id}"))
 
         fetch_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
 
@@ -296,6 +450,10 @@ class ExecutionRepository(BaseRepository):
         if form_id and len(fetch_results) > 2 and not isinstance(fetch_results[2], Exception):
             form_index = cast(dict, fetch_results[2])
 
+        batch_index: dict | None = None
+        if batch_id and not isinstance(fetch_results[-1], Exception):
+            batch_index = cast(dict, fetch_results[-1])
+
         # Update indexes in parallel
         update_tasks = []
 
@@ -323,12 +481,32 @@ class ExecutionRepository(BaseRepository):
             form_index["ErrorMessage"] = error_message
             update_tasks.append(self.relationships_service.update_entity(form_index))
 
+        if batch_index:
+            batch_index["Status"] = status.value
+            if status not in [ExecutionStatus.PENDING, ExecutionStatus.RUNNING]:
+                batch_index["CompletedAt"] = now.isoformat()
+                batch_index["DurationMs"] = duration_ms
+            batch_index["ErrorMessage"] = error_message
+            update_tasks.append(self.relationships_service.update_entity(batch_index))
+
+        # Count the first transition to a terminal status in the dashboard rollups
+        if first_terminal:
+            failure = None
+            if status == ExecutionStatus.FAILED:
+                failure = {
+                    "executionId": execution_id,
+                    "workflowName": workflow_name,
+                    "errorMessage": (error_message or "")[:500] or None,
+                    "startedAt": str(execution_entity.get("StartedAt") or "") or None
+                }
+            update_tasks.append(record_execution_rollup(self._service, status.value, duration_ms, now, failure))
+
         # Execute all updates in parallel
         if update_tasks:
             update_results: list = await asyncio.gather(*update_tasks, return_exceptions=True)
             for i, result in enumerate(update_results):
                 if isinstance(result, Exception):
-                    logger.warning(f"Failed to update index {i} for {execution_id}: {result}")
+                    logger.warning(f"Failed to update index/rollup {i} for {execution_id}: {result}")
 
         # Update status index - delete old status, create new if Pending/Running/Cancelling
         try:
@@ -367,6 +545,67 @@ class ExecutionRepository(BaseRepository):
 
         return self._entity_to_model(execution_entity)
 
+    async def create_batch(
+        self,
+        batch_id: str,
+        workflow_name: str,
+        user_id: str,
+        user_name: str,
+        total: int
+    ) -> dict:
+        """
+        Create the header row for a batch launch
+
+        Args:
+            batch_id: Batch ID (UUID)
+            workflow_name: Workflow launched by the batch
+            user_id: User ID who launched the batch
+            user_name: Display name of user
+            total: Number of executions in the batch
+
+        Returns:
+            Created batch entity
+        """
+        batch_entity = {
+            "PartitionKey": "GLOBAL",
+            "RowKey": f"batch:{batch_id}",
+            "BatchId": batch_id,
+            "WorkflowName": workflow_name,
+            "CreatedBy": user_id,
+            "CreatedByName": user_name,
+            "CreatedAt": datetime.utcnow().isoformat(),
+            "Total": total,
+        }
+
+        await self.relationships_service.insert_entity(batch_entity)
+
+        logger.info(f"Created batch {batch_id} for {workflow_name} ({total} executions)")
+
+        return batch_entity
+
+    async def get_batch(self, batch_id: str) -> tuple[dict | None, list[dict]]:
+        """
+        Get a batch header and the display rows of its executions
+
+        Both come from the GLOBAL partition of the Relationships table, so
+        progress for any number of executions is two queries.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Tuple of (batch entity or None if not found, batch index entities)
+        """
+        batch_entity, batch_rows = await asyncio.gather(
+            self.relationships_service.get_entity("GLOBAL", f"batch:{batch_id}"),
+            self.relationships_service.query_entities(
+                f"PartitionKey eq 'GLOBAL' and RowKey ge 'batchexec:{batch_id}:' "
+                f"and RowKey lt 'batchexec:{batch_id};'"
+            ),
+        )
+
+        return batch_entity, batch_rows
+
     async def get_execution(self, execution_id: str, org_id: str | None = None) -> WorkflowExecution | None:
         """
         Get full execution by ID
@@ -934,6 +1173,13 @@ class ExecutionRepository(BaseRepository):
             except (ValueError, TypeError):
                 duration_ms = None
 
+        attempt_history = None
+        if entity.get("AttemptHistory"):
+            try:
+                attempt_history = json.loads(entity["AttemptHistory"])
+            except json.JSONDecodeError:
+                attempt_history = None
+
         return WorkflowExecution(
             executionId=cast(str, entity.get("ExecutionId", "")),
             workflowName=cast(str, entity.get("WorkflowName", "")),
@@ -949,5 +1195,7 @@ class ExecutionRepository(BaseRepository):
             durationMs=duration_ms,
             startedAt=started_at,
             completedAt=completed_at,
-            logs=None  # Logs fetched separately from blob storage
+            logs=None,  # Logs fetched separately from blob storage
+            attempts=entity.get("Attempts"),
+            attemptHistory=attempt_history
         )
@@ -0,0 +1,291 @@
+"""
+Schedule Repository
+Schedule state for CRON workflows with a NextRunAt index
+
+Storage (Config table):
+- State: PartitionKey "GLOBAL", RowKey "schedule:{workflow_name}"
+  (WorkflowName holds the workflow description, CronExpression, NextRunAt,
+  ClaimedRunAt, LastRunAt, LastExecutionId, ExecutionCount, CreatedAt)
+- Due index: PartitionKey "SCHEDULEDUE", RowKey "due:{next_run_at}:{workflow_name}"
+  with next_run_at formatted to whole seconds, so a single RowKey range query
+  returns every schedule due at a given time
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
+
+from shared.workflows.cron_parser import calculate_next_run, is_cron_expression_valid
+
+from .base import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+STATE_PARTITION = "GLOBAL"
+INDEX_PARTITION = "SCHEDULEDUE"
+
+# Fixed-width timestamps keep index RowKeys in chronological order
+_DUE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _state_row_key(workflow_name: str) -> str:
+    return f"schedule:{workflow_name}"
+
+
+def _due_row_key(next_run_at: datetime, workflow_name: str) -> str:
+    return f"due:{next_run_at.strftime(_DUE_FORMAT)}:{workflow_name}"
+
+
+class ScheduleRepository(BaseRepository):
+    """
+    Repository for CRON schedule state and the NextRunAt index
+    """
+
+    def __init__(self):
+        super().__init__("Config")
+
+    async def list_states(self) -> dict[str, dict]:
+        """
+        Get every schedule state row in one range query.
+
+        Returns:
+            Workflow name -> schedule state entity
+        """
+        entities = await self.query(
+            f"PartitionKey eq '{STATE_PARTITION}' and RowKey ge 'schedule:' and RowKey lt 'schedule;'"
+        )
+        return {entity["RowKey"].split(":", 1)[1]: entity for entity in entities}
+
+    async def _set_due(self, workflow_name: str, old: datetime | None, new: datetime | None) -> None:
+        """Move a schedule's index row from one NextRunAt to another"""
+        if old is not None and old != new:
+            await self.delete(INDEX_PARTITION, _due_row_key(old, workflow_name))
+        if new is not None:
+            await self.upsert({
+                "PartitionKey": INDEX_PARTITION,
+                "RowKey": _due_row_key(new, workflow_name),
+                "WorkflowName": workflow_name
+            })
+
+    async def sync_schedules(self, workflows: list[Any], now: datetime | None = None) -> dict[str, Any]:
+        """
+        Reconcile schedule state and index rows with workflow metadata.
+
+        Creates state for new schedules, recalculates NextRunAt when a CRON
+        expression changed, and removes state for workflows that are no
+        longer scheduled or have invalid CRON expressions.
+
+        Args:
+            workflows: WorkflowMetadata for scheduled workflows (schedule set)
+            now: Current time (default: utcnow)
+
+        Returns:
+            Dict with created, updated and removed counts and per-workflow errors
+        """
+        now = now or datetime.utcnow()
+        states = await self.list_states()
+        results: dict[str, Any] = {"created": 0, "updated": 0, "removed": 0, "errors": []}
+        tasks = []
+
+        valid: set[str] = set()
+        for workflow in workflows:
+            cron_expression = workflow.schedule
+            if not cron_expression or not is_cron_expression_valid(cron_expression):
+                results["errors"].append({
+                    "workflow_name": workflow.name,
+                    "error": f"Invalid CRON expression: {cron_expression}"
+                })
+                continue
+
+            valid.add(workflow.name)
+            state = states.get(workflow.name)
+
+            if state is None:
+                next_run_at = calculate_next_run(cron_expression, now)
+                tasks.append(self._create(workflow, next_run_at, now))
+                results["created"] += 1
+            elif state.get("CronExpression") != cron_expression or state.get("WorkflowName") != workflow.description:
+                tasks.append(self._update_definition(workflow, state, now))
+                results["updated"] += 1
+            elif not state.get("NextRunAt"):
+                tasks.append(self._update_definition(workflow, state, now))
+                results["updated"] += 1
+
+        for workflow_name, state in states.items():
+            if workflow_name not in valid:
+                tasks.append(self._remove(workflow_name, state))
+                results["removed"] += 1
+
+        await asyncio.gather(*tasks)
+        return results
+
+    async def _create(self, workflow: Any, next_run_at: datetime, now: datetime) -> None:
+        await self.upsert({
+            "PartitionKey": STATE_PARTITION,
+            "RowKey": _state_row_key(workflow.name),
+            "WorkflowName": workflow.description,
+            "CronExpression": workflow.schedule,
+            "NextRunAt": next_run_at.isoformat(),
+            "LastRunAt": None,
+            "LastExecutionId": None,
+            "ExecutionCount": 0,
+            "CreatedAt": now.isoformat()
+        })
+        await self._set_due(workflow.name, None, next_run_at)
+
+    async def _update_definition(self, workflow: Any, state: dict, now: datetime) -> None:
+        old_next = self._parse_datetime(state.get("NextRunAt"))
+        next_run_at = old_next
+        if state.get("CronExpression") != workflow.schedule or old_next is None:
+            next_run_at = calculate_next_run(workflow.schedule, now)
+
+        await self.update({
+            "PartitionKey": STATE_PARTITION,
+            "RowKey": _state_row_key(workflow.name),
+            "WorkflowName": workflow.description,
+            "CronExpression": workflow.schedule,
+            "NextRunAt": next_run_at.isoformat() if next_run_at else None
+        })
+        await self._set_due(workflow.name, old_next, next_run_at)
+
+    async def _remove(self, workflow_name: str, state: dict) -> None:
+        logger.info(f"Removing schedule state for {workflow_name} (no longer scheduled or invalid CRON)")
+        old_next = self._parse_datetime(state.get("NextRunAt"))
+        await self._set_due(workflow_name, old_next, None)
+        await self.delete(STATE_PARTITION, _state_row_key(workflow_name))
+
+    async def get_due(self, now: datetime | None = None) -> list[dict]:
+        """
+        Index rows for schedules whose NextRunAt is at or before now (one range query).
+
+        Args:
+            now: Current time (default: utcnow)
+
+        Returns:
+            Index entities (RowKey, WorkflowName) in NextRunAt order
+        """
+        now = now or datetime.utcnow()
+        # "~" sorts after ":" so every row with a timestamp <= now is included
+        entities = await self.query(
+            f"PartitionKey eq '{INDEX_PARTITION}' and RowKey ge 'due:' "
+            f"and RowKey le 'due:{now.strftime(_DUE_FORMAT)}~'",
+            select=["RowKey", "WorkflowName"]
+        )
+        return entities
+
+    async def claim(
+        self,
+        workflow_name: str,
+        now: datetime | None = None,
+        index_row_key: str | None = None
+    ) -> dict | None:
+        """
+        Claim a due run by advancing NextRunAt with an ETag match.
+
+        Only one scheduler instance can claim a given run; others get None.
+        The index row moves to the new NextRunAt and the claimed slot is kept
+        in ClaimedRunAt, so release_claim can undo the claim.
+
+        Args:
+            workflow_name: Scheduled workflow name
+            now: Current time (default: utcnow)
+            index_row_key: Index row the claim came from; deleted if it no longer
+                matches the schedule state (left behind by an interrupted update)
+
+        Returns:
+            Schedule state after the claim, or None if not due or claimed elsewhere
+        """
+        now = now or datetime.utcnow()
+        state = await self.get_by_id(STATE_PARTITION, _state_row_key(workflow_name))
+        old_next = self._parse_datetime(state.get("NextRunAt")) if state else None
+
+        if not state or old_next is None or old_next > now:
+            current_key = _due_row_key(old_next, workflow_name) if old_next else None
+            if index_row_key and index_row_key != current_key:
+                await self.delete(INDEX_PARTITION, index_row_key)
+            return None
+
+        new_next = calculate_next_run(state.get("CronExpression") or "", now)
+        state["NextRunAt"] = new_next.isoformat()
+        state["ClaimedRunAt"] = old_next.isoformat()
+        try:
+            await self._service.update_entity_with_etag(state)
+        except (ResourceModifiedError, ResourceNotFoundError):
+            logger.info(f"Schedule {workflow_name} was claimed by another scheduler instance")
+            return None
+
+        await self._set_due(workflow_name, old_next, new_next)
+        return state
+
+    async def release_claim(self, workflow_name: str, claim: dict) -> bool:
+        """
+        Undo a claim whose run could not be enqueued, so the next pass runs it.
+
+        NextRunAt is restored to the claimed slot with an ETag match, and only
+        if the schedule has not moved on since the claim.
+
+        Args:
+            workflow_name: Scheduled workflow name
+            claim: Schedule state returned by claim()
+
+        Returns:
+            True if the claim was released
+        """
+        state = await self.get_by_id(STATE_PARTITION, _state_row_key(workflow_name))
+        claimed_next = self._parse_datetime(claim.get("NextRunAt"))
+        claimed_slot = self._parse_datetime(claim.get("ClaimedRunAt"))
+        if (
+            not state or claimed_slot is None
+            or state.get("NextRunAt") != claim.get("NextRunAt")
+            or state.get("ClaimedRunAt") != claim.get("ClaimedRunAt")
+        ):
+            return False
+
+        state["NextRunAt"] = claimed_slot.isoformat()
+        state["ClaimedRunAt"] = None
+        try:
+            await self._service.update_entity_with_etag(state)
+        except (ResourceModifiedError, ResourceNotFoundError):
+            logger.info(f"Schedule {workflow_name} changed after the claim; not releasing it")
+            return False
+
+        await self._set_due(workflow_name, claimed_next, claimed_slot)
+        return True
+
+    async def record_run(
+        self,
+        workflow_name: str,
+        execution_id: str,
+        run_at: datetime,
+        next_run_at: datetime | None = None
+    ) -> None:
+        """
+        Record a triggered run on the schedule state.
+
+        Args:
+            workflow_name: Scheduled workflow name
+            execution_id: Execution that was enqueued
+            run_at: When the run was triggered
+            next_run_at: New NextRunAt (manual triggers reschedule; claimed runs already did)
+        """
+        state = await self.get_by_id(STATE_PARTITION, _state_row_key(workflow_name))
+        if not state:
+            return
+
+        update = {
+            "PartitionKey": STATE_PARTITION,
+            "RowKey": _state_row_key(workflow_name),
+            "LastRunAt": run_at.isoformat(),
+            "LastExecutionId": execution_id,
+            "ExecutionCount": int(state.get("ExecutionCount") or 0) + 1
+        }
+        if next_run_at is not None:
+            update["NextRunAt"] = next_run_at.isoformat()
+
+        await self.update(update)
+
+        if next_run_at is not None:
+            await self._set_due(workflow_name, self._parse_datetime(state.get("NextRunAt")), next_run_at)
@@ -0,0 +1,149 @@
+"""
+Workflow Retry Policy
+Parses the retry_policy declared with @workflow and decides whether (and when)
+a failed queued execution is attempted again.
+
+Retries are scheduled by re-sending the queue message with a visibility delay
+(see shared.async_executor.requeue_workflow_execution), so no worker sleeps
+between attempts and the Functions host's dequeue count / poison queue is only
+reached by infrastructure failures.
+
+Policy keys (snake_case or the camelCase names used by the API model):
+    max_attempts: Total attempts including the first (default 3, max 10)
+    backoff_seconds: Delay before the first retry, doubled for each later retry (default 2)
+    max_backoff_seconds: Cap on the delay (default 60)
+    retry_on: Exception types (classes or names) that are retried; empty retries any error
+    jitter: Randomize delays to spread out retries of executions that failed together (default True)
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+# Azure Storage Queues reject visibility timeouts longer than 7 days
+MAX_VISIBILITY_DELAY_SECONDS = 7 * 24 * 60 * 60
+
+MAX_ATTEMPTS_LIMIT = 10
+
+_KEY_ALIASES = {
+    "maxAttempts": "max_attempts",
+    "backoff": "backoff_seconds",
+    "backoffSeconds": "backoff_seconds",
+    "maxBackoffSeconds": "max_backoff_seconds",
+    "retryOn": "retry_on",
+}
+
+
+@dataclass(frozen=True)
+class WorkflowRetryPolicy:
+    """Normalized retry policy for a workflow"""
+    max_attempts: int = 3
+    backoff_seconds: float = 2
+    max_backoff_seconds: float = 60
+    retry_on: tuple[str, ...] = field(default_factory=tuple)
+    jitter: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkflowRetryPolicy":
+        """
+        Build a policy from a retry_policy dict.
+
+        Args:
+            data: Policy dict as declared in @workflow(retry_policy=...)
+
+        Returns:
+            WorkflowRetryPolicy
+
+        Raises:
+            ValueError: If a key is unknown or a value is out of range
+        """
+        values: dict[str, Any] = {}
+        for key, value in data.items():
+            name = _KEY_ALIASES.get(key, key)
+            if name not in cls.__dataclass_fields__:
+                raise ValueError(f"Unknown retry_policy option '{key}'")
+            values[name] = value
+
+        if "retry_on" in values:
+            retry_on = values["retry_on"]
+            if isinstance(retry_on, (str, type)):
+                retry_on = [retry_on]
+            values["retry_on"] = tuple(
+                item.__name__ if isinstance(item, type) else str(item) for item in retry_on
+            )
+
+        policy = cls(**values)
+
+        if not 1 <= policy.max_attempts <= MAX_ATTEMPTS_LIMIT:
+            raise ValueError(f"retry_policy max_attempts must be between 1 and {MAX_ATTEMPTS_LIMIT}")
+        if policy.backoff_seconds <= 0 or policy.max_backoff_seconds <= 0:
+            raise ValueError("retry_policy backoff values must be positive")
+        if policy.max_backoff_seconds < policy.backoff_seconds:
+            raise ValueError("retry_policy max_backoff_seconds must be >= backoff_seconds")
+
+        return policy
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the normalized dict stored on workflow metadata"""
+        return {
+            "max_attempts": self.max_attempts,
+            "backoff_seconds": self.backoff_seconds,
+            "max_backoff_seconds": self.max_backoff_seconds,
+            "retry_on": list(self.retry_on),
+            "jitter": self.jitter,
+        }
+
+    def should_retry(self, attempt: int, error_type: str | None) -> bool:
+        """
+        Check whether a failed attempt is retried.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based)
+            error_type: Exception type name of the failure
+
+        Returns:
+            True if another attempt should be scheduled
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if not self.retry_on:
+            return True
+        return error_type in self.retry_on
+
+    def backoff_delay(self, attempt: int, rng: random.Random | None = None) -> int:
+        """
+        Delay before the attempt following a failed one.
+
+        Exponential backoff capped at max_backoff_seconds. With jitter the
+        delay is drawn from [cap/2, cap] ("equal jitter"), so retries are
+        spread out but never immediate.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based)
+            rng: Random source (for tests)
+
+        Returns:
+            Delay in whole seconds (at least 1)
+        """
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = delay / 2 + (rng or random).uniform(0, delay / 2)
+        return max(1, min(MAX_VISIBILITY_DELAY_SECONDS, round(delay)))
+
+
+def parse_retry_policy(data: dict[str, Any] | None) -> WorkflowRetryPolicy | None:
+    """
+    Parse an optional retry_policy dict.
+
+    Args:
+        data: Policy dict or None
+
+    Returns:
+        WorkflowRetryPolicy, or None if no policy is declared
+
+    Raises:
+        ValueError: If the policy is invalid
+    """
+    if not data:
+        return None
+    return WorkflowRetryPolicy.from_dict(data)
@@ -7,15 +7,21 @@ Uses Dulwich (pure Python Git implementation) - works without git binary.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import shutil
 import tempfile
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 from dulwich import porcelain
+from dulwich.config import ConfigDict, StackedConfig
 from dulwich.repo import Repo as DulwichRepo
 from dulwich.errors import NotGitRepository
 from dulwich.objects import Commit as DulwichCommit, Blob, Tree, ShaFile
@@ -31,13 +37,132 @@ from shared.models import (
 )
 from shared.repositories.config import ConfigRepository
 from shared.keyvault import KeyVaultClient
+from shared.services.git_status_engine import GitStatusEngine, WorkspaceStatus
 from shared.utils.file_operations import manual_copy_tree, get_system_tmp
 
 logger = logging.getLogger(__name__)
 
-# Module-level lock to prevent concurrent Git fetch operations
-# This prevents SMB lock file conflicts when multiple requests arrive simultaneously
-_fetch_lock = asyncio.Lock()
+T = TypeVar("T")
+
+# Dulwich is blocking (object store reads, tree walks, SMB file I/O). All git work
+# runs on this small dedicated pool so it never stalls the Functions event loop,
+# and a burst of git requests can't starve the default executor used elsewhere.
+GIT_EXECUTOR_MAX_WORKERS = int(os.environ.get("GIT_EXECUTOR_MAX_WORKERS", "4"))
+_git_executor = ThreadPoolExecutor(
+    max_workers=GIT_EXECUTOR_MAX_WORKERS,
+    thread_name_prefix="git-ops"
+)
+
+# Socket timeout (connect and each read) for dulwich's HTTP transport. The git sync
+# worker's operation timeout only cancels at checkpoints and waits for the worker
+# thread; this bounds the network calls in between, so a stalled fetch/push/clone
+# raises in the thread instead of holding the workspace lock indefinitely.
+GIT_NETWORK_TIMEOUT_SECONDS = float(os.environ.get("GIT_NETWORK_TIMEOUT_SECONDS", "120"))
+
+# Per-workspace locks serializing mutating git operations (fetch, pull, push, commit,
+# discard, conflict resolution). This also prevents SMB lock file conflicts
+# ("main.lock already exists") when multiple requests arrive simultaneously.
+_workspace_locks: dict[str, asyncio.Lock] = {}
+
+# Operation currently holding each workspace lock, so it can be cancelled
+_active_operations: dict[str, "GitOperation"] = {}
+
+
+def _network_timeout_config() -> ConfigDict:
+    """Config layer applying GIT_NETWORK_TIMEOUT_SECONDS to dulwich's HTTP transport"""
+    config = ConfigDict()
+    config.set((b"http",), b"timeout", str(GIT_NETWORK_TIMEOUT_SECONDS).encode())
+    return config
+
+
+class _WorkspaceRepo(DulwichRepo):
+    """Dulwich repository whose fetches and pushes use the git network timeout"""
+
+    def get_config_stack(self) -> StackedConfig:
+        stack = super().get_config_stack()
+        stack.backends.insert(0, _network_timeout_config())
+        return stack
+
+
+class GitOperationCancelled(Exception):
+    """Raised inside a git operation when it has been cancelled"""
+    pass
+
+
+class GitOperation:
+    """
+    Handle for a running git operation.
+
+    Cancellation is cooperative: the blocking work checks the flag at safe
+    points (between fetch, conflict detection and applying changes) and stops
+    before touching the working tree.
+    """
+
+    def __init__(self, name: str, workspace_path: Path):
+        self.name = name
+        self.workspace_path = workspace_path
+        self.started_at = datetime.now(timezone.utc)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation (takes effect at the next checkpoint)"""
+        self._cancelled.set()
+
+    def checkpoint(self) -> None:
+        """
+        Raise if cancellation was requested.
+
+        Raises:
+            GitOperationCancelled: If the operation was cancelled
+        """
+        if self._cancelled.is_set():
+            raise GitOperationCancelled(f"Git {self.name} was cancelled")
+
+
+def _get_workspace_lock(workspace_path: Path) -> asyncio.Lock:
+    """Get (or create) the lock serializing git operations on a workspace"""
+    key = str(workspace_path)
+    lock = _workspace_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _workspace_locks[key] = lock
+    return lock
+
+
+def get_active_operation(workspace_path: Path) -> GitOperation | None:
+    """
+    Get the git operation currently running on a workspace.
+
+    Args:
+        workspace_path: Workspace path
+
+    Returns:
+        Running GitOperation, or None if the workspace is idle
+    """
+    return _active_operations.get(str(workspace_path))
+
+
+def cancel_git_operation(workspace_path: Path) -> bool:
+    """
+    Cancel the git operation currently running on a workspace.
+
+    Args:
+        workspace_path: Workspace path
+
+    Returns:
+        True if an operation was running and has been asked to stop
+    """
+    operation = get_active_operation(workspace_path)
+    if operation is None:
+        return False
+
+    logger.info(f"Cancelling git {operation.name} on {workspace_path}")
+    operation.cancel()
+    return True
 
 
 class GitIntegrationService:
@@ -65,8 +190,91 @@ class GitIntegrationService:
                 f"Workspace directory does not exist: {self.workspace_path}"
             )
 
+        self.status_engine = GitStatusEngine(self.workspace_path)
+        self._operation: GitOperation | None = None
+
         logger.info(f"Initialized Git integration service at: {self.workspace_path}")
 
+    @asynccontextmanager
+    async def _git_operation(self, name: str) -> AsyncIterator[GitOperation]:
+        """
+        Serialize a mutating git operation on this workspace and make it cancellable.
+
+        Args:
+            name: Operation name (for logging and cancellation messages)
+
+        Yields:
+            GitOperation handle for the running operation
+        """
+        lock = _get_workspace_lock(self.workspace_path)
+        if lock.locked():
+            logger.info(f"Git {name} waiting for running operation on {self.workspace_path}")
+
+        async with lock:
+            operation = GitOperation(name, self.workspace_path)
+            _active_operations[str(self.workspace_path)] = operation
+            self._operation = operation
+            try:
+                yield operation
+            finally:
+                _active_operations.pop(str(self.workspace_path), None)
+                self._operation = None
+
+    async def _run_git(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run blocking git work on the dedicated git executor.
+
+        If the awaiting task is cancelled, the running operation is flagged so the
+        worker thread stops at its next checkpoint, and this waits for the thread
+        to finish so the workspace lock is never released while git is still writing.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_git_executor, functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._operation is not None:
+                self._operation.cancel()
+            try:
+                await future
+            except BaseException:
+                pass
+            raise
+
+    def _checkpoint(self) -> None:
+        """Stop the current operation here if it has been cancelled"""
+        if self._operation is not None:
+            self._operation.checkpoint()
+
+    @staticmethod
+    def _threadsafe_log(send_log: Callable[..., Any]) -> Callable[..., None]:
+        """
+        Wrap an async send_log callback so it can be called from the git executor.
+
+        Messages are scheduled on the event loop in call order, so progress keeps
+        streaming to the terminal while the blocking work runs.
+
+        Args:
+            send_log: async send_log(message, level="info") callback
+
+        Returns:
+            Synchronous log(message, level="info") function
+        """
+        loop = asyncio.get_running_loop()
+
+        def log(message: str, level: str = "info") -> None:
+            asyncio.run_coroutine_threadsafe(send_log(message, level), loop)
+
+        return log
+
     @staticmethod
     def _is_real_file(path: Path) -> bool:
         """
@@ -101,7 +309,7 @@ class GitIntegrationService:
         """Get Dulwich repository instance"""
         if not self.is_git_repo():
             raise ValueError("Workspace is not a Git repository. Call initialize_repo() first.")
-        return DulwichRepo(str(self.workspace_path))
+        return _WorkspaceRepo(str(self.workspace_path))
 
     async def initialize_repo(
         self,
@@ -142,29 +350,30 @@ class GitIntegrationService:
         # Convert HTTPS URL to use token authentication
         auth_url = self._insert_token_in_url(repo_url, token)
 
-        # Check workspace state (filter out SMB metadata files)
-        workspace_empty = not any(
-            self._is_real_file(item) for item in self.workspace_path.iterdir()
-        )
-        is_git_repo = self.is_git_repo()
+        async with self._git_operation("initialize"):
+            # Check workspace state (filter out SMB metadata files)
+            workspace_empty = await self._run_git(
+                lambda: not any(self._is_real_file(item) for item in self.workspace_path.iterdir())
+            )
+            is_git_repo = await self._run_git(self.is_git_repo)
 
-        result = None
+            result = None
 
-        # Scenario 1: Already a Git repo - just update remote
-        if is_git_repo:
-            logger.info("Workspace is already a Git repository, updating configuration...")
-            self._update_existing_repo(auth_url, branch)
+            # Scenario 1: Already a Git repo - just update remote
+            if is_git_repo:
+                logger.info("Workspace is already a Git repository, updating configuration...")
+                await self._run_git(self._update_existing_repo, auth_url, branch)
 
-        # Scenario 2: Empty workspace - just clone
-        elif workspace_empty:
-            logger.info("Workspace is empty, cloning repository...")
-            self._clone_repo(auth_url, branch)
+            # Scenario 2: Empty workspace - just clone
+            elif workspace_empty:
+                logger.info("Workspace is empty, cloning repository...")
+                await self._run_git(self._clone_repo, auth_url, branch)
 
-        # Scenario 3: Has files but no Git - backup and replace
-        else:
-            logger.info("Workspace has files, backing up and replacing with repository...")
-            backup_path = await self._clear_and_clone(auth_url, branch)
-            result = {"backup_path": backup_path}
+            # Scenario 3: Has files but no Git - backup and replace
+            else:
+                logger.info("Workspace has files, backing up and replacing with repository...")
+                backup_path = await self._clear_and_clone(auth_url, branch)
+                result = {"backup_path": backup_path}
 
         logger.info("Repository initialized successfully")
         return result
@@ -236,11 +445,14 @@ class GitIntegrationService:
 
         try:
             logger.info(f"Step 1: Cloning to temporary directory: {tmp_clone_dir}")
+            clone_config = StackedConfig.default()
+            clone_config.backends.insert(0, _network_timeout_config())
             porcelain.clone(
                 auth_url,
                 str(tmp_clone_dir),
                 checkout=True,
-                branch=branch.encode('utf-8')
+                branch=branch.encode('utf-8'),
+                config=clone_config
             )
             logger.info("Clone to /tmp completed")
 
@@ -291,6 +503,47 @@ class GitIntegrationService:
         """
         logger.info("Clearing workspace and cloning from remote")
 
+        backup_dir = await self._run_git(self._backup_and_clone, auth_url, branch)
+
+        # Install requirements if requirements.txt exists
+        requirements_file = self.workspace_path / "requirements.txt"
+        if requirements_file.exists():
+            logger.info("Installing requirements from requirements.txt")
+            from shared.package_manager import WorkspacePackageManager
+
+            package_manager = WorkspacePackageManager(workspace_path=self.workspace_path)
+            try:
+                # Note: We can't stream here since this is called from initialize_repo
+                # Just run the install silently
+                await package_manager.install_requirements_streaming()
+                logger.info("Requirements installed successfully")
+            except Exception as e:
+                logger.warning(f"Failed to install requirements: {e}")
+                # Don't fail the whole operation if requirements install fails
+
+        return str(backup_dir)
+
+    def _count_workspace_files(self) -> int:
+        """
+        Count every file in the workspace outside .git directories (blocking).
+
+        Ignored and untracked files are included, since replacing the workspace
+        moves them to the backup too.
+        """
+        file_count = 0
+        if self.workspace_path.exists():
+            for _root, dirs, files in os.walk(self.workspace_path):
+                dirs[:] = [d for d in dirs if d != ".git"]
+                file_count += len(files)
+        return file_count
+
+    def _backup_and_clone(self, auth_url: str, branch: str) -> Path:
+        """
+        Move workspace contents to a temporary backup and clone in their place (blocking).
+
+        Returns:
+            Path to backup directory
+        """
         # Create temporary backup
         backup_dir = Path(tempfile.mkdtemp(prefix="bifrost_backup_"))
         logger.info(f"Creating backup at {backup_dir}")
@@ -313,24 +566,7 @@ class GitIntegrationService:
         self._clone_repo(auth_url, branch)
 
         logger.info(f"Replaced workspace with remote content. Backup available at {backup_dir}")
-
-        # Install requirements if requirements.txt exists
-        requirements_file = self.workspace_path / "requirements.txt"
-        if requirements_file.exists():
-            logger.info("Installing requirements from requirements.txt")
-            from shared.package_manager import PackageManager  # type: ignore[attr-defined]
-
-            package_manager = PackageManager(workspace_path=self.workspace_path)
-            try:
-                # Note: We can't stream here since this is called from initialize_repo
-                # Just run the install silently
-                await package_manager.install_requirements_streaming()
-                logger.info("Requirements installed successfully")
-            except Exception as e:
-                logger.warning(f"Failed to install requirements: {e}")
-                # Don't fail the whole operation if requirements install fails
-
-        return str(backup_dir)
+        return backup_dir
 
     def _get_pushed_commit_shas(self) -> set[bytes]:
         """
@@ -369,13 +605,13 @@ class GitIntegrationService:
         Fetch latest refs from remote without merging.
         Lightweight operation to update remote tracking branches.
 
-        Uses a module-level lock to prevent concurrent fetch operations that would
+        Holds the workspace git lock to prevent concurrent operations that would
         cause SMB lock file conflicts on Azure Files/network mounts.
 
         Args:
             context: Organization context for retrieving GitHub configuration
         """
-        if not self.is_git_repo():
+        if not await self._run_git(self.is_git_repo):
             logger.warning("Not a git repo, skipping fetch")
             return
 
@@ -385,15 +621,15 @@ class GitIntegrationService:
             logger.warning("No GitHub configuration found, cannot fetch")
             return
 
-        # Acquire lock to prevent concurrent fetch operations
+        # Acquire lock to prevent concurrent git operations
         # This prevents "main.lock already exists" errors on SMB mounts
-        async with _fetch_lock:
+        async with self._git_operation("fetch"):
             logger.info(f"Fetching from remote: {auth_url.replace(auth_url.split('@')[0].split('//')[1], '***') if '@' in auth_url else auth_url}")
 
             try:
-                repo = self.get_repo()
+                repo = await self._run_git(self.get_repo)
                 # Use 'origin' so Dulwich automatically updates refs/remotes/origin/*
-                _result = porcelain.fetch(repo, remote_location='origin')
+                _result = await self._run_git(porcelain.fetch, repo, remote_location='origin')
                 logger.info(f"Fetched latest refs from remote. Refs: {_result.refs}")
 
             except Exception as e:
@@ -407,6 +643,10 @@ class GitIntegrationService:
         Returns:
             Tuple of (commits_ahead, commits_behind)
         """
+        return await self._run_git(self._get_commits_ahead_behind_sync)
+
+    def _get_commits_ahead_behind_sync(self) -> tuple[int, int]:
+        """Blocking implementation of get_commits_ahead_behind() (runs on the git executor)"""
         if not self.is_git_repo():
             logger.warning("Not a git repo, returning (0, 0)")
             return (0, 0)
@@ -504,6 +744,10 @@ class GitIntegrationService:
                 - total: Total number of commits
                 - has_more: Whether there are more commits to load
         """
+        return await self._run_git(self._get_commit_history_sync, limit, offset)
+
+    def _get_commit_history_sync(self, limit: int = 20, offset: int = 0) -> dict:
+        """Blocking implementation of get_commit_history() (runs on the git executor)"""
         if not self.is_git_repo():
             return {"commits": [], "total": 0, "has_more": False}
 
@@ -581,6 +825,18 @@ class GitIntegrationService:
             logger.error(f"Failed to get commit history: {e}", exc_info=True)
             return {"commits": [], "total": 0, "has_more": False}
 
+    def get_status(self, use_cache: bool = True) -> WorkspaceStatus:
+        """
+        Get working tree status from the incremental status engine.
+
+        Args:
+            use_cache: Whether a cached result may be returned (default: True)
+
+        Returns:
+            WorkspaceStatus with staged, unstaged, untracked and conflicted paths
+        """
+        return self.status_engine.get_status(self.get_repo(), use_cache=use_cache)
+
     async def get_changed_files(self) -> list[FileChange]:
         """
         Get list of changed files in workspace.
@@ -588,75 +844,40 @@ class GitIntegrationService:
         Returns:
             List of FileChange objects with status and diff info
         """
-        repo = self.get_repo()
-        changes = []
+        return await self._run_git(self._get_changed_files_sync)
 
-        # Get conflicted files to exclude them from changes
-        conflicts = await self.get_conflicts()
-        conflicted_paths = {c.file_path for c in conflicts}
+    def _get_changed_files_sync(self) -> list[FileChange]:
+        """Blocking implementation of get_changed_files() (runs on the git executor)"""
+        status = self.get_status()
 
-        # Get status using Dulwich
-        status = porcelain.status(repo)
-
-        # Helper to decode path (handles both bytes and str)
-        def decode_path(path):
-            return path.decode('utf-8') if isinstance(path, bytes) else path
-
-        # Staged changes (added to index)
-        for path in status.staged['add']:
-            decoded_path = decode_path(path)
-            if self._is_real_file(Path(decoded_path)):
-                changes.append(FileChange(
-                    path=decoded_path,
-                    status=GitFileStatus.ADDED,
-                    additions=None,
-                    deletions=None
-                ))
+        # Conflicted files should only appear in the conflicts array
+        seen: set[str] = set(status.conflicted)
+        changes = []
 
-        for path in status.staged['modify']:
-            decoded_path = decode_path(path)
-            if self._is_real_file(Path(decoded_path)):
+        def add_changes(paths: list[str], file_status: GitFileStatus):
+            for path in paths:
+                if path in seen or not self._is_real_file(Path(path)):
+                    continue
+                seen.add(path)
                 changes.append(FileChange(
-                    path=decoded_path,
-                    status=GitFileStatus.MODIFIED,
+                    path=path,
+                    status=file_status,
                     additions=None,
                     deletions=None
                 ))
 
-        for path in status.staged['delete']:
-            decoded_path = decode_path(path)
-            if self._is_real_file(Path(decoded_path)):
-                changes.append(FileChange(
-                    path=decoded_path,
-                    status=GitFileStatus.DELETED,
-                    additions=None,
-                    deletions=None
-                ))
+        # Staged changes (added to index)
+        add_changes(status.staged_add, GitFileStatus.ADDED)
+        add_changes(status.staged_modify, GitFileStatus.MODIFIED)
+        add_changes(status.staged_delete, GitFileStatus.DELETED)
 
         # Unstaged changes
-        for path in status.unstaged:
-            decoded_path = decode_path(path)
-            if self._is_real_file(Path(decoded_path)) and decoded_path not in [f.path for f in changes]:
-                changes.append(FileChange(
-                    path=decoded_path,
-                    status=GitFileStatus.MODIFIED,
-                    additions=None,
-                    deletions=None
-                ))
+        add_changes(status.unstaged, GitFileStatus.MODIFIED)
 
         # Untracked files
-        for path in status.untracked:
-            decoded_path = decode_path(path)
-            if self._is_real_file(Path(decoded_path)):
-                changes.append(FileChange(
-                    path=decoded_path,
-                    status=GitFileStatus.UNTRACKED,
-                    additions=None,
-                    deletions=None
-                ))
+        add_changes(status.untracked, GitFileStatus.UNTRACKED)
 
-        # Filter out conflicted files - they should only appear in conflicts array
-        return [c for c in changes if c.path not in conflicted_paths]
+        return changes
 
     async def get_conflicts(self) -> list[ConflictInfo]:
         """
@@ -665,6 +886,10 @@ class GitIntegrationService:
         Returns:
             List of ConflictInfo objects with ours/theirs/base content
         """
+        return await self._run_git(self._get_conflicts_sync)
+
+    def _get_conflicts_sync(self) -> list[ConflictInfo]:
+        """Blocking implementation of get_conflicts() (runs on the git executor)"""
         repo = self.get_repo()
         conflicts = []
 
@@ -721,6 +946,11 @@ class GitIntegrationService:
         Returns:
             dict with commit_sha, files_committed, success status
         """
+        async with self._git_operation("commit"):
+            return await self._run_git(self._commit_sync, message)
+
+    def _commit_sync(self, message: str) -> dict:
+        """Blocking implementation of commit() (runs on the git executor)"""
         repo = self.get_repo()
 
         try:
@@ -728,11 +958,11 @@ class GitIntegrationService:
             porcelain.add(repo, paths=[b'.'])
 
             # Count files to be committed (before commit clears staging area)
-            status = porcelain.status(repo)
+            staged = porcelain.get_tree_changes(repo)
             files_committed = (
-                len(status.staged.get('add', [])) +
-                len(status.staged.get('modify', [])) +
-                len(status.staged.get('delete', []))
+                len(staged.get('add', [])) +
+                len(staged.get('modify', [])) +
+                len(staged.get('delete', []))
             )
 
             # Commit
@@ -783,39 +1013,30 @@ class GitIntegrationService:
         Returns:
             dict with success status
         """
+        async with self._git_operation("push"):
+            return await self._push(context, connection_id)
+
+    async def _push(self, context: Any, connection_id: str | None = None) -> dict:
+        """push() body, run with the workspace git lock held"""
         repo = self.get_repo()
 
-        # Initialize WebPubSub broadcaster for streaming logs
-        from shared.webpubsub_broadcaster import WebPubSubBroadcaster
-        broadcaster = WebPubSubBroadcaster()
+        # Stream logs through the process-wide publisher (queued, sent in the background)
+        from shared.webpubsub_broadcaster import get_publisher
+        publisher = get_publisher()
 
         async def send_log(message: str, level: str = "info"):
             """Send log message to WebPubSub terminal"""
-            if connection_id and broadcaster.enabled and broadcaster.client:
-                try:
-                    broadcaster.client.send_to_connection(
-                        connection_id=connection_id,
-                        message={
-                            "type": "log",
-                            "level": level,
-                            "message": message
-                        },
-                        content_type="application/json"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to send log to WebPubSub: {e}")
+            if connection_id:
+                publisher.publish(
+                    {"type": "log", "level": level, "message": message},
+                    connection_id=connection_id
+                )
 
         try:
             # Check for uncommitted changes before pushing
             await send_log("Checking for uncommitted changes...")
-            status = porcelain.status(repo)
-            has_changes = (
-                status.staged.get('add') or
-                status.staged.get('modify') or
-                status.staged.get('delete') or
-                status.unstaged or
-                status.untracked
-            )
+            status = await self._run_git(self.get_status, use_cache=False)
+            has_changes = status.has_changes
 
             if has_changes:
                 error_msg = "Cannot push: you have uncommitted changes. Please commit your changes first, then push."
@@ -848,96 +1069,123 @@ class GitIntegrationService:
 
             await send_log(f"Pushing to GitHub repository: {repo_full_name}")
 
-            # Get current branch
-            current_branch = self.get_current_branch() or 'main'
+            return await self._run_git(
+                self._push_sync, repo, repo_full_name, token, self._threadsafe_log(send_log)
+            )
 
-            # Get authenticated remote URL
-            auth_url = f"https://{token}@github.com/{repo_full_name}.git"
+        except GitOperationCancelled as e:
+            await send_log(f"✗ {e}", "warning")
+            return {
+                "success": False,
+                "error": str(e)
+            }
 
-            # Get local and remote commit SHAs for counting commits to push
-            local_ref = f'refs/heads/{current_branch}'.encode('utf-8')
-            remote_ref = f'refs/remotes/origin/{current_branch}'.encode('utf-8')
+        except Exception as e:
+            error_msg = f"Failed to push: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            await send_log(error_msg, "error")
+            return {
+                "success": False,
+                "error": error_msg
+            }
 
-            local_commit_sha = repo.refs[local_ref]
-            local_commit_sha_str = local_commit_sha.decode('utf-8')
+    def _push_sync(
+        self,
+        repo: DulwichRepo,
+        repo_full_name: str,
+        token: str,
+        log: Callable[..., None]
+    ) -> dict:
+        """
+        Blocking part of push(): count commits and upload objects.
 
-            try:
-                remote_commit_sha = repo.refs[remote_ref]
-                remote_commit_sha_str = remote_commit_sha.decode('utf-8')
-                await send_log(f"Local: {local_commit_sha_str[:8]}, Remote: {remote_commit_sha_str[:8]}")
-            except KeyError:
-                await send_log("No remote tracking ref found, will create new branch")
-                remote_commit_sha = None
-                remote_commit_sha_str = None
-
-            # If already up to date, nothing to push
-            if remote_commit_sha and local_commit_sha == remote_commit_sha:
-                await send_log("✓ Already up to date, nothing to push")
-                return {
-                    "success": True,
-                    "commits_pushed": 0,
-                    "error": None
-                }
+        Runs on the git executor. Progress goes through log(), which forwards
+        to the caller's send_log on the event loop.
+        """
+        # Get current branch
+        current_branch = self.get_current_branch() or 'main'
 
-            # Count commits to push
-            commits_to_push = []
-            if remote_commit_sha:
-                # Walk from local to remote to count commits
-                walker = repo.get_walker(include=[local_commit_sha], exclude=[remote_commit_sha])
-                commits_to_push = list(walker)
-            else:
-                # No remote ref, count all commits from HEAD
-                walker = repo.get_walker(include=[local_commit_sha])
-                commits_to_push = list(walker)
+        # Get authenticated remote URL
+        auth_url = f"https://{token}@github.com/{repo_full_name}.git"
 
-            commits_count = len(commits_to_push)
-            await send_log(f"Pushing {commits_count} commit(s) to GitHub...")
+        # Get local and remote commit SHAs for counting commits to push
+        local_ref = f'refs/heads/{current_branch}'.encode('utf-8')
+        remote_ref = f'refs/remotes/origin/{current_branch}'.encode('utf-8')
 
-            # Push using Dulwich porcelain.push() which preserves commit SHAs
-            logger.info(f"Pushing to {auth_url}")
-            await send_log("Uploading objects to GitHub...")
+        local_commit_sha = repo.refs[local_ref]
+        local_commit_sha_str = local_commit_sha.decode('utf-8')
 
-            try:
-                # Use porcelain.push to push the current branch
-                # This preserves local commit SHAs instead of recreating them
-                def progress_callback(msg):
-                    """Callback for push progress"""
-                    logger.info(f"Push progress: {msg.decode('utf-8') if isinstance(msg, bytes) else msg}")
-
-                push_result = porcelain.push(
-                    repo.path,
-                    remote_location=auth_url,
-                    refspecs=[f"refs/heads/{current_branch}:refs/heads/{current_branch}".encode('utf-8')],
-                    progress=progress_callback
-                )
+        try:
+            remote_commit_sha = repo.refs[remote_ref]
+            remote_commit_sha_str = remote_commit_sha.decode('utf-8')
+            log(f"Local: {local_commit_sha_str[:8]}, Remote: {remote_commit_sha_str[:8]}")
+        except KeyError:
+            log("No remote tracking ref found, will create new branch")
+            remote_commit_sha = None
+            remote_commit_sha_str = None
+
+        # If already up to date, nothing to push
+        if remote_commit_sha and local_commit_sha == remote_commit_sha:
+            log("✓ Already up to date, nothing to push")
+            return {
+                "success": True,
+                "commits_pushed": 0,
+                "error": None
+            }
 
-                logger.info(f"Push result: {push_result}")
-                await send_log(f"Pushed {commits_count} commit(s) to GitHub")
+        # Count commits to push
+        commits_to_push = []
+        if remote_commit_sha:
+            # Walk from local to remote to count commits
+            walker = repo.get_walker(include=[local_commit_sha], exclude=[remote_commit_sha])
+            commits_to_push = list(walker)
+        else:
+            # No remote ref, count all commits from HEAD
+            walker = repo.get_walker(include=[local_commit_sha])
+            commits_to_push = list(walker)
 
-                # Update local remote tracking ref to match local branch
-                # This ensures the local tracking ref reflects what's actually on GitHub
-                repo.refs[remote_ref] = local_commit_sha
-                await send_log(f"Updated local tracking ref to {local_commit_sha_str[:8]}")
+        commits_count = len(commits_to_push)
+        log(f"Pushing {commits_count} commit(s) to GitHub...")
 
-                return {
-                    "success": True,
-                    "commits_pushed": commits_count,
-                    "error": None
-                }
+        self._checkpoint()
 
-            except Exception as push_error:
-                logger.error(f"Push failed: {str(push_error)}")
-                raise
+        # Push using Dulwich porcelain.push() which preserves commit SHAs
+        logger.info(f"Pushing to {auth_url}")
+        log("Uploading objects to GitHub...")
+
+        try:
+            # Use porcelain.push to push the current branch
+            # This preserves local commit SHAs instead of recreating them
+            def progress_callback(msg):
+                """Callback for push progress"""
+                logger.info(f"Push progress: {msg.decode('utf-8') if isinstance(msg, bytes) else msg}")
+
+            push_result = porcelain.push(
+                repo,
+                remote_location=auth_url,
+                refspecs=[f"refs/heads/{current_branch}:refs/heads/{current_branch}".encode('utf-8')],
+                progress=progress_callback
+            )
+
+            logger.info(f"Push result: {push_result}")
+            log(f"Pushed {commits_count} commit(s) to GitHub")
+
+            # Update local remote tracking ref to match local branch
+            # This ensures the local tracking ref reflects what's actually on GitHub
+            repo.refs[remote_ref] = local_commit_sha
+            log(f"Updated local tracking ref to {local_commit_sha_str[:8]}")
 
-        except Exception as e:
-            error_msg = f"Failed to push: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            await send_log(error_msg, "error")
             return {
-                "success": False,
-                "error": error_msg
+                "success": True,
+                "commits_pushed": commits_count,
+                "error": None
             }
 
+        except Exception as push_error:
+            logger.error(f"Push failed: {str(push_error)}")
+            raise
+
+
     async def pull(self, context: Any, connection_id: str | None = None) -> dict:
         """
         Pull changes from GitHub remote.
@@ -951,27 +1199,24 @@ class GitIntegrationService:
         Returns:
             dict with updated_files, conflicts, success status
         """
+        async with self._git_operation("pull"):
+            return await self._pull(context, connection_id)
+
+    async def _pull(self, context: Any, connection_id: str | None = None) -> dict:
+        """pull() body, run with the workspace git lock held"""
         repo = self.get_repo()
 
-        # Initialize WebPubSub broadcaster for streaming logs
-        from shared.webpubsub_broadcaster import WebPubSubBroadcaster
-        broadcaster = WebPubSubBroadcaster()
+        # Stream logs through the process-wide publisher (queued, sent in the background)
+        from shared.webpubsub_broadcaster import get_publisher
+        publisher = get_publisher()
 
         async def send_log(message: str, level: str = "info"):
             """Send log message to WebPubSub terminal"""
-            if connection_id and broadcaster.enabled and broadcaster.client:
-                try:
-                    broadcaster.client.send_to_connection(
-                        connection_id=connection_id,
-                        message={
-                            "type": "log",
-                            "level": level,
-                            "message": message
-                        },
-                        content_type="application/json"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to send log to WebPubSub: {e}")
+            if connection_id:
+                publisher.publish(
+                    {"type": "log", "level": level, "message": message},
+                    connection_id=connection_id
+                )
 
         # Check if we're already in a merge state
         from pathlib import Path
@@ -1005,506 +1250,527 @@ class GitIntegrationService:
             if not auth_url:
                 raise Exception("No GitHub configuration found")
 
-            await send_log("Fetching changes from remote...")
-            # Use 'origin' so Dulwich automatically updates refs/remotes/origin/*
-            _result = porcelain.fetch(repo, remote_location='origin')
-            await send_log("Fetch complete")
+            return await self._run_git(self._pull_sync, repo, self._threadsafe_log(send_log))
 
-            # Get current branch
-            current_branch = self.get_current_branch() or 'main'
-            local_ref = f'refs/heads/{current_branch}'.encode('utf-8')
-            remote_ref = f'refs/remotes/origin/{current_branch}'.encode('utf-8')
+        except GitOperationCancelled as e:
+            await send_log(f"✗ {e}", "warning")
+            return {
+                "success": False,
+                "updated_files": [],
+                "conflicts": [],
+                "error": str(e)
+            }
 
-            # Get current commit and remote commit
-            local_commit = repo.refs[local_ref]
-            remote_commit = repo.refs[remote_ref] if remote_ref in repo.refs else None
+        except Exception as e:
+            logger.error(f"Failed to pull from GitHub: {e}", exc_info=True)
 
-            if not remote_commit:
-                raise Exception(f"Remote branch {current_branch} not found")
+            # Try to get conflicts even on error
+            try:
+                conflicts = await self.get_conflicts()
+                if conflicts:
+                    conflict_files = [c.file_path for c in conflicts]
+                    return {
+                        "success": False,
+                        "updated_files": [],
+                        "conflicts": [c.model_dump() for c in conflicts],
+                        "error": f"Merge conflicts occurred: {', '.join(conflict_files)}"
+                    }
+            except Exception as conflict_err:
+                logger.warning(f"Failed to check for conflicts after pull error: {conflict_err}")
 
-            # If already up to date, return success
-            if local_commit == remote_commit:
-                await send_log("Already up to date", "success")
-                return {
-                    "success": True,
-                    "updated_files": [],
-                    "conflicts": [],
-                    "error": None
-                }
+            # Format error message properly
+            error_msg = str(e)
+            # Clean up bytes representation in error messages
+            if "b'" in error_msg:
+                import re
+                error_msg = re.sub(r"b'([^']+)'", r'\1', error_msg)
 
-            # Find merge base (common ancestor)
-            merge_bases = porcelain.merge_base(repo, committishes=[local_commit, remote_commit])
-            base_commit_raw = repo[merge_bases[0]] if merge_bases else None
-            base_commit = base_commit_raw if isinstance(base_commit_raw, DulwichCommit) else None
+            # Send error to WebPubSub terminal
+            full_error_msg = f"Failed to pull from GitHub: {error_msg}"
+            await send_log(f"✗ {full_error_msg}", "error")
 
-            # Check if local is ahead of remote (remote is ancestor of local)
-            # If so, there's nothing to pull - user just needs to push
-            if base_commit and base_commit.id == remote_commit:
-                # Remote is behind local - nothing to pull
-                await send_log("Local is ahead of remote, nothing to pull")
-                return {
-                    "success": True,
-                    "updated_files": [],
-                    "conflicts": [],
-                    "error": None
-                }
+            return {
+                "success": False,
+                "updated_files": [],
+                "conflicts": [],
+                "error": full_error_msg
+            }
 
-            await send_log("Checking for uncommitted changes...")
+    def _pull_sync(self, repo: DulwichRepo, log: Callable[..., None]) -> dict:
+        """
+        Blocking part of pull(): fetch, conflict detection and merge.
 
-            # First, check for uncommitted changes that would conflict with incoming changes
-            from dulwich.porcelain import status as git_status
-            from dulwich.diff_tree import tree_changes
+        Runs on the git executor. Progress goes through log(), which forwards
+        to the caller's send_log on the event loop.
+        """
 
-            git_status_result = git_status(repo)
-            uncommitted_files = set()
+        log("Fetching changes from remote...")
+        # Use 'origin' so Dulwich automatically updates refs/remotes/origin/*
+        _result = porcelain.fetch(repo, remote_location='origin')
+        log("Fetch complete")
+        self._checkpoint()
 
-            # Collect all uncommitted files (staged and unstaged)
-            for file_list in [git_status_result.staged.get('add', []),
-                             git_status_result.staged.get('modify', []),
-                             git_status_result.staged.get('delete', [])]:
-                uncommitted_files.update(f.decode('utf-8') if isinstance(f, bytes) else f for f in file_list)
-            uncommitted_files.update(f.decode('utf-8') if isinstance(f, bytes) else f for f in git_status_result.unstaged)
+        # Get current branch
+        current_branch = self.get_current_branch() or 'main'
+        local_ref = f'refs/heads/{current_branch}'.encode('utf-8')
+        remote_ref = f'refs/remotes/origin/{current_branch}'.encode('utf-8')
 
-            logger.info(f"Found {len(uncommitted_files)} uncommitted file(s): {uncommitted_files}")
+        # Get current commit and remote commit
+        local_commit = repo.refs[local_ref]
+        remote_commit = repo.refs[remote_ref] if remote_ref in repo.refs else None
 
-            # Get files that will be changed by the pull (compare local HEAD with remote)
-            local_commit_obj_raw = repo[local_commit]
-            remote_commit_obj_raw = repo[remote_commit]
+        if not remote_commit:
+            raise Exception(f"Remote branch {current_branch} not found")
 
-            # Cast to Commit type for type safety
-            if not isinstance(local_commit_obj_raw, DulwichCommit) or not isinstance(remote_commit_obj_raw, DulwichCommit):
-                raise Exception("Failed to retrieve commit objects")
+        # If already up to date, return success
+        if local_commit == remote_commit:
+            log("Already up to date", "success")
+            return {
+                "success": True,
+                "updated_files": [],
+                "conflicts": [],
+                "error": None
+            }
 
-            local_commit_obj = local_commit_obj_raw
-            remote_commit_obj = remote_commit_obj_raw
+        # Find merge base (common ancestor)
+        merge_bases = porcelain.merge_base(repo, committishes=[local_commit, remote_commit])
+        base_commit_raw = repo[merge_bases[0]] if merge_bases else None
+        base_commit = base_commit_raw if isinstance(base_commit_raw, DulwichCommit) else None
 
-            remote_changed_files = set()
-            for change in tree_changes(repo.object_store, local_commit_obj.tree, remote_commit_obj.tree):
-                if change.type != 'unchanged':
-                    path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
-                    if path_bytes:
-                        path = path_bytes.decode('utf-8')
-                        remote_changed_files.add(path)
+        # Check if local is ahead of remote (remote is ancestor of local)
+        # If so, there's nothing to pull - user just needs to push
+        if base_commit and base_commit.id == remote_commit:
+            # Remote is behind local - nothing to pull
+            log("Local is ahead of remote, nothing to pull")
+            return {
+                "success": True,
+                "updated_files": [],
+                "conflicts": [],
+                "error": None
+            }
 
-            logger.info(f"Remote will change {len(remote_changed_files)} file(s): {remote_changed_files}")
+        log("Checking for uncommitted changes...")
 
-            # Find files with uncommitted changes that remote also wants to change
-            uncommitted_conflicts = uncommitted_files & remote_changed_files
+        # First, check for uncommitted changes that would conflict with incoming changes
+        from dulwich.diff_tree import tree_changes
 
-            if uncommitted_conflicts:
-                logger.warning(f"Uncommitted changes conflict with incoming changes in {len(uncommitted_conflicts)} file(s): {uncommitted_conflicts}")
+        status = self.get_status(use_cache=False)
+        uncommitted_files = set()
 
-                conflict_list = ", ".join(sorted(uncommitted_conflicts))
-                error_msg = f"Your local changes to the following files would be overwritten by pull: {conflict_list}. Please commit your changes or stash them before pulling."
-                await send_log(f"✗ {error_msg}", "error")
+        # Collect all uncommitted files (staged and unstaged)
+        for file_list in [status.staged_add, status.staged_modify, status.staged_delete, status.unstaged]:
+            uncommitted_files.update(file_list)
 
-                return {
-                    "success": False,
-                    "updated_files": [],
-                    "conflicts": [],
-                    "error": error_msg
-                }
+        logger.info(f"Found {len(uncommitted_files)} uncommitted file(s): {uncommitted_files}")
 
-            await send_log("Checking for merge conflicts...")
-            # Check for conflicts by comparing trees (don't write markers)
-            from dulwich.merge import three_way_merge
+        # Get files that will be changed by the pull (compare local HEAD with remote)
+        local_commit_obj_raw = repo[local_commit]
+        remote_commit_obj_raw = repo[remote_commit]
 
-            try:
-                logger.info(f"Checking for conflicts: base={base_commit.id.decode('utf-8')[:8] if base_commit else 'None'}, ours={local_commit.decode('utf-8')[:8]}, theirs={remote_commit.decode('utf-8')[:8]}")
-
-                # Perform tree-level merge to detect conflicted paths (but don't write markers)
-                merged_tree, conflicted_paths = three_way_merge(
-                    repo.object_store,
-                    base_commit=base_commit,
-                    ours_commit=local_commit_obj,
-                    theirs_commit=remote_commit_obj
-                )
+        # Cast to Commit type for type safety
+        if not isinstance(local_commit_obj_raw, DulwichCommit) or not isinstance(remote_commit_obj_raw, DulwichCommit):
+            raise Exception("Failed to retrieve commit objects")
 
-                logger.info(f"Conflict detection result: {len(conflicted_paths)} conflicted path(s)")
+        local_commit_obj = local_commit_obj_raw
+        remote_commit_obj = remote_commit_obj_raw
 
-                # For each conflicted path, collect local and remote content without writing markers
-                conflicts_list = []
+        remote_changed_files = set()
+        for change in tree_changes(repo.object_store, local_commit_obj.tree, remote_commit_obj.tree):
+            if change.type != 'unchanged':
+                path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
+                if path_bytes:
+                    path = path_bytes.decode('utf-8')
+                    remote_changed_files.add(path)
 
-                def get_object_for_path(commit_obj: DulwichCommit | None, path_b: bytes | None) -> ShaFile | None:
-                    """Get tree or blob object for a path"""
-                    if not commit_obj:
-                        return None
-                    tree_obj_raw = repo[commit_obj.tree]
-                    if not isinstance(tree_obj_raw, (Tree, Blob)):
-                        return None
-                    tree_obj: ShaFile = tree_obj_raw
-                    if not path_b:  # Root
-                        return tree_obj
-                    parts = path_b.split(b'/')
-                    for part in parts:
-                        if not hasattr(tree_obj, '__getitem__'):
-                            return None
-                        mode, sha = tree_obj[part]  # type: ignore
-                        obj = repo[sha]
-                        if hasattr(obj, 'items'):  # It's a tree
-                            tree_obj = obj
-                        else:  # It's a blob
-                            return obj
-                    return tree_obj
+        logger.info(f"Remote will change {len(remote_changed_files)} file(s): {remote_changed_files}")
 
-                def process_conflicted_tree(path_prefix, base_tree, ours_tree, theirs_tree):
-                    """Recursively process a conflicted tree to find actual file conflicts"""
-                    # Get all file names from all three trees
-                    base_entries = {name: (mode, sha) for name, mode, sha in base_tree.items()} if base_tree else {}
-                    ours_entries = {name: (mode, sha) for name, mode, sha in ours_tree.items()} if ours_tree else {}
-                    theirs_entries = {name: (mode, sha) for name, mode, sha in theirs_tree.items()} if theirs_tree else {}
-
-                    all_names = set(base_entries.keys()) | set(ours_entries.keys()) | set(theirs_entries.keys())
-
-                    for name in all_names:
-                        file_path_bytes = path_prefix + b'/' + name if path_prefix else name
-                        file_path_str = file_path_bytes.decode('utf-8')
-
-                        base_entry = base_entries.get(name)
-                        ours_entry = ours_entries.get(name)
-                        theirs_entry = theirs_entries.get(name)
-
-                        # Check if all three point to same SHA (no conflict)
-                        if base_entry and ours_entry and theirs_entry:
-                            if base_entry[1] == ours_entry[1] == theirs_entry[1]:
-                                continue  # No conflict
-
-                        # Get objects
-                        base_obj = repo[base_entry[1]] if base_entry else None
-                        ours_obj = repo[ours_entry[1]] if ours_entry else None
-                        theirs_obj = repo[theirs_entry[1]] if theirs_entry else None
-
-                        # Check if any is a tree (directory)
-                        is_tree = any(hasattr(obj, 'items') for obj in [base_obj, ours_obj, theirs_obj] if obj)
-
-                        if is_tree:
-                            # Recursively process subdirectory
-                            process_conflicted_tree(
-                                file_path_bytes,
-                                base_obj if hasattr(base_obj, 'items') else None,
-                                ours_obj if hasattr(ours_obj, 'items') else None,
-                                theirs_obj if hasattr(theirs_obj, 'items') else None
-                            )
-                        else:
-                            # It's a file conflict - just collect the content from both sides
-                            try:
-                                current_content = ours_obj.as_raw_string().decode('utf-8', errors='replace') if ours_obj else ""
-                                incoming_content = theirs_obj.as_raw_string().decode('utf-8', errors='replace') if theirs_obj else ""
-                                base_content = base_obj.as_raw_string().decode('utf-8', errors='replace') if base_obj else None
-
-                                conflicts_list.append({
-                                    "file_path": file_path_str,
-                                    "current_content": current_content,
-                                    "incoming_content": incoming_content,
-                                    "base_content": base_content,
-                                })
-                                logger.info(f"Found conflict in: {file_path_str}")
-
-                            except Exception as e:
-                                logger.warning(f"Failed to read content for {file_path_str}: {e}")
-
-                for path_bytes in conflicted_paths:
-                    path_str = path_bytes.decode('utf-8') if isinstance(path_bytes, bytes) else path_bytes
-                    logger.info(f"Processing conflicted path: {path_str}")
-
-                    try:
-                        base_obj = get_object_for_path(base_commit, path_bytes) if base_commit else None
-                        ours_obj = get_object_for_path(local_commit_obj, path_bytes)
-                        theirs_obj = get_object_for_path(remote_commit_obj, path_bytes)
-
-                        # Check if it's a tree or blob
-                        if any(hasattr(obj, 'items') for obj in [base_obj, ours_obj, theirs_obj] if obj):
-                            # It's a tree - recursively process
-                            process_conflicted_tree(
-                                path_bytes,
-                                base_obj if hasattr(base_obj, 'items') else None,
-                                ours_obj if hasattr(ours_obj, 'items') else None,
-                                theirs_obj if hasattr(theirs_obj, 'items') else None
-                            )
-                        else:
-                            # It's a blob - collect content
+        # Find files with uncommitted changes that remote also wants to change
+        uncommitted_conflicts = uncommitted_files & remote_changed_files
+
+        if uncommitted_conflicts:
+            logger.warning(f"Uncommitted changes conflict with incoming changes in {len(uncommitted_conflicts)} file(s): {uncommitted_conflicts}")
+
+            conflict_list = ", ".join(sorted(uncommitted_conflicts))
+            error_msg = f"Your local changes to the following files would be overwritten by pull: {conflict_list}. Please commit your changes or stash them before pulling."
+            log(f"✗ {error_msg}", "error")
+
+            return {
+                "success": False,
+                "updated_files": [],
+                "conflicts": [],
+                "error": error_msg
+            }
+
+        self._checkpoint()
+        log("Checking for merge conflicts...")
+        # Check for conflicts by comparing trees (don't write markers)
+        from dulwich.merge import three_way_merge
+
+        try:
+            logger.info(f"Checking for conflicts: base={base_commit.id.decode('utf-8')[:8] if base_commit else 'None'}, ours={local_commit.decode('utf-8')[:8]}, theirs={remote_commit.decode('utf-8')[:8]}")
+
+            # Perform tree-level merge to detect conflicted paths (but don't write markers)
+            merged_tree, conflicted_paths = three_way_merge(
+                repo.object_store,
+                base_commit=base_commit,
+                ours_commit=local_commit_obj,
+                theirs_commit=remote_commit_obj
+            )
+
+            logger.info(f"Conflict detection result: {len(conflicted_paths)} conflicted path(s)")
+
+            # For each conflicted path, collect local and remote content without writing markers
+            conflicts_list = []
+
+            def get_object_for_path(commit_obj: DulwichCommit | None, path_b: bytes | None) -> ShaFile | None:
+                """Get tree or blob object for a path"""
+                if not commit_obj:
+                    return None
+                tree_obj_raw = repo[commit_obj.tree]
+                if not isinstance(tree_obj_raw, (Tree, Blob)):
+                    return None
+                tree_obj: ShaFile = tree_obj_raw
+                if not path_b:  # Root
+                    return tree_obj
+                parts = path_b.split(b'/')
+                for part in parts:
+                    if not hasattr(tree_obj, '__getitem__'):
+                        return None
+                    mode, sha = tree_obj[part]  # type: ignore
+                    obj = repo[sha]
+                    if hasattr(obj, 'items'):  # It's a tree
+                        tree_obj = obj
+                    else:  # It's a blob
+                        return obj
+                return tree_obj
+
+            def process_conflicted_tree(path_prefix, base_tree, ours_tree, theirs_tree):
+                """Recursively process a conflicted tree to find actual file conflicts"""
+                # Get all file names from all three trees
+                base_entries = {name: (mode, sha) for name, mode, sha in base_tree.items()} if base_tree else {}
+                ours_entries = {name: (mode, sha) for name, mode, sha in ours_tree.items()} if ours_tree else {}
+                theirs_entries = {name: (mode, sha) for name, mode, sha in theirs_tree.items()} if theirs_tree else {}
+
+                all_names = set(base_entries.keys()) | set(ours_entries.keys()) | set(theirs_entries.keys())
+
+                for name in all_names:
+                    file_path_bytes = path_prefix + b'/' + name if path_prefix else name
+                    file_path_str = file_path_bytes.decode('utf-8')
+
+                    base_entry = base_entries.get(name)
+                    ours_entry = ours_entries.get(name)
+                    theirs_entry = theirs_entries.get(name)
+
+                    # Check if all three point to same SHA (no conflict)
+                    if base_entry and ours_entry and theirs_entry:
+                        if base_entry[1] == ours_entry[1] == theirs_entry[1]:
+                            continue  # No conflict
+
+                    # Get objects
+                    base_obj = repo[base_entry[1]] if base_entry else None
+                    ours_obj = repo[ours_entry[1]] if ours_entry else None
+                    theirs_obj = repo[theirs_entry[1]] if theirs_entry else None
+
+                    # Check if any is a tree (directory)
+                    is_tree = any(hasattr(obj, 'items') for obj in [base_obj, ours_obj, theirs_obj] if obj)
+
+                    if is_tree:
+                        # Recursively process subdirectory
+                        process_conflicted_tree(
+                            file_path_bytes,
+                            base_obj if hasattr(base_obj, 'items') else None,
+                            ours_obj if hasattr(ours_obj, 'items') else None,
+                            theirs_obj if hasattr(theirs_obj, 'items') else None
+                        )
+                    else:
+                        # It's a file conflict - just collect the content from both sides
+                        try:
                             current_content = ours_obj.as_raw_string().decode('utf-8', errors='replace') if ours_obj else ""
                             incoming_content = theirs_obj.as_raw_string().decode('utf-8', errors='replace') if theirs_obj else ""
                             base_content = base_obj.as_raw_string().decode('utf-8', errors='replace') if base_obj else None
 
                             conflicts_list.append({
-                                "file_path": path_str,
+                                "file_path": file_path_str,
                                 "current_content": current_content,
                                 "incoming_content": incoming_content,
                                 "base_content": base_content,
                             })
-                            logger.info(f"Found conflict in: {path_str}")
+                            logger.info(f"Found conflict in: {file_path_str}")
 
-                    except Exception as e:
-                        logger.warning(f"Failed to process {path_str}: {e}")
+                        except Exception as e:
+                            logger.warning(f"Failed to read content for {file_path_str}: {e}")
 
-                # If we have conflicts, write merge state to Git and return
-                if conflicts_list:
-                    await send_log(f"⚠️ Found {len(conflicts_list)} conflicting file(s)", "warning")
-                    logger.warning(f"Pull detected {len(conflicts_list)} conflict(s) in files: {[c['file_path'] for c in conflicts_list]}")
-
-                    # Write MERGE_HEAD to mark that we're in a merge state
-                    from pathlib import Path
-                    merge_head_path = Path(repo.controldir()) / 'MERGE_HEAD'
-                    merge_head_path.write_text(remote_commit.decode('utf-8') + '\n')
-                    logger.info(f"Wrote MERGE_HEAD: {remote_commit.decode('utf-8')[:8]}")
+            for path_bytes in conflicted_paths:
+                self._checkpoint()
+                path_str = path_bytes.decode('utf-8') if isinstance(path_bytes, bytes) else path_bytes
+                logger.info(f"Processing conflicted path: {path_str}")
 
-                    # Write conflicted files to index with multiple stages
-                    # This makes Git recognize them as conflicts (like a real merge)
-                    index = repo.open_index()
-                    for conflict_path_str in [c['file_path'] for c in conflicts_list]:
-                        conflict_path_b = conflict_path_str.encode('utf-8')
+                try:
+                    base_obj = get_object_for_path(base_commit, path_bytes) if base_commit else None
+                    ours_obj = get_object_for_path(local_commit_obj, path_bytes)
+                    theirs_obj = get_object_for_path(remote_commit_obj, path_bytes)
+
+                    # Check if it's a tree or blob
+                    if any(hasattr(obj, 'items') for obj in [base_obj, ours_obj, theirs_obj] if obj):
+                        # It's a tree - recursively process
+                        process_conflicted_tree(
+                            path_bytes,
+                            base_obj if hasattr(base_obj, 'items') else None,
+                            ours_obj if hasattr(ours_obj, 'items') else None,
+                            theirs_obj if hasattr(theirs_obj, 'items') else None
+                        )
+                    else:
+                        # It's a blob - collect content
+                        current_content = ours_obj.as_raw_string().decode('utf-8', errors='replace') if ours_obj else ""
+                        incoming_content = theirs_obj.as_raw_string().decode('utf-8', errors='replace') if theirs_obj else ""
+                        base_content = base_obj.as_raw_string().decode('utf-8', errors='replace') if base_obj else None
+
+                        conflicts_list.append({
+                            "file_path": path_str,
+                            "current_content": current_content,
+                            "incoming_content": incoming_content,
+                            "base_content": base_content,
+                        })
+                        logger.info(f"Found conflict in: {path_str}")
 
-                        # Get the three versions from the trees
-                        def get_blob_from_tree(tree_obj: ShaFile | None, path_b: bytes) -> Blob | None:
-                            if not tree_obj:
-                                return None
-                            parts = path_b.split(b'/')
-                            current_tree = tree_obj
-                            for part in parts[:-1]:
-                                try:
-                                    if not hasattr(current_tree, '__getitem__'):
-                                        return None
-                                    mode, sha = current_tree[part]  # type: ignore
-                                    current_tree = repo[sha]
-                                except (KeyError, TypeError):
-                                    return None
+                except Exception as e:
+                    logger.warning(f"Failed to process {path_str}: {e}")
+
+            # If we have conflicts, write merge state to Git and return
+            if conflicts_list:
+                log(f"⚠️ Found {len(conflicts_list)} conflicting file(s)", "warning")
+                logger.warning(f"Pull detected {len(conflicts_list)} conflict(s) in files: {[c['file_path'] for c in conflicts_list]}")
+
+                # Write MERGE_HEAD to mark that we're in a merge state
+                from pathlib import Path
+                merge_head_path = Path(repo.controldir()) / 'MERGE_HEAD'
+                merge_head_path.write_text(remote_commit.decode('utf-8') + '\n')
+                logger.info(f"Wrote MERGE_HEAD: {remote_commit.decode('utf-8')[:8]}")
+
+                # Write conflicted files to index with multiple stages
+                # This makes Git recognize them as conflicts (like a real merge)
+                index = repo.open_index()
+                for conflict_path_str in [c['file_path'] for c in conflicts_list]:
+                    conflict_path_b = conflict_path_str.encode('utf-8')
+
+                    # Get the three versions from the trees
+                    def get_blob_from_tree(tree_obj: ShaFile | None, path_b: bytes) -> Blob | None:
+                        if not tree_obj:
+                            return None
+                        parts = path_b.split(b'/')
+                        current_tree = tree_obj
+                        for part in parts[:-1]:
                             try:
                                 if not hasattr(current_tree, '__getitem__'):
                                     return None
-                                mode, sha = current_tree[parts[-1]]  # type: ignore
-                                blob_obj = repo[sha]
-                                return blob_obj if isinstance(blob_obj, Blob) else None
+                                mode, sha = current_tree[part]  # type: ignore
+                                current_tree = repo[sha]
                             except (KeyError, TypeError):
                                 return None
+                        try:
+                            if not hasattr(current_tree, '__getitem__'):
+                                return None
+                            mode, sha = current_tree[parts[-1]]  # type: ignore
+                            blob_obj = repo[sha]
+                            return blob_obj if isinstance(blob_obj, Blob) else None
+                        except (KeyError, TypeError):
+                            return None
 
-                        base_tree_obj = repo[base_commit.tree] if base_commit else None
-                        ours_tree_obj = repo[local_commit_obj.tree]
-                        theirs_tree_obj = repo[remote_commit_obj.tree]
+                    base_tree_obj = repo[base_commit.tree] if base_commit else None
+                    ours_tree_obj = repo[local_commit_obj.tree]
+                    theirs_tree_obj = repo[remote_commit_obj.tree]
 
-                        base_blob = get_blob_from_tree(base_tree_obj, conflict_path_b)
-                        ours_blob = get_blob_from_tree(ours_tree_obj, conflict_path_b)
-                        theirs_blob = get_blob_from_tree(theirs_tree_obj, conflict_path_b)
+                    base_blob = get_blob_from_tree(base_tree_obj, conflict_path_b)
+                    ours_blob = get_blob_from_tree(ours_tree_obj, conflict_path_b)
+                    theirs_blob = get_blob_from_tree(theirs_tree_obj, conflict_path_b)
 
-                        # Remove stage 0 entry if it exists
-                        if conflict_path_b in index:
-                            del index[conflict_path_b]
+                    # Remove stage 0 entry if it exists
+                    if conflict_path_b in index:
+                        del index[conflict_path_b]
 
-                        # Create ConflictedIndexEntry with all three versions
-                        from dulwich.index import IndexEntry, ConflictedIndexEntry
-                        import time
-                        import stat
+                    # Create ConflictedIndexEntry with all three versions
+                    from dulwich.index import IndexEntry, ConflictedIndexEntry
+                    import time
+                    import stat
 
-                        def make_index_entry(blob: Blob | None) -> IndexEntry | None:
-                            """Create an IndexEntry for a blob."""
-                            if not blob or not isinstance(blob, Blob):
-                                return None
-                            return IndexEntry(
-                                ctime=(int(time.time()), 0),
-                                mtime=(int(time.time()), 0),
-                                dev=0,
-                                ino=0,
-                                mode=stat.S_IFREG | 0o644,
-                                uid=0,
-                                gid=0,
-                                size=len(blob.data),
-                                sha=blob.id,
-                                flags=len(conflict_path_b),  # No stage in flags for ConflictedIndexEntry
-                            )
-
-                        # Store as ConflictedIndexEntry so get_conflicts() can find it
-                        conflicted_entry = ConflictedIndexEntry(
-                            ancestor=make_index_entry(base_blob),  # stage 1
-                            this=make_index_entry(ours_blob),      # stage 2
-                            other=make_index_entry(theirs_blob)    # stage 3
-                        )
-                        index[conflict_path_b] = conflicted_entry
-
-                    index.write()
-                    logger.info(f"Wrote {len(conflicts_list)} conflicted files to index with stages")
-
-                    # Write conflict markers to working directory files
-                    from dulwich.merge import merge_blobs
-                    files_with_markers = 0
-
-                    # Get tree objects (need them for the loop below)
-                    base_tree_for_markers = repo[base_commit.tree] if base_commit else None
-                    ours_tree_for_markers = repo[local_commit_obj.tree]
-                    theirs_tree_for_markers = repo[remote_commit_obj.tree]
-
-                    for conflict_path_str in [c['file_path'] for c in conflicts_list]:
-                        conflict_path_b = conflict_path_str.encode('utf-8')
-
-                        # Get the three blob versions
-                        base_blob = get_blob_from_tree(base_tree_for_markers, conflict_path_b)
-                        ours_blob = get_blob_from_tree(ours_tree_for_markers, conflict_path_b)
-                        theirs_blob = get_blob_from_tree(theirs_tree_for_markers, conflict_path_b)
-
-                        # Use merge_blobs to create content with conflict markers
-                        merged_content, had_conflicts = merge_blobs(
-                            base_blob,
-                            ours_blob,
-                            theirs_blob,
-                            path=conflict_path_b
+                    def make_index_entry(blob: Blob | None) -> IndexEntry | None:
+                        """Create an IndexEntry for a blob."""
+                        if not blob or not isinstance(blob, Blob):
+                            return None
+                        return IndexEntry(
+                            ctime=(int(time.time()), 0),
+                            mtime=(int(time.time()), 0),
+                            dev=0,
+                            ino=0,
+                            mode=stat.S_IFREG | 0o644,
+                            uid=0,
+                            gid=0,
+                            size=len(blob.data),
+                            sha=blob.id,
+                            flags=len(conflict_path_b),  # No stage in flags for ConflictedIndexEntry
                         )
 
-                        # Write the merged content (with conflict markers) to working directory
-                        workspace_path = Path(repo.path)
-                        file_path = workspace_path / conflict_path_str
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
-                        file_path.write_bytes(merged_content)
-                        files_with_markers += 1
-                        logger.info(f"Wrote conflict markers to {conflict_path_str}")
+                    # Store as ConflictedIndexEntry so get_conflicts() can find it
+                    conflicted_entry = ConflictedIndexEntry(
+                        ancestor=make_index_entry(base_blob),  # stage 1
+                        this=make_index_entry(ours_blob),      # stage 2
+                        other=make_index_entry(theirs_blob)    # stage 3
+                    )
+                    index[conflict_path_b] = conflicted_entry
+
+                index.write()
+                logger.info(f"Wrote {len(conflicts_list)} conflicted files to index with stages")
+
+                # Write conflict markers to working directory files
+                from dulwich.merge import merge_blobs
+                files_with_markers = 0
+
+                # Get tree objects (need them for the loop below)
+                base_tree_for_markers = repo[base_commit.tree] if base_commit else None
+                ours_tree_for_markers = repo[local_commit_obj.tree]
+                theirs_tree_for_markers = repo[remote_commit_obj.tree]
+
+                for conflict_path_str in [c['file_path'] for c in conflicts_list]:
+                    conflict_path_b = conflict_path_str.encode('utf-8')
+
+                    # Get the three blob versions
+                    base_blob = get_blob_from_tree(base_tree_for_markers, conflict_path_b)
+                    ours_blob = get_blob_from_tree(ours_tree_for_markers, conflict_path_b)
+                    theirs_blob = get_blob_from_tree(theirs_tree_for_markers, conflict_path_b)
+
+                    # Use merge_blobs to create content with conflict markers
+                    merged_content, had_conflicts = merge_blobs(
+                        base_blob,
+                        ours_blob,
+                        theirs_blob,
+                        path=conflict_path_b
+                    )
 
-                    logger.info(f"Wrote conflict markers to {files_with_markers} file(s) in working directory")
+                    # Write the merged content (with conflict markers) to working directory
+                    workspace_path = Path(repo.path)
+                    file_path = workspace_path / conflict_path_str
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    file_path.write_bytes(merged_content)
+                    files_with_markers += 1
+                    logger.info(f"Wrote conflict markers to {conflict_path_str}")
 
-                    return {
-                        "success": False,
-                        "updated_files": [],
-                        "conflicts": conflicts_list,
-                        "error": f"Merge conflicts in {len(conflicts_list)} file(s)"
-                    }
+                logger.info(f"Wrote conflict markers to {files_with_markers} file(s) in working directory")
 
-                # Merge succeeded without conflicts - now actually perform the merge using Dulwich
-                await send_log("No conflicts detected, applying changes...")
-                logger.info("No conflicts detected, performing merge using Dulwich...")
+                return {
+                    "success": False,
+                    "updated_files": [],
+                    "conflicts": conflicts_list,
+                    "error": f"Merge conflicts in {len(conflicts_list)} file(s)"
+                }
 
-                try:
-                    # Check if this is a fast-forward merge (base == local)
-                    if base_commit and base_commit.id == local_commit:
-                        # Fast-forward: just update refs and working tree
-                        logger.info("Fast-forward merge: updating refs")
-                        await send_log("Fast-forwarding to remote commit...")
-
-                        # Update local branch ref to point to remote commit
-                        repo.refs[local_ref] = remote_commit
-
-                        # Update working tree to match remote commit
-                        # Use reset_index to update the working directory
-                        from dulwich.index import build_index_from_tree
-                        index_path = os.path.join(repo.controldir(), 'index')
-                        remote_commit_obj_for_ff = repo[remote_commit]
-                        if not isinstance(remote_commit_obj_for_ff, DulwichCommit):
-                            raise Exception("Failed to retrieve remote commit object")
-                        remote_tree = remote_commit_obj_for_ff.tree
-
-                        with open(index_path, 'wb'):  # noqa: F841
-                            build_index_from_tree(repo.path, index_path, repo.object_store, remote_tree)
-
-                        # Get updated files by comparing trees
-                        from dulwich.diff_tree import tree_changes
-                        local_commit_obj_for_ff = repo[local_commit]
-                        if not isinstance(local_commit_obj_for_ff, DulwichCommit):
-                            raise Exception("Failed to retrieve local commit object")
-                        old_tree = local_commit_obj_for_ff.tree
-                        new_tree = remote_tree
-
-                        updated_files = []
-                        for change in tree_changes(repo.object_store, old_tree, new_tree):
-                            if change.type != 'unchanged':
-                                path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
-                                if path_bytes:
-                                    updated_files.append(path_bytes.decode('utf-8'))
-
-                        logger.info(f"Fast-forward completed: {len(updated_files)} file(s) updated")
-                        await send_log(f"✓ Pull successful! Fast-forwarded {len(updated_files)} file(s)", "success")
+            # Merge succeeded without conflicts - now actually perform the merge using Dulwich
+            # (last point where cancellation is honoured - nothing has been written yet)
+            self._checkpoint()
+            log("No conflicts detected, applying changes...")
+            logger.info("No conflicts detected, performing merge using Dulwich...")
 
-                    else:
-                        # True merge: stage the merged tree and create MERGE_HEAD state
-                        # This allows the user to review changes and commit manually (GitHub Desktop-style)
-                        logger.info("Staging merge with Dulwich")
-                        await send_log("Staging merged changes...")
-
-                        # Stage the merged tree in the index using build_index_from_tree
-                        # This updates both the index and working tree
-                        from dulwich.index import build_index_from_tree
-                        index_path = os.path.join(repo.controldir(), 'index')
-
-                        with open(index_path, 'wb'):  # noqa: F841
-                            build_index_from_tree(repo.path, index_path, repo.object_store, merged_tree.id)
-
-                        logger.info("Staged merged tree to index and updated working tree")
-
-                        # Write MERGE_HEAD to mark merge in progress
-                        from pathlib import Path
-                        merge_head_path = Path(repo.controldir()) / 'MERGE_HEAD'
-                        merge_head_path.write_text(remote_commit.decode('utf-8') + '\n')
-                        logger.info(f"Wrote MERGE_HEAD: {remote_commit.decode('utf-8')[:8]}")
-
-                        # Calculate which files changed in the merge
-                        # We want the union of (local→merged) and (remote→merged) changes
-                        from dulwich.diff_tree import tree_changes
-
-                        local_changes = set()
-                        for change in tree_changes(repo.object_store, local_commit_obj.tree, merged_tree.id):
-                            if change.type != 'unchanged':
-                                path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
-                                if path_bytes:
-                                    local_changes.add(path_bytes.decode('utf-8'))
-
-                        remote_changes = set()
-                        for change in tree_changes(repo.object_store, remote_commit_obj.tree, merged_tree.id):
-                            if change.type != 'unchanged':
-                                path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
-                                if path_bytes:
-                                    remote_changes.add(path_bytes.decode('utf-8'))
-
-                        updated_files = list(local_changes | remote_changes)
-
-                        logger.info(f"Merge staged successfully, {len(updated_files)} file(s) ready to commit")
-                        await send_log(f"✓ Merge prepared! {len(updated_files)} file(s) staged. Review and commit to complete the merge.", "success")
+            try:
+                # Check if this is a fast-forward merge (base == local)
+                if base_commit and base_commit.id == local_commit:
+                    # Fast-forward: just update refs and working tree
+                    logger.info("Fast-forward merge: updating refs")
+                    log("Fast-forwarding to remote commit...")
+
+                    # Update local branch ref to point to remote commit
+                    repo.refs[local_ref] = remote_commit
+
+                    # Update working tree to match remote commit
+                    # Use reset_index to update the working directory
+                    from dulwich.index import build_index_from_tree
+                    index_path = os.path.join(repo.controldir(), 'index')
+                    remote_commit_obj_for_ff = repo[remote_commit]
+                    if not isinstance(remote_commit_obj_for_ff, DulwichCommit):
+                        raise Exception("Failed to retrieve remote commit object")
+                    remote_tree = remote_commit_obj_for_ff.tree
+
+                    with open(index_path, 'wb'):  # noqa: F841
+                        build_index_from_tree(repo.path, index_path, repo.object_store, remote_tree)
+
+                    # Get updated files by comparing trees
+                    from dulwich.diff_tree import tree_changes
+                    local_commit_obj_for_ff = repo[local_commit]
+                    if not isinstance(local_commit_obj_for_ff, DulwichCommit):
+                        raise Exception("Failed to retrieve local commit object")
+                    old_tree = local_commit_obj_for_ff.tree
+                    new_tree = remote_tree
+
+                    updated_files = []
+                    for change in tree_changes(repo.object_store, old_tree, new_tree):
+                        if change.type != 'unchanged':
+                            path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
+                            if path_bytes:
+                                updated_files.append(path_bytes.decode('utf-8'))
+
+                    logger.info(f"Fast-forward completed: {len(updated_files)} file(s) updated")
+                    log(f"✓ Pull successful! Fast-forwarded {len(updated_files)} file(s)", "success")
 
-                    return {
-                        "success": True,
-                        "updated_files": updated_files,
-                        "conflicts": [],
-                        "error": None
-                    }
+                else:
+                    # True merge: stage the merged tree and create MERGE_HEAD state
+                    # This allows the user to review changes and commit manually (GitHub Desktop-style)
+                    logger.info("Staging merge with Dulwich")
+                    log("Staging merged changes...")
 
-                except Exception as e:
-                    logger.error(f"Merge execution failed: {str(e)}")
-                    raise
+                    # Stage the merged tree in the index using build_index_from_tree
+                    # This updates both the index and working tree
+                    from dulwich.index import build_index_from_tree
+                    index_path = os.path.join(repo.controldir(), 'index')
 
-            except Exception as merge_error:
-                # Unexpected merge error
-                error_msg = str(merge_error)
-                logger.error(f"Merge failed with error: {error_msg}")
-                raise
+                    with open(index_path, 'wb'):  # noqa: F841
+                        build_index_from_tree(repo.path, index_path, repo.object_store, merged_tree.id)
 
-        except Exception as e:
-            logger.error(f"Failed to pull from GitHub: {e}", exc_info=True)
+                    logger.info("Staged merged tree to index and updated working tree")
 
-            # Try to get conflicts even on error
-            try:
-                conflicts = await self.get_conflicts()
-                if conflicts:
-                    conflict_files = [c.file_path for c in conflicts]
-                    return {
-                        "success": False,
-                        "updated_files": [],
-                        "conflicts": [c.model_dump() for c in conflicts],
-                        "error": f"Merge conflicts occurred: {', '.join(conflict_files)}"
-                    }
-            except Exception as conflict_err:
-                logger.warning(f"Failed to check for conflicts after pull error: {conflict_err}")
+                    # Write MERGE_HEAD to mark merge in progress
+                    from pathlib import Path
+                    merge_head_path = Path(repo.controldir()) / 'MERGE_HEAD'
+                    merge_head_path.write_text(remote_commit.decode('utf-8') + '\n')
+                    logger.info(f"Wrote MERGE_HEAD: {remote_commit.decode('utf-8')[:8]}")
 
-            # Format error message properly
-            error_msg = str(e)
-            # Clean up bytes representation in error messages
-            if "b'" in error_msg:
-                import re
-                error_msg = re.sub(r"b'([^']+)'", r'\1', error_msg)
+                    # Calculate which files changed in the merge
+                    # We want the union of (local→merged) and (remote→merged) changes
+                    from dulwich.diff_tree import tree_changes
 
-            # Send error to WebPubSub terminal
-            full_error_msg = f"Failed to pull from GitHub: {error_msg}"
-            await send_log(f"✗ {full_error_msg}", "error")
+                    local_changes = set()
+                    for change in tree_changes(repo.object_store, local_commit_obj.tree, merged_tree.id):
+                        if change.type != 'unchanged':
+                            path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
+                            if path_bytes:
+                                local_changes.add(path_bytes.decode('utf-8'))
+
+                    remote_changes = set()
+                    for change in tree_changes(repo.object_store, remote_commit_obj.tree, merged_tree.id):
+                        if change.type != 'unchanged':
+                            path_bytes = change.new.path if change.new and change.new.path else (change.old.path if change.old else None)
+                            if path_bytes:
+                                remote_changes.add(path_bytes.decode('utf-8'))
+
+                    updated_files = list(local_changes | remote_changes)
+
+                    logger.info(f"Merge staged successfully, {len(updated_files)} file(s) ready to commit")
+                    log(f"✓ Merge prepared! {len(updated_files)} file(s) staged. Review and commit to complete the merge.", "success")
+
+                return {
+                    "success": True,
+                    "updated_files": updated_files,
+                    "conflicts": [],
+                    "error": None
+                }
+
+            except Exception as e:
+                logger.error(f"Merge execution failed: {str(e)}")
+                raise
+
+        except Exception as merge_error:
+            # Unexpected merge error
+            error_msg = str(merge_error)
+            logger.error(f"Merge failed with error: {error_msg}")
+            raise
 
-            return {
-                "success": False,
-                "updated_files": [],
-                "conflicts": [],
-                "error": full_error_msg
-            }
 
     async def refresh_status(self, context: Any, fetch: bool = False) -> dict:
         """
@@ -1520,7 +1786,7 @@ class GitIntegrationService:
         """
         try:
             # Check if Git repo is initialized
-            initialized = self.is_git_repo()
+            initialized = await self._run_git(self.is_git_repo)
 
             # Check if GitHub is configured (has authenticated remote URL)
             configured = False
@@ -1537,7 +1803,7 @@ class GitIntegrationService:
                     "success": True,
                     "initialized": initialized,
                     "configured": configured,
-                    "current_branch": self.get_current_branch() if initialized else None,
+                    "current_branch": await self._run_git(self.get_current_branch) if initialized else None,
                     "changed_files": [],
                     "conflicts": [],
                     "merging": False,
@@ -1558,17 +1824,15 @@ class GitIntegrationService:
                     logger.warning(f"Failed to fetch from remote during refresh: {e}")
 
             # 2. Get current branch
-            current_branch = self.get_current_branch()
+            current_branch = await self._run_git(self.get_current_branch)
 
-            # 3. Get local changes and conflicts
+            # 3. Get local changes and conflicts (conflict contents only read when there are any)
             changed_files = await self.get_changed_files()
-            conflicts = await self.get_conflicts()
+            status = await self._run_git(self.get_status)
+            conflicts = await self.get_conflicts() if status.conflicted else []
 
             # 4. Check if in merge state
-            from pathlib import Path
-            repo = self.get_repo()
-            merge_head_path = Path(repo.controldir()) / 'MERGE_HEAD'
-            merging = merge_head_path.exists()
+            merging = await self._run_git(self._is_merging)
 
             # 5. Get ahead/behind counts
             ahead, behind = await self.get_commits_ahead_behind()
@@ -1608,6 +1872,10 @@ class GitIntegrationService:
                 "error": f"Failed to refresh status: {str(e)}"
             }
 
+    def _is_merging(self) -> bool:
+        """Whether a merge is in progress (MERGE_HEAD exists)"""
+        return (Path(self.get_repo().controldir()) / 'MERGE_HEAD').exists()
+
     async def discard_unpushed_commits(self, context: Any = None) -> dict:
         """
         Discard all unpushed commits by resetting local branch to remote tracking ref.
@@ -1616,6 +1884,11 @@ class GitIntegrationService:
         Returns:
             dict with success status and list of discarded commits
         """
+        async with self._git_operation("discard"):
+            return await self._run_git(self._discard_unpushed_commits_sync)
+
+    def _discard_unpushed_commits_sync(self) -> dict:
+        """Blocking implementation of discard_unpushed_commits() (runs on the git executor)"""
         repo = self.get_repo()
 
         try:
@@ -1692,6 +1965,11 @@ class GitIntegrationService:
         Returns:
             dict with success status and list of discarded commits
         """
+        async with self._git_operation("discard"):
+            return await self._run_git(self._discard_commit_sync, commit_sha)
+
+    def _discard_commit_sync(self, commit_sha: str) -> dict:
+        """Blocking implementation of discard_commit() (runs on the git executor)"""
         repo = self.get_repo()
 
         try:
@@ -1790,6 +2068,17 @@ class GitIntegrationService:
         Returns:
             Number of remaining conflicts
         """
+        async with self._git_operation("resolve conflict"):
+            await self._run_git(self._stage_resolved_file, file_path, resolution)
+
+            # Check remaining conflicts
+            remaining_conflicts = await self.get_conflicts()
+            logger.info(f"Remaining conflicts after staging: {len(remaining_conflicts)}")
+
+            return len(remaining_conflicts)
+
+    def _stage_resolved_file(self, file_path: str, resolution: str) -> None:
+        """Replace a file's conflict stages with its resolved content at stage 0 (blocking)"""
         full_path = self.workspace_path / file_path
 
         if not full_path.exists():
@@ -1845,12 +2134,6 @@ class GitIntegrationService:
 
         logger.info(f"Staged resolved file: {file_path} (resolution: {resolution})")
 
-        # Check remaining conflicts
-        remaining_conflicts = await self.get_conflicts()
-        logger.info(f"Remaining conflicts after staging: {len(remaining_conflicts)}")
-
-        return len(remaining_conflicts)
-
     async def abort_merge(self) -> dict:
         """
         Abort an in-progress merge and return to pre-merge state.
@@ -1861,6 +2144,11 @@ class GitIntegrationService:
         Returns:
             dict with success status
         """
+        async with self._git_operation("abort merge"):
+            return await self._run_git(self._abort_merge_sync)
+
+    def _abort_merge_sync(self) -> dict:
+        """Blocking implementation of abort_merge() (runs on the git executor)"""
         repo = self.get_repo()
 
         from pathlib import Path
@@ -2015,15 +2303,11 @@ class GitIntegrationService:
         Returns:
             Dictionary with workspace analysis results
         """
-        # Count files in workspace (excluding .git)
-        file_count = 0
-        if self.workspace_path.exists():
-            for item in self.workspace_path.rglob("*"):
-                if item.is_file() and ".git" not in item.parts:
-                    file_count += 1
-
         # Check if it's already a Git repo
-        is_git = self.is_git_repo()
+        is_git = await self._run_git(self.is_git_repo)
+
+        # Count files in workspace (excluding .git)
+        file_count = await self._run_git(self._count_workspace_files)
         existing_remote = None
 
         if is_git:
@@ -0,0 +1,307 @@
+"""
+Git Status Engine
+
+Incremental working-tree status for GitIntegrationService.
+
+porcelain.status() re-checks every tracked file and walks the whole working
+tree on each call. On an SMB-mounted workspace each stat/read is a network
+round-trip, so refresh_status took seconds. This engine:
+
+- trusts index stat data (mtime/size/inode) and only re-hashes files whose
+  stat changed, remembering those hashes between calls
+- reuses directory listings whose directory mtime is unchanged when looking
+  for untracked files, and prunes ignored directories before descending
+- caches the whole result until the workspace change generation, the index
+  or HEAD moves (with a short TTL as a safety net for out-of-band changes)
+"""
+
+import logging
+import os
+import stat
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from dulwich import porcelain
+from dulwich.ignore import IgnoreFilterManager
+from dulwich.index import ConflictedIndexEntry, blob_from_path_and_stat
+from dulwich.repo import Repo as DulwichRepo
+
+from shared.utils.file_operations import get_workspace_generation
+
+logger = logging.getLogger(__name__)
+
+# Git mode for submodule (gitlink) entries - never hashed from the working tree
+_S_IFGITLINK = 0o160000
+
+# Files modified this recently may still change within the same mtime tick,
+# so their hashes are not remembered (git's "racy clean" problem)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Safety net for changes made outside the editor/git service (other workers, SMB clients)
+_status_cache_ttl = timedelta(seconds=30)
+
+# Status results: workspace path -> (cache key, cached_at, status)
+_status_cache: dict[str, tuple[tuple, datetime, "WorkspaceStatus"]] = {}
+
+# Working-tree blob hashes: absolute path -> ((mtime_ns, size, inode), sha)
+_hash_cache: dict[bytes, tuple[tuple[int, int, int], bytes]] = {}
+_HASH_CACHE_MAX_ENTRIES = 20000
+
+# Directory listings: absolute path -> (mtime_ns, [(name, is_dir), ...])
+_dir_cache: dict[str, tuple[int, list[tuple[str, bool]]]] = {}
+_DIR_CACHE_MAX_ENTRIES = 5000
+
+# Guards the caches above; status runs on several git executor threads at once.
+# Held only around cache lookups and updates, never around hashing or listing I/O
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class WorkspaceStatus:
+    """Working tree status relative to HEAD (paths are workspace-relative, '/'-separated)"""
+    staged_add: list[str] = field(default_factory=list)
+    staged_modify: list[str] = field(default_factory=list)
+    staged_delete: list[str] = field(default_factory=list)
+    unstaged: list[str] = field(default_factory=list)
+    untracked: list[str] = field(default_factory=list)
+    conflicted: list[str] = field(default_factory=list)
+    tracked_count: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether there is anything to commit"""
+        return bool(
+            self.staged_add or self.staged_modify or self.staged_delete
+            or self.unstaged or self.untracked
+        )
+
+
+def invalidate_status_cache(workspace_path: Path | None = None) -> None:
+    """
+    Drop cached status results.
+
+    Args:
+        workspace_path: Workspace to invalidate, or None for all workspaces
+    """
+    with _cache_lock:
+        if workspace_path is None:
+            _status_cache.clear()
+        else:
+            _status_cache.pop(str(workspace_path), None)
+
+
+def _decode(path: str | bytes) -> str:
+    return path.decode('utf-8', errors='replace') if isinstance(path, bytes) else path
+
+
+def _entry_mtime_ns(mtime: int | float | tuple) -> int:
+    """Index entry mtime as nanoseconds (dulwich stores (sec, nsec) or a number)"""
+    if isinstance(mtime, tuple):
+        return int(mtime[0]) * 1_000_000_000 + int(mtime[1])
+    return int(mtime * 1_000_000_000)
+
+
+class GitStatusEngine:
+    """
+    Computes and caches working tree status for a workspace repository.
+    """
+
+    def __init__(self, workspace_path: Path):
+        """
+        Initialize status engine.
+
+        Args:
+            workspace_path: Path to the workspace (repository root)
+        """
+        self.workspace_path = workspace_path
+
+    def _cache_key(self, repo: DulwichRepo) -> tuple:
+        """Everything that invalidates a cached status when it changes"""
+        index_path = Path(repo.index_path())
+        try:
+            index_mtime = index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            index_mtime = 0
+
+        try:
+            head = repo.refs[b'HEAD']
+        except KeyError:
+            head = None
+
+        return (get_workspace_generation(), index_mtime, head)
+
+    def get_status(self, repo: DulwichRepo, use_cache: bool = True) -> WorkspaceStatus:
+        """
+        Get working tree status, served from cache when nothing has moved.
+
+        Args:
+            repo: Dulwich repository for the workspace
+            use_cache: Whether a cached result may be returned
+
+        Returns:
+            WorkspaceStatus
+        """
+        cache_key = self._cache_key(repo)
+        cache_id = str(self.workspace_path)
+
+        if use_cache:
+            with _cache_lock:
+                cached = _status_cache.get(cache_id)
+            if cached is not None:
+                cached_key, cached_at, cached_status = cached
+                if cached_key == cache_key and datetime.now(timezone.utc) - cached_at < _status_cache_ttl:
+                    return cached_status
+
+        started = time.perf_counter()
+        result = self._compute_status(repo)
+        logger.debug(
+            f"Computed git status in {(time.perf_counter() - started) * 1000:.1f}ms "
+            f"({result.tracked_count} tracked, {len(result.unstaged)} unstaged, "
+            f"{len(result.untracked)} untracked)"
+        )
+
+        with _cache_lock:
+            _status_cache[cache_id] = (cache_key, datetime.now(timezone.utc), result)
+        return result
+
+    def _compute_status(self, repo: DulwichRepo) -> WorkspaceStatus:
+        index = repo.open_index()
+        result = WorkspaceStatus()
+
+        # Staged: index vs HEAD tree (no working tree access)
+        staged = porcelain.get_tree_changes(repo)
+        result.staged_add = [_decode(p) for p in staged.get('add', [])]
+        result.staged_modify = [_decode(p) for p in staged.get('modify', [])]
+        result.staged_delete = [_decode(p) for p in staged.get('delete', [])]
+
+        root = os.fsencode(str(self.workspace_path))
+        try:
+            index_mtime_ns = os.stat(repo.index_path()).st_mtime_ns
+        except FileNotFoundError:
+            index_mtime_ns = 0
+
+        tracked: set[str] = set()
+        tracked_dirs: set[str] = set()
+
+        for path_bytes, entry in index.items():
+            path = _decode(path_bytes)
+            tracked.add(path)
+
+            # Record every ancestor directory so the untracked walk knows where to descend
+            parent = path.rpartition('/')[0]
+            while parent and parent not in tracked_dirs:
+                tracked_dirs.add(parent)
+                parent = parent.rpartition('/')[0]
+
+            if isinstance(entry, ConflictedIndexEntry):
+                result.conflicted.append(path)
+                continue
+
+            if self._is_modified(root, path_bytes, entry, index_mtime_ns):
+                result.unstaged.append(path)
+
+        result.tracked_count = len(tracked)
+        result.untracked = self._find_untracked(repo, tracked, tracked_dirs)
+        return result
+
+    def _is_modified(self, root: bytes, path_bytes: bytes, entry, index_mtime_ns: int) -> bool:
+        """Check one tracked file against its index entry, hashing only when stat changed"""
+        if entry.mode == _S_IFGITLINK:
+            return False
+
+        full_path = os.path.join(root, path_bytes)
+        try:
+            st = os.lstat(full_path)
+        except FileNotFoundError:
+            return True
+
+        if stat.S_ISDIR(st.st_mode):
+            return True
+
+        entry_sec, entry_nsec = divmod(_entry_mtime_ns(entry.mtime), 1_000_000_000)
+        file_sec, file_nsec = divmod(st.st_mtime_ns, 1_000_000_000)
+        stat_matches = (
+            st.st_size == entry.size
+            and file_sec == entry_sec
+            # Some index writers only record whole seconds
+            and (entry_nsec == 0 or file_nsec == entry_nsec)
+        )
+        # Entries modified in the same second the index was written can't be trusted
+        racy = entry_sec >= index_mtime_ns // 1_000_000_000
+        if stat_matches and not racy:
+            return False
+
+        return self._blob_sha(full_path, st) != entry.sha
+
+    def _blob_sha(self, full_path: bytes, st: os.stat_result) -> bytes:
+        """Hash a working tree file as a git blob, reusing the previous hash if stat is unchanged"""
+        validator = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with _cache_lock:
+            cached = _hash_cache.get(full_path)
+        if cached is not None and cached[0] == validator:
+            return cached[1]
+
+        sha = blob_from_path_and_stat(full_path, st).id
+
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            with _cache_lock:
+                if full_path not in _hash_cache and len(_hash_cache) >= _HASH_CACHE_MAX_ENTRIES:
+                    del _hash_cache[next(iter(_hash_cache))]
+                _hash_cache[full_path] = (validator, sha)
+
+        return sha
+
+    def _list_dir(self, dir_path: str) -> list[tuple[str, bool]]:
+        """List a directory as (name, is_dir) pairs, reusing the listing while its mtime is unchanged"""
+        dir_mtime = os.stat(dir_path).st_mtime_ns
+        with _cache_lock:
+            cached = _dir_cache.get(dir_path)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        with os.scandir(dir_path) as it:
+            entries = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in it]
+
+        with _cache_lock:
+            if dir_path not in _dir_cache and len(_dir_cache) >= _DIR_CACHE_MAX_ENTRIES:
+                del _dir_cache[next(iter(_dir_cache))]
+            _dir_cache[dir_path] = (dir_mtime, entries)
+        return entries
+
+    def _find_untracked(
+        self,
+        repo: DulwichRepo,
+        tracked: set[str],
+        tracked_dirs: set[str]
+    ) -> list[str]:
+        """Find untracked, non-ignored files (every file, like porcelain's untracked_files='all')"""
+        ignore = IgnoreFilterManager.from_repo(repo)
+        untracked: list[str] = []
+        pending = [""]
+
+        while pending:
+            rel_dir = pending.pop()
+            abs_dir = os.path.join(str(self.workspace_path), rel_dir) if rel_dir else str(self.workspace_path)
+
+            try:
+                entries = self._list_dir(abs_dir)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+
+            for name, is_dir in entries:
+                if name == '.git':
+                    continue
+
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+
+                if is_dir:
+                    # Tracked directories are always walked; ignored untracked ones are pruned
+                    if rel in tracked_dirs or not ignore.is_ignored(f"{rel}/"):
+                        pending.append(rel)
+                elif rel not in tracked and not ignore.is_ignored(rel):
+                    untracked.append(rel)
+
+        return sorted(untracked)
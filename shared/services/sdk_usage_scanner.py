@@ -5,8 +5,12 @@ Scans workspace Python files for Bifrost SDK calls (config.get, secrets.get, oau
 and validates them against stored data to identify missing configurations.
 """
 
+import asyncio
+import bisect
 import logging
+import os
 import re
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -40,6 +44,55 @@ OAUTH_GET_TOKEN_PATTERN = re.compile(
 )
 
 
+# Per-file scan results: (workspace, absolute path) -> (mtime_ns, size, usage)
+# Files are only re-read and re-parsed when their mtime or size changes
+_file_usage_cache: dict[tuple[str, str], tuple[int, int, "FileSDKUsage | None"]] = {}
+
+# Substrings that must appear in a file for the corresponding pattern to match
+_PATTERNS = (
+    ("config.get", CONFIG_GET_PATTERN, "config_calls"),
+    ("secrets.get", SECRETS_GET_PATTERN, "secret_calls"),
+    ("oauth.get_token", OAUTH_GET_TOKEN_PATTERN, "oauth_calls"),
+)
+
+
+# Stored key sets: (source, scope) -> (loaded_at, keys). Kept briefly so repeated
+# scans from the editor don't re-list configs, Key Vault and OAuth connections
+STORE_CACHE_TTL_SECONDS = 30
+_store_key_cache: dict[tuple[str, str], tuple[float, set[str]]] = {}
+
+# Maximum time to wait for one store lookup before reporting it unavailable
+STORE_LOOKUP_TIMEOUT_SECONDS = 10
+
+# Store sources, in the order of SDKUsageType values
+SOURCE_CONFIG = "config"
+SOURCE_SECRET = "secret"
+SOURCE_OAUTH = "oauth"
+
+
+def clear_scan_cache() -> None:
+    """Drop all cached per-file scan results and stored key sets"""
+    _file_usage_cache.clear()
+    _store_key_cache.clear()
+
+
+def invalidate_stored_keys(source: str, scope: str | None = None) -> None:
+    """
+    Drop cached stored key sets after a config, secret or OAuth write.
+
+    Lookups include GLOBAL keys in every scope, so a GLOBAL write (or one
+    whose scope is unknown, None) drops the source's key sets for all scopes.
+
+    Args:
+        source: SOURCE_CONFIG, SOURCE_SECRET or SOURCE_OAUTH
+        scope: Scope that was written ("GLOBAL" or organization ID)
+    """
+    for cache_key in list(_store_key_cache):
+        cached_source, cached_scope = cache_key
+        if cached_source == source and (scope in (None, "GLOBAL") or cached_scope == scope):
+            _store_key_cache.pop(cache_key, None)
+
+
 @dataclass
 class SDKCall:
     """Represents a single SDK call found in code"""
@@ -91,6 +144,8 @@ class SDKUsageScanner:
             workspace_path: Path to workspace directory to scan
         """
         self.workspace_path = Path(workspace_path)
+        # Sources whose stored keys could not be loaded during the last validation
+        self.unavailable_sources: list[str] = []
 
     def extract_sdk_calls(self, content: str) -> FileSDKUsage:
         """
@@ -102,29 +157,23 @@ class SDKUsageScanner:
         Returns:
             FileSDKUsage with extracted calls (file_path/file_name will be empty)
         """
-        lines = content.split('\n')
         usage = FileSDKUsage(file_path="", file_name="")
 
-        # Extract config.get() calls
-        for match in CONFIG_GET_PATTERN.finditer(content):
-            key = match.group(1)
-            line_num = content[:match.start()].count('\n') + 1
-            line_content = lines[line_num - 1].strip() if line_num <= len(lines) else ""
-            usage.config_calls.append(SDKCall(key=key, line_number=line_num, line_content=line_content))
-
-        # Extract secrets.get() calls
-        for match in SECRETS_GET_PATTERN.finditer(content):
-            key = match.group(1)
-            line_num = content[:match.start()].count('\n') + 1
-            line_content = lines[line_num - 1].strip() if line_num <= len(lines) else ""
-            usage.secret_calls.append(SDKCall(key=key, line_number=line_num, line_content=line_content))
-
-        # Extract oauth.get_token() calls
-        for match in OAUTH_GET_TOKEN_PATTERN.finditer(content):
-            provider = match.group(1)
-            line_num = content[:match.start()].count('\n') + 1
-            line_content = lines[line_num - 1].strip() if line_num <= len(lines) else ""
-            usage.oauth_calls.append(SDKCall(key=provider, line_number=line_num, line_content=line_content))
+        # Newline offsets are computed once (and only if something matched), so
+        # each match's line number is a binary search instead of a prefix scan
+        newlines: list[int] | None = None
+        lines: list[str] = []
+
+        for needle, pattern, attribute in _PATTERNS:
+            if needle not in content:
+                continue
+            calls: list[SDKCall] = getattr(usage, attribute)
+            for match in pattern.finditer(content):
+                if newlines is None:
+                    newlines = [m.start() for m in re.finditer('\n', content)]
+                    lines = content.split('\n')
+                line_num = bisect.bisect_right(newlines, match.start()) + 1
+                calls.append(SDKCall(key=match.group(1), line_number=line_num, line_content=lines[line_num - 1].strip()))
 
         return usage
 
@@ -161,45 +210,83 @@ class SDKUsageScanner:
         """
         Scan all Python files in workspace for SDK calls.
 
+        The tree is walked once (skipping hidden and __pycache__ directories).
+        Files whose mtime and size are unchanged since the last scan reuse their
+        cached result, so only changed files are read and parsed.
+
         Returns:
             List of FileSDKUsage for files that have SDK calls
         """
-        results = []
+        results: list[FileSDKUsage] = []
 
         if not self.workspace_path.exists():
             logger.warning(f"Workspace path does not exist: {self.workspace_path}")
             return results
 
-        # Find all Python files
-        for py_file in self.workspace_path.rglob("*.py"):
-            # Skip __pycache__ and hidden directories
-            if "__pycache__" in str(py_file) or any(part.startswith('.') for part in py_file.parts):
-                continue
-
-            usage = self.scan_file(py_file)
-            if usage and usage.has_any_calls:
-                results.append(usage)
-
-        logger.info(f"Scanned workspace, found {len(results)} files with SDK calls")
+        workspace_key = str(self.workspace_path)
+        seen: set[tuple[str, str]] = set()
+        parsed = 0
+
+        for root, dirs, files in os.walk(self.workspace_path):
+            # Prune hidden and __pycache__ directories in place
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d != "__pycache__"]
+
+            for name in files:
+                if not name.endswith(".py") or name.startswith('.'):
+                    continue
+
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                cache_key = (workspace_key, path)
+                seen.add(cache_key)
+                cached = _file_usage_cache.get(cache_key)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    usage = cached[2]
+                else:
+                    usage = self.scan_file(Path(path))
+                    _file_usage_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, usage)
+                    parsed += 1
+
+                if usage and usage.has_any_calls:
+                    results.append(usage)
+
+        # Forget deleted files of this workspace
+        for cache_key in [k for k in _file_usage_cache if k[0] == workspace_key and k not in seen]:
+            del _file_usage_cache[cache_key]
+
+        results.sort(key=lambda usage: usage.file_path)
+        logger.info(
+            f"Scanned workspace ({len(seen)} files, {parsed} parsed), "
+            f"found {len(results)} files with SDK calls"
+        )
         return results
 
     async def validate_workspace(
         self,
-        context: 'ExecutionContext'
+        context: 'ExecutionContext',
+        file_usages: list[FileSDKUsage] | None = None,
+        refresh: bool = False
     ) -> 'list[SDKUsageIssue]':
         """
         Scan workspace and validate SDK calls against stored data.
 
         Args:
             context: Execution context for repository access
+            file_usages: Result of scan_workspace() (scanned now if not provided)
+            refresh: Look up stored keys even if cached (explicit rescan)
 
         Returns:
             List of SDKUsageIssue for missing configurations
         """
-        from shared.models import SDKUsageIssue, SDKUsageType
+        from shared.models import SDKUsageIssue
 
-        # Phase 1: Scan all files
-        file_usages = self.scan_workspace()
+        # Phase 1: Scan all files (unless the caller already did)
+        if file_usages is None:
+            file_usages = self.scan_workspace()
 
         if not file_usages:
             return []
@@ -209,57 +296,19 @@ class SDKUsageScanner:
         need_secrets = any(f.has_secret_calls for f in file_usages)
         need_oauth = any(f.has_oauth_calls for f in file_usages)
 
-        # Phase 2: Only query what we need
-        stored_configs: set[str] = set()
-        stored_secrets: set[str] = set()
-        stored_oauth_providers: set[str] = set()
-
-        if need_configs:
-            stored_configs = await self._get_stored_config_keys(context)
-
-        if need_secrets:
-            stored_secrets = await self._get_stored_secret_keys(context)
-
-        if need_oauth:
-            stored_oauth_providers = await self._get_stored_oauth_providers(context)
+        # Phase 2: Only query what we need (concurrently)
+        stored = await self._load_stored_keys(context, need_configs, need_secrets, need_oauth, refresh)
 
         # Phase 3: Compare and generate issues
         issues: list[SDKUsageIssue] = []
 
         for file_usage in file_usages:
-            # Check config calls
-            for call in file_usage.config_calls:
-                if call.key not in stored_configs:
-                    issues.append(SDKUsageIssue(
-                        file_path=file_usage.file_path,
-                        file_name=file_usage.file_name,
-                        type=SDKUsageType.CONFIG,
-                        key=call.key,
-                        line_number=call.line_number,
-                    ))
-
-            # Check secret calls
-            for call in file_usage.secret_calls:
-                if call.key not in stored_secrets:
-                    issues.append(SDKUsageIssue(
-                        file_path=file_usage.file_path,
-                        file_name=file_usage.file_name,
-                        type=SDKUsageType.SECRET,
-                        key=call.key,
-                        line_number=call.line_number,
-                    ))
-
-            # Check OAuth calls
-            for call in file_usage.oauth_calls:
-                if call.key not in stored_oauth_providers:
-                    issues.append(SDKUsageIssue(
-                        file_path=file_usage.file_path,
-                        file_name=file_usage.file_name,
-                        type=SDKUsageType.OAUTH,
-                        key=call.key,
-                        line_number=call.line_number,
-                    ))
+            issues.extend(self._find_missing(file_usage, stored))
 
+        if self.unavailable_sources:
+            logger.warning(
+                f"Validation incomplete, could not load stored keys for: {', '.join(self.unavailable_sources)}"
+            )
         logger.info(f"Validation complete: {len(issues)} issues found")
         return issues
 
@@ -280,8 +329,6 @@ class SDKUsageScanner:
         Returns:
             List of SDKUsageIssue for missing configurations
         """
-        from shared.models import SDKUsageIssue, SDKUsageType
-
         full_path = self.workspace_path / file_path
 
         # Get file content
@@ -301,87 +348,118 @@ class SDKUsageScanner:
             return []
 
         # Only query backends for types we found
-        stored_configs: set[str] = set()
-        stored_secrets: set[str] = set()
-        stored_oauth_providers: set[str] = set()
+        stored = await self._load_stored_keys(
+            context, usage.has_config_calls, usage.has_secret_calls, usage.has_oauth_calls
+        )
 
-        if usage.has_config_calls:
-            stored_configs = await self._get_stored_config_keys(context)
+        return self._find_missing(usage, stored)
 
-        if usage.has_secret_calls:
-            stored_secrets = await self._get_stored_secret_keys(context)
+    @staticmethod
+    def _find_missing(usage: FileSDKUsage, stored: dict[str, set[str] | None]) -> 'list[SDKUsageIssue]':
+        """
+        Issues for calls whose key is not in the stored key sets.
 
-        if usage.has_oauth_calls:
-            stored_oauth_providers = await self._get_stored_oauth_providers(context)
+        Sources that could not be loaded (None) are not reported, since a
+        failed lookup says nothing about whether a key exists.
+        """
+        from shared.models import SDKUsageIssue, SDKUsageType
 
-        # Generate issues
         issues: list[SDKUsageIssue] = []
+        for source, calls, issue_type in (
+            (SOURCE_CONFIG, usage.config_calls, SDKUsageType.CONFIG),
+            (SOURCE_SECRET, usage.secret_calls, SDKUsageType.SECRET),
+            (SOURCE_OAUTH, usage.oauth_calls, SDKUsageType.OAUTH),
+        ):
+            keys = stored.get(source)
+            if keys is None:
+                continue
+            for call in calls:
+                if call.key not in keys:
+                    issues.append(SDKUsageIssue(
+                        file_path=usage.file_path,
+                        file_name=usage.file_name,
+                        type=issue_type,
+                        key=call.key,
+                        line_number=call.line_number,
+                    ))
+        return issues
+
+    async def _load_stored_keys(
+        self,
+        context: 'ExecutionContext',
+        need_configs: bool,
+        need_secrets: bool,
+        need_oauth: bool,
+        refresh: bool = False
+    ) -> dict[str, set[str] | None]:
+        """
+        Load the needed stored key sets concurrently.
 
-        for call in usage.config_calls:
-            if call.key not in stored_configs:
-                issues.append(SDKUsageIssue(
-                    file_path=usage.file_path,
-                    file_name=usage.file_name,
-                    type=SDKUsageType.CONFIG,
-                    key=call.key,
-                    line_number=call.line_number,
-                ))
-
-        for call in usage.secret_calls:
-            if call.key not in stored_secrets:
-                issues.append(SDKUsageIssue(
-                    file_path=usage.file_path,
-                    file_name=usage.file_name,
-                    type=SDKUsageType.SECRET,
-                    key=call.key,
-                    line_number=call.line_number,
-                ))
-
-        for call in usage.oauth_calls:
-            if call.key not in stored_oauth_providers:
-                issues.append(SDKUsageIssue(
-                    file_path=usage.file_path,
-                    file_name=usage.file_name,
-                    type=SDKUsageType.OAUTH,
-                    key=call.key,
-                    line_number=call.line_number,
-                ))
+        Each source is served from a short-TTL cache when possible (unless
+        refresh is set), otherwise looked up with its own timeout. Failed or timed out sources map to None
+        and are listed in self.unavailable_sources.
 
-        return issues
+        Args:
+            context: Execution context for repository access
+            need_configs: Whether config keys are needed
+            need_secrets: Whether secret keys are needed
+            need_oauth: Whether OAuth providers are needed
+            refresh: Skip the cache and look up every needed source
+
+        Returns:
+            Source name -> key set (None if the lookup failed)
+        """
+        lookups = {
+            SOURCE_CONFIG: (need_configs, self._get_stored_config_keys),
+            SOURCE_SECRET: (need_secrets, self._get_stored_secret_keys),
+            SOURCE_OAUTH: (need_oauth, self._get_stored_oauth_providers),
+        }
+        sources = [source for source, (needed, _) in lookups.items() if needed]
+
+        async def load(source: str) -> set[str] | None:
+            cache_key = (source, str(context.scope))
+            cached = _store_key_cache.get(cache_key)
+            if cached and not refresh and time.monotonic() - cached[0] < STORE_CACHE_TTL_SECONDS:
+                return cached[1]
+
+            try:
+                keys = await asyncio.wait_for(lookups[source][1](context), STORE_LOOKUP_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.error(f"Timed out listing stored {source} keys")
+                return None
+            except Exception as e:
+                logger.error(f"Failed to list stored {source} keys: {e}")
+                return None
+
+            _store_key_cache[cache_key] = (time.monotonic(), keys)
+            return keys
+
+        results = await asyncio.gather(*(load(source) for source in sources))
+        stored = dict(zip(sources, results))
+        self.unavailable_sources = [source for source in sources if stored[source] is None]
+        return stored
 
     async def _get_stored_config_keys(self, context: 'ExecutionContext') -> set[str]:
         """Get all stored config keys for the context's scope"""
         from shared.repositories.config import ConfigRepository
 
-        try:
-            repo = ConfigRepository(context)
-            configs = await repo.list_config(include_global=True)
-            return {c.key for c in configs}
-        except Exception as e:
-            logger.error(f"Failed to list configs: {e}")
-            return set()
+        repo = ConfigRepository(context)
+        configs = await repo.list_config(include_global=True)
+        return {c.key for c in configs}
 
     async def _get_stored_secret_keys(self, context: 'ExecutionContext') -> set[str]:
         """Get all stored secret keys for the context's scope"""
         from shared.keyvault import KeyVaultClient
 
-        try:
-            async with KeyVaultClient() as kv:
-                secrets = await kv.list_secrets(context.scope)
-                return set(secrets)
-        except Exception as e:
-            logger.error(f"Failed to list secrets: {e}")
-            return set()
+        async with KeyVaultClient() as kv:
+            secrets = await kv.list_secrets(context.scope)
+            return set(secrets)
 
     async def _get_stored_oauth_providers(self, context: 'ExecutionContext') -> set[str]:
         """Get all stored OAuth providers with completed status"""
         from shared.services.oauth_storage_service import OAuthStorageService
 
-        try:
-            service = OAuthStorageService()
-            connections = await service.list_connections(context.scope, include_global=True)
-            # Only include completed connections
-            return {c.connection_name for c in connections if c.status == "completed"}
-        except Exception as e:
-            logger.error(f"Failed to list OAuth connections: {e}")
-            return set()
+        service = OAuthStorageService()
+        connections = await service.list_connections(context.scope, include_global=True)
+        # Only include completed connections
+        return {c.connection_name for c in connections if c.status == "completed"}
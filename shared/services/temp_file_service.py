@@ -3,16 +3,37 @@ Temporary File Service
 
 Provides temporary file/directory creation (similar to PowerShell's New-TemporaryFile).
 Works with mounted /tmp directory.
+
+Files created during a workflow execution go into a per-execution directory
+(executions/{execution_id}) that the engine removes when the execution ends.
+Everything else is reclaimed by the temp cleanup timer (age- and quota-based,
+see TempFileService.reclaim).
 """
 
 import logging
 import os
+import shutil
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Subdirectory holding one directory per running execution
+EXECUTIONS_DIR_NAME = "executions"
+
+
+@dataclass
+class ReclaimStats:
+    """Outcome of a TempFileService.reclaim run"""
+    scanned: int = 0
+    deleted: int = 0
+    bytes_reclaimed: int = 0
+    bytes_remaining: int = 0
+    timed_out: bool = False
+
 
 class TempFileService:
     """
@@ -37,7 +58,13 @@ class TempFileService:
 
         logger.info(f"Initialized temp file service at: {self.tmp_path}")
 
-    def create_temp_file(self, suffix: str = '', prefix: str = 'tmp', text_mode: bool = False) -> Path:
+    def create_temp_file(
+        self,
+        suffix: str = '',
+        prefix: str = 'tmp',
+        text_mode: bool = False,
+        execution_id: str | None = None
+    ) -> Path:
         """
         Create a temporary file and return its path.
 
@@ -47,13 +74,15 @@ class TempFileService:
             suffix: File suffix (e.g., '.txt', '.json')
             prefix: File prefix (default: 'tmp')
             text_mode: If True, open in text mode (default: False for binary)
+            execution_id: Create the file in this execution's directory
 
         Returns:
             Path to created temporary file
         """
         # Create unique filename
         filename = f"{prefix}_{uuid.uuid4().hex}{suffix}"
-        file_path = self.tmp_path / filename
+        base = self.get_execution_directory(execution_id) if execution_id else self.tmp_path
+        file_path = base / filename
 
         # Create empty file
         file_path.touch()
@@ -62,20 +91,27 @@ class TempFileService:
 
         return file_path
 
-    def create_temp_directory(self, suffix: str = '', prefix: str = 'tmp') -> Path:
+    def create_temp_directory(
+        self,
+        suffix: str = '',
+        prefix: str = 'tmp',
+        execution_id: str | None = None
+    ) -> Path:
         """
         Create a temporary directory and return its path.
 
         Args:
             suffix: Directory suffix
             prefix: Directory prefix (default: 'tmp')
+            execution_id: Create the directory in this execution's directory
 
         Returns:
             Path to created temporary directory
         """
         # Create unique directory name
         dirname = f"{prefix}_{uuid.uuid4().hex}{suffix}"
-        dir_path = self.tmp_path / dirname
+        base = self.get_execution_directory(execution_id) if execution_id else self.tmp_path
+        dir_path = base / dirname
 
         # Create directory
         dir_path.mkdir(parents=True, exist_ok=False)
@@ -96,6 +132,125 @@ class TempFileService:
         """
         return self.tmp_path / filename
 
+    def get_execution_directory(self, execution_id: str, create: bool = True) -> Path:
+        """
+        Get the temp directory for one execution.
+
+        Args:
+            execution_id: Execution ID
+            create: Create the directory if it doesn't exist
+
+        Returns:
+            Path to executions/{execution_id} in the temp directory
+
+        Raises:
+            ValueError: If execution_id is not a plain directory name
+        """
+        if not execution_id or Path(execution_id).name != execution_id or execution_id in (".", ".."):
+            raise ValueError(f"Invalid execution ID for temp directory: {execution_id}")
+
+        dir_path = self.tmp_path / EXECUTIONS_DIR_NAME / execution_id
+        if create:
+            dir_path.mkdir(parents=True, exist_ok=True)
+        return dir_path
+
+    def remove_execution_directory(self, execution_id: str) -> int:
+        """
+        Remove an execution's temp directory (called when the execution ends).
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Bytes reclaimed (0 if the execution created no temp files)
+        """
+        dir_path = self.get_execution_directory(execution_id, create=False)
+        if not dir_path.exists():
+            return 0
+
+        size, _ = self._measure(dir_path, deadline=None)
+        if not self._delete(dir_path):
+            return 0
+
+        logger.debug(f"Removed temp directory for execution {execution_id} ({size} bytes)")
+        return size
+
+    def reclaim(
+        self,
+        max_age_hours: float = 24,
+        max_bytes: int | None = None,
+        time_budget_seconds: float | None = None,
+        min_age_minutes: float = 60
+    ) -> ReclaimStats:
+        """
+        Reclaim temp space by age, then by size.
+
+        Each top-level entry (and each execution directory) is treated as one
+        unit, aged by the newest modification time anywhere inside it:
+
+        1. Entries not modified for max_age_hours are deleted.
+        2. If the rest still exceeds max_bytes, entries are deleted oldest
+           first until under the quota. Entries modified within
+           min_age_minutes are never evicted for size, since they may be in use.
+
+        The run stops when time_budget_seconds is used up, so a huge tree
+        can't stall the caller; the next run continues where this one left off
+        (deleted entries are gone, so the scan gets cheaper each time).
+
+        Args:
+            max_age_hours: Delete entries older than this
+            max_bytes: Size quota for the temp directory (None for no quota)
+            time_budget_seconds: Maximum run time (None for unbounded)
+            min_age_minutes: Minimum age before an entry may be evicted for size
+
+        Returns:
+            ReclaimStats with counts and bytes reclaimed
+        """
+        stats = ReclaimStats()
+        now = time.time()
+        deadline = time.monotonic() + time_budget_seconds if time_budget_seconds is not None else None
+        age_cutoff = now - max_age_hours * 3600
+        candidates: list[tuple[float, int, Path]] = []
+
+        for entry in self._reclaim_entries():
+            measured = self._measure(entry, deadline)
+            if measured is None:
+                stats.timed_out = True
+                break
+            size, newest_mtime = measured
+            stats.scanned += 1
+
+            if newest_mtime < age_cutoff:
+                if self._delete(entry):
+                    stats.deleted += 1
+                    stats.bytes_reclaimed += size
+                    continue
+            candidates.append((newest_mtime, size, entry))
+            stats.bytes_remaining += size
+
+        if max_bytes is not None and not stats.timed_out and stats.bytes_remaining > max_bytes:
+            evict_cutoff = now - min_age_minutes * 60
+            for newest_mtime, size, entry in sorted(candidates, key=lambda candidate: candidate[0]):
+                if stats.bytes_remaining <= max_bytes or newest_mtime > evict_cutoff:
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    stats.timed_out = True
+                    break
+                if self._delete(entry):
+                    stats.deleted += 1
+                    stats.bytes_reclaimed += size
+                    stats.bytes_remaining -= size
+
+        if stats.deleted > 0:
+            logger.info(
+                f"Cleaned up {stats.deleted} old temporary files/directories "
+                f"({stats.bytes_reclaimed} bytes) in {self.tmp_path}"
+            )
+        if stats.timed_out:
+            logger.warning(f"Temp cleanup of {self.tmp_path} stopped at its time budget")
+
+        return stats
+
     def cleanup_old_files(self, max_age_hours: int = 24) -> int:
         """
         Clean up temporary files older than specified age.
@@ -106,36 +261,63 @@ class TempFileService:
         Returns:
             Number of files deleted
         """
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
-        deleted_count = 0
+        try:
+            return self.reclaim(max_age_hours=max_age_hours).deleted
+        except Exception as e:
+            logger.error(f"Error during temp file cleanup: {e}", exc_info=True)
+            return 0
+
+    def _reclaim_entries(self):
+        """Top-level entries, with the executions directory expanded to one entry per execution"""
+        for entry in self.tmp_path.iterdir():
+            if entry.name == EXECUTIONS_DIR_NAME and entry.is_dir() and not entry.is_symlink():
+                yield from entry.iterdir()
+            else:
+                yield entry
+
+    @staticmethod
+    def _measure(path: Path, deadline: float | None) -> tuple[int, float] | None:
+        """
+        Total size and newest mtime of a file or directory tree.
 
+        Returns:
+            (size_bytes, newest_mtime), or None if the deadline passed mid-walk
+        """
         try:
-            for entry in self.tmp_path.iterdir():
+            stat = path.lstat()
+        except OSError:
+            return 0, 0.0
+
+        size, newest = stat.st_size, stat.st_mtime
+        if not path.is_dir() or path.is_symlink():
+            return size, newest
+
+        for root, dirs, files in os.walk(path):
+            if deadline is not None and time.monotonic() > deadline:
+                return None
+            for name in dirs + files:
                 try:
-                    # Skip if modified recently
-                    if entry.stat().st_mtime > cutoff_time:
-                        continue
-
-                    # Delete file or directory
-                    if entry.is_file():
-                        entry.unlink()
-                        deleted_count += 1
-                    elif entry.is_dir():
-                        import shutil
-                        shutil.rmtree(entry)
-                        deleted_count += 1
-
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"Could not delete {entry}: {e}")
+                    child = os.lstat(os.path.join(root, name))
+                except OSError:
                     continue
+                size += child.st_size
+                newest = max(newest, child.st_mtime)
+        return size, newest
 
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old temporary files/directories")
-
-        except Exception as e:
-            logger.error(f"Error during temp file cleanup: {e}", exc_info=True)
-
-        return deleted_count
+    @staticmethod
+    def _delete(path: Path) -> bool:
+        """Delete a file or directory tree; False if it could not be removed"""
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            logger.warning(f"Could not delete {path}: {e}")
+            return False
 
     def delete_temp_file(self, file_path: Path) -> None:
         """
@@ -155,7 +337,6 @@ class TempFileService:
         if file_path.is_file():
             file_path.unlink()
         elif file_path.is_dir():
-            import shutil
             shutil.rmtree(file_path)
 
         logger.debug(f"Deleted temporary file: {file_path}")
@@ -173,23 +354,43 @@ def get_temp_file_service() -> TempFileService:
     return _temp_file_service
 
 
+def _current_execution_id() -> str | None:
+    """Execution ID of the running workflow, if called from one"""
+    from bifrost._context import get_execution_context
+
+    try:
+        return getattr(get_execution_context(), "execution_id", None)
+    except RuntimeError:
+        return None
+
+
 # Convenience functions (like PowerShell cmdlets)
 
 def new_temp_file(suffix: str = '', prefix: str = 'tmp') -> Path:
     """
     Create a new temporary file (like PowerShell's New-TemporaryFile).
 
+    Inside a workflow execution the file is created in the execution's
+    temp directory and removed when the execution ends.
+
     Returns:
         Path to the temporary file
     """
-    return get_temp_file_service().create_temp_file(suffix=suffix, prefix=prefix)
+    return get_temp_file_service().create_temp_file(
+        suffix=suffix, prefix=prefix, execution_id=_current_execution_id()
+    )
 
 
 def new_temp_directory(suffix: str = '', prefix: str = 'tmp') -> Path:
     """
     Create a new temporary directory.
 
+    Inside a workflow execution the directory is created in the execution's
+    temp directory and removed when the execution ends.
+
     Returns:
         Path to the temporary directory
     """
-    return get_temp_file_service().create_temp_directory(suffix=suffix, prefix=prefix)
+    return get_temp_file_service().create_temp_directory(
+        suffix=suffix, prefix=prefix, execution_id=_current_execution_id()
+    )
@@ -0,0 +1,93 @@
+"""
+Storage Bootstrap
+Creates the required tables and queues at function app startup
+
+Table and queue creation run concurrently. Once every table and queue
+exists, a marker row is written for the current storage schema version
+(a fingerprint of REQUIRED_TABLES and REQUIRED_QUEUES), so later cold
+starts do a single entity read instead of one round-trip per table and queue.
+
+    Config table, PartitionKey "SYSTEM", RowKey "bootstrap:storage"
+    SchemaVersion: fingerprint the storage was last bootstrapped for
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from shared.init_tables import REQUIRED_TABLES, init_tables
+from shared.queue_init import REQUIRED_QUEUES, init_queues
+
+logger = logging.getLogger(__name__)
+
+MARKER_TABLE = "Config"
+MARKER_PARTITION = "SYSTEM"
+MARKER_ROW_KEY = "bootstrap:storage"
+
+# Changes whenever a table or queue is added, so new resources get created
+STORAGE_SCHEMA_VERSION = hashlib.sha256(
+    "\n".join(["tables", *REQUIRED_TABLES, "queues", *REQUIRED_QUEUES]).encode()
+).hexdigest()[:16]
+
+
+def _marker_table(connection_string: str) -> Any:
+    from azure.data.tables import TableClient
+    return TableClient.from_connection_string(connection_string, table_name=MARKER_TABLE)
+
+
+def _marker_is_current(connection_string: str) -> bool:
+    """Whether storage was already bootstrapped for STORAGE_SCHEMA_VERSION"""
+    try:
+        marker = _marker_table(connection_string).get_entity(MARKER_PARTITION, MARKER_ROW_KEY)
+    except Exception:
+        # Missing row or table (first start), or storage unreachable - bootstrap
+        return False
+    return marker.get("SchemaVersion") == STORAGE_SCHEMA_VERSION
+
+
+def _write_marker(connection_string: str) -> None:
+    try:
+        _marker_table(connection_string).upsert_entity({
+            "PartitionKey": MARKER_PARTITION,
+            "RowKey": MARKER_ROW_KEY,
+            "SchemaVersion": STORAGE_SCHEMA_VERSION,
+            "BootstrappedAt": datetime.utcnow().isoformat()
+        })
+    except Exception as e:
+        logger.warning(f"Failed to write storage bootstrap marker: {e}")
+
+
+def bootstrap_storage(connection_string: str | None = None, force: bool = False) -> dict[str, Any]:
+    """
+    Ensure all required tables and queues exist.
+
+    Args:
+        connection_string: Azure Storage connection string (default: AzureWebJobsStorage)
+        force: Create tables and queues even if the marker row is current
+
+    Returns:
+        Dict with skipped (marker was current) and the init_tables / init_queues
+        results under "tables" and "queues" (None when skipped)
+    """
+    if connection_string is None:
+        connection_string = os.environ.get("AzureWebJobsStorage")
+    if not connection_string:
+        raise ValueError("AzureWebJobsStorage environment variable not set")
+
+    if not force and _marker_is_current(connection_string):
+        logger.info(f"Storage already bootstrapped for schema {STORAGE_SCHEMA_VERSION}")
+        return {"skipped": True, "tables": None, "queues": None}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tables_future = executor.submit(init_tables, connection_string)
+        queues_future = executor.submit(init_queues, connection_string)
+        tables = tables_future.result()
+        queues = queues_future.result()
+
+    if not tables["failed"] and not queues["failed"]:
+        _write_marker(connection_string)
+
+    return {"skipped": False, "tables": tables, "queues": queues}
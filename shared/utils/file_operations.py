@@ -4,12 +4,43 @@ File Operation Utilities
 Utilities for file operations that work with Azure Files SMB limitations.
 """
 
+import hashlib
 import logging
+import os
 import tempfile
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Workspace change generation - bumped whenever this process modifies workspace
+# files, so caches derived from the working tree (e.g. git status) know to refresh
+_workspace_generation = 0
+
+
+def bump_workspace_generation() -> int:
+    """
+    Record that workspace files changed.
+
+    Returns:
+        The new generation number
+    """
+    global _workspace_generation
+    _workspace_generation += 1
+    return _workspace_generation
+
+
+def get_workspace_generation() -> int:
+    """Get the current workspace change generation."""
+    return _workspace_generation
+
+
+def _is_excluded(name: str, exclude_patterns: list[str]) -> bool:
+    """Check a file/directory name against simple exclude patterns ('._*' or exact names)."""
+    return any(
+        name.startswith(pattern.rstrip('*')) if pattern.endswith('*') else name == pattern
+        for pattern in exclude_patterns
+    )
+
 
 def manual_copy_tree(src: Path, dst: Path, exclude_patterns: list[str] | None = None) -> None:
     """
@@ -45,9 +76,7 @@ def manual_copy_tree(src: Path, dst: Path, exclude_patterns: list[str] | None =
     # Copy all items
     for item in src.iterdir():
         # Skip excluded patterns
-        if any(item.name.startswith(pattern.rstrip('*')) if pattern.endswith('*')
-               else item.name == pattern
-               for pattern in exclude_patterns):
+        if _is_excluded(item.name, exclude_patterns):
             logger.debug(f"Skipping excluded item: {item.name}")
             continue
 
@@ -69,6 +98,146 @@ def manual_copy_tree(src: Path, dst: Path, exclude_patterns: list[str] | None =
                 raise
 
 
+def _manifest_entry(digest: str, dst_file: Path) -> str:
+    """Manifest value for a synced file: content hash plus the destination's size and mtime"""
+    stat = dst_file.stat()
+    return f"{digest}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _is_in_sync(entry: str | None, digest: str, dst_file: Path) -> bool:
+    """Whether dst_file still holds exactly what the manifest recorded for this content"""
+    if entry is None:
+        return False
+    try:
+        return entry == _manifest_entry(digest, dst_file)
+    except OSError:
+        # Deleted out of band
+        return False
+
+
+def sync_tree(
+    src: Path,
+    dst: Path,
+    manifest: dict[str, str],
+    exclude_patterns: list[str] | None = None,
+    removable: set[str] | None = None
+) -> tuple[dict[str, str], int]:
+    """
+    Incrementally copy a directory tree, transferring only changed files.
+
+    `manifest` records every file previously synced into `dst` (relative
+    POSIX path -> content sha256 plus the destination file's size and mtime).
+    A file is skipped only when its hash matches and the destination file is
+    still the one that was written, so re-syncing an unchanged tree costs
+    local reads and a stat per file, while files deleted or edited in `dst`
+    out of band are repaired.
+
+    Nothing is removed unless listed in `removable`: previously synced files
+    in that set that no longer exist in `src` are deleted (e.g. modules
+    dropped by an upgrade, taken from the replaced package's RECORD).
+
+    When `src` and `dst` are on the same device, files are hard-linked instead
+    of copied. Otherwise (e.g. /tmp -> Azure Files) they are copied with
+    simple read/write operations like manual_copy_tree().
+
+    Args:
+        src: Source directory path
+        dst: Destination directory path
+        manifest: Entries for files previously synced into dst
+        exclude_patterns: Optional list of file/directory names to exclude
+        removable: Relative paths that may be deleted if absent from src
+
+    Returns:
+        Tuple of (updated manifest, number of files written)
+
+    Raises:
+        FileNotFoundError: If source directory doesn't exist
+        OSError: If copy operations fail
+    """
+    if exclude_patterns is None:
+        exclude_patterns = []
+
+    if not src.exists():
+        raise FileNotFoundError(f"Source directory does not exist: {src}")
+
+    dst.mkdir(parents=True, exist_ok=True)
+    same_device = os.stat(src).st_dev == os.stat(dst).st_dev
+
+    updated = dict(manifest)
+    seen: set[str] = set()
+    written = 0
+
+    for root, dirs, files in os.walk(src):
+        dirs[:] = [d for d in dirs if not _is_excluded(d, exclude_patterns)]
+        rel_root = Path(root).relative_to(src)
+
+        for name in files:
+            if _is_excluded(name, exclude_patterns):
+                continue
+
+            src_file = Path(root) / name
+            rel = (rel_root / name).as_posix()
+            seen.add(rel)
+
+            with open(src_file, 'rb') as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+
+            dst_file = dst / rel
+            if _is_in_sync(manifest.get(rel), digest, dst_file):
+                continue
+
+            dst_file.parent.mkdir(parents=True, exist_ok=True)
+
+            if same_device:
+                # Never write through an existing hard link - it may be shared with src
+                dst_file.unlink(missing_ok=True)
+                try:
+                    os.link(src_file, dst_file)
+                except OSError:
+                    with open(dst_file, 'wb') as f_dst:
+                        f_dst.write(content)
+            else:
+                try:
+                    with open(dst_file, 'wb') as f_dst:
+                        f_dst.write(content)
+                except OSError as e:
+                    logger.error(f"Failed to copy {src_file} to {dst_file}: {e}")
+                    raise
+
+            updated[rel] = _manifest_entry(digest, dst_file)
+            written += 1
+
+    # Remove files of replaced packages that the new install no longer has
+    for rel in removable or ():
+        if rel not in seen:
+            (dst / rel).unlink(missing_ok=True)
+            updated.pop(rel, None)
+
+    return updated, written
+
+
+def tree_matches_manifest(dst: Path, manifest: dict[str, str]) -> bool:
+    """
+    Check that every file sync_tree() recorded in `manifest` is still in `dst` as written.
+
+    Only stats the destination (size and mtime), so it is cheap even on
+    Azure Files; it cannot see extra files added to `dst` out of band.
+
+    Args:
+        dst: Destination directory path
+        manifest: Entries for files previously synced into dst
+
+    Returns:
+        True if no recorded file was deleted or modified
+    """
+    for rel, entry in manifest.items():
+        digest = entry.split(":", 1)[0]
+        if not _is_in_sync(entry, digest, dst / rel):
+            return False
+    return True
+
+
 def get_system_tmp() -> Path:
     """
     Get the system's actual temp directory.
@@ -2,25 +2,330 @@
 Web PubSub broadcasting utilities
 
 Provides helpers for broadcasting real-time execution updates to connected clients
-via Azure Web PubSub - the SIMPLE way that actually works!
+via Azure Web PubSub.
+
+Execution updates go through a process-wide publisher: callers enqueue a
+message and return immediately, and a background task on the event loop
+sends the queue with one shared async client (one HTTP transport per
+process). The queue is bounded; when it is full, stale progress messages
+are dropped first so completion and history updates still get through.
+When Web PubSub is not configured the publisher is a NoOpPublisher that
+only records messages, which is also what tests use.
 """
 
 import asyncio
 import logging
 import os
-from datetime import datetime
-
-from azure.messaging.webpubsubservice import WebPubSubServiceClient
-from azure.identity import DefaultAzureCredential
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# Messages waiting to be sent before the publisher starts dropping
+PUBLISH_QUEUE_MAX_SIZE = 1000
+
+# Messages kept by NoOpPublisher for inspection
+NOOP_HISTORY_SIZE = 1000
+
+
+@dataclass
+class PublishMessage:
+    """One queued Web PubSub message (for a group or a single connection)"""
+    message: dict
+    group: str | None = None
+    connection_id: str | None = None
+    droppable: bool = False
+
+
+def _webpubsub_settings() -> tuple[str, str | None, str | None]:
+    """Hub name, managed identity endpoint and connection string from the environment"""
+    return (
+        os.getenv('AZURE_WEBPUBSUB_HUB', 'bifrost'),
+        os.getenv('AZURE_WEBPUBSUB_ENDPOINT'),
+        os.getenv('WebPubSubConnectionString')
+    )
+
+
+def _create_async_client() -> Any:
+    """Async Web PubSub client from the environment (managed identity or connection string)"""
+    from azure.messaging.webpubsubservice.aio import WebPubSubServiceClient as AsyncWebPubSubServiceClient
+
+    hub_name, endpoint, connection_string = _webpubsub_settings()
+    if endpoint:
+        from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+        return AsyncWebPubSubServiceClient(
+            endpoint=endpoint,
+            hub=hub_name,
+            credential=AsyncDefaultAzureCredential()
+        )
+    return AsyncWebPubSubServiceClient.from_connection_string(
+        connection_string=connection_string,
+        hub=hub_name
+    )
+
+
+class NoOpPublisher:
+    """
+    Publisher used when Web PubSub is not configured (and in tests).
+
+    Records the most recent messages in `published` instead of sending them.
+    """
+
+    enabled = False
+
+    def __init__(self):
+        self.published: deque[PublishMessage] = deque(maxlen=NOOP_HISTORY_SIZE)
+
+    def publish(
+        self,
+        message: dict,
+        *,
+        group: str | None = None,
+        connection_id: str | None = None,
+        droppable: bool = False
+    ) -> None:
+        self.published.append(PublishMessage(message, group, connection_id, droppable))
+
+    async def flush(self, timeout: float | None = None) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        return {"queued": 0, "sent": 0, "dropped": 0, "failed": 0}
+
+
+class WebPubSubPublisher:
+    """
+    Fire-and-forget Web PubSub sender shared by the whole process.
+
+    publish() is synchronous and thread-safe: it adds the message to a
+    bounded queue and wakes a sender task on the event loop the publisher is
+    bound to (the first running loop it sees, re-bound if that loop closes).
+    The sender sends messages in order with one async client.
+
+    When the queue is full the oldest droppable (progress) message is
+    discarded; a new droppable message is discarded if nothing queued can
+    be; only a queue full of non-droppable messages loses its oldest entry.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] = _create_async_client,
+        max_queue_size: int = PUBLISH_QUEUE_MAX_SIZE
+    ):
+        self._client_factory = client_factory
+        self._max_queue_size = max_queue_size
+        self._queue: deque[PublishMessage] = deque()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._sender: asyncio.Task | None = None
+        self._client: Any = None
+        self._sending = False
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def publish(
+        self,
+        message: dict,
+        *,
+        group: str | None = None,
+        connection_id: str | None = None,
+        droppable: bool = False
+    ) -> None:
+        """
+        Queue a message for a group or a single connection and return immediately.
+
+        Args:
+            message: JSON-serializable payload
+            group: Group to send to
+            connection_id: Connection to send to (used when group is None)
+            droppable: Whether the message may be dropped under backpressure
+                (progress updates superseded by later ones)
+        """
+        with self._lock:
+            if len(self._queue) >= self._max_queue_size and not self._make_room(droppable):
+                self.dropped += 1
+                return
+            self._queue.append(PublishMessage(message, group, connection_id, droppable))
+
+        self._wake()
+
+    def _make_room(self, droppable: bool) -> bool:
+        """Drop one queued message for a new one; False if the new message should be dropped instead"""
+        for index, queued in enumerate(self._queue):
+            if queued.droppable:
+                del self._queue[index]
+                self.dropped += 1
+                return True
+        if droppable:
+            return False
+        self._queue.popleft()
+        self.dropped += 1
+        return True
+
+    def _wake(self) -> None:
+        """Start or wake the sender task on the bound event loop"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is not None and (self._loop is None or self._loop.is_closed() or self._loop is running):
+            self._bind(running)
+            self._wakeup.set()
+        elif self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass
+        # Otherwise the message waits until publish() is next called on a running loop
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind to an event loop and make sure its sender task is running"""
+        stale_client = None
+        if self._loop is not loop:
+            # The async client's transport belongs to the previous loop;
+            # the new sender task closes it before sending anything
+            stale_client = self._client
+            self._loop = loop
+            self._client = None
+            self._wakeup = asyncio.Event()
+            self._sender = None
+        if self._sender is None or self._sender.done():
+            self._sender = loop.create_task(self._run(stale_client))
+
+    async def _close_client(self, client: Any) -> None:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Web PubSub client: {e}")
+
+    async def _run(self, stale_client: Any = None) -> None:
+        if stale_client is not None:
+            await self._close_client(stale_client)
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self._drain()
+
+    async def _drain(self) -> None:
+        """Send queued messages in order until the queue is empty"""
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._sending = False
+                    return
+                item = self._queue.popleft()
+                self._sending = True
+            await self._send(item)
+
+    async def _send(self, item: PublishMessage) -> None:
+        try:
+            if self._client is None:
+                self._client = self._client_factory()
+            if item.group is not None:
+                await self._client.send_to_group(
+                    group=item.group, message=item.message, content_type="application/json"
+                )
+            else:
+                await self._client.send_to_connection(
+                    connection_id=item.connection_id, message=item.message, content_type="application/json"
+                )
+            self.sent += 1
+        except Exception as e:
+            # Real-time updates are non-critical
+            self.failed += 1
+            logger.warning(f"Failed to publish Web PubSub message (non-fatal): {e}")
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait until queued messages have been sent.
+
+        Must be called on the event loop the publisher is bound to (or any
+        loop, if it is not bound to a live one).
+
+        Args:
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+        """
+        self._bind(asyncio.get_running_loop())
+
+        async def drained() -> None:
+            while True:
+                with self._lock:
+                    if not self._queue and not self._sending:
+                        return
+                self._wakeup.set()
+                await asyncio.sleep(0.01)
+
+        try:
+            await asyncio.wait_for(drained(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Web PubSub flush timed out with {len(self._queue)} messages queued")
+
+    async def aclose(self, timeout: float | None = 5) -> None:
+        """Flush, stop the sender task and close the async client"""
+        await self.flush(timeout)
+        if self._sender is not None:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+            self._sender = None
+        if self._client is not None:
+            await self._close_client(self._client)
+            self._client = None
+        self._loop = None
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            queued = len(self._queue)
+        return {"queued": queued, "sent": self.sent, "dropped": self.dropped, "failed": self.failed}
+
+
+_publisher: WebPubSubPublisher | NoOpPublisher | None = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher() -> WebPubSubPublisher | NoOpPublisher:
+    """
+    Process-wide publisher (a NoOpPublisher when Web PubSub is not configured).
+
+    Returns:
+        The shared publisher
+    """
+    global _publisher
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _, endpoint, connection_string = _webpubsub_settings()
+                _publisher = WebPubSubPublisher() if endpoint or connection_string else NoOpPublisher()
+    return _publisher
+
+
+def set_publisher(publisher: WebPubSubPublisher | NoOpPublisher | None) -> None:
+    """Replace the process-wide publisher (None re-reads the environment on next use)"""
+    global _publisher
+    _publisher = publisher
+
 
 class WebPubSubBroadcaster:
     """
     Helper for broadcasting execution updates via Azure Web PubSub.
 
-    Direct HTTP-based broadcasting - no queues, no triggers, no poison queues!
+    Execution updates are handed to the process-wide publisher
+    (get_publisher()) and sent in the background, so broadcasting never
+    waits on HTTP. Other senders (git jobs, package installs) publish to a
+    connection with get_publisher().publish(..., connection_id=...).
     Auto-detects if Web PubSub is enabled via environment variable.
     If disabled, all broadcast calls are silently ignored (no-op).
 
@@ -49,101 +354,58 @@ class WebPubSubBroadcaster:
         1. Managed Identity (production) - uses AZURE_WEBPUBSUB_ENDPOINT env var
         2. Connection String (local dev) - uses WebPubSubConnectionString env var
 
-        Note: Client initialization is lazy to avoid event loop issues in tests.
+        Messages are sent by the process-wide publisher, which owns the
+        async client; the broadcaster holds no connection of its own.
         """
         # Get configuration
-        self.hub_name = os.getenv('AZURE_WEBPUBSUB_HUB', 'bifrost')
-        self.endpoint = os.getenv('AZURE_WEBPUBSUB_ENDPOINT')
-        self.connection_string = os.getenv('WebPubSubConnectionString')
+        self.hub_name, self.endpoint, self.connection_string = _webpubsub_settings()
 
         self.enabled = bool(self.endpoint or self.connection_string)
-        self._client = None
+        self.publisher = get_publisher()
 
         if not self.enabled:
             logger.debug("Web PubSub disabled (no endpoint or connection string) - broadcasts will be skipped")
 
-    @property
-    def client(self):
-        """
-        Lazy initialization of Web PubSub client.
-
-        This avoids event loop issues during initialization, especially in tests.
-        Creates the client only when actually needed for sending messages.
+    def publish_execution_update(
+        self,
+        execution_id: str,
+        status: str,
+        latest_logs: list[dict] | None = None,
+        is_complete: bool = False,
+        result_preview: str | None = None
+    ) -> None:
         """
-        if self._client is not None:
-            return self._client
+        Queue an execution update for the execution's group (returns immediately).
 
-        if not self.enabled:
-            return None
+        Progress updates may be dropped under backpressure; the completion
+        update never is. Safe to call from any thread.
 
-        try:
-            if self.endpoint:
-                # Use managed identity (production)
-                # Import here to avoid creating credential at module load time
-                logger.info(f"Initializing Web PubSub with managed identity: {self.endpoint}")
-                try:
-                    credential = DefaultAzureCredential()
-                    self._client = WebPubSubServiceClient(
-                        endpoint=self.endpoint,
-                        hub=self.hub_name,
-                        credential=credential
-                    )
-                    logger.info("Web PubSub broadcaster initialized with managed identity")
-                except Exception as cred_error:
-                    # If credential creation fails (e.g., in tests), disable broadcaster
-                    logger.warning(f"Failed to create DefaultAzureCredential: {cred_error}")
-                    self.enabled = False
-                    return None
-            elif self.connection_string:
-                # Use connection string (local dev)
-                logger.info("Initializing Web PubSub with connection string")
-                self._client = WebPubSubServiceClient.from_connection_string(
-                    connection_string=self.connection_string,
-                    hub=self.hub_name
-                )
-                logger.info("Web PubSub broadcaster initialized with connection string")
-            else:
-                # Should not reach here, but satisfy type checker
-                logger.warning("Web PubSub not configured (no endpoint or connection string)")
-                self.enabled = False
-                return None
-        except Exception as e:
-            logger.warning(f"Failed to initialize Web PubSub client: {e}")
-            self.enabled = False
-            self._client = None
-
-        return self._client
-
-    def close(self):
-        """
-        Close the Web PubSub client and cleanup resources.
-
-        This closes the underlying aiohttp ClientSession used by the Azure SDK.
-        Should be called when done using the broadcaster to prevent resource leaks.
-        """
-        if self._client is not None:
-            try:
-                # Azure SDK clients have a close() method that closes internal aiohttp sessions
-                if hasattr(self._client, 'close'):
-                    self._client.close()
-                    logger.debug("Closed Web PubSub client")
-                self._client = None
-            except Exception as e:
-                logger.warning(f"Error closing Web PubSub client: {e}")
-
-    def __del__(self):
+        Args:
+            execution_id: Execution ID
+            status: Current execution status
+            latest_logs: Recent log entries (last 50 are sent)
+            is_complete: Whether execution finished
+            result_preview: Leading part of the encoded result
         """
-        Cleanup on garbage collection as a fallback.
+        if not self.enabled:
+            return
 
-        This ensures resources are released even if close() isn't explicitly called.
-        Note: __del__ is not guaranteed to run, so explicit close() is preferred.
-        """
-        try:
-            if self._client is not None:
-                self.close()
-        except Exception:
-            # Ignore errors in __del__ to avoid issues during interpreter shutdown
-            pass
+        message: dict = {
+            "executionId": execution_id,
+            "status": status,
+            "isComplete": is_complete,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        if latest_logs:
+            message["latestLogs"] = latest_logs[-50:]
+        if result_preview is not None:
+            message["resultPreview"] = result_preview
+
+        self.publisher.publish(
+            {"target": "executionUpdate", "data": message},
+            group=f"execution:{execution_id}",
+            droppable=not is_complete
+        )
 
     async def broadcast_execution_update(
         self,
@@ -152,13 +414,11 @@ class WebPubSubBroadcaster:
         executed_by: str,
         scope: str,
         latest_logs: list[dict] | None = None,
-        is_complete: bool = False
+        is_complete: bool = False,
+        result_preview: str | None = None
     ):
         """
-        Broadcast execution update to subscribed clients (async, non-blocking).
-
-        Uses asyncio.to_thread() to prevent blocking the event loop with
-        synchronous HTTP calls to Azure Web PubSub.
+        Broadcast execution update to subscribed clients (fire-and-forget).
 
         Args:
             execution_id: Execution ID
@@ -167,48 +427,13 @@ class WebPubSubBroadcaster:
             scope: Organization scope
             latest_logs: Recent log entries (last 50)
             is_complete: Whether execution finished
+            result_preview: Leading part of the encoded result (completion only)
 
         Returns:
             None (fire-and-forget)
         """
-        if not self.enabled or not self.client:
-            logger.debug(f"Broadcast skipped - enabled={self.enabled}, client={self.client is not None}")
-            return
-
-        logger.debug(f"Broadcasting execution update for {execution_id}")
-
         try:
-            # Prepare message
-            message = {
-                "executionId": execution_id,
-                "status": status,
-                "isComplete": is_complete,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-
-            if latest_logs and len(latest_logs) > 0:
-                message["latestLogs"] = latest_logs[-50:]
-
-            # Send to execution-specific group
-            group_name = f"execution:{execution_id}"
-
-            payload = {
-                "target": "executionUpdate",
-                "data": message
-            }
-
-            logger.debug(f"Sending to {group_name}: {len(latest_logs) if latest_logs else 0} logs")
-
-            # Run sync HTTP call in thread pool to avoid blocking event loop
-            await asyncio.to_thread(
-                self.client.send_to_group,
-                group=group_name,
-                message=payload,
-                content_type="application/json"
-            )
-
-            logger.debug(f"Sent execution update to group {group_name}")
-
+            self.publish_execution_update(execution_id, status, latest_logs, is_complete, result_preview)
         except Exception as e:
             # Log but don't fail - real-time updates are non-critical
             logger.warning(
@@ -248,13 +473,11 @@ class WebPubSubBroadcaster:
         Returns:
             None (broadcasts are fire-and-forget)
         """
-        if not self.enabled or not self.client:
-            logger.debug(f"Broadcast to history skipped - enabled={self.enabled}, client={self.client is not None}")
+        if not self.enabled:
+            logger.debug("Broadcast to history skipped - Web PubSub disabled")
             return
 
         try:
-            # Build message dict with proper typing to allow both str and int values
-            from typing import Any
             message: dict[str, Any] = {
                 "executionId": execution_id,
                 "workflowName": workflow_name,
@@ -262,7 +485,7 @@ class WebPubSubBroadcaster:
                 "executedBy": executed_by,
                 "executedByName": executed_by_name,
                 "startedAt": started_at.isoformat(),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
             if completed_at:
@@ -270,24 +493,11 @@ class WebPubSubBroadcaster:
             if duration_ms is not None:
                 message["durationMs"] = duration_ms
 
-            # Send to scope-specific history group
-            group_name = f"history:{scope}"
-
-            logger.info(f"Sending history update to {group_name}: {execution_id} ({status})")
-
-            # Run sync HTTP call in thread pool to avoid blocking event loop
-            await asyncio.to_thread(
-                self.client.send_to_group,
-                group=group_name,
-                message={
-                    "target": "executionHistoryUpdate",
-                    "data": message
-                },
-                content_type="application/json"
+            self.publisher.publish(
+                {"target": "executionHistoryUpdate", "data": message},
+                group=f"history:{scope}"
             )
 
-            logger.info(f"Sent history update to group {group_name}")
-
         except Exception as e:
             logger.warning(
                 f"Failed to broadcast to history (non-fatal): {str(e)}",
@@ -0,0 +1,327 @@
+"""
+Workflow Process Pool
+
+Runs workflows declared with @workflow(isolation="process") in a warm pool of
+worker processes instead of on the queue worker's event loop, so CPU-bound or
+blocking workflow code cannot freeze cancellation checks and other executions.
+
+- Processes are started with the "spawn" method (forking a process that runs
+  an event loop and SDK threads is unsafe). They inherit the parent's sys.path
+  and workspace import restrictions.
+- Each process runs one execution at a time. The workflow is loaded in the
+  child and the bifrost SDK context, config and Web PubSub broadcaster are
+  re-initialized there, so SDK calls and live log streaming work as inline.
+- The ExecutionResult is sent back over a pipe. Cancelling the awaiting task
+  (user cancellation or timeout in the queue worker) kills the process; a
+  replacement is started on the next acquire.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from dataclasses import fields
+from multiprocessing.connection import Connection
+from typing import Any
+
+from shared.engine import ExecutionRequest, ExecutionResult
+from shared.models import ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+# Worker processes kept warm (executions beyond this wait for a free process)
+WORKFLOW_PROCESS_POOL_SIZE = int(
+    os.environ.get("WORKFLOW_PROCESS_POOL_SIZE", str(max(2, os.cpu_count() or 2)))
+)
+
+# Executions per process before it is recycled (bounds leaks in user code)
+WORKFLOW_PROCESS_MAX_JOBS = int(os.environ.get("WORKFLOW_PROCESS_MAX_JOBS", "100"))
+
+_mp = multiprocessing.get_context("spawn")
+
+
+class WorkflowProcessError(Exception):
+    """A worker process failed outside of the workflow itself"""
+
+
+# ==================== CHILD PROCESS ====================
+
+
+def _child_main(conn: Connection, restrictions: list[tuple[list[str], str | None]]) -> None:
+    """Worker process loop: receive a job, run it, send back the result"""
+    if restrictions:
+        from shared.import_restrictor import install_import_restrictions
+        for workspace_paths, home_path in restrictions:
+            install_import_restrictions(workspace_paths, home_path=home_path)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        if job is None:
+            return
+
+        try:
+            conn.send(("result", asyncio.run(_run_job(job))))
+        except Exception as e:
+            conn.send(("error", {"error_type": type(e).__name__, "error_message": str(e)}))
+
+
+async def _run_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Load and execute a workflow in the child process"""
+    from shared.discovery import load_workflow
+    from shared.engine import execute
+
+    loaded = load_workflow(job["workflow_name"])
+    if not loaded:
+        raise LookupError(f"Workflow '{job['workflow_name']}' not found in worker process")
+
+    broadcaster = None
+    if job["broadcast"]:
+        from shared.webpubsub_broadcaster import WebPubSubBroadcaster
+        broadcaster = WebPubSubBroadcaster()
+
+    result = await execute(ExecutionRequest(
+        execution_id=job["execution_id"],
+        caller=job["caller"],
+        organization=job["organization"],
+        config=job["config"],
+        func=loaded[0],
+        name=job["workflow_name"],
+        tags=["workflow"],
+        timeout_seconds=job["timeout_seconds"],
+        parameters=job["parameters"],
+        transient=job["transient"],
+        is_platform_admin=job["is_platform_admin"],
+        broadcaster=broadcaster
+    ))
+
+    if broadcaster is not None:
+        # The job's event loop closes when it returns - send queued log updates first
+        await broadcaster.publisher.aclose()
+
+    # Results and captured variables may hold arbitrary objects - send a JSON-safe copy
+    payload = {f.name: getattr(result, f.name) for f in fields(result)}
+    return json.loads(json.dumps(payload, default=str))
+
+
+# ==================== PARENT PROCESS ====================
+
+
+def _active_restrictions() -> list[tuple[list[str], str | None]]:
+    """Import restrictions installed in this process, to re-install in children"""
+    from shared.import_restrictor import get_active_restrictors
+    return [(r.workspace_paths, r.home_path) for r in get_active_restrictors()]
+
+
+class _PoolProcess:
+    """One worker process and the parent end of its pipe"""
+
+    def __init__(self):
+        self.conn, child_conn = _mp.Pipe()
+        self.process = _mp.Process(
+            target=_child_main,
+            args=(child_conn, _active_restrictions()),
+            name="workflow-pool",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        """Hard-kill the process (used for cancellation and timeouts)"""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        """Ask the process to exit, killing it if it does not"""
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=5)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class WorkflowProcessPool:
+    """
+    Warm pool of worker processes running one workflow execution each.
+    """
+
+    def __init__(self, size: int = WORKFLOW_PROCESS_POOL_SIZE, max_jobs: int = WORKFLOW_PROCESS_MAX_JOBS):
+        """
+        Initialize pool (processes are started by warm() or on first use).
+
+        Args:
+            size: Number of worker processes
+            max_jobs: Executions per process before it is replaced
+        """
+        self.size = size
+        self.max_jobs = max_jobs
+        self._idle: list[_PoolProcess] = []
+        self._busy: set[_PoolProcess] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+
+    def warm(self) -> None:
+        """Start worker processes up to the pool size"""
+        while len(self._idle) + len(self._busy) < self.size:
+            self._idle.append(_PoolProcess())
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Per-event-loop semaphore bounding concurrent executions to the pool size"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.size)
+            self._slots_loop = loop
+        return self._slots
+
+    def _acquire(self) -> _PoolProcess:
+        while self._idle:
+            proc = self._idle.pop()
+            if proc.is_alive():
+                self._busy.add(proc)
+                return proc
+            proc.kill()
+
+        proc = _PoolProcess()
+        self._busy.add(proc)
+        return proc
+
+    def _release(self, proc: _PoolProcess) -> None:
+        self._busy.discard(proc)
+        if proc.jobs >= self.max_jobs or not proc.is_alive():
+            proc.stop()
+        else:
+            self._idle.append(proc)
+
+    def _discard(self, proc: _PoolProcess) -> None:
+        self._busy.discard(proc)
+        proc.kill()
+
+    async def run(self, job: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a job in a worker process.
+
+        Args:
+            job: Picklable job description (see execute_in_process)
+
+        Returns:
+            ExecutionResult fields as a dict
+
+        Raises:
+            WorkflowProcessError: If the process died or failed before running the workflow
+            asyncio.CancelledError: If cancelled (the process is killed first)
+        """
+        async with self._get_slots():
+            self.warm()
+            proc = self._acquire()
+            loop = asyncio.get_running_loop()
+
+            try:
+                proc.conn.send(job)
+                proc.jobs += 1
+                kind, payload = await loop.run_in_executor(None, proc.conn.recv)
+            except (EOFError, OSError) as e:
+                exit_code = proc.process.exitcode
+                self._discard(proc)
+                raise WorkflowProcessError(
+                    f"Worker process exited unexpectedly (exit code {exit_code})"
+                ) from e
+            except BaseException:
+                # Cancellation or timeout: hard-kill so blocking code cannot keep running
+                self._discard(proc)
+                raise
+
+            self._release(proc)
+
+        if kind == "error":
+            raise WorkflowProcessError(f"{payload['error_type']}: {payload['error_message']}")
+
+        return payload
+
+    def shutdown(self) -> None:
+        """Stop all worker processes"""
+        for proc in self._idle + list(self._busy):
+            proc.stop()
+        self._idle.clear()
+        self._busy.clear()
+
+
+_pool: WorkflowProcessPool | None = None
+
+
+def get_workflow_process_pool() -> WorkflowProcessPool:
+    """Get the process-wide workflow process pool"""
+    global _pool
+    if _pool is None:
+        _pool = WorkflowProcessPool()
+    return _pool
+
+
+def shutdown_workflow_process_pool() -> None:
+    """Stop the process-wide pool (for shutdown and tests)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+async def execute_in_process(request: ExecutionRequest) -> ExecutionResult:
+    """
+    Execute a workflow in the process pool.
+
+    Mirrors shared.engine.execute(): workflow errors come back as a FAILED
+    ExecutionResult rather than an exception. The parent's broadcaster is only
+    used to decide whether the child streams logs; the parent keeps it open.
+
+    Args:
+        request: Engine request for a named workflow (inline scripts are not supported)
+
+    Returns:
+        ExecutionResult from the worker process
+
+    Raises:
+        ValueError: If the request has no workflow name
+        asyncio.CancelledError: If cancelled (the worker process is killed)
+    """
+    if not request.name or request.code:
+        raise ValueError("Process isolation requires a named workflow")
+
+    job = {
+        "execution_id": request.execution_id,
+        "workflow_name": request.name,
+        "caller": request.caller,
+        "organization": request.organization,
+        "config": request.config,
+        "parameters": request.parameters,
+        "timeout_seconds": request.timeout_seconds,
+        "transient": request.transient,
+        "is_platform_admin": request.is_platform_admin,
+        "broadcast": request.broadcaster is not None,
+    }
+
+    try:
+        payload = await get_workflow_process_pool().run(job)
+    except WorkflowProcessError as e:
+        logger.error(f"Process execution failed for {request.execution_id}: {e}")
+        return ExecutionResult(
+            execution_id=request.execution_id,
+            status=ExecutionStatus.FAILED,
+            result=None,
+            duration_ms=0,
+            error_message=str(e),
+            error_type="WorkflowProcessError"
+        )
+
+    payload["status"] = ExecutionStatus(payload["status"])
+    return ExecutionResult(**payload)
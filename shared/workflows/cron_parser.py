@@ -10,6 +10,9 @@ from croniter import croniter
 
 logger = logging.getLogger(__name__)
 
+# Schedule processor timer interval (functions/timer/schedule_processor.py)
+TIMER_INTERVAL_MINUTES = 1
+
 
 def validate_cron_expression(expression: str) -> bool:
     """
@@ -65,20 +68,21 @@ def is_cron_expression_valid(expression: str) -> bool:
     return True
 
 
-def round_to_next_timer_interval(dt: datetime) -> datetime:
+def round_to_next_timer_interval(dt: datetime, interval_minutes: int = TIMER_INTERVAL_MINUTES) -> datetime:
     """
-    Round a datetime up to the next 5-minute timer interval.
+    Round a datetime up to the next schedule processor timer interval.
 
-    Our schedule processor runs every 5 minutes (at :00, :05, :10, :15, etc.),
-    so we round up the actual CRON next run to the next timer execution.
+    The schedule processor runs every TIMER_INTERVAL_MINUTES, so we round up
+    the actual CRON next run to the next timer execution.
 
     Args:
         dt: Datetime to round
+        interval_minutes: Timer interval in minutes
 
     Returns:
-        Datetime rounded up to next 5-minute interval
+        Datetime rounded up to the next interval
 
-    Examples:
+    Examples (5-minute interval):
         10:11 -> 10:15
         10:15 -> 10:15 (already on interval)
         10:16 -> 10:20
@@ -88,8 +92,8 @@ def round_to_next_timer_interval(dt: datetime) -> datetime:
     # Get minutes since midnight
     minutes_since_midnight = dt.hour * 60 + dt.minute
 
-    # Round up to next 5-minute interval
-    rounded_minutes = ((minutes_since_midnight + 4) // 5) * 5
+    # Round up to next interval
+    rounded_minutes = ((minutes_since_midnight + interval_minutes - 1) // interval_minutes) * interval_minutes
 
     # If we've rolled over to next day
     if rounded_minutes >= 1440:  # 24 * 60
@@ -107,15 +111,15 @@ def calculate_next_run(expression: str, from_time: datetime | None = None) -> da
     """
     Calculate the next run time for a CRON expression.
 
-    Since our schedule processor runs every 5 minutes, the returned time
-    is rounded up to the next 5-minute timer interval (:00, :05, :10, etc.).
+    The returned time is rounded up to the schedule processor's timer
+    interval (TIMER_INTERVAL_MINUTES).
 
     Args:
         expression: CRON expression string
         from_time: Base time to calculate from (default: now in UTC)
 
     Returns:
-        datetime of next scheduled run in UTC, rounded to next 5-minute interval
+        datetime of next scheduled run in UTC, rounded to the timer interval
 
     Raises:
         ValueError: If CRON expression is invalid
@@ -130,7 +134,7 @@ def calculate_next_run(expression: str, from_time: datetime | None = None) -> da
     cron = croniter(expression, base_time)
     next_run = cron.get_next(datetime)
 
-    # Round up to next 5-minute timer interval
+    # Round up to next timer interval
     # This ensures Next Run reflects when it will ACTUALLY execute
     next_run_rounded = round_to_next_timer_interval(next_run)
 
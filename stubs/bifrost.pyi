@@ -139,6 +139,9 @@ def workflow(
     tags: list[str] | None = None,
     execution_mode: str | None = None,  # Auto: "sync" if endpoint_enabled else "async"
     timeout_seconds: int = 300,
+    isolation: str = "none",  # "process" runs queued executions in a worker process pool
+    max_concurrency: int | None = None,
+    integrations: list[str] | None = None,
     max_duration_seconds: int = 300,
     retry_policy: dict[str, Any] | None = None,
     schedule: str | None = None,
@@ -156,6 +159,10 @@ def workflow(
         tags: Optional tags for filtering
         execution_mode: "sync", "async", or None (auto-select based on endpoint_enabled)
         timeout_seconds: Max execution time
+        isolation: "none" or "process" (run in a worker process; timeouts and
+            cancellation kill the process)
+        max_concurrency: Max queued executions of this workflow running at once
+        integrations: Integration names whose shared concurrency limits apply
         expose_in_forms: Whether workflow can be triggered from forms
         required_permission: Permission required to execute
 
@@ -1409,6 +1416,53 @@ class workflows:
         """
         ...
 
+    @staticmethod
+    async def execute_batch(
+        workflow_name: str,
+        targets: list[str | dict[str, Any]],
+        parameters: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Queue a workflow for many organizations in one call.
+
+        Requires platform admin privileges. Must be awaited.
+
+        Args:
+            workflow_name: Name of workflow to execute
+            targets: Organization IDs, or dicts with "orgId" and optional
+                "inputData" (per-organization parameters)
+            parameters: Parameters shared by every execution (optional)
+
+        Returns:
+            dict: Batch details (batchId, executions, rejected)
+
+        Raises:
+            PermissionError: If user is not platform admin
+            ValueError: If workflow not found or targets are invalid
+            RuntimeError: If no execution context
+        """
+        ...
+
+    @staticmethod
+    async def get_batch(batch_id: str) -> dict[str, Any]:
+        """
+        Get aggregated progress of a batch launch.
+
+        Requires platform admin privileges. Must be awaited.
+
+        Args:
+            batch_id: Batch ID returned by execute_batch
+
+        Returns:
+            dict: Progress (total, completed, statusCounts, isComplete, executions)
+
+        Raises:
+            PermissionError: If user is not platform admin
+            ValueError: If batch not found
+            RuntimeError: If no execution context
+        """
+        ...
+
     @staticmethod
     def list() -> list[dict[str, Any]]:
         """
@@ -0,0 +1,66 @@
+"""
+Test that executions remove their temp directory when they finish.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+import shared.services.temp_file_service as temp_module
+from shared.context import Caller, Organization
+from shared.decorators import workflow
+from shared.engine import ExecutionRequest, ExecutionStatus, execute
+from shared.services.temp_file_service import new_temp_directory, new_temp_file
+
+
+@pytest.fixture
+def tmp_root(tmp_path):
+    """Temp file service rooted in a test directory"""
+    with patch.dict(os.environ, {"TMP_PATH": str(tmp_path)}):
+        temp_module._temp_file_service = None
+        yield tmp_path
+    temp_module._temp_file_service = None
+
+
+def _request(execution_id: str, func) -> ExecutionRequest:
+    return ExecutionRequest(
+        execution_id=execution_id,
+        caller=Caller(user_id="test-user", email="test@example.com", name="Test User"),
+        organization=Organization(id="test-org", name="Test Org"),
+        config={},
+        name=func.__name__,
+        parameters={},
+        func=func
+    )
+
+
+class TestExecutionTempDirectory:
+    """Test temp directory cleanup by the engine (sync HTTP executions and data providers)"""
+
+    async def test_successful_execution_leaves_no_directory(self, tmp_root):
+        created = []
+
+        @workflow(name="temp_files_workflow", description="Creates temp files")
+        async def temp_files_workflow(context):
+            path = new_temp_file(suffix=".csv")
+            path.write_text("a,b\n")
+            created.extend([path, new_temp_directory()])
+            return "done"
+
+        result = await execute(_request("exec-temp-1", temp_files_workflow))
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert all(path.parent == tmp_root / "executions" / "exec-temp-1" for path in created)
+        assert not (tmp_root / "executions" / "exec-temp-1").exists()
+
+    async def test_failed_execution_leaves_no_directory(self, tmp_root):
+        @workflow(name="temp_files_failing_workflow", description="Creates a temp file then fails")
+        async def temp_files_failing_workflow(context):
+            new_temp_file().write_text("partial")
+            raise RuntimeError("boom")
+
+        result = await execute(_request("exec-temp-2", temp_files_failing_workflow))
+
+        assert result.status == ExecutionStatus.FAILED
+        assert not (tmp_root / "executions" / "exec-temp-2").exists()
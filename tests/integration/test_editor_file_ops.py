@@ -4,19 +4,42 @@ Integration tests for editor file operations.
 Tests the file_operations.py module with actual file system operations.
 """
 
+import inspect
+import json
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
+
+import azure.functions as func
+
+from functions.http.editor_files import editor_read_file
+from shared.editor import file_operations
 from shared.editor.file_operations import (
     validate_and_resolve_path,
     list_directory,
+    get_file_etag,
     read_file,
     write_file,
 )
 from shared.models import FileType
 
 
+def _read_file_request(headers: dict | None = None, **params) -> func.HttpRequest:
+    return func.HttpRequest(
+        method="GET",
+        url="/api/editor/files/content",
+        params={"path": "workflows/sync_users.py", **params},
+        headers=headers or {},
+        body=b"",
+    )
+
+
+async def _call_read_file(req: func.HttpRequest) -> func.HttpResponse:
+    """Call the route function without the Functions host"""
+    return await inspect.unwrap(editor_read_file._function.get_user_function())(req)
+
+
 class TestFileOperations:
     """Integration tests for file operations module"""
 
@@ -56,6 +79,8 @@ class TestFileOperations:
 
         # Cleanup
         shutil.rmtree(temp_dir, ignore_errors=True)
+        file_operations.invalidate_etag_cache()
+        file_operations.invalidate_listing_cache()
 
     def test_validate_and_resolve_path_valid(self, temp_home):
         """Test path validation with valid paths"""
@@ -112,6 +137,67 @@ class TestFileOperations:
         assert sync_users.size > 0
         assert "workflows/sync_users.py" in sync_users.path
 
+    def test_list_directory_recursive(self, temp_home):
+        """Test recursive listing returns each folder followed by its contents"""
+        files = list_directory("", recursive=True)
+
+        paths = [f.path for f in files]
+        assert paths == [
+            "data_providers",
+            "data_providers/get_users.py",
+            "workflows",
+            "workflows/sync_orders.py",
+            "workflows/sync_users.py",
+        ]
+
+    def test_list_directory_recursive_max_depth(self, temp_home):
+        """Test recursive listing stops at max_depth"""
+        home_path = temp_home["home_path"]
+        (home_path / "workflows" / "nested").mkdir()
+        (home_path / "workflows" / "nested" / "deep.py").write_text("pass")
+
+        paths = {f.path for f in list_directory("", recursive=True, max_depth=2)}
+
+        assert "workflows/nested" in paths
+        assert "workflows/nested/deep.py" not in paths
+
+    def test_list_directory_skips_hidden_entries(self, temp_home):
+        """Test hidden folders and metadata files are filtered out"""
+        home_path = temp_home["home_path"]
+        (home_path / "__pycache__").mkdir()
+        (home_path / "workflows" / "._sync_users.py").write_text("")
+        (home_path / "workflows" / "compiled.pyc").write_bytes(b"\x00")
+
+        paths = {f.path for f in list_directory("", recursive=True)}
+
+        assert "__pycache__" not in paths
+        assert "workflows/._sync_users.py" not in paths
+        assert "workflows/compiled.pyc" not in paths
+
+    def test_list_directory_does_not_follow_symlinks(self, temp_home):
+        """Test symlinked folders are neither listed nor descended into"""
+        home_path = temp_home["home_path"]
+        outside = Path(temp_home["temp_dir"]) / "outside"
+        outside.mkdir()
+        (outside / "secret.py").write_text("")
+        (home_path / "workflows" / "escape").symlink_to(outside, target_is_directory=True)
+        (home_path / "workflows" / "loop").symlink_to(home_path, target_is_directory=True)
+
+        paths = {f.path for f in list_directory("", recursive=True)}
+
+        assert not any(path.startswith(("workflows/escape", "workflows/loop")) for path in paths)
+        assert "workflows/sync_users.py" in paths
+
+    async def test_list_directory_cache_invalidated_by_write(self, temp_home):
+        """Test editor writes invalidate the cached listing of the parent folder"""
+        before = {f.name: f.size for f in list_directory("workflows")}
+
+        await write_file("workflows/sync_users.py", "x" * 500)
+
+        after = {f.name: f.size for f in list_directory("workflows")}
+        assert after["sync_users.py"] == 500
+        assert after["sync_users.py"] != before["sync_users.py"]
+
     def test_list_directory_not_found(self, temp_home):
         """Test listing non-existent directory"""
         with pytest.raises(FileNotFoundError):
@@ -215,6 +301,94 @@ class TestFileOperations:
         with pytest.raises(ValueError, match="Only UTF-8 and base64 encodings are supported"):
             await write_file("workflows/test.py", "content", encoding="latin-1")
 
+    async def test_get_file_etag_matches_read(self, temp_home):
+        """Test get_file_etag returns the same etag as a full read"""
+        response = await read_file("workflows/sync_users.py")
+        etag = await get_file_etag("workflows/sync_users.py")
+
+        assert etag == response.etag
+
+    async def test_write_file_seeds_etag_cache(self, temp_home, monkeypatch):
+        """Test etag after write is served from the validator cache without re-reading"""
+        response = await write_file("workflows/cached.py", "print('hi')\n")
+
+        def fail_hash(path):
+            raise AssertionError("file should not be re-hashed")
+
+        monkeypatch.setattr(file_operations, "_hash_file", fail_hash)
+
+        assert await get_file_etag("workflows/cached.py") == response.etag
+
+    async def test_get_file_etag_detects_external_change(self, temp_home):
+        """Test cached etag is invalidated when the file changes on disk"""
+        home_path = temp_home["home_path"]
+        original = await get_file_etag("workflows/sync_users.py")
+
+        (home_path / "workflows" / "sync_users.py").write_text("changed outside the editor")
+
+        assert await get_file_etag("workflows/sync_users.py") != original
+
+    async def test_read_file_byte_range(self, temp_home):
+        """Test reading a byte range returns partial content with whole-file etag"""
+        full = await read_file("workflows/sync_users.py")
+        response = await read_file("workflows/sync_users.py", offset=7, length=7)
+
+        assert response.content == "bifrost"
+        assert response.isPartial is True
+        assert response.offset == 7
+        assert response.size == 7
+        assert response.totalSize == full.size
+        assert response.etag == full.etag
+
+    async def test_read_file_line_range(self, temp_home):
+        """Test reading a line range returns only the requested lines"""
+        response = await read_file("workflows/sync_users.py", start_line=3, end_line=4)
+
+        assert response.content == "def run(context):\n    pass"
+        assert response.isPartial is True
+        assert response.startLine == 3
+        assert response.endLine == 4
+        assert response.offset == len("import bifrost\n\n")
+
+    async def test_read_endpoint_not_modified(self, temp_home):
+        """Test a full read with a matching If-None-Match returns 304 and no body"""
+        etag = await get_file_etag("workflows/sync_users.py")
+
+        response = await _call_read_file(_read_file_request(headers={"If-None-Match": f'"{etag}"'}))
+
+        assert response.status_code == 304
+        assert response.get_body() == b""
+        assert response.headers["ETag"] == f'"{etag}"'
+
+    async def test_read_endpoint_range_ignores_if_none_match(self, temp_home):
+        """Test a ranged read returns the range even when If-None-Match matches"""
+        etag = await get_file_etag("workflows/sync_users.py")
+
+        response = await _call_read_file(_read_file_request(
+            headers={"If-None-Match": f'"{etag}"'}, offset="7", length="7"
+        ))
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{etag}"'
+        body = json.loads(response.get_body())
+        assert body["content"] == "bifrost"
+        assert body["isPartial"] is True
+
+    async def test_read_endpoint_stale_etag_returns_content(self, temp_home):
+        """Test a full read with a stale If-None-Match returns the file"""
+        response = await _call_read_file(_read_file_request(headers={"If-None-Match": '"stale"'}))
+
+        assert response.status_code == 200
+        assert json.loads(response.get_body())["content"].startswith("import bifrost")
+
+    async def test_read_file_invalid_range(self, temp_home):
+        """Test invalid or mixed ranges are rejected"""
+        with pytest.raises(ValueError, match="Invalid line range"):
+            await read_file("workflows/sync_users.py", start_line=5, end_line=2)
+
+        with pytest.raises(ValueError, match="Cannot combine"):
+            await read_file("workflows/sync_users.py", offset=0, start_line=1)
+
 
 class TestBifrostTypesEndpoint:
     """Integration tests for bifrost types endpoint"""
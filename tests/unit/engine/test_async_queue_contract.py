@@ -5,12 +5,19 @@ These tests verify that we create and process queue messages correctly
 without depending on actual Azure Queue Storage infrastructure.
 """
 
+import asyncio
 import json
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from shared.async_executor import enqueue_workflow_execution
+from shared import async_executor
+from shared.async_executor import (
+    ExecutionRequest,
+    enqueue_workflow_execution,
+    enqueue_workflow_executions,
+)
 from shared.context import ExecutionContext, Organization
+from shared.models import ExecutionStatus
 
 
 class TestQueueMessageCreation:
@@ -130,8 +137,48 @@ class TestQueueMessageCreation:
         assert create_call.kwargs["org_id"] == "test-org"
         assert create_call.kwargs["form_id"] == "form-123"
 
-        # Verify update_execution was called with PENDING status
-        assert mock_exec_logger.update_execution.called
+        # Verify record is written once, directly as PENDING
+        assert create_call.kwargs["status"] == ExecutionStatus.PENDING
+        assert not mock_exec_logger.update_execution.called
+
+    @pytest.mark.asyncio
+    @patch('shared.async_executor.get_queue_client')
+    @patch('shared.async_executor.get_execution_logger')
+    async def test_enqueue_uses_shared_queue_client(
+        self, mock_get_logger, mock_get_queue_client
+    ):
+        """Test that enqueue reuses the long-lived queue client"""
+        mock_queue_client = MagicMock()
+        mock_queue_client.send_message = AsyncMock()
+
+        mock_context_manager = MagicMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_queue_client)
+        mock_context_manager.__aexit__ = AsyncMock(return_value=False)
+        mock_get_queue_client.return_value = mock_context_manager
+
+        mock_exec_logger = MagicMock()
+        mock_exec_logger.create_execution = AsyncMock()
+        mock_get_logger.return_value = mock_exec_logger
+
+        org = Organization(id="test-org", name="Test Org", is_active=True)
+        context = ExecutionContext(
+            user_id="test-user",
+            email="test@example.com",
+            name="Test User",
+            scope="test-org",
+            organization=org,
+            is_platform_admin=False,
+            is_function_key=False,
+            execution_id="test-exec-shared"
+        )
+
+        await enqueue_workflow_execution(
+            context=context,
+            workflow_name="test_workflow",
+            parameters={}
+        )
+
+        mock_get_queue_client.assert_called_once_with(shared=True, queue_name="workflow-executions")
 
     @pytest.mark.asyncio
     @patch('shared.async_executor.get_queue_client')
@@ -293,6 +340,103 @@ class TestQueueMessageCreation:
         assert len(sent_ids) == 3
 
 
+class TestBulkEnqueue:
+    """Test enqueueing many executions in one call"""
+
+    @pytest.mark.asyncio
+    @patch('shared.async_executor.get_queue_client')
+    @patch('shared.async_executor.get_execution_logger')
+    async def test_bulk_enqueue_batches_records_and_sends_messages(
+        self, mock_get_logger, mock_get_queue_client
+    ):
+        """Test bulk enqueue writes records in one call and sends one message each"""
+        mock_queue_client = MagicMock()
+        mock_queue_client.send_message = AsyncMock()
+
+        mock_context_manager = MagicMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_queue_client)
+        mock_context_manager.__aexit__ = AsyncMock(return_value=False)
+        mock_get_queue_client.return_value = mock_context_manager
+
+        mock_exec_logger = MagicMock()
+        mock_exec_logger.create_executions = AsyncMock()
+        mock_get_logger.return_value = mock_exec_logger
+
+        requests = []
+        for org_id in ["org-a", "org-b"]:
+            context = ExecutionContext(
+                user_id="test-user",
+                email="test@example.com",
+                name="Test User",
+                scope=org_id,
+                organization=Organization(id=org_id, name=org_id, is_active=True),
+                is_platform_admin=True,
+                is_function_key=False,
+                execution_id=f"test-exec-{org_id}"
+            )
+            requests.append(ExecutionRequest(
+                context=context,
+                workflow_name="test_workflow",
+                parameters={"org": org_id}
+            ))
+
+        execution_ids = await enqueue_workflow_executions(requests)
+
+        assert len(set(execution_ids)) == 2
+
+        # One batched record write covering both orgs
+        mock_exec_logger.create_executions.assert_called_once()
+        records = mock_exec_logger.create_executions.call_args[0][0]
+        assert [r["org_id"] for r in records] == ["org-a", "org-b"]
+        assert [r["execution_id"] for r in records] == execution_ids
+
+        # One queue message per execution
+        messages = [json.loads(c[0][0]) for c in mock_queue_client.send_message.call_args_list]
+        assert sorted(m["execution_id"] for m in messages) == sorted(execution_ids)
+        assert {m["org_id"] for m in messages} == {"org-a", "org-b"}
+
+    @pytest.mark.asyncio
+    @patch('shared.async_executor.get_execution_logger')
+    async def test_bulk_enqueue_empty(self, mock_get_logger):
+        """Test bulk enqueue with no requests does nothing"""
+        assert await enqueue_workflow_executions([]) == []
+        assert not mock_get_logger.called
+
+
+class TestSharedQueueClient:
+    """Test the process-wide queue client used for enqueues"""
+
+    def test_new_event_loop_closes_stale_client(self):
+        """Should close the previous loop's client before creating a new one"""
+        key = ("UseDevelopmentStorage=true;shared-client-test", "workflow-executions")
+        clients = []
+
+        def from_connection_string(*args, **kwargs):
+            client = MagicMock()
+            client.create_queue = AsyncMock()
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+
+        async def enter():
+            return await async_executor.SharedQueueClientContextManager(*key).__aenter__()
+
+        try:
+            with patch("shared.async_executor.QueueClient.from_connection_string",
+                       side_effect=from_connection_string):
+                first = asyncio.run(enter())
+                second = asyncio.run(enter())
+        finally:
+            async_executor._shared_queue_clients.pop(key, None)
+            async_executor._ensured_queues.discard(key)
+
+        assert first is clients[0] and second is clients[1]
+        first.close.assert_awaited_once()
+        second.close.assert_not_awaited()
+        first.create_queue.assert_awaited_once()
+        second.create_queue.assert_not_awaited()
+
+
 class TestQueueMessageProcessing:
     """Test that worker can process queue messages correctly"""
 
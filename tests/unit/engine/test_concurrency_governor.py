@@ -0,0 +1,227 @@
+"""
+Unit tests for the concurrency governor
+
+Tests limit resolution, the process and table-storage backends, and
+deferral in the queue worker. Table storage is replaced by an in-memory fake.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+from shared import concurrency_governor
+from shared.concurrency_governor import (
+    ConcurrencyLimit,
+    ProcessConcurrencyGovernor,
+    TableConcurrencyGovernor,
+    limits_for_workflow,
+    parse_integration_limits,
+)
+from shared.decorators import workflow
+from shared.discovery import WorkflowMetadata
+
+
+class FakeLeaseTable:
+    """In-memory stand-in for the table service used by lease rows"""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.versions: dict[str, int] = {}
+
+    async def get_entity(self, partition_key, row_key):
+        row = self.rows.get(row_key)
+        if row is None:
+            return None
+        return {**row, "etag": self.versions[row_key]}
+
+    async def insert_entity(self, entity):
+        if entity["RowKey"] in self.rows:
+            raise ResourceExistsError("exists")
+        self.rows[entity["RowKey"]] = dict(entity)
+        self.versions[entity["RowKey"]] = 1
+        return entity
+
+    async def update_entity_with_etag(self, entity):
+        etag = entity.pop("etag")
+        if self.versions.get(entity["RowKey"]) != etag:
+            raise ResourceModifiedError("modified")
+        self.rows[entity["RowKey"]] = dict(entity)
+        self.versions[entity["RowKey"]] += 1
+        return entity
+
+    async def delete_entity(self, partition_key, row_key, etag=None):
+        if etag is not None and self.versions.get(row_key) != etag:
+            raise ResourceModifiedError("modified")
+        self.rows.pop(row_key, None)
+        return True
+
+    def take_over(self, row_key, holder):
+        """Another worker claims the row after it expired"""
+        self.rows[row_key]["Holder"] = holder
+        self.versions[row_key] += 1
+
+
+class TestLimits:
+    """Test limit declaration and resolution"""
+
+    def test_parse_integration_limits(self):
+        assert parse_integration_limits("HaloPSA=5, msgraph=20") == {"halopsa": 5, "msgraph": 20}
+        assert parse_integration_limits(None) == {}
+
+    @pytest.mark.parametrize("value", ["halopsa", "halopsa=0", "=3", "halopsa=x"])
+    def test_invalid_integration_limits(self, value):
+        with pytest.raises(ValueError):
+            parse_integration_limits(value)
+
+    def test_limits_for_workflow(self, monkeypatch):
+        monkeypatch.setattr(concurrency_governor, "INTEGRATION_LIMITS", {"halopsa": 5})
+        metadata = WorkflowMetadata(
+            name="sync_users", description="Sync", max_concurrency=3, integrations=["HaloPSA", "unlimited"]
+        )
+
+        assert limits_for_workflow(metadata) == [
+            ConcurrencyLimit("integration:halopsa", 5),
+            ConcurrencyLimit("workflow:sync_users", 3),
+        ]
+
+    def test_decorator_options(self):
+        @workflow(name="limited_wf", description="Limited", max_concurrency=2, integrations=["HaloPSA"])
+        async def limited_wf(context):
+            pass
+
+        assert limited_wf._workflow_metadata.max_concurrency == 2
+        assert limited_wf._workflow_metadata.integrations == ["halopsa"]
+
+    def test_decorator_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            workflow(name="bad_wf", description="Bad", max_concurrency=0)
+
+
+class TestProcessGovernor:
+    """Test the in-process backend"""
+
+    async def test_all_or_nothing(self):
+        governor = ProcessConcurrencyGovernor()
+        shared_limit = ConcurrencyLimit("integration:halopsa", 1)
+
+        first = await governor.try_acquire([shared_limit, ConcurrencyLimit("workflow:a", 5)], "exec-1")
+        assert first is not None
+
+        # Second execution is blocked by the shared integration limit and holds nothing
+        assert await governor.try_acquire([shared_limit, ConcurrencyLimit("workflow:b", 5)], "exec-2") is None
+        assert governor.get_stats()["inUse"] == {"integration:halopsa": 1, "workflow:a": 1}
+
+        await first.release()
+        await first.release()
+        assert governor.get_stats()["inUse"] == {}
+        assert await governor.try_acquire([shared_limit], "exec-2") is not None
+
+
+class TestTableGovernor:
+    """Test the table-storage lease backend"""
+
+    @pytest.fixture
+    def table(self, monkeypatch):
+        fake = FakeLeaseTable()
+        monkeypatch.setattr(TableConcurrencyGovernor, "_service", lambda self: fake)
+        return fake
+
+    async def test_slots_are_shared_between_governors(self, table):
+        limit = ConcurrencyLimit("workflow:sync_users", 2)
+        worker_a, worker_b = TableConcurrencyGovernor(), TableConcurrencyGovernor()
+
+        lease_1 = await worker_a.try_acquire([limit], "exec-1")
+        lease_2 = await worker_b.try_acquire([limit], "exec-2")
+
+        assert lease_1 is not None and lease_2 is not None
+        assert await worker_b.try_acquire([limit], "exec-3") is None
+
+        await lease_1.release()
+        assert len(table.rows) == 1
+        assert await worker_b.try_acquire([limit], "exec-3") is not None
+
+    async def test_expired_lease_is_taken_over(self, table):
+        limit = ConcurrencyLimit("workflow:sync_users", 1)
+        table.rows["lease:workflow:sync_users:0"] = {
+            "RowKey": "lease:workflow:sync_users:0",
+            "Holder": "crashed-exec",
+            "ExpiresAt": (datetime.utcnow() - timedelta(seconds=5)).isoformat()
+        }
+        table.versions["lease:workflow:sync_users:0"] = 1
+
+        lease = await TableConcurrencyGovernor().try_acquire([limit], "exec-1")
+
+        assert lease is not None
+        assert table.rows["lease:workflow:sync_users:0"]["Holder"] == "exec-1"
+        await lease.release()
+
+    async def test_partial_claims_are_released(self, table):
+        governor = TableConcurrencyGovernor()
+        full = ConcurrencyLimit("integration:halopsa", 1)
+        held = await governor.try_acquire([full], "exec-1")
+
+        assert await governor.try_acquire([ConcurrencyLimit("a:first", 1), full], "exec-2") is None
+        assert set(table.rows) == {"lease:integration:halopsa:0"}
+        await held.release()
+
+    async def test_renewal_extends_only_held_slots(self, table):
+        governor = TableConcurrencyGovernor()
+        lease = await governor.try_acquire(
+            [ConcurrencyLimit("a:first", 1), ConcurrencyLimit("b:second", 1)], "exec-1"
+        )
+        table.rows["lease:a:first:0"]["ExpiresAt"] = "2000-01-01T00:00:00"
+        table.rows["lease:b:second:0"]["ExpiresAt"] = "2000-01-01T00:00:00"
+        table.take_over("lease:b:second:0", "exec-2")
+
+        await governor._renew_once(lease)
+
+        assert table.rows["lease:a:first:0"]["ExpiresAt"] > datetime.utcnow().isoformat()
+        # The taken-over slot keeps its new holder's row untouched and is dropped from the lease
+        assert table.rows["lease:b:second:0"]["Holder"] == "exec-2"
+        assert table.rows["lease:b:second:0"]["ExpiresAt"] == "2000-01-01T00:00:00"
+        assert lease.slots == ["lease:a:first:0"]
+        await lease.release()
+
+    async def test_release_keeps_slot_taken_over_after_read(self, table, monkeypatch):
+        governor = TableConcurrencyGovernor()
+        lease = await governor.try_acquire([ConcurrencyLimit("workflow:wf", 1)], "exec-1")
+        read = table.get_entity
+
+        async def read_then_take_over(partition_key, row_key):
+            entity = await read(partition_key, row_key)
+            table.take_over(row_key, "exec-2")
+            return entity
+
+        monkeypatch.setattr(table, "get_entity", read_then_take_over)
+        await lease.release()
+
+        assert table.rows["lease:workflow:wf:0"]["Holder"] == "exec-2"
+
+
+class TestWorkerDeferral:
+    """Test that the worker defers executions over a concurrency limit"""
+
+    async def test_full_limit_defers_without_running(self, monkeypatch):
+        from functions.queue import worker
+
+        governor = ProcessConcurrencyGovernor()
+        monkeypatch.setattr(worker, "get_concurrency_governor", lambda: governor)
+        metadata = WorkflowMetadata(name="sync_users", description="Sync", max_concurrency=1)
+        held = await governor.try_acquire(limits_for_workflow(metadata), "exec-running")
+
+        message = {"execution_id": "exec-2", "workflow_name": "sync_users", "org_id": "org-a"}
+        with patch.object(worker, "load_workflow", return_value=(None, metadata)), \
+                patch.object(worker, "_run_workflow_execution", new_callable=AsyncMock) as mock_run, \
+                patch("shared.async_executor.requeue_workflow_execution", new_callable=AsyncMock) as mock_requeue:
+            await worker.handle_workflow_execution(message)
+
+            mock_run.assert_not_called()
+            mock_requeue.assert_called_once()
+
+            await held.release()
+            await worker.handle_workflow_execution(message)
+
+        mock_run.assert_called_once_with(message)
+        assert governor.get_stats()["inUse"] == {}
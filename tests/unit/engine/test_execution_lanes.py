@@ -0,0 +1,193 @@
+"""
+Unit tests for execution lanes
+
+Tests lane routing, per-organization caps with deferral, and lane metrics.
+Queues, storage and the engine are mocked.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from shared import execution_lanes
+from shared.async_executor import ExecutionRequest, enqueue_workflow_execution, enqueue_workflow_executions
+from shared.context import ExecutionContext, Organization
+from shared.execution_lanes import (
+    LANE_BULK,
+    LANE_INTERACTIVE,
+    LANE_SCHEDULED,
+    get_lane_metrics,
+    queue_for_lane,
+    record_start,
+    release_org_slot,
+    try_acquire_org_slot,
+)
+from shared.handlers.metrics_handlers import get_queue_metrics
+
+
+@pytest.fixture(autouse=True)
+def lane_state(monkeypatch):
+    """Fresh slots/metrics and known per-org caps"""
+    monkeypatch.setattr(execution_lanes, "ORG_CONCURRENCY_LIMITS", {
+        LANE_INTERACTIVE: 0,
+        LANE_SCHEDULED: 2,
+        LANE_BULK: 1,
+    })
+    execution_lanes.reset_lane_state()
+    yield
+    execution_lanes.reset_lane_state()
+
+
+@pytest.fixture
+def mock_queue():
+    """Patch get_queue_client, recording the queue each message goes to"""
+    sent: list[tuple[str, dict, dict]] = []
+
+    def get_client(shared=False, queue_name="workflow-executions"):
+        queue_client = MagicMock()
+
+        async def send_message(message, **kwargs):
+            sent.append((queue_name, json.loads(message), kwargs))
+
+        queue_client.send_message = send_message
+        context_manager = MagicMock()
+        context_manager.__aenter__ = AsyncMock(return_value=queue_client)
+        context_manager.__aexit__ = AsyncMock(return_value=False)
+        return context_manager
+
+    with patch("shared.async_executor.get_queue_client", side_effect=get_client), \
+            patch("shared.async_executor.get_execution_logger") as mock_get_logger, \
+            patch("shared.webpubsub_broadcaster.WebPubSubBroadcaster"):
+        exec_logger = MagicMock()
+        exec_logger.create_execution = AsyncMock()
+        exec_logger.create_executions = AsyncMock()
+        mock_get_logger.return_value = exec_logger
+        yield sent
+
+
+def _context(org_id: str) -> ExecutionContext:
+    return ExecutionContext(
+        user_id="user-1",
+        email="user@example.com",
+        name="User",
+        scope=org_id,
+        organization=Organization(id=org_id, name=org_id),
+        is_platform_admin=False,
+        is_function_key=False,
+        execution_id=f"ctx-{org_id}"
+    )
+
+
+class TestLaneRouting:
+    """Test that enqueues go to the lane's queue"""
+
+    def test_unknown_lane(self):
+        with pytest.raises(ValueError, match="Unknown execution lane"):
+            queue_for_lane("urgent")
+
+    async def test_single_enqueue_defaults_to_interactive(self, mock_queue):
+        await enqueue_workflow_execution(_context("org-a"), "wf", {})
+
+        queue_name, message, _ = mock_queue[0]
+        assert queue_name == "workflow-executions"
+        assert message["lane"] == LANE_INTERACTIVE
+        assert message["enqueued_at"]
+
+    async def test_scheduled_lane(self, mock_queue):
+        await enqueue_workflow_execution(_context("org-a"), "wf", {}, lane=LANE_SCHEDULED)
+
+        assert mock_queue[0][0] == "workflow-executions-scheduled"
+
+    async def test_bulk_enqueue_uses_each_request_lane(self, mock_queue):
+        await enqueue_workflow_executions([
+            ExecutionRequest(context=_context("org-a"), workflow_name="wf", parameters={}, lane=LANE_BULK),
+            ExecutionRequest(context=_context("org-b"), workflow_name="wf", parameters={}),
+        ])
+
+        assert sorted(queue for queue, _, _ in mock_queue) == ["workflow-executions", "workflow-executions-bulk"]
+
+
+class TestOrgSlots:
+    """Test per-organization caps"""
+
+    def test_cap_per_org_and_lane(self):
+        assert try_acquire_org_slot(LANE_BULK, "org-a")
+        assert not try_acquire_org_slot(LANE_BULK, "org-a")
+
+        # Other orgs and lanes are unaffected
+        assert try_acquire_org_slot(LANE_BULK, "org-b")
+        assert try_acquire_org_slot(LANE_SCHEDULED, "org-a")
+
+        release_org_slot(LANE_BULK, "org-a")
+        assert try_acquire_org_slot(LANE_BULK, "org-a")
+
+    def test_interactive_is_unlimited(self):
+        assert all(try_acquire_org_slot(LANE_INTERACTIVE, "org-a") for _ in range(50))
+
+    def test_metrics(self):
+        try_acquire_org_slot(LANE_BULK, "org-a")
+        try_acquire_org_slot(LANE_BULK, "org-a")
+        record_start(LANE_BULK, (datetime.utcnow() - timedelta(seconds=2)).isoformat())
+
+        bulk = get_lane_metrics()[LANE_BULK]
+
+        assert bulk["running"] == 1
+        assert bulk["deferred"] == 1
+        assert bulk["started"] == 1
+        assert 1900 <= bulk["waitP50Ms"] <= bulk["waitMaxMs"] < 5000
+
+
+class TestWorkerDeferral:
+    """Test that the worker defers messages over their organization's cap"""
+
+    async def test_over_cap_message_is_requeued(self):
+        from functions.queue.worker import handle_workflow_execution
+
+        message = {"execution_id": "exec-2", "org_id": "org-a", "lane": LANE_BULK, "enqueued_at": "2024-01-01T00:00:00"}
+        assert try_acquire_org_slot(LANE_BULK, "org-a")
+
+        with patch("shared.async_executor.requeue_workflow_execution", new_callable=AsyncMock) as mock_requeue, \
+                patch("functions.queue.worker._run_workflow_execution", new_callable=AsyncMock) as mock_run:
+            await handle_workflow_execution(message)
+
+        mock_run.assert_not_called()
+        mock_requeue.assert_called_once_with(message, 1, execution_lanes.FAIR_SHARE_DEFER_SECONDS)
+
+    async def test_slot_released_after_run(self):
+        from functions.queue.worker import handle_workflow_execution
+
+        message = {"execution_id": "exec-1", "org_id": "org-a", "lane": LANE_BULK}
+
+        with patch("functions.queue.worker._run_workflow_execution", new_callable=AsyncMock) as mock_run:
+            await handle_workflow_execution(message)
+            await handle_workflow_execution(message)
+
+        assert mock_run.call_count == 2
+        assert get_lane_metrics()[LANE_BULK]["running"] == 0
+
+
+class TestQueueMetricsHandler:
+    """Test get_queue_metrics"""
+
+    async def test_requires_platform_admin(self):
+        context = Mock(spec=ExecutionContext)
+        context.is_platform_admin = False
+
+        with pytest.raises(PermissionError):
+            await get_queue_metrics(context)
+
+    async def test_combines_depths_and_lane_metrics(self):
+        context = Mock(spec=ExecutionContext)
+        context.is_platform_admin = True
+
+        with patch("shared.execution_lanes.get_queue_depths", new_callable=AsyncMock) as mock_depths:
+            mock_depths.return_value = {LANE_INTERACTIVE: 3, LANE_SCHEDULED: 0, LANE_BULK: None}
+            metrics = await get_queue_metrics(context)
+
+        lanes = {lane["lane"]: lane for lane in metrics["lanes"]}
+        assert lanes[LANE_INTERACTIVE]["depth"] == 3
+        assert lanes[LANE_BULK]["depth"] is None
+        assert lanes[LANE_BULK]["orgConcurrencyLimit"] == 1
+        assert lanes[LANE_BULK]["queue"] == "workflow-executions-bulk"
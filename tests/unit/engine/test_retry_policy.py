@@ -0,0 +1,224 @@
+"""
+Unit tests for workflow retry policies
+
+Tests policy parsing, backoff delays, delayed requeue and the queue
+worker's retry path. Storage, queue and engine are mocked.
+"""
+
+import json
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.async_executor import requeue_workflow_execution
+from shared.decorators import workflow
+from shared.engine import ExecutionResult
+from shared.models import ExecutionStatus
+from shared.retry_policy import WorkflowRetryPolicy, parse_retry_policy
+
+
+class TestParseRetryPolicy:
+    """Test retry_policy parsing and validation"""
+
+    def test_none_without_policy(self):
+        assert parse_retry_policy(None) is None
+        assert parse_retry_policy({}) is None
+
+    def test_accepts_snake_and_camel_case(self):
+        policy = parse_retry_policy({"max_attempts": 5, "backoffSeconds": 3, "maxBackoffSeconds": 30})
+
+        assert policy == WorkflowRetryPolicy(max_attempts=5, backoff_seconds=3, max_backoff_seconds=30)
+
+    def test_retry_on_classes_become_names(self):
+        policy = parse_retry_policy({"retry_on": [TimeoutError, "HTTPError"]})
+
+        assert policy is not None
+        assert policy.retry_on == ("TimeoutError", "HTTPError")
+
+    @pytest.mark.parametrize("data", [
+        {"max_attempts": 0},
+        {"max_attempts": 11},
+        {"backoff_seconds": 0},
+        {"backoff_seconds": 10, "max_backoff_seconds": 5},
+        {"unknown": True},
+    ])
+    def test_invalid_policy(self, data):
+        with pytest.raises(ValueError):
+            parse_retry_policy(data)
+
+    def test_decorator_normalizes_policy(self):
+        @workflow(name="retrying_wf", description="Retries", retry_policy={"max_attempts": 4, "retry_on": ConnectionError})
+        async def retrying_wf(context):
+            pass
+
+        assert retrying_wf._workflow_metadata.retry_policy == {
+            "max_attempts": 4,
+            "backoff_seconds": 2,
+            "max_backoff_seconds": 60,
+            "retry_on": ["ConnectionError"],
+            "jitter": True,
+        }
+
+    def test_decorator_rejects_invalid_policy(self):
+        with pytest.raises(ValueError):
+            workflow(name="bad_retry_wf", description="Bad", retry_policy={"max_attempts": 0})
+
+
+class TestRetryDecisions:
+    """Test should_retry and backoff_delay"""
+
+    def test_stops_at_max_attempts(self):
+        policy = WorkflowRetryPolicy(max_attempts=3)
+
+        assert policy.should_retry(1, "RuntimeError")
+        assert policy.should_retry(2, "RuntimeError")
+        assert not policy.should_retry(3, "RuntimeError")
+
+    def test_retry_on_filters_error_types(self):
+        policy = WorkflowRetryPolicy(retry_on=("TimeoutError",))
+
+        assert policy.should_retry(1, "TimeoutError")
+        assert not policy.should_retry(1, "ValueError")
+
+    def test_exponential_backoff_without_jitter(self):
+        policy = WorkflowRetryPolicy(backoff_seconds=2, max_backoff_seconds=10, jitter=False)
+
+        assert [policy.backoff_delay(n) for n in range(1, 5)] == [2, 4, 8, 10]
+
+    def test_jitter_stays_within_half_and_full_delay(self):
+        policy = WorkflowRetryPolicy(backoff_seconds=8, max_backoff_seconds=60)
+        rng = random.Random(42)
+
+        delays = {policy.backoff_delay(3, rng) for _ in range(200)}
+
+        assert min(delays) >= 16
+        assert max(delays) <= 32
+        assert len(delays) > 1
+
+
+class TestRequeue:
+    """Test requeue_workflow_execution"""
+
+    @patch("shared.async_executor.get_queue_client")
+    async def test_sends_with_visibility_delay(self, mock_get_queue_client):
+        queue_client = MagicMock()
+        queue_client.send_message = AsyncMock()
+        context_manager = MagicMock()
+        context_manager.__aenter__ = AsyncMock(return_value=queue_client)
+        context_manager.__aexit__ = AsyncMock(return_value=False)
+        mock_get_queue_client.return_value = context_manager
+
+        await requeue_workflow_execution({"execution_id": "exec-1", "workflow_name": "wf"}, 2, 30)
+
+        mock_get_queue_client.assert_called_once_with(shared=True, queue_name="workflow-executions")
+        message, = queue_client.send_message.call_args.args
+        assert json.loads(message) == {"execution_id": "exec-1", "workflow_name": "wf", "attempt": 2}
+        assert queue_client.send_message.call_args.kwargs == {"visibility_timeout": 30}
+
+
+MESSAGE = {
+    "execution_id": "exec-1",
+    "workflow_name": "flaky_wf",
+    "org_id": None,
+    "user_id": "user-1",
+    "user_name": "User",
+    "user_email": "user@example.com",
+    "parameters": {},
+}
+
+
+@pytest.fixture
+def worker_env():
+    """Patch the worker's storage, config, workflow loading and engine"""
+    from shared.discovery import WorkflowMetadata
+
+    metadata = WorkflowMetadata(
+        name="flaky_wf",
+        description="Flaky",
+        retry_policy={"max_attempts": 2, "retry_on": ["ConnectionError"]}
+    )
+    exec_logger = MagicMock()
+    exec_logger.update_execution = AsyncMock()
+    exec_repo = MagicMock()
+    exec_repo.get_execution_status = AsyncMock(return_value="Running")
+    exec_repo.close = AsyncMock()
+
+    with patch("functions.queue.worker.get_execution_logger", return_value=exec_logger), \
+            patch("functions.queue.worker.ExecutionRepository", return_value=exec_repo), \
+            patch("functions.queue.worker.load_config_for_partition", new_callable=AsyncMock, return_value={}), \
+            patch("functions.queue.worker.load_workflow", return_value=(MagicMock(), metadata)), \
+            patch("functions.queue.worker.execute", new_callable=AsyncMock) as mock_execute, \
+            patch("shared.webpubsub_broadcaster.WebPubSubBroadcaster"), \
+            patch("shared.async_executor.requeue_workflow_execution", new_callable=AsyncMock) as mock_requeue:
+        yield {"logger": exec_logger, "execute": mock_execute, "requeue": mock_requeue}
+
+
+def _failed(error_type: str) -> ExecutionResult:
+    return ExecutionResult(
+        execution_id="exec-1",
+        status=ExecutionStatus.FAILED,
+        result=None,
+        duration_ms=5,
+        error_message="upstream unavailable",
+        error_type=error_type
+    )
+
+
+class TestWorkerRetries:
+    """Test the queue worker's retry path"""
+
+    async def test_retryable_failure_is_requeued(self, worker_env):
+        from functions.queue.worker import handle_workflow_execution
+
+        worker_env["execute"].return_value = _failed("ConnectionError")
+
+        await handle_workflow_execution(dict(MESSAGE))
+
+        worker_env["requeue"].assert_called_once()
+        message, attempt, delay = worker_env["requeue"].call_args.args
+        assert message["execution_id"] == "exec-1"
+        assert attempt == 2
+        assert 1 <= delay <= 2
+
+        final = worker_env["logger"].update_execution.call_args.kwargs
+        assert final["status"] == ExecutionStatus.PENDING
+        assert final["attempt"]["attempt"] == 1
+        assert final["attempt"]["retryDelaySeconds"] == delay
+
+    async def test_retried_attempt_keeps_its_logs_and_variables(self, worker_env):
+        from functions.queue.worker import handle_workflow_execution
+
+        result = _failed("ConnectionError")
+        result.logs = [{"level": "error", "message": "connect failed"}]
+        result.variables = {"host": "api"}
+        worker_env["execute"].return_value = result
+
+        await handle_workflow_execution(dict(MESSAGE))
+
+        final = worker_env["logger"].update_execution.call_args.kwargs
+        assert final["status"] == ExecutionStatus.PENDING
+        assert final["logs"] == result.logs
+        assert final["variables"] == result.variables
+
+    async def test_last_attempt_fails_execution(self, worker_env):
+        from functions.queue.worker import handle_workflow_execution
+
+        worker_env["execute"].return_value = _failed("ConnectionError")
+
+        await handle_workflow_execution({**MESSAGE, "attempt": 2})
+
+        worker_env["requeue"].assert_not_called()
+        final = worker_env["logger"].update_execution.call_args.kwargs
+        assert final["status"] == ExecutionStatus.FAILED
+        assert final["attempt"]["attempt"] == 2
+
+    async def test_non_retryable_error_fails_execution(self, worker_env):
+        from functions.queue.worker import handle_workflow_execution
+
+        worker_env["execute"].return_value = _failed("ValueError")
+
+        await handle_workflow_execution(dict(MESSAGE))
+
+        worker_env["requeue"].assert_not_called()
+        assert worker_env["logger"].update_execution.call_args.kwargs["status"] == ExecutionStatus.FAILED
@@ -0,0 +1,137 @@
+"""
+Unit tests for the workflow process pool
+
+Runs real spawned worker processes against a temporary workspace.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from shared.context import Caller, Organization
+from shared.decorators import workflow
+from shared.engine import ExecutionRequest
+from shared.models import ExecutionStatus
+from shared.workflow_process_pool import (
+    WorkflowProcessPool,
+    execute_in_process,
+    shutdown_workflow_process_pool,
+)
+
+WORKFLOW_SOURCE = '''
+import os
+import time
+
+from shared.decorators import workflow
+
+
+@workflow(name="pool_compute", description="Runs in the pool", isolation="process")
+async def pool_compute(context, value: int):
+    return {"pid": os.getpid(), "double": value * 2, "org": context.org_id}
+
+
+@workflow(name="pool_blocking", description="Blocks the process", isolation="process")
+async def pool_blocking(context):
+    time.sleep(60)
+
+
+@workflow(name="pool_failing", description="Raises", isolation="process")
+async def pool_failing(context):
+    raise RuntimeError("boom")
+'''
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Workspace with process-isolated workflows (children inherit the environment)"""
+    (tmp_path / "pool_workflows.py").write_text(WORKFLOW_SOURCE)
+    monkeypatch.setenv("BIFROST_WORKSPACE_LOCATION", str(tmp_path))
+    monkeypatch.setattr("shared.workflow_process_pool._pool", WorkflowProcessPool(size=1))
+    yield tmp_path
+    shutdown_workflow_process_pool()
+
+
+def _request(name: str, parameters: dict | None = None) -> ExecutionRequest:
+    return ExecutionRequest(
+        execution_id=f"exec-{name}",
+        caller=Caller(user_id="user", email="user@example.com", name="User"),
+        organization=Organization(id="org-1", name="Org One"),
+        config={},
+        name=name,
+        tags=["workflow"],
+        parameters=parameters or {}
+    )
+
+
+class TestIsolationMetadata:
+    """Test the @workflow isolation option"""
+
+    def test_defaults_to_none(self):
+        """Should run inline unless requested"""
+        @workflow(name="inline_wf", description="Inline")
+        async def inline_wf(context):
+            pass
+
+        assert inline_wf._workflow_metadata.isolation == "none"
+
+    def test_process_isolation(self):
+        """Should record process isolation"""
+        @workflow(name="isolated_wf", description="Isolated", isolation="process")
+        async def isolated_wf(context):
+            pass
+
+        assert isolated_wf._workflow_metadata.isolation == "process"
+
+    def test_invalid_isolation_rejected(self):
+        """Should reject unknown isolation modes at decoration time"""
+        with pytest.raises(ValueError, match="Invalid isolation 'thread'"):
+            @workflow(name="bad_isolation_wf", description="Bad", isolation="thread")  # type: ignore[arg-type]
+            async def bad_isolation_wf(context):
+                pass
+
+
+class TestProcessExecution:
+    """Test executing workflows in worker processes"""
+
+    async def test_runs_in_child_process(self, workspace):
+        """Should execute in another process with the request's context"""
+        result = await execute_in_process(_request("pool_compute", {"value": 21}))
+
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.result["double"] == 42
+        assert result.result["org"] == "org-1"
+        assert result.result["pid"] != os.getpid()
+
+    async def test_workflow_error_returns_failed_result(self, workspace):
+        """Should surface workflow exceptions as a FAILED result"""
+        result = await execute_in_process(_request("pool_failing"))
+
+        assert result.status == ExecutionStatus.FAILED
+        assert result.error_type == "RuntimeError"
+        assert result.error_message == "boom"
+
+    async def test_unknown_workflow(self, workspace):
+        """Should fail when the child cannot load the workflow"""
+        result = await execute_in_process(_request("does_not_exist"))
+
+        assert result.status == ExecutionStatus.FAILED
+        assert result.error_type == "WorkflowProcessError"
+
+    async def test_cancel_kills_blocking_workflow(self, workspace):
+        """Should hard-kill a process stuck in blocking code when cancelled"""
+        from shared import workflow_process_pool
+
+        task = asyncio.create_task(execute_in_process(_request("pool_blocking")))
+        await asyncio.sleep(0.5)
+        (proc,) = workflow_process_pool._pool._busy
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert time.monotonic() - started < 10
+        assert not proc.is_alive()
+        assert not workflow_process_pool._pool._busy
@@ -1,13 +1,16 @@
 """
 Unit tests for executions handlers
 
-Tests business logic for execution queries and filtering.
+Tests business logic for execution queries and filtering, and the
+?tail= mode of the execution logs endpoint.
 Uses AsyncMock for async functions and mocks repositories.
 """
 
+import inspect
+import json
 import uuid
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -266,3 +269,69 @@ class TestFilterFunctions:
         executions = [{'id': i} for i in range(5)]
         result = apply_limit(executions, 0)
         assert len(result) == 0
+
+
+class TestExecutionLogsTailEndpoint:
+    """GET /api/executions/{executionId}/logs?tail=N"""
+
+    @pytest.fixture
+    def logs_endpoint(self):
+        """The route function below its auth decorator, with storage mocked"""
+        from functions.http.executions import get_execution_logs
+
+        blob_service = MagicMock()
+        blob_service.get_logs_tail = AsyncMock(return_value=None)
+        logs_repo = MagicMock()
+        logs_repo.get_logs = AsyncMock(return_value=[])
+        logs_repo.get_latest_logs = AsyncMock(return_value=[])
+
+        with patch(
+            "shared.handlers.executions_handlers._get_and_authorize_execution",
+            new_callable=AsyncMock, return_value=(Mock(), None)
+        ), patch("shared.handlers.executions_handlers.get_blob_service", return_value=blob_service), \
+                patch("shared.repositories.execution_logs.get_execution_logs_repository", return_value=logs_repo):
+            yield inspect.unwrap(get_execution_logs._function.get_user_function()), blob_service, logs_repo
+
+    @staticmethod
+    def _request(context, params):
+        req = MagicMock()
+        req.context = context
+        req.route_params = {"executionId": "exec-1"}
+        req.params = params
+        return req
+
+    async def test_tail_reads_range_from_logs_blob(self, logs_endpoint, mock_context):
+        endpoint, blob_service, logs_repo = logs_endpoint
+        blob_service.get_logs_tail.return_value = [
+            {"timestamp": "2024-01-01T00:00:01", "level": "debug", "message": "detail", "source": "workflow"},
+            {"timestamp": "2024-01-01T00:00:02", "level": "info", "message": "done", "source": "workflow"},
+        ]
+
+        response = await endpoint(self._request(mock_context, {"tail": "2"}))
+
+        assert response.status_code == 200
+        assert [log["message"] for log in json.loads(response.get_body())] == ["done"]
+        blob_service.get_logs_tail.assert_awaited_once_with("exec-1", 2)
+        logs_repo.get_logs.assert_not_called()
+
+    async def test_tail_of_running_execution_uses_tail_rows(self, logs_endpoint, mock_context_admin):
+        endpoint, blob_service, logs_repo = logs_endpoint
+        logs_repo.get_latest_logs.return_value = [{
+            "ExecutionLogId": "log-9", "RowKey": "2024-01-01T00:00:09.000000Z-0009",
+            "Level": "INFO", "Message": "still running"
+        }]
+
+        response = await endpoint(self._request(mock_context_admin, {"tail": "5"}))
+
+        assert response.status_code == 200
+        assert json.loads(response.get_body())[0]["executionLogId"] == "log-9"
+        logs_repo.get_latest_logs.assert_awaited_once_with("exec-1", 5)
+
+    @pytest.mark.parametrize("tail", ["0", "abc", "-3", "5001"])
+    async def test_invalid_tail(self, logs_endpoint, mock_context, tail):
+        endpoint, blob_service, logs_repo = logs_endpoint
+
+        response = await endpoint(self._request(mock_context, {"tail": tail}))
+
+        assert response.status_code == 400
+        blob_service.get_logs_tail.assert_not_called()
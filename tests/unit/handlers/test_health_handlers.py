@@ -6,15 +6,27 @@ Tests health check logic with mocked dependencies
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from shared.handlers import health_handlers
 from shared.handlers.health_handlers import (
     check_api_health,
     check_keyvault_health,
+    clear_keyvault_health_cache,
     perform_general_health_check,
     perform_keyvault_health_check,
 )
 from shared.models import GeneralHealthResponse, HealthCheck, KeyVaultHealthResponse
 
 
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Each test probes Key Vault afresh"""
+    clear_keyvault_health_cache()
+    yield
+    clear_keyvault_health_cache()
+
+
 class TestCheckApiHealth:
     """Tests for check_api_health"""
 
@@ -425,3 +437,52 @@ class TestIntegration:
         # Specific health with no manager
         specific_response = await perform_keyvault_health_check(None)
         assert specific_response.status == "unhealthy"
+
+
+class TestKeyVaultHealthCache:
+    """Tests for the cached Key Vault probe"""
+
+    def _manager(self):
+        manager = MagicMock()
+        manager.vault_url = "https://test-vault.vault.azure.net/"
+        manager.health_check = AsyncMock(return_value={
+            "status": "healthy",
+            "can_connect": True,
+            "can_list_secrets": True,
+            "can_get_secrets": True,
+            "secret_count": None,
+            "secret_count_truncated": True
+        })
+        return manager
+
+    async def test_probe_is_cached(self):
+        """Repeated polls within the TTL should probe Key Vault once"""
+        manager = self._manager()
+
+        for _ in range(3):
+            response = await perform_general_health_check(manager)
+
+        assert response.status == "healthy"
+        manager.health_check.assert_awaited_once_with(deep=False)
+
+    async def test_probe_expires(self, monkeypatch):
+        """Should probe again once the cached result is older than the TTL"""
+        manager = self._manager()
+        clock = [100.0]
+        monkeypatch.setattr(health_handlers.time, "monotonic", lambda: clock[0])
+
+        await check_keyvault_health(manager)
+        clock[0] += health_handlers.KEYVAULT_HEALTH_CACHE_TTL_SECONDS + 1
+        await check_keyvault_health(manager)
+
+        assert manager.health_check.await_count == 2
+
+    async def test_deep_mode_is_opt_in(self):
+        """Deep checks should run separately from the cached quick probe"""
+        manager = self._manager()
+
+        quick = await perform_keyvault_health_check(manager)
+        await perform_keyvault_health_check(manager, deep=True)
+
+        assert quick.secretCountTruncated is True
+        assert [call.kwargs["deep"] for call in manager.health_check.await_args_list] == [False, True]
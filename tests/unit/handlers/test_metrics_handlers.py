@@ -5,11 +5,12 @@ Tests business logic for dashboard metrics and statistics.
 Uses mocks for discovery and table services.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from shared.handlers import metrics_handlers
 from shared.handlers.metrics_handlers import (
     get_dashboard_metrics,
     get_execution_statistics,
@@ -25,6 +26,13 @@ from shared.context import ExecutionContext
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_metrics_caches():
+    """Reset module-level count caches between tests"""
+    metrics_handlers._data_provider_counts.clear()
+    metrics_handlers._form_count_cache.clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock ExecutionContext"""
@@ -104,26 +112,26 @@ class TestGetReverseTimestamp:
 class TestGetWorkflowMetadata:
     """Tests for get_workflow_metadata function"""
 
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
-    def test_successful_metadata_retrieval(self, mock_scan_providers, mock_scan_workflows):
+    def test_successful_metadata_retrieval(self, mock_scan_providers, mock_workflow_index):
         """Test successful retrieval of workflow metadata"""
         # Create mock workflows and providers
-        mock_scan_workflows.return_value = [Mock() for _ in range(5)]
+        mock_workflow_index.return_value = ("fingerprint", [Mock() for _ in range(5)])
         mock_scan_providers.return_value = [Mock() for _ in range(3)]
 
         result = get_workflow_metadata()
 
         assert result["workflowCount"] == 5
         assert result["dataProviderCount"] == 3
-        mock_scan_workflows.assert_called_once()
+        mock_workflow_index.assert_called_once()
         mock_scan_providers.assert_called_once()
 
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
-    def test_metadata_with_zero_counts(self, mock_scan_providers, mock_scan_workflows):
+    def test_metadata_with_zero_counts(self, mock_scan_providers, mock_workflow_index):
         """Test metadata retrieval with zero counts"""
-        mock_scan_workflows.return_value = []
+        mock_workflow_index.return_value = ("fingerprint", [])
         mock_scan_providers.return_value = []
 
         result = get_workflow_metadata()
@@ -131,11 +139,11 @@ class TestGetWorkflowMetadata:
         assert result["workflowCount"] == 0
         assert result["dataProviderCount"] == 0
 
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
-    def test_metadata_retrieval_exception(self, mock_scan_providers, mock_scan_workflows):
+    def test_metadata_retrieval_exception(self, mock_scan_providers, mock_workflow_index):
         """Test graceful handling when discovery fails"""
-        mock_scan_workflows.side_effect = Exception("Discovery error")
+        mock_workflow_index.side_effect = Exception("Discovery error")
 
         result = get_workflow_metadata()
 
@@ -407,19 +415,19 @@ class TestGetDashboardMetrics:
     """Tests for get_dashboard_metrics function"""
 
     @pytest.mark.asyncio
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
     @patch("shared.handlers.metrics_handlers.get_async_table_service")
     async def test_successful_metrics_aggregation(
         self,
         mock_get_async_table_service,
         mock_scan_providers,
-        mock_scan_workflows,
+        mock_workflow_index,
         mock_context
     ):
         """Test successful aggregation of all metrics"""
         # Setup discovery mocks
-        mock_scan_workflows.return_value = [Mock() for _ in range(5)]
+        mock_workflow_index.return_value = ("fingerprint", [Mock() for _ in range(5)])
         mock_scan_providers.return_value = [Mock() for _ in range(3)]
 
         # Setup table service mock
@@ -429,6 +437,7 @@ class TestGetDashboardMetrics:
         # Mock form query
         mock_service.query_entities.side_effect = [
             [{"RowKey": "form:1"}, {"RowKey": "form:2"}],
+            [],  # No metrics rollups yet
             []  # For execution statistics query
         ]
 
@@ -443,24 +452,24 @@ class TestGetDashboardMetrics:
         assert "recentFailures" in result
 
     @pytest.mark.asyncio
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
     @patch("shared.handlers.metrics_handlers.get_async_table_service")
     async def test_metrics_with_discovery_failure(
         self,
         mock_get_async_table_service,
         mock_scan_providers,
-        mock_scan_workflows,
+        mock_workflow_index,
         mock_context
     ):
         """Test metrics generation when discovery fails"""
         # Setup discovery to fail
-        mock_scan_workflows.side_effect = Exception("Discovery error")
+        mock_workflow_index.side_effect = Exception("Discovery error")
 
         # Setup table service mock
         mock_service = AsyncMock()
         mock_get_async_table_service.side_effect = make_async_context_manager(mock_service)
-        mock_service.query_entities.side_effect = [[], []]
+        mock_service.query_entities.side_effect = [[], [], []]
 
         result = await get_dashboard_metrics(mock_context)
 
@@ -469,23 +478,23 @@ class TestGetDashboardMetrics:
         assert result["dataProviderCount"] == 0
 
     @pytest.mark.asyncio
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
     @patch("shared.handlers.metrics_handlers.get_async_table_service")
     async def test_metrics_complete_structure(
         self,
         mock_get_async_table_service,
         mock_scan_providers,
-        mock_scan_workflows,
+        mock_workflow_index,
         mock_context
     ):
         """Test complete metrics structure"""
-        mock_scan_workflows.return_value = [Mock() for _ in range(10)]
+        mock_workflow_index.return_value = ("fingerprint", [Mock() for _ in range(10)])
         mock_scan_providers.return_value = [Mock() for _ in range(5)]
 
         mock_service = AsyncMock()
         mock_get_async_table_service.side_effect = make_async_context_manager(mock_service)
-        mock_service.query_entities.side_effect = [[], []]
+        mock_service.query_entities.side_effect = [[], [], []]
 
         result = await get_dashboard_metrics(mock_context)
 
@@ -504,18 +513,18 @@ class TestGetDashboardMetrics:
         assert isinstance(result["recentFailures"], list)
 
     @pytest.mark.asyncio
-    @patch("shared.handlers.metrics_handlers.scan_all_workflows")
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
     @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
     @patch("shared.handlers.metrics_handlers.get_async_table_service")
     async def test_metrics_with_complex_execution_data(
         self,
         mock_get_async_table_service,
         mock_scan_providers,
-        mock_scan_workflows,
+        mock_workflow_index,
         mock_context
     ):
         """Test metrics with complex execution data"""
-        mock_scan_workflows.return_value = [Mock() for _ in range(3)]
+        mock_workflow_index.return_value = ("fingerprint", [Mock() for _ in range(3)])
         mock_scan_providers.return_value = [Mock() for _ in range(2)]
 
         mock_service = AsyncMock()
@@ -529,8 +538,8 @@ class TestGetDashboardMetrics:
             {"Status": "Running", "DurationMs": None}
         ]
 
-        # First call for forms, second for executions
-        mock_service.query_entities.side_effect = [[], executions]
+        # Forms, then metrics rollups (none yet), then the execution scan fallback
+        mock_service.query_entities.side_effect = [[], [], executions]
 
         result = await get_dashboard_metrics(mock_context)
 
@@ -539,3 +548,100 @@ class TestGetDashboardMetrics:
         assert result["executionStats"]["failedCount"] == 1
         assert result["executionStats"]["runningCount"] == 1
         assert result["executionStats"]["successRate"] == 66.7
+
+    @pytest.mark.asyncio
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
+    @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
+    @patch("shared.handlers.metrics_handlers.get_async_table_service")
+    async def test_metrics_from_rollups(
+        self,
+        mock_get_async_table_service,
+        mock_scan_providers,
+        mock_workflow_index,
+        mock_context
+    ):
+        """Test that rollup rows replace the execution scan"""
+        mock_workflow_index.return_value = ("fingerprint", [])
+        mock_scan_providers.return_value = []
+
+        mock_service = AsyncMock()
+        mock_get_async_table_service.side_effect = make_async_context_manager(mock_service)
+
+        rollup = {"RowKey": "all:day:2024-01-15:03", "CountSuccess": 3, "CountFailed": 1, "DurationCount": 4, "DurationTotalMs": 8000}
+        # Forms, rollup rows, then Running and Pending status indexes
+        mock_service.query_entities.side_effect = [[], [rollup], [{"RowKey": "status:Running:a"}], []]
+
+        result = await get_dashboard_metrics(mock_context)
+
+        assert mock_service.query_entities.call_count == 4
+        assert result["executionStats"]["totalExecutions"] == 5
+        assert result["executionStats"]["runningCount"] == 1
+        assert result["executionStats"]["successRate"] == 75.0
+        assert result["executionStats"]["avgDurationSeconds"] == 2.0
+
+    @pytest.mark.asyncio
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
+    @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
+    @patch("shared.handlers.metrics_handlers.get_async_table_service")
+    async def test_days_before_rollups_are_backfilled_once(
+        self,
+        mock_get_async_table_service,
+        mock_scan_providers,
+        mock_workflow_index,
+        mock_context
+    ):
+        """Test that executions from before the first rollup day are merged in by a one-time backfill"""
+        mock_workflow_index.return_value = ("fingerprint", [])
+        mock_scan_providers.return_value = []
+
+        mock_service = AsyncMock()
+        mock_get_async_table_service.side_effect = make_async_context_manager(mock_service)
+        mock_service.get_entity.return_value = None  # No backfill marker yet
+
+        today = datetime.utcnow()
+        live = {"RowKey": f"all:day:{today:%Y-%m-%d}:03", "CountSuccess": 2}
+        finished_before = today - timedelta(days=3)
+        executions = [
+            {"Status": "Success", "CompletedAt": finished_before, "DurationMs": 1000},
+            {"Status": "Failed", "CompletedAt": finished_before, "DurationMs": 1000, "ExecutionId": "exec-old"},
+        ]
+
+        async def insert_entity(entity):
+            inserted.append(dict(entity))
+
+        inserted: list[dict] = []
+        mock_service.insert_entity.side_effect = insert_entity
+
+        # Forms, rollup rows, the one-time execution scan, rollup rows again, Running and Pending indexes
+        responses = [[], [live], executions, lambda: [live, *inserted[:1]], [], []]
+
+        async def query_entities(*args, **kwargs):
+            response = responses.pop(0)
+            return response() if callable(response) else response
+
+        mock_service.query_entities.side_effect = query_entities
+
+        result = await get_dashboard_metrics(mock_context)
+
+        backfill_filter = mock_service.query_entities.call_args_list[2].kwargs["filter"]
+        assert backfill_filter.startswith("RowKey ge 'execution:")
+        assert [row["RowKey"] for row in inserted] == [
+            f"all:day:{finished_before:%Y-%m-%d}:backfill", "backfill"
+        ]
+        assert result["executionStats"]["successCount"] == 3
+        assert result["executionStats"]["failedCount"] == 1
+        assert result["recentFailures"][0]["executionId"] == "exec-old"
+
+    @patch("shared.handlers.metrics_handlers.get_workflow_index")
+    @patch("shared.handlers.metrics_handlers.scan_all_data_providers")
+    def test_data_providers_rescanned_only_on_workspace_change(self, mock_scan_providers, mock_workflow_index):
+        """Test that data provider discovery is cached by workspace fingerprint"""
+        mock_scan_providers.return_value = [Mock()]
+        mock_workflow_index.return_value = ("fingerprint-1", [])
+
+        get_workflow_metadata()
+        get_workflow_metadata()
+        mock_workflow_index.return_value = ("fingerprint-2", [])
+        get_workflow_metadata()
+
+        assert mock_scan_providers.call_count == 2
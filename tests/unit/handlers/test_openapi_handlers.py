@@ -395,8 +395,8 @@ class TestGenerateWorkflowEndpoints:
         """Should initialize paths if not present"""
         spec = {}
 
-        with patch('shared.handlers.openapi_handlers.scan_all_workflows') as mock_scan:
-            mock_scan.return_value = []
+        with patch('shared.handlers.openapi_handlers.get_workflow_index') as mock_index:
+            mock_index.return_value = ("fingerprint", [])
 
             generate_workflow_endpoints(spec)
 
@@ -406,8 +406,8 @@ class TestGenerateWorkflowEndpoints:
         """Should preserve existing paths in spec"""
         spec = {"paths": {"/existing": {"get": {}}}}
 
-        with patch('shared.handlers.openapi_handlers.scan_all_workflows') as mock_scan:
-            mock_scan.return_value = []
+        with patch('shared.handlers.openapi_handlers.get_workflow_index') as mock_index:
+            mock_index.return_value = ("fingerprint", [])
 
             generate_workflow_endpoints(spec)
 
@@ -428,8 +428,8 @@ class TestGenerateWorkflowEndpoints:
         mock_workflow2.endpoint_enabled = False
         mock_workflow2.name = "workflow2"
 
-        with patch('shared.handlers.openapi_handlers.scan_all_workflows') as mock_scan:
-            mock_scan.return_value = [mock_workflow1, mock_workflow2]
+        with patch('shared.handlers.openapi_handlers.get_workflow_index') as mock_index:
+            mock_index.return_value = ("fingerprint", [mock_workflow1, mock_workflow2])
 
             generate_workflow_endpoints(spec)
 
@@ -447,8 +447,8 @@ class TestGenerateWorkflowEndpoints:
         mock_workflow.parameters = []
         mock_workflow.description = "Test workflow"
 
-        with patch('shared.handlers.openapi_handlers.scan_all_workflows') as mock_scan:
-            mock_scan.return_value = [mock_workflow]
+        with patch('shared.handlers.openapi_handlers.get_workflow_index') as mock_index:
+            mock_index.return_value = ("fingerprint", [mock_workflow])
 
             generate_workflow_endpoints(spec)
 
@@ -0,0 +1,195 @@
+"""
+Unit tests for schedule processing
+
+Tests the NextRunAt index in ScheduleRepository and the claim-and-enqueue
+pass shared by the schedule_processor timer and the process endpoint.
+Table storage is replaced by an in-memory fake; enqueueing is mocked.
+"""
+
+import re
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceModifiedError
+
+from shared.discovery import WorkflowMetadata
+from shared.handlers import schedules_handlers
+from shared.handlers.schedules_handlers import run_due_schedules
+from shared.repositories.schedules import INDEX_PARTITION, STATE_PARTITION, ScheduleRepository
+
+NOW = datetime(2024, 1, 15, 10, 0, 0)
+
+
+class FakeConfigTable:
+    """In-memory stand-in for the Config table (supports RowKey range filters)"""
+
+    def __init__(self):
+        self.rows: dict[tuple[str, str], dict] = {}
+        self.versions: dict[tuple[str, str], int] = {}
+        self.queries = 0
+
+    async def get_entity(self, partition_key, row_key):
+        key = (partition_key, row_key)
+        if key not in self.rows:
+            return None
+        return {**self.rows[key], "etag": self.versions[key]}
+
+    async def query_entities(self, filter, select=None):
+        self.queries += 1
+        partition = re.search(r"PartitionKey eq '([^']*)'", filter).group(1)
+        bounds = re.findall(r"RowKey (ge|lt|le) '([^']*)'", filter)
+        checks = {"ge": lambda a, b: a >= b, "lt": lambda a, b: a < b, "le": lambda a, b: a <= b}
+        return [
+            dict(row) for (pk, rk), row in sorted(self.rows.items())
+            if pk == partition and all(checks[op](rk, value) for op, value in bounds)
+        ]
+
+    async def upsert_entity(self, entity, mode="merge"):
+        key = (entity["PartitionKey"], entity["RowKey"])
+        self.rows[key] = {**self.rows.get(key, {}), **entity}
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return entity
+
+    async def update_entity(self, entity, mode="merge"):
+        return await self.upsert_entity(entity)
+
+    async def update_entity_with_etag(self, entity):
+        entity = dict(entity)
+        key = (entity["PartitionKey"], entity["RowKey"])
+        if self.versions.get(key) != entity.pop("etag"):
+            raise ResourceModifiedError("modified")
+        return await self.upsert_entity(entity)
+
+    async def delete_entity(self, partition_key, row_key):
+        return self.rows.pop((partition_key, row_key), None) is not None
+
+    async def close(self):
+        pass
+
+    def index_keys(self):
+        return sorted(rk for pk, rk in self.rows if pk == INDEX_PARTITION)
+
+
+@pytest.fixture
+def table(monkeypatch):
+    fake = FakeConfigTable()
+    monkeypatch.setattr("shared.repositories.base.AsyncTableStorageService", lambda *args, **kwargs: fake)
+    return fake
+
+
+def _workflow(name: str, schedule: str) -> WorkflowMetadata:
+    return WorkflowMetadata(name=name, description=f"{name} description", schedule=schedule)
+
+
+class TestScheduleRepository:
+    """Test schedule state sync and the NextRunAt index"""
+
+    async def test_sync_creates_state_and_index(self, table):
+        results = await ScheduleRepository().sync_schedules(
+            [_workflow("hourly", "0 * * * *"), _workflow("broken", "not cron")], NOW
+        )
+
+        assert results["created"] == 1
+        assert results["errors"][0]["workflow_name"] == "broken"
+        assert table.rows[(STATE_PARTITION, "schedule:hourly")]["NextRunAt"] == "2024-01-15T11:00:00"
+        assert table.index_keys() == ["due:2024-01-15T11:00:00:hourly"]
+
+    async def test_sync_moves_index_on_cron_change_and_removes_stale(self, table):
+        repo = ScheduleRepository()
+        await repo.sync_schedules([_workflow("hourly", "0 * * * *"), _workflow("daily", "0 9 * * *")], NOW)
+
+        results = await repo.sync_schedules([_workflow("hourly", "*/15 * * * *")], NOW)
+
+        assert (results["updated"], results["removed"]) == (1, 1)
+        assert (STATE_PARTITION, "schedule:daily") not in table.rows
+        assert table.index_keys() == ["due:2024-01-15T10:15:00:hourly"]
+
+    async def test_get_due_is_a_range_query(self, table):
+        repo = ScheduleRepository()
+        await repo.sync_schedules([_workflow("every_minute", "* * * * *"), _workflow("hourly", "0 * * * *")], NOW)
+
+        due = await repo.get_due(NOW + timedelta(minutes=1))
+
+        assert [entity["WorkflowName"] for entity in due] == ["every_minute"]
+
+    async def test_claim_only_once(self, table):
+        repo = ScheduleRepository()
+        await repo.sync_schedules([_workflow("every_minute", "* * * * *")], NOW)
+        later = NOW + timedelta(minutes=1)
+
+        assert await repo.claim("every_minute", later) is not None
+        assert await repo.claim("every_minute", later) is None
+        assert table.index_keys() == ["due:2024-01-15T10:02:00:every_minute"]
+
+    async def test_claim_drops_orphaned_index_row(self, table):
+        repo = ScheduleRepository()
+        await repo.sync_schedules([_workflow("hourly", "0 * * * *")], NOW)
+        await repo.upsert({"PartitionKey": INDEX_PARTITION, "RowKey": "due:2024-01-15T09:00:00:hourly", "WorkflowName": "hourly"})
+
+        assert await repo.claim("hourly", NOW, index_row_key="due:2024-01-15T09:00:00:hourly") is None
+        assert table.index_keys() == ["due:2024-01-15T11:00:00:hourly"]
+
+
+class TestRunDueSchedules:
+    """Test the claim-and-enqueue pass"""
+
+    @pytest.fixture(autouse=True)
+    def workflow_index(self, monkeypatch):
+        index = ("fingerprint-1", [_workflow("every_minute", "* * * * *"), _workflow("hourly", "0 * * * *")])
+        monkeypatch.setattr(schedules_handlers, "_synced_fingerprint", None)
+        monkeypatch.setattr(schedules_handlers, "get_workflow_index", lambda: index)
+        return index
+
+    async def test_due_runs_are_enqueued_in_bulk(self, table):
+        await run_due_schedules(MagicMock(), NOW)
+
+        with patch.object(schedules_handlers, "enqueue_workflow_executions", new_callable=AsyncMock) as mock_enqueue:
+            mock_enqueue.return_value = ["exec-1"]
+            results = await run_due_schedules(MagicMock(), NOW + timedelta(minutes=1))
+
+        requests, = mock_enqueue.call_args.args
+        assert [(r.workflow_name, r.lane) for r in requests] == [("every_minute", "scheduled")]
+        assert (results["due"], results["executed"]) == (1, 1)
+
+        state = table.rows[(STATE_PARTITION, "schedule:every_minute")]
+        assert state["LastExecutionId"] == "exec-1"
+        assert state["ExecutionCount"] == 1
+
+    async def test_failed_enqueue_releases_claims(self, table):
+        await run_due_schedules(MagicMock(), NOW)
+        later = NOW + timedelta(minutes=1)
+
+        with patch.object(schedules_handlers, "enqueue_workflow_executions", new_callable=AsyncMock) as mock_enqueue:
+            mock_enqueue.side_effect = RuntimeError("queue unavailable")
+            results = await run_due_schedules(MagicMock(), later)
+
+            assert results["errors"] == [{"workflow_name": "every_minute", "error": "queue unavailable"}]
+            state = table.rows[(STATE_PARTITION, "schedule:every_minute")]
+            assert state["NextRunAt"] == later.isoformat()
+            assert "due:2024-01-15T10:01:00:every_minute" in table.index_keys()
+
+            # The next pass runs the slot that failed to enqueue
+            mock_enqueue.side_effect = None
+            mock_enqueue.return_value = ["exec-1"]
+            results = await run_due_schedules(MagicMock(), later + timedelta(seconds=30))
+
+        assert results["executed"] == 1
+        assert table.rows[(STATE_PARTITION, "schedule:every_minute")]["LastExecutionId"] == "exec-1"
+
+    async def test_release_skipped_when_schedule_moved_on(self, table):
+        repo = ScheduleRepository()
+        await repo.sync_schedules([_workflow("every_minute", "* * * * *")], NOW)
+        claim = await repo.claim("every_minute", NOW + timedelta(minutes=1))
+        assert await repo.claim("every_minute", NOW + timedelta(minutes=2)) is not None
+
+        assert await repo.release_claim("every_minute", claim) is False
+        assert table.rows[(STATE_PARTITION, "schedule:every_minute")]["NextRunAt"] == "2024-01-15T10:03:00"
+
+    async def test_sync_skipped_when_workspace_unchanged(self, table):
+        with patch.object(ScheduleRepository, "sync_schedules", new_callable=AsyncMock) as mock_sync:
+            mock_sync.return_value = {"created": 0, "updated": 0, "removed": 0, "errors": []}
+            await run_due_schedules(MagicMock(), NOW)
+            await run_due_schedules(MagicMock(), NOW)
+
+        mock_sync.assert_called_once()
@@ -0,0 +1,206 @@
+"""
+Unit tests for batch workflow launch logic
+
+Tests fan-out of one workflow across organizations, aggregated batch
+progress and handler error responses. Repositories and the queue are mocked.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.context import ExecutionContext, Organization
+from shared.handlers.workflows_logic import get_workflow_batch_logic, launch_workflow_batch_logic
+from shared.models import Organization as OrganizationModel
+
+NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def admin_context():
+    """Platform admin context"""
+    return ExecutionContext(
+        user_id="admin-user",
+        email="admin@example.com",
+        name="Admin",
+        scope="GLOBAL",
+        organization=None,
+        is_platform_admin=True,
+        is_function_key=False,
+        execution_id="exec-admin"
+    )
+
+
+@pytest.fixture
+def org_user_context():
+    """Regular organization user context"""
+    return ExecutionContext(
+        user_id="org-user",
+        email="user@example.com",
+        name="User",
+        scope="org-a",
+        organization=Organization(id="org-a", name="Org A"),
+        is_platform_admin=False,
+        is_function_key=False,
+        execution_id="exec-user"
+    )
+
+
+@pytest.fixture
+def mock_org_repo():
+    """OrganizationRepository returning two active orgs and one inactive org"""
+    with patch("shared.repositories.organizations.OrganizationRepository") as mock_cls:
+        repo = MagicMock()
+        repo.list_organizations = AsyncMock(return_value=[
+            OrganizationModel(id="org-a", name="Org A", isActive=True, createdBy="seed", createdAt=NOW, updatedAt=NOW),
+            OrganizationModel(id="org-b", name="Org B", isActive=True, createdBy="seed", createdAt=NOW, updatedAt=NOW),
+            OrganizationModel(id="org-off", name="Org Off", isActive=False, createdBy="seed", createdAt=NOW, updatedAt=NOW),
+        ])
+        mock_cls.return_value = repo
+        yield repo
+
+
+@pytest.fixture
+def mock_exec_repo():
+    """ExecutionRepository with batch methods mocked"""
+    with patch("shared.repositories.executions.ExecutionRepository") as mock_cls:
+        repo = MagicMock()
+        repo.create_batch = AsyncMock()
+        repo.get_batch = AsyncMock()
+        mock_cls.return_value = repo
+        yield repo
+
+
+class TestLaunchWorkflowBatch:
+    """Test launch_workflow_batch_logic"""
+
+    async def test_launches_for_each_org(self, admin_context, mock_org_repo, mock_exec_repo):
+        """Should resolve workflow and orgs once and enqueue every target in one call"""
+        with patch("shared.discovery.load_workflow", return_value=(MagicMock(), MagicMock())) as mock_load, \
+                patch("shared.async_executor.enqueue_workflow_executions", new_callable=AsyncMock) as mock_enqueue:
+            mock_enqueue.side_effect = lambda requests: [f"exec-{i}" for i in range(len(requests))]
+
+            result = await launch_workflow_batch_logic(
+                admin_context,
+                "sync_licenses",
+                [{"orgId": "org-a"}, {"orgId": "org-b", "inputData": {"dry_run": False}}],
+                parameters={"dry_run": True, "region": "us"}
+            )
+
+        mock_load.assert_called_once_with("sync_licenses")
+        mock_org_repo.list_organizations.assert_called_once()
+        mock_enqueue.assert_called_once()
+
+        requests = mock_enqueue.call_args[0][0]
+        assert [r.context.org_id for r in requests] == ["org-a", "org-b"]
+        assert requests[0].parameters == {"dry_run": True, "region": "us"}
+        assert requests[1].parameters == {"dry_run": False, "region": "us"}
+        assert {r.batch_id for r in requests} == {result["batchId"]}
+
+        mock_exec_repo.create_batch.assert_called_once()
+        assert mock_exec_repo.create_batch.call_args.kwargs["total"] == 2
+
+        assert result["total"] == 2
+        assert [e["executionId"] for e in result["executions"]] == ["exec-0", "exec-1"]
+        assert result["rejected"] == []
+
+    async def test_rejects_unknown_and_inactive_orgs(self, admin_context, mock_org_repo, mock_exec_repo):
+        """Should skip unknown and inactive orgs and report them"""
+        with patch("shared.discovery.load_workflow", return_value=(MagicMock(), MagicMock())), \
+                patch("shared.async_executor.enqueue_workflow_executions", new_callable=AsyncMock) as mock_enqueue:
+            mock_enqueue.side_effect = lambda requests: [f"exec-{i}" for i in range(len(requests))]
+
+            result = await launch_workflow_batch_logic(
+                admin_context,
+                "sync_licenses",
+                [{"orgId": "org-a"}, {"orgId": "org-off"}, {"orgId": "org-missing"}]
+            )
+
+        assert result["total"] == 1
+        assert result["rejected"] == [
+            {"orgId": "org-off", "reason": "Organization is inactive"},
+            {"orgId": "org-missing", "reason": "Organization not found"},
+        ]
+
+    async def test_unknown_workflow(self, admin_context, mock_org_repo, mock_exec_repo):
+        """Should raise ValueError without writing anything"""
+        with patch("shared.discovery.load_workflow", return_value=None):
+            with pytest.raises(ValueError, match="Workflow not found"):
+                await launch_workflow_batch_logic(admin_context, "missing", [{"orgId": "org-a"}])
+
+        mock_exec_repo.create_batch.assert_not_called()
+
+    async def test_requires_platform_admin(self, org_user_context):
+        """Should reject non-admin callers"""
+        with pytest.raises(PermissionError):
+            await launch_workflow_batch_logic(org_user_context, "sync_licenses", [{"orgId": "org-a"}])
+
+
+class TestWorkflowBatchHandlers:
+    """Test HTTP error responses of the batch handlers"""
+
+    async def test_unexpected_error_returns_500(self, admin_context):
+        """Should report an internal error instead of raising"""
+        from shared.handlers.workflows_handlers import launch_workflow_batch_handler
+
+        req = MagicMock()
+        req.org_context = admin_context
+        req.get_json.return_value = {"workflowName": "sync_licenses", "targets": [{"orgId": "org-a"}]}
+
+        with patch(
+            "shared.handlers.workflows_logic.launch_workflow_batch_logic",
+            new_callable=AsyncMock, side_effect=RuntimeError("queue unavailable")
+        ):
+            response = await launch_workflow_batch_handler(req)
+
+        assert response.status_code == 500
+        assert json.loads(response.get_body())["error"] == "InternalServerError"
+
+    async def test_batch_progress_error_returns_500(self, admin_context):
+        """Should report an internal error when progress can't be loaded"""
+        from shared.handlers.workflows_handlers import get_workflow_batch_handler
+
+        req = MagicMock()
+        req.org_context = admin_context
+        req.route_params = {"batchId": "batch-1"}
+
+        with patch(
+            "shared.handlers.workflows_logic.get_workflow_batch_logic",
+            new_callable=AsyncMock, side_effect=RuntimeError("storage unavailable")
+        ):
+            response = await get_workflow_batch_handler(req)
+
+        assert response.status_code == 500
+        assert json.loads(response.get_body())["error"] == "InternalServerError"
+
+
+class TestGetWorkflowBatch:
+    """Test get_workflow_batch_logic"""
+
+    async def test_aggregates_progress(self, admin_context, mock_exec_repo):
+        """Should count executions per status and detect completion"""
+        mock_exec_repo.get_batch.return_value = (
+            {"BatchId": "batch-1", "WorkflowName": "sync_licenses", "Total": 3},
+            [
+                {"ExecutionId": "e1", "OrganizationId": "org-a", "Status": "Success"},
+                {"ExecutionId": "e2", "OrganizationId": "org-b", "Status": "Failed", "ErrorMessage": "boom"},
+                {"ExecutionId": "e3", "OrganizationId": "org-c", "Status": "Running"},
+            ]
+        )
+
+        progress = await get_workflow_batch_logic(admin_context, "batch-1")
+
+        assert progress is not None
+        assert progress["total"] == 3
+        assert progress["completed"] == 2
+        assert progress["statusCounts"] == {"Success": 1, "Failed": 1, "Running": 1}
+        assert progress["isComplete"] is False
+        assert progress["executions"][1]["errorMessage"] == "boom"
+
+    async def test_batch_not_found(self, admin_context, mock_exec_repo):
+        """Should return None for unknown batches"""
+        mock_exec_repo.get_batch.return_value = (None, [])
+
+        assert await get_workflow_batch_logic(admin_context, "missing") is None
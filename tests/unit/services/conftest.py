@@ -40,6 +40,50 @@ def mock_blob_service_client():
         }
 
 
+class FakeSecretPages:
+    """Stand-in for the AsyncPageIterator returned by by_page()"""
+
+    def __init__(self, items, page_size):
+        self.items = items
+        self.page_size = page_size
+        self.pages_fetched = 0
+        self.continuation_token = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        start = self.pages_fetched * self.page_size
+        if self.pages_fetched and self.continuation_token is None:
+            raise StopAsyncIteration
+        self.pages_fetched += 1
+        end = start + self.page_size
+        self.continuation_token = str(end) if end < len(self.items) else None
+        return _iterate(self.items[start:end])
+
+
+class FakeSecretPager:
+    """Stand-in for the AsyncItemPaged returned by list_properties_of_secrets"""
+
+    def __init__(self, items, page_size):
+        self.items = items
+        self.page_size = page_size
+        self.pages: list[FakeSecretPages] = []
+
+    def __aiter__(self):
+        return _iterate(self.items)
+
+    def by_page(self):
+        pages = FakeSecretPages(self.items, self.page_size)
+        self.pages.append(pages)
+        return pages
+
+
+async def _iterate(items):
+    for item in items:
+        yield item
+
+
 @pytest.fixture
 def mock_secret_client():
     """Mock SecretClient for Key Vault operations"""
@@ -67,15 +111,13 @@ def mock_secret_client():
             secret_obj.value = secrets_store[name]
             return secret_obj
 
-        async def mock_list_properties():
+        def mock_list_properties(max_page_size=None):
             props_list = []
             for name in secrets_store:
                 prop = MagicMock()
                 prop.name = name
                 props_list.append(prop)
-            # Return async generator
-            for prop in props_list:
-                yield prop
+            return FakeSecretPager(props_list, max_page_size or 25)
 
         async def mock_delete_secret(name):
             if name in secrets_store:
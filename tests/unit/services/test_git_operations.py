@@ -0,0 +1,257 @@
+"""
+Unit tests for GitIntegrationService operation dispatch
+
+Tests cover:
+- Blocking git work runs on the dedicated git executor
+- Per-workspace serialization of mutating operations
+- Cooperative cancellation (explicit and via task cancellation)
+- Progress streaming from executor threads through send_log
+- Network timeout applied to dulwich's HTTP transport
+"""
+
+import asyncio
+import threading
+
+import pytest
+from dulwich import porcelain
+from dulwich.client import get_transport_and_path
+from dulwich.repo import Repo
+
+from shared.services.git_integration_service import (
+    GIT_NETWORK_TIMEOUT_SECONDS,
+    GitIntegrationService,
+    GitOperationCancelled,
+    cancel_git_operation,
+    get_active_operation,
+)
+from shared.services.git_status_engine import invalidate_status_cache
+
+
+@pytest.fixture
+def git_service(tmp_path):
+    """Service over a freshly initialized repository"""
+    Repo.init(str(tmp_path)).close()
+    invalidate_status_cache()
+    yield GitIntegrationService(workspace_path=str(tmp_path))
+    invalidate_status_cache()
+
+
+class TestGitExecutor:
+    """Test off-event-loop dispatch"""
+
+    async def test_runs_on_git_executor(self, git_service):
+        """Should run blocking work on a git-ops thread, not the event loop thread"""
+        thread_name = await git_service._run_git(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("git-ops")
+
+    async def test_refresh_status_checks_repo_on_git_executor(self, git_service):
+        """Should not open the repository on the event loop thread"""
+        threads = []
+        is_git_repo = git_service.is_git_repo
+
+        def recording_is_git_repo():
+            threads.append(threading.current_thread().name)
+            return is_git_repo()
+
+        async def no_remote_url(context):
+            return None
+
+        git_service.is_git_repo = recording_is_git_repo
+        git_service._get_authenticated_remote_url = no_remote_url
+
+        result = await git_service.refresh_status(context=None)
+
+        assert result["initialized"] is True
+        assert threads and all(name.startswith("git-ops") for name in threads)
+
+    async def test_event_loop_not_blocked(self, git_service):
+        """Should keep the event loop responsive while git work runs"""
+        release = threading.Event()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not release.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        await git_service._run_git(release.wait, 0.2)
+        release.set()
+        await ticker_task
+
+        assert ticks > 5
+
+    async def test_commit_through_executor(self, git_service):
+        """Should commit workspace changes"""
+        (git_service.workspace_path / "a.py").write_text("a = 1\n")
+
+        result = await git_service.commit("Add a")
+
+        assert result["success"] is True
+        assert result["files_committed"] == 1
+        assert await git_service.get_changed_files() == []
+
+
+class TestWorkspaceLock:
+    """Test per-workspace serialization"""
+
+    async def test_operations_are_serialized(self, git_service):
+        """Should not run two mutating operations on one workspace at once"""
+        running = 0
+        max_running = 0
+
+        def work():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            threading.Event().wait(0.05)
+            running -= 1
+
+        async def operation(name):
+            async with git_service._git_operation(name):
+                await git_service._run_git(work)
+
+        await asyncio.gather(*(operation(f"op{i}") for i in range(3)))
+
+        assert max_running == 1
+
+    async def test_active_operation_registered(self, git_service):
+        """Should expose the running operation and clear it afterwards"""
+        async with git_service._git_operation("commit") as operation:
+            assert get_active_operation(git_service.workspace_path) is operation
+
+        assert get_active_operation(git_service.workspace_path) is None
+
+
+class TestCancellation:
+    """Test cooperative cancellation"""
+
+    async def test_cancel_git_operation(self, git_service):
+        """Should raise GitOperationCancelled at the next checkpoint"""
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def work():
+            started.set()
+            proceed.wait(5)
+            git_service._checkpoint()
+
+        async def operation():
+            async with git_service._git_operation("pull"):
+                await git_service._run_git(work)
+
+        task = asyncio.create_task(operation())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        assert cancel_git_operation(git_service.workspace_path) is True
+        proceed.set()
+
+        with pytest.raises(GitOperationCancelled):
+            await task
+
+    async def test_cancel_with_no_operation(self, git_service):
+        """Should report that nothing was cancelled"""
+        assert cancel_git_operation(git_service.workspace_path) is False
+
+    async def test_task_cancellation_waits_for_thread(self, git_service):
+        """Should stop the thread at its checkpoint before releasing the workspace lock"""
+        started = threading.Event()
+        finished = threading.Event()
+
+        def work():
+            started.set()
+            try:
+                for _ in range(500):
+                    git_service._checkpoint()
+                    threading.Event().wait(0.01)
+            finally:
+                finished.set()
+
+        async def operation():
+            async with git_service._git_operation("pull"):
+                await git_service._run_git(work)
+
+        task = asyncio.create_task(operation())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert finished.is_set()
+        assert get_active_operation(git_service.workspace_path) is None
+
+
+class TestProgressStreaming:
+    """Test send_log forwarding from executor threads"""
+
+    async def test_threadsafe_log_preserves_order(self, git_service):
+        """Should deliver every progress message to send_log in order"""
+        received = []
+
+        async def send_log(message, level="info"):
+            received.append((message, level))
+
+        log = git_service._threadsafe_log(send_log)
+
+        def work():
+            for i in range(20):
+                log(f"step {i}")
+            log("done", "success")
+
+        await git_service._run_git(work)
+        await asyncio.sleep(0)
+
+        assert received == [(f"step {i}", "info") for i in range(20)] + [("done", "success")]
+
+    async def test_pull_failure_returns_error_result(self, git_service):
+        """Should surface errors raised on the executor as a pull error result"""
+        (git_service.workspace_path / "a.py").write_text("a = 1\n")
+        with Repo(str(git_service.workspace_path)) as repo:
+            porcelain.add(repo, paths=[str(git_service.workspace_path / "a.py")])
+            porcelain.commit(repo, message=b"init", author=b"T <t@example.com>", committer=b"T <t@example.com>")
+
+        async def fake_remote_url(context):
+            return "https://token@github.com/example/missing.git"
+
+        git_service._get_authenticated_remote_url = fake_remote_url
+
+        result = await git_service.pull(context=None)
+
+        assert result["success"] is False
+        assert "Failed to pull from GitHub" in result["error"]
+
+
+class TestNetworkTimeout:
+    """Test the transport-level timeout for fetch, pull and push"""
+
+    def test_workspace_repo_transport_uses_timeout(self, git_service):
+        """Should pass GIT_NETWORK_TIMEOUT_SECONDS to dulwich's HTTP client"""
+        with git_service.get_repo() as repo:
+            client, _ = get_transport_and_path(
+                "https://token@github.com/example/repo.git",
+                config=repo.get_config_stack()
+            )
+
+        assert client.pool_manager.connection_pool_kw["timeout"] == GIT_NETWORK_TIMEOUT_SECONDS
+
+
+class TestAnalyzeWorkspace:
+    """Test workspace analysis before configuring a repository"""
+
+    async def test_file_count_includes_ignored_files(self, git_service):
+        """Should count every file outside .git, since the replace moves them all"""
+        workspace = git_service.workspace_path
+        (workspace / ".gitignore").write_text("build/\n")
+        (workspace / "a.py").write_text("a = 1\n")
+        (workspace / "build").mkdir()
+        (workspace / "build" / "out.txt").write_text("out\n")
+
+        result = await git_service.analyze_workspace(
+            token="token", repo_url="https://github.com/example/repo.git"
+        )
+
+        assert result["file_count"] == 3
+        assert result["requires_confirmation"] is True
@@ -0,0 +1,189 @@
+"""
+Unit tests for GitStatusEngine
+
+Tests cover:
+- Detecting staged, modified, deleted and untracked files
+- Ignored files and directories
+- Agreement with porcelain.status()
+- Result caching and invalidation via the workspace generation
+- Concurrent status calls sharing the process-wide caches
+"""
+
+import os
+import time
+
+import pytest
+from dulwich import porcelain
+from dulwich.repo import Repo
+
+from shared.services import git_status_engine
+from shared.services.git_status_engine import GitStatusEngine, invalidate_status_cache
+from shared.utils.file_operations import bump_workspace_generation
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Status results are cached process-wide"""
+    invalidate_status_cache()
+    git_status_engine._hash_cache.clear()
+    git_status_engine._dir_cache.clear()
+    yield
+    invalidate_status_cache()
+
+
+@pytest.fixture
+def repo_dir(tmp_path):
+    """Repository with two committed files (backdated to avoid racy-clean checks)"""
+    repo = Repo.init(str(tmp_path))
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_text("b = 2\n")
+
+    old = time.time() - 60
+    for path in (tmp_path / "a.py", tmp_path / "pkg" / "b.py"):
+        os.utime(path, (old, old))
+
+    porcelain.add(repo, paths=[str(tmp_path / "a.py"), str(tmp_path / "pkg" / "b.py")])
+    porcelain.commit(repo, message=b"initial", author=b"T <t@example.com>", committer=b"T <t@example.com>")
+    repo.close()
+    return tmp_path
+
+
+def _status(repo_dir, use_cache=True):
+    with Repo(str(repo_dir)) as repo:
+        return GitStatusEngine(repo_dir).get_status(repo, use_cache=use_cache)
+
+
+class TestGitStatusEngine:
+    """Test status computation"""
+
+    def test_clean_repo(self, repo_dir):
+        """Should report no changes for a clean checkout"""
+        status = _status(repo_dir)
+
+        assert not status.has_changes
+        assert status.tracked_count == 2
+
+    def test_detects_modified_deleted_and_untracked(self, repo_dir):
+        """Should report unstaged modifications, deletions and untracked files"""
+        (repo_dir / "a.py").write_text("a = 100\n")
+        (repo_dir / "pkg" / "b.py").unlink()
+        (repo_dir / "new.py").write_text("x = 1\n")
+        (repo_dir / "newdir").mkdir()
+        (repo_dir / "newdir" / "c.py").write_text("c = 3\n")
+
+        status = _status(repo_dir)
+
+        assert sorted(status.unstaged) == ["a.py", "pkg/b.py"]
+        assert status.untracked == ["new.py", "newdir/c.py"]
+        assert status.has_changes
+
+    def test_detects_content_change_with_same_size_and_mtime(self, repo_dir):
+        """Should hash files whose mtime falls in the racy window of the index"""
+        path = repo_dir / "a.py"
+        st = path.stat()
+        path.write_text("a = 9\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        with Repo(str(repo_dir)) as repo:
+            index_path = repo.index_path()
+        os.utime(index_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert _status(repo_dir).unstaged == ["a.py"]
+
+    def test_detects_staged_files(self, repo_dir):
+        """Should report files added to the index"""
+        (repo_dir / "staged.py").write_text("s = 1\n")
+        with Repo(str(repo_dir)) as repo:
+            porcelain.add(repo, paths=[str(repo_dir / "staged.py")])
+
+        status = _status(repo_dir)
+
+        assert status.staged_add == ["staged.py"]
+        assert "staged.py" not in status.untracked
+
+    def test_respects_gitignore(self, repo_dir):
+        """Should skip ignored files and ignored directories"""
+        (repo_dir / ".gitignore").write_text("*.log\nbuild/\n")
+        (repo_dir / "debug.log").write_text("log\n")
+        (repo_dir / "build").mkdir()
+        (repo_dir / "build" / "out.py").write_text("out\n")
+
+        assert _status(repo_dir).untracked == [".gitignore"]
+
+    def test_matches_porcelain_status(self, repo_dir):
+        """Should agree with dulwich's full status scan"""
+        (repo_dir / "a.py").write_text("changed\n")
+        (repo_dir / "pkg" / "new.py").write_text("new\n")
+
+        status = _status(repo_dir)
+        with Repo(str(repo_dir)) as repo:
+            expected = porcelain.status(repo)
+
+        def decode(paths):
+            return sorted(p.decode() if isinstance(p, bytes) else p for p in paths)
+
+        assert sorted(status.unstaged) == decode(expected.unstaged)
+        assert sorted(status.untracked) == decode(expected.untracked)
+
+
+class TestGitStatusCache:
+    """Test status result caching"""
+
+    def test_returns_cached_result(self, repo_dir):
+        """Should serve repeated calls from cache"""
+        first = _status(repo_dir)
+        (repo_dir / "new.py").write_text("x = 1\n")
+
+        assert _status(repo_dir) is first
+
+    def test_generation_bump_invalidates(self, repo_dir):
+        """Should recompute after the workspace generation changes"""
+        _status(repo_dir)
+        (repo_dir / "new.py").write_text("x = 1\n")
+        bump_workspace_generation()
+
+        assert _status(repo_dir).untracked == ["new.py"]
+
+    def test_expired_entry_recomputed(self, repo_dir):
+        """Should recompute once the cached result is older than the TTL"""
+        first = _status(repo_dir)
+        cache_id = str(repo_dir)
+        cache_key, cached_at, cached_status = git_status_engine._status_cache[cache_id]
+        git_status_engine._status_cache[cache_id] = (
+            cache_key, cached_at - git_status_engine._status_cache_ttl, cached_status
+        )
+
+        assert _status(repo_dir) is not first
+
+    def test_bypass_cache(self, repo_dir):
+        """Should recompute when use_cache is False"""
+        _status(repo_dir)
+        (repo_dir / "new.py").write_text("x = 1\n")
+
+        assert _status(repo_dir, use_cache=False).untracked == ["new.py"]
+
+    def test_concurrent_status_with_evicting_caches(self, repo_dir, monkeypatch):
+        """Should give the same result from several threads while the caches evict"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(git_status_engine, "_HASH_CACHE_MAX_ENTRIES", 2)
+        monkeypatch.setattr(git_status_engine, "_DIR_CACHE_MAX_ENTRIES", 2)
+        old = time.time() - 60
+        for name in ("a.py", "pkg/b.py"):
+            (repo_dir / name).write_text("changed = True\n")
+            os.utime(repo_dir / name, (old, old))
+        for i in range(10):
+            (repo_dir / f"dir{i}").mkdir()
+            (repo_dir / f"dir{i}" / "c.py").write_text("c = 3\n")
+
+        def status(_):
+            result = _status(repo_dir, use_cache=False)
+            return sorted(result.unstaged), result.untracked
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(status, range(20)))
+
+        assert all(result == results[0] for result in results)
+        assert results[0][0] == ["a.py", "pkg/b.py"]
+        assert len(results[0][1]) == 10
@@ -293,6 +293,35 @@ class TestKeyVaultClientHealthCheck:
         assert result["can_connect"] is True
         assert result["secret_count"] == 0
 
+    async def test_health_check_quick_probe_is_capped(self, mock_secret_client, mock_default_credential):
+        """Should stop listing at the probe cap unless deep mode is requested"""
+        from shared.keyvault import HEALTH_PROBE_MAX_SECRETS
+
+        for i in range(HEALTH_PROBE_MAX_SECRETS + 5):
+            mock_secret_client["secrets_store"][f"test-org--secret-{i}"] = "value"
+        client = KeyVaultClient(vault_url="https://test-vault.vault.azure.net/")
+
+        pagers = []
+        list_properties = mock_secret_client["instance"].list_properties_of_secrets
+
+        def recording_list_properties(**kwargs):
+            pagers.append(list_properties(**kwargs))
+            return pagers[-1]
+
+        mock_secret_client["instance"].list_properties_of_secrets = recording_list_properties
+        quick = await client.health_check()
+        deep = await client.health_check(deep=True)
+
+        # The quick probe reads one page and never requests the next
+        assert pagers[0].page_size == HEALTH_PROBE_MAX_SECRETS
+        assert pagers[0].pages[0].pages_fetched == 1
+
+        assert quick["status"] == "healthy"
+        assert quick["secret_count"] is None
+        assert quick["secret_count_truncated"] is True
+        assert deep["secret_count"] == HEALTH_PROBE_MAX_SECRETS + 5
+        assert deep["secret_count_truncated"] is False
+
     async def test_health_check_list_permission_denied(self, mock_default_credential):
         """Should report degraded status when list permission denied"""
         with patch("shared.keyvault.SecretClient") as mock_client_class:
@@ -7,7 +7,18 @@ Tests SDK usage extraction (regex patterns) and validation against stored data.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from shared.services.sdk_usage_scanner import SDKUsageScanner, SDKCall, FileSDKUsage
+import asyncio
+
+from shared.services import sdk_usage_scanner
+from shared.services.sdk_usage_scanner import SDKUsageScanner, SDKCall, FileSDKUsage, clear_scan_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Each test starts without cached scan results or stored key sets"""
+    clear_scan_cache()
+    yield
+    clear_scan_cache()
 
 
 class TestSDKCallExtraction:
@@ -249,6 +260,60 @@ class TestScanWorkspace:
         assert results[0].file_name == "with_calls.py"
 
 
+class TestIncrementalScan:
+    """Test line numbers and the per-file scan cache"""
+
+    def test_line_numbers(self, tmp_path):
+        """Should report the line of each call, including the first and last line"""
+        content = 'config.get("first")\n\nx = 1\nsecrets.get("middle")\noauth.get_token("last")'
+        (tmp_path / "wf.py").write_text(content)
+
+        usage = SDKUsageScanner(tmp_path).extract_sdk_calls(content)
+
+        assert usage.config_calls[0].line_number == 1
+        assert usage.secret_calls[0].line_number == 4
+        assert usage.secret_calls[0].line_content == 'secrets.get("middle")'
+        assert usage.oauth_calls[0].line_number == 5
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        """Should reuse cached results until a file's mtime or size changes"""
+        (tmp_path / "a.py").write_text('config.get("a")')
+        (tmp_path / "b.py").write_text('config.get("b")')
+        scanner = SDKUsageScanner(tmp_path)
+        scanner.scan_workspace()
+
+        (tmp_path / "b.py").write_text('config.get("b_changed")')
+        with patch.object(SDKUsageScanner, "scan_file", wraps=scanner.scan_file) as mock_scan:
+            results = scanner.scan_workspace()
+
+        assert [call.args[0].name for call in mock_scan.call_args_list] == ["b.py"]
+        assert {usage.config_calls[0].key for usage in results} == {"a", "b_changed"}
+
+    def test_deleted_files_are_dropped(self, tmp_path):
+        """Should not report files removed since the last scan"""
+        (tmp_path / "a.py").write_text('config.get("a")')
+        (tmp_path / "b.py").write_text('config.get("b")')
+        scanner = SDKUsageScanner(tmp_path)
+        assert len(scanner.scan_workspace()) == 2
+
+        (tmp_path / "b.py").unlink()
+
+        assert [usage.file_name for usage in scanner.scan_workspace()] == ["a.py"]
+
+    async def test_validate_uses_given_scan(self, tmp_path):
+        """Should validate the passed scan result without scanning again"""
+        (tmp_path / "wf.py").write_text('config.get("missing_key")')
+        scanner = SDKUsageScanner(tmp_path)
+        file_usages = scanner.scan_workspace()
+
+        with patch.object(SDKUsageScanner, "scan_workspace") as mock_scan, \
+                patch.object(SDKUsageScanner, "_get_stored_config_keys", new_callable=AsyncMock, return_value=set()):
+            issues = await scanner.validate_workspace(MagicMock(), file_usages)
+
+        mock_scan.assert_not_called()
+        assert [issue.key for issue in issues] == ["missing_key"]
+
+
 class TestValidateWorkspace:
     """Test workspace validation against stored data"""
 
@@ -455,6 +520,128 @@ class TestEfficiency:
             mock_oauth.assert_not_called()
 
 
+class TestStoreLookups:
+    """Test concurrent, cached stored-key lookups"""
+
+    @pytest.fixture
+    def mock_context(self):
+        context = MagicMock()
+        context.scope = "test-org"
+        return context
+
+    async def test_lookups_run_concurrently(self, tmp_path, mock_context):
+        """Should issue the store lookups at the same time"""
+        (tmp_path / "wf.py").write_text('config.get("a")\nsecrets.get("b")\noauth.get_token("c")')
+        started = []
+        all_started = asyncio.Event()
+
+        def lookup(source, keys):
+            async def fetch(context):
+                started.append(source)
+                if len(started) == 3:
+                    all_started.set()
+                # Times out unless all three lookups are in flight together
+                await asyncio.wait_for(all_started.wait(), 1)
+                return keys
+            return fetch
+
+        with patch.object(SDKUsageScanner, "_get_stored_config_keys", side_effect=lookup("config", {"a"})), \
+                patch.object(SDKUsageScanner, "_get_stored_secret_keys", side_effect=lookup("secret", {"b"})), \
+                patch.object(SDKUsageScanner, "_get_stored_oauth_providers", side_effect=lookup("oauth", {"c"})):
+            scanner = SDKUsageScanner(tmp_path)
+            issues = await scanner.validate_workspace(mock_context)
+
+        assert issues == []
+        assert sorted(started) == ["config", "oauth", "secret"]
+        assert scanner.unavailable_sources == []
+
+    async def test_failed_source_is_reported_not_flagged(self, tmp_path, mock_context, monkeypatch):
+        """Should mark failed or slow sources unavailable instead of reporting every key missing"""
+        monkeypatch.setattr(sdk_usage_scanner, "STORE_LOOKUP_TIMEOUT_SECONDS", 0.05)
+        (tmp_path / "wf.py").write_text('config.get("a")\nsecrets.get("b")\noauth.get_token("c")')
+
+        async def slow(context):
+            await asyncio.sleep(1)
+            return set()
+
+        with patch.object(SDKUsageScanner, "_get_stored_config_keys", new_callable=AsyncMock, return_value=set()), \
+                patch.object(SDKUsageScanner, "_get_stored_secret_keys", new_callable=AsyncMock,
+                             side_effect=RuntimeError("vault down")), \
+                patch.object(SDKUsageScanner, "_get_stored_oauth_providers", side_effect=slow):
+            scanner = SDKUsageScanner(tmp_path)
+            issues = await scanner.validate_workspace(mock_context)
+
+        assert [(issue.type.value, issue.key) for issue in issues] == [("config", "a")]
+        assert scanner.unavailable_sources == ["secret", "oauth"]
+
+    async def test_key_sets_are_cached_briefly(self, tmp_path, mock_context, monkeypatch):
+        """Should reuse stored key sets within the TTL and reload after it"""
+        (tmp_path / "wf.py").write_text('secrets.get("b")')
+        clock = [1000.0]
+        monkeypatch.setattr(sdk_usage_scanner.time, "monotonic", lambda: clock[0])
+
+        with patch.object(
+            SDKUsageScanner, "_get_stored_secret_keys", new_callable=AsyncMock, return_value={"b"}
+        ) as mock_secrets:
+            scanner = SDKUsageScanner(tmp_path)
+            await scanner.validate_workspace(mock_context)
+            await scanner.validate_file("wf.py", mock_context)
+            assert mock_secrets.call_count == 1
+
+            clock[0] += sdk_usage_scanner.STORE_CACHE_TTL_SECONDS + 1
+            await scanner.validate_workspace(mock_context)
+            assert mock_secrets.call_count == 2
+
+    async def test_writes_invalidate_cached_key_sets(self, tmp_path, mock_context):
+        """Should reload a source after a write to its scope or to GLOBAL"""
+        (tmp_path / "wf.py").write_text('config.get("a")')
+        mock_context.scope = "org-1"
+
+        with patch.object(
+            SDKUsageScanner, "_get_stored_config_keys", new_callable=AsyncMock, side_effect=[set(), {"a"}, {"a"}]
+        ) as mock_configs:
+            scanner = SDKUsageScanner(tmp_path)
+            assert len(await scanner.validate_workspace(mock_context)) == 1
+
+            sdk_usage_scanner.invalidate_stored_keys(sdk_usage_scanner.SOURCE_SECRET, "org-1")
+            sdk_usage_scanner.invalidate_stored_keys(sdk_usage_scanner.SOURCE_CONFIG, "org-2")
+            await scanner.validate_workspace(mock_context)
+            assert mock_configs.call_count == 1
+
+            sdk_usage_scanner.invalidate_stored_keys(sdk_usage_scanner.SOURCE_CONFIG, "org-1")
+            assert await scanner.validate_workspace(mock_context) == []
+
+            sdk_usage_scanner.invalidate_stored_keys(sdk_usage_scanner.SOURCE_CONFIG, "GLOBAL")
+            await scanner.validate_workspace(mock_context)
+            assert mock_configs.call_count == 3
+
+    async def test_refresh_skips_cache(self, tmp_path, mock_context):
+        """Should look up stored keys again on an explicit rescan"""
+        (tmp_path / "wf.py").write_text('secrets.get("b")')
+
+        with patch.object(
+            SDKUsageScanner, "_get_stored_secret_keys", new_callable=AsyncMock, return_value={"b"}
+        ) as mock_secrets:
+            scanner = SDKUsageScanner(tmp_path)
+            await scanner.validate_workspace(mock_context)
+            await scanner.validate_workspace(mock_context, refresh=True)
+            assert mock_secrets.call_count == 2
+
+    async def test_failed_lookup_is_not_cached(self, tmp_path, mock_context):
+        """Should retry a failed source on the next validation"""
+        (tmp_path / "wf.py").write_text('secrets.get("b")')
+
+        with patch.object(
+            SDKUsageScanner, "_get_stored_secret_keys", new_callable=AsyncMock,
+            side_effect=[RuntimeError("vault down"), {"b"}]
+        ):
+            scanner = SDKUsageScanner(tmp_path)
+            assert await scanner.validate_workspace(mock_context) == []
+            assert scanner.unavailable_sources == ["secret"]
+            assert await scanner.validate_workspace(mock_context) == []
+            assert scanner.unavailable_sources == []
+
+
 class TestFileSDKUsageProperties:
     """Test FileSDKUsage helper properties"""
 
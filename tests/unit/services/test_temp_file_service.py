@@ -358,3 +358,106 @@ class TestTempFileServicePathSafety:
 
         with pytest.raises(ValueError):
             service.delete_temp_file(Path("/tmp/../../../etc/passwd"))
+
+
+class TestTempFileServiceReclaim:
+    """Test age/quota reclamation and per-execution directories"""
+
+    def _write(self, root: Path, relative: str, size: int, age_hours: float) -> Path:
+        """Write a file and backdate it and its directories below root"""
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        mtime = time.time() - age_hours * 3600
+        target = path
+        while target != root:
+            os.utime(target, (mtime, mtime))
+            target = target.parent
+        return path
+
+    def test_quota_evicts_oldest_first(self, temp_test_dir):
+        """Should delete the oldest entries until under the quota"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+        oldest = self._write(temp_test_dir, "oldest.bin", 100, age_hours=5)
+        self._write(temp_test_dir, "export/data.bin", 100, age_hours=4)
+        newer = self._write(temp_test_dir, "newer.bin", 100, age_hours=3)
+
+        stats = service.reclaim(max_age_hours=24, max_bytes=150)
+
+        assert not oldest.exists()
+        assert not (temp_test_dir / "export").exists()
+        assert newer.exists()
+        assert stats.deleted == 2
+        assert stats.bytes_reclaimed >= 200
+        assert stats.bytes_remaining <= 150
+
+    def test_quota_spares_recent_entries(self, temp_test_dir):
+        """Should not evict entries modified within min_age_minutes"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+        recent = self._write(temp_test_dir, "in-use.bin", 500, age_hours=0)
+
+        stats = service.reclaim(max_bytes=100, min_age_minutes=60)
+
+        assert recent.exists()
+        assert stats.deleted == 0
+
+    def test_time_budget_stops_run(self, temp_test_dir):
+        """Should stop scanning once the time budget is used up"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+        for i in range(3):
+            self._write(temp_test_dir, f"dir{i}/file.bin", 10, age_hours=48)
+
+        stats = service.reclaim(max_age_hours=24, time_budget_seconds=0)
+
+        assert stats.timed_out is True
+        assert stats.deleted == 0
+
+    def test_execution_directories_are_aged_individually(self, temp_test_dir):
+        """Should treat each execution directory as its own entry"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+        executions = temp_test_dir / "executions"
+        stale = self._write(executions, "exec-stale/f.bin", 10, age_hours=48)
+        active = self._write(executions, "exec-active/f.bin", 10, age_hours=0)
+
+        service.reclaim(max_age_hours=24)
+
+        assert not stale.parent.exists()
+        assert active.exists()
+
+    def test_remove_execution_directory(self, temp_test_dir):
+        """Should remove an execution's directory and report bytes reclaimed"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+        file_path = service.create_temp_file(suffix=".csv", execution_id="exec-1")
+        file_path.write_bytes(b"a" * 64)
+
+        assert file_path.parent == temp_test_dir / "executions" / "exec-1"
+        assert service.remove_execution_directory("exec-1") >= 64
+        assert not file_path.parent.exists()
+        assert service.remove_execution_directory("exec-1") == 0
+
+    def test_execution_id_must_be_a_name(self, temp_test_dir):
+        """Should reject execution IDs that would escape the executions directory"""
+        service = TempFileService(tmp_path=str(temp_test_dir))
+
+        with pytest.raises(ValueError):
+            service.get_execution_directory("../outside")
+
+    def test_new_temp_file_uses_execution_directory(self, temp_test_dir):
+        """Should create files in the running execution's directory"""
+        from unittest.mock import MagicMock
+
+        from bifrost._context import clear_execution_context, set_execution_context
+        import shared.services.temp_file_service as temp_module
+
+        context = MagicMock()
+        context.execution_id = "exec-42"
+        with patch.dict(os.environ, {"TMP_PATH": str(temp_test_dir)}):
+            temp_module._temp_file_service = None
+            set_execution_context(context)
+            try:
+                file_path = new_temp_file(suffix=".txt")
+            finally:
+                clear_execution_context()
+                temp_module._temp_file_service = None
+
+        assert file_path.parent == temp_test_dir / "executions" / "exec-42"
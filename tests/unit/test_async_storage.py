@@ -0,0 +1,73 @@
+"""
+Unit tests for AsyncTableStorageService batch inserts
+
+Tests how entities are split into entity group transactions and how many
+transactions are in flight at once. The table client is replaced by a fake.
+"""
+
+import asyncio
+
+from shared import async_storage
+from shared.async_storage import MAX_BATCH_OPERATIONS, AsyncTableStorageService
+
+
+class FakeTransactionClient:
+    """Records submitted transactions and the peak number in flight"""
+
+    def __init__(self):
+        self.transactions: list[list] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def submit_transaction(self, operations):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.transactions.append(operations)
+        self.in_flight -= 1
+
+
+def make_service() -> tuple[AsyncTableStorageService, FakeTransactionClient]:
+    service = AsyncTableStorageService("Relationships")
+    client = FakeTransactionClient()
+    service._in_context_manager = True
+    service._client = client
+    return service, client
+
+
+class TestInsertEntitiesBatch:
+    """Test transaction splitting and concurrency"""
+
+    async def test_splits_by_partition_and_operation_count(self):
+        service, client = make_service()
+        entities = [{"PartitionKey": "GLOBAL", "RowKey": f"r{i}"} for i in range(MAX_BATCH_OPERATIONS + 1)]
+        entities.append({"PartitionKey": "org-1", "RowKey": "r0"})
+
+        await service.insert_entities_batch(entities)
+
+        sizes = sorted(len(operations) for operations in client.transactions)
+        assert sizes == [1, 1, MAX_BATCH_OPERATIONS]
+        assert all(len({op[1]["PartitionKey"] for op in operations}) == 1 for operations in client.transactions)
+
+    async def test_splits_large_entities_by_payload_size(self):
+        service, client = make_service()
+        # ~60 KiB each: 100 of them would be far over the 4 MiB transaction limit
+        entities = [{"PartitionKey": "GLOBAL", "RowKey": f"r{i}", "Data": "x" * 60_000} for i in range(100)]
+
+        await service.insert_entities_batch(entities)
+
+        assert len(client.transactions) > 1
+        for operations in client.transactions:
+            payload = sum(len(op[1]["Data"]) for op in operations)
+            assert payload < async_storage.MAX_BATCH_PAYLOAD_BYTES
+        assert sum(len(operations) for operations in client.transactions) == 100
+
+    async def test_bounds_transactions_in_flight(self, monkeypatch):
+        monkeypatch.setattr(async_storage, "MAX_CONCURRENT_TRANSACTIONS", 3)
+        service, client = make_service()
+        entities = [{"PartitionKey": f"org-{i}", "RowKey": "r0"} for i in range(10)]
+
+        await service.insert_entities_batch(entities)
+
+        assert len(client.transactions) == 10
+        assert client.max_in_flight == 3
@@ -0,0 +1,164 @@
+"""
+Unit tests for execution log and variable blobs
+
+Tests the compressed NDJSON format, reading legacy JSON blobs, tail reads
+through the chunk index and conditional (If-None-Match) re-reads. Blob
+storage is replaced by an in-memory fake.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError, ResourceNotFoundError
+
+from shared import blob_storage
+from shared.blob_storage import EXECUTION_CONTAINER, BlobStorageService, clear_blob_read_cache
+
+
+class FakeBlobClient:
+    """One blob in FakeContainer: download with offset and ETag conditions"""
+
+    def __init__(self, container, name):
+        self.container = container
+        self.name = name
+
+    async def upload_blob(self, data, overwrite=False, metadata=None, content_settings=None):
+        version = self.container.versions.get(self.name, 0) + 1
+        self.container.versions[self.name] = version
+        self.container.blobs[self.name] = (bytes(data), metadata or {}, f'"v{version}"')
+
+    async def get_blob_properties(self):
+        if self.name not in self.container.blobs:
+            raise ResourceNotFoundError("not found")
+        _, metadata, etag = self.container.blobs[self.name]
+        return SimpleNamespace(metadata=metadata, etag=etag)
+
+    async def download_blob(self, offset=None, etag=None, match_condition=None):
+        if self.name not in self.container.blobs:
+            raise ResourceNotFoundError("not found")
+        data, _, current = self.container.blobs[self.name]
+        if match_condition == MatchConditions.IfModified and etag == current:
+            raise HttpResponseError(response=SimpleNamespace(status_code=304, reason="Not Modified", headers={}))
+        if match_condition == MatchConditions.IfNotModified and etag != current:
+            raise ResourceModifiedError("modified")
+
+        body = data[offset or 0:]
+        self.container.bytes_downloaded += len(body)
+
+        async def readall():
+            return body
+
+        return SimpleNamespace(readall=readall, properties=SimpleNamespace(etag=current))
+
+
+class FakeContainer:
+    def __init__(self):
+        self.blobs: dict[str, tuple[bytes, dict, str]] = {}
+        self.versions: dict[str, int] = {}
+        self.bytes_downloaded = 0
+
+    def get_blob_client(self, name):
+        return FakeBlobClient(self, name)
+
+
+@pytest.fixture
+def container():
+    return FakeContainer()
+
+
+@pytest.fixture
+def service(container):
+    clear_blob_read_cache()
+    svc = BlobStorageService()
+    svc._initialized_containers.add(EXECUTION_CONTAINER)
+    svc.blob_service_client = SimpleNamespace(get_container_client=lambda name: container)
+    yield svc
+    clear_blob_read_cache()
+
+
+def make_logs(count):
+    return [{"sequence": i, "level": "INFO", "message": f"line {i}"} for i in range(count)]
+
+
+class TestNdjsonFormat:
+    """Test writing and reading compressed NDJSON"""
+
+    async def test_logs_round_trip(self, service, container):
+        logs = make_logs(450)
+
+        path = await service.upload_logs("exec-1", logs)
+
+        data, metadata, _ = container.blobs[path]
+        assert path == "exec-1/logs.ndjson.gz"
+        assert data[:2] == b"\x1f\x8b"
+        assert metadata["lines"] == "450"
+        assert len(metadata["offsets"].split(",")) == 3
+        assert await service.get_logs("exec-1") == logs
+
+    async def test_variables_round_trip(self, service):
+        variables = {"count": 3, "user": {"name": "Ana"}, "items": [1, 2]}
+
+        await service.upload_variables("exec-1", variables)
+
+        assert await service.get_variables("exec-1") == variables
+
+    async def test_retried_attempt_keeps_its_own_blobs(self, service):
+        first, final = make_logs(3), make_logs(5)
+
+        path = await service.upload_logs("exec-1", first, attempt=1)
+        await service.upload_logs("exec-1", final)
+
+        assert path == "exec-1/attempts/1/logs.ndjson.gz"
+        assert await service.get_logs("exec-1", attempt=1) == first
+        assert await service.get_logs("exec-1") == final
+
+    async def test_chunk_index_stays_bounded(self):
+        _, index = blob_storage._encode_ndjson(list(range(100_000)))
+
+        assert len(index.offsets) <= blob_storage.NDJSON_MAX_CHUNKS
+        assert index.lines == 100_000
+
+
+class TestLegacyBlobs:
+    """Test that JSON blobs written before NDJSON stay readable"""
+
+    async def test_legacy_logs_and_variables(self, service, container):
+        logs = make_logs(3)
+        await container.get_blob_client("exec-1/logs.json").upload_blob(json.dumps(logs, indent=2).encode())
+        await container.get_blob_client("exec-1/variables.json").upload_blob(json.dumps({"a": 1}).encode())
+
+        assert await service.get_logs("exec-1") == logs
+        assert await service.get_variables("exec-1") == {"a": 1}
+        assert await service.get_logs_tail("exec-1", 2) == logs[1:]
+
+    async def test_missing_blob(self, service):
+        assert await service.get_logs("exec-missing") is None
+        assert await service.get_variables("exec-missing") is None
+
+
+class TestReads:
+    """Test tail reads and conditional re-reads"""
+
+    async def test_tail_downloads_only_last_chunks(self, service, container):
+        logs = make_logs(1000)
+        await service.upload_logs("exec-1", logs)
+        full_size = len(container.blobs["exec-1/logs.ndjson.gz"][0])
+
+        tail = await service.get_logs_tail("exec-1", 50)
+
+        assert tail == logs[-50:]
+        assert container.bytes_downloaded < full_size / 2
+
+    async def test_unchanged_blob_is_revalidated_not_downloaded(self, service, container):
+        await service.upload_logs("exec-1", make_logs(10))
+
+        await service.get_logs("exec-1")
+        downloaded = container.bytes_downloaded
+        assert await service.get_logs("exec-1") == make_logs(10)
+        assert container.bytes_downloaded == downloaded
+
+        # Re-upload invalidates the cached copy
+        await service.upload_logs("exec-1", make_logs(12))
+        assert len(await service.get_logs("exec-1")) == 12
@@ -0,0 +1,123 @@
+"""
+Unit tests for function app cold start
+
+Tests the marker-gated storage bootstrap, blueprint selection, lazily
+imported modules and a cold-import time budget measured with
+`python -X importtime` in a fresh interpreter.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from functions.blueprints import TIMER_BLUEPRINTS, blueprint_modules
+from shared import storage_bootstrap
+from shared.storage_bootstrap import STORAGE_SCHEMA_VERSION, bootstrap_storage
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of every blueprint module in a fresh interpreter.
+# Roughly 3x what it takes on a developer machine - a regression here means
+# something heavy is being imported at module level again.
+COLD_IMPORT_BUDGET_MS = 3500
+
+EMPTY_RESULTS = {"created": [], "already_exists": [], "failed": []}
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, AZURE_FUNCTIONS_ENVIRONMENT="Testing")
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True, text=True, env=env, cwd=PROJECT_ROOT, timeout=120
+    )
+
+
+class TestStorageBootstrap:
+    """Test the marker row short-circuit"""
+
+    @pytest.fixture
+    def table(self):
+        table = MagicMock()
+        with patch.object(storage_bootstrap, "_marker_table", return_value=table), \
+                patch.object(storage_bootstrap, "init_tables", return_value=EMPTY_RESULTS) as init_tables, \
+                patch.object(storage_bootstrap, "init_queues", return_value=EMPTY_RESULTS) as init_queues:
+            table.init_tables = init_tables
+            table.init_queues = init_queues
+            yield table
+
+    def test_current_marker_skips_bootstrap(self, table):
+        table.get_entity.return_value = {"SchemaVersion": STORAGE_SCHEMA_VERSION}
+
+        result = bootstrap_storage("conn")
+
+        assert result["skipped"] is True
+        table.init_tables.assert_not_called()
+        table.init_queues.assert_not_called()
+
+    @pytest.mark.parametrize("marker", [ResourceNotFoundError("missing"), {"SchemaVersion": "older"}])
+    def test_missing_or_stale_marker_bootstraps_and_writes_marker(self, table, marker):
+        if isinstance(marker, Exception):
+            table.get_entity.side_effect = marker
+        else:
+            table.get_entity.return_value = marker
+
+        result = bootstrap_storage("conn")
+
+        assert result["skipped"] is False
+        table.init_tables.assert_called_once_with("conn")
+        table.init_queues.assert_called_once_with("conn")
+        assert table.upsert_entity.call_args.args[0]["SchemaVersion"] == STORAGE_SCHEMA_VERSION
+
+    def test_failures_leave_marker_unwritten(self, table):
+        table.get_entity.side_effect = ResourceNotFoundError("missing")
+        table.init_queues.return_value = {**EMPTY_RESULTS, "failed": [{"queue": "q", "error": "boom"}]}
+
+        bootstrap_storage("conn")
+
+        table.upsert_entity.assert_not_called()
+
+
+class TestLazyImports:
+    """Test which modules a cold start imports"""
+
+    def test_testing_host_skips_timer_blueprints(self):
+        modules = blueprint_modules(include_timers=False)
+
+        assert not set(TIMER_BLUEPRINTS) & set(modules)
+        assert set(TIMER_BLUEPRINTS) <= set(blueprint_modules())
+
+    def test_heavy_modules_load_on_first_use(self):
+        result = run_python(
+            "import sys\n"
+            "import functions.http.openapi\n"
+            "import shared.handlers.schedules_handlers\n"
+            "print(sorted(m for m in ('yaml', 'shared.handlers.openapi_handlers', "
+            "'shared.handlers.health_handlers') if m in sys.modules))"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_blueprint_cold_import_budget(self):
+        result = run_python(
+            "import importlib\n"
+            "from functions.blueprints import blueprint_modules\n"
+            "for name in blueprint_modules(include_timers=False):\n"
+            "    importlib.import_module(name)",
+            "-X", "importtime"
+        )
+        assert result.returncode == 0, result.stderr
+
+        # Top-level entries (no indentation) carry the cumulative time of everything below them
+        total_us = sum(
+            int(match.group(1))
+            for match in re.finditer(r"^import time:\s+\d+ \|\s+(\d+) \| \S", result.stderr, re.M)
+        )
+
+        assert total_us / 1000 < COLD_IMPORT_BUDGET_MS
@@ -0,0 +1,154 @@
+"""
+Unit tests for ExecutionLogger result handling
+
+Tests that results are encoded once and routed inline or to blob storage by
+the encoded size, and the compact JSON codec with and without orjson.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from shared import execution_logger as execution_logger_module
+from shared import json_codec
+from shared.execution_logger import BLOB_THRESHOLD_BYTES, ExecutionLogger
+from shared.json_codec import dumps_bytes
+from shared.models import ExecutionStatus
+
+
+class TestJsonCodec:
+    """Test compact encoding"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_utf8(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_codec, "orjson", None)
+
+        value = {"name": "café", "items": [1, 2], 3: None}
+        encoded = dumps_bytes(value)
+
+        assert encoded == '{"name":"café","items":[1,2],"3":null}'.encode("utf-8")
+
+    def test_falls_back_for_values_orjson_rejects(self):
+        assert json.loads(dumps_bytes({"big": 2 ** 70})) == {"big": 2 ** 70}
+
+    def test_orjson_is_used_when_installed(self):
+        assert json_codec.ORJSON_AVAILABLE
+
+    def test_both_encoders_accept_the_same_values(self, monkeypatch):
+        @dataclass
+        class Point:
+            x: int
+            when: date
+
+        value = {
+            "at": datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc),
+            "naive": datetime(2024, 1, 2, 3, 4, 5),
+            "day": date(2024, 1, 2),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "status": ExecutionStatus.SUCCESS,
+            "point": Point(1, date(2024, 1, 2)),
+        }
+        with_orjson = dumps_bytes(value)
+        monkeypatch.setattr(json_codec, "orjson", None)
+        without_orjson = dumps_bytes(value)
+
+        assert with_orjson == without_orjson
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_unserializable_values_fail_on_both_paths(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_codec, "orjson", None)
+
+        with pytest.raises(TypeError):
+            dumps_bytes({"items": {1, 2}})
+
+
+@pytest.fixture
+def logger_under_test():
+    execution_model = MagicMock(workflowName="wf", executedByName="User", startedAt=datetime(2026, 1, 1))
+    execution_model.completedAt = None
+    execution_model.model_dump.return_value = {}
+
+    with patch.object(execution_logger_module, "ExecutionRepository"), \
+            patch.object(execution_logger_module, "get_blob_service"):
+        exec_logger = ExecutionLogger()
+    exec_logger.repository = MagicMock()
+    exec_logger.repository.update_execution = AsyncMock(return_value=execution_model)
+    exec_logger.blob_service = MagicMock()
+    exec_logger.blob_service.upload_result = AsyncMock()
+    exec_logger.blob_service.upload_logs = AsyncMock(side_effect=lambda execution_id, logs, attempt=None: (
+        f"{execution_id}/attempts/{attempt}/logs" if attempt else f"{execution_id}/logs"
+    ))
+    exec_logger.blob_service.upload_variables = AsyncMock(side_effect=lambda execution_id, variables, attempt=None: (
+        f"{execution_id}/attempts/{attempt}/variables" if attempt else f"{execution_id}/variables"
+    ))
+    return exec_logger
+
+
+class TestResultRouting:
+    """Test inline vs blob routing on the encoded result"""
+
+    async def test_small_result_stored_inline_as_encoded_text(self, logger_under_test):
+        with patch.object(execution_logger_module, "dumps_bytes", wraps=dumps_bytes) as encode:
+            await logger_under_test.update_execution(
+                "exec-1", None, "user-1", ExecutionStatus.SUCCESS, result={"ok": True}
+            )
+
+        encode.assert_called_once()
+        kwargs = logger_under_test.repository.update_execution.call_args.kwargs
+        assert kwargs["result"] == '{"ok":true}'
+        assert kwargs["result_in_blob"] is False
+        logger_under_test.blob_service.upload_result.assert_not_called()
+
+    async def test_large_result_uploads_the_same_bytes(self, logger_under_test):
+        result = {"rows": ["x" * 100] * 20}
+        broadcaster = MagicMock()
+        broadcaster.broadcast_execution_update = AsyncMock()
+        broadcaster.broadcast_execution_to_history = AsyncMock()
+
+        await logger_under_test.update_execution(
+            "exec-1", None, "user-1", ExecutionStatus.SUCCESS, result=result, webpubsub_broadcaster=broadcaster
+        )
+
+        encoded = dumps_bytes(result)
+        assert len(encoded) > BLOB_THRESHOLD_BYTES
+        logger_under_test.blob_service.upload_result.assert_awaited_once_with("exec-1", result, encoded=encoded)
+        kwargs = logger_under_test.repository.update_execution.call_args.kwargs
+        assert kwargs["result"] is None
+        assert kwargs["result_in_blob"] is True
+
+        preview = broadcaster.broadcast_execution_update.call_args.kwargs["result_preview"]
+        assert preview == encoded[:execution_logger_module.RESULT_PREVIEW_BYTES].decode("utf-8")
+
+
+class TestAttemptBlobs:
+    """Test log/variables blob references in the attempt history"""
+
+    async def test_retried_attempt_gets_its_own_blobs(self, logger_under_test):
+        await logger_under_test.update_execution(
+            "exec-1", None, "user-1", ExecutionStatus.PENDING,
+            logs=[{"message": "try 1"}], variables={"x": 1},
+            attempt={"attempt": 1, "errorMessage": "boom"}
+        )
+
+        logger_under_test.blob_service.upload_logs.assert_awaited_once_with(
+            "exec-1", [{"message": "try 1"}], attempt=1
+        )
+        attempt = logger_under_test.repository.update_execution.call_args.kwargs["attempt"]
+        assert attempt["logsBlob"] == "exec-1/attempts/1/logs"
+        assert attempt["variablesBlob"] == "exec-1/attempts/1/variables"
+
+    async def test_final_attempt_references_the_execution_blobs(self, logger_under_test):
+        await logger_under_test.update_execution(
+            "exec-1", None, "user-1", ExecutionStatus.FAILED,
+            logs=[{"message": "try 2"}], attempt={"attempt": 2, "errorMessage": "boom"}
+        )
+
+        attempt = logger_under_test.repository.update_execution.call_args.kwargs["attempt"]
+        assert attempt["logsBlob"] == "exec-1/logs"
+        assert attempt["variablesBlob"] is None
@@ -0,0 +1,224 @@
+"""
+Unit tests for ExecutionLogsRepository
+
+Tests counter and tail rows maintained on append, server-side paging and
+the bounded sequence cache. Table storage is replaced by an in-memory fake.
+"""
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables import TableErrorCode, TableTransactionError
+
+from shared.repositories import execution_logs
+from shared.repositories.execution_logs import ExecutionLogsRepository
+
+
+class FakeLogsTable:
+    """In-memory ExecutionLogs table serving both the sync and async clients"""
+
+    def __init__(self):
+        self.rows: dict[tuple[str, str], dict] = {}
+        self.etags: dict[tuple[str, str], str] = {}
+        self.transactions = 0
+        self.counter_reads = 0
+        self.fetched = 0
+
+    # Sync TableClient
+    def create_table(self):
+        pass
+
+    def submit_transaction(self, operations):
+        self.transactions += 1
+        # All or nothing: check every precondition before writing
+        for index, (op, entity, *options) in enumerate(operations):
+            key = (entity["PartitionKey"], entity["RowKey"])
+            if op == "create" and key in self.rows:
+                raise self._conflict(TableErrorCode.ENTITY_ALREADY_EXISTS, index)
+            if op == "update" and options[0].get("etag") != self.etags.get(key):
+                raise self._conflict(TableErrorCode.UPDATE_CONDITION_NOT_SATISFIED, index)
+
+        results = []
+        for op, entity, *options in operations:
+            key = (entity["PartitionKey"], entity["RowKey"])
+            replace = op == "create" or (options and str(options[0].get("mode")).endswith("REPLACE"))
+            self.rows[key] = dict(entity) if replace else {**self.rows.get(key, {}), **entity}
+            self.etags[key] = f"etag-{self.transactions}"
+            results.append({"etag": self.etags[key]})
+        return results
+
+    @staticmethod
+    def _conflict(error_code, index):
+        error = TableTransactionError(message=f"{index}:{error_code.value}", index=index)
+        error.error_code = error_code
+        return error
+
+    def get_entity_sync(self, partition_key, row_key):
+        key = (partition_key, row_key)
+        if key not in self.rows:
+            raise ResourceNotFoundError("missing")
+        self.counter_reads += 1
+        entity = MagicMock()
+        entity.get.side_effect = self.rows[key].get
+        entity.metadata = {"etag": self.etags[key]}
+        return entity
+
+    # Async AsyncTableStorageService
+    async def get_entity(self, partition_key, row_key):
+        row = self.rows.get((partition_key, row_key))
+        return dict(row) if row else None
+
+    def _match(self, filter):
+        partition = re.search(r"PartitionKey eq '([^']*)'", filter).group(1)
+        bounds = re.findall(r"RowKey (ge|gt|lt|le) '([^']*)'", filter)
+        ops = {"ge": str.__ge__, "gt": str.__gt__, "lt": str.__lt__, "le": str.__le__}
+        return [
+            dict(row) for (pk, rk), row in sorted(self.rows.items())
+            if pk == partition and all(ops[op](rk, value) for op, value in bounds)
+        ]
+
+    async def query_entities(self, filter, select=None):
+        rows = self._match(filter)
+        self.fetched += len(rows)
+        return rows
+
+    async def query_entities_paged(self, filter, select=None, results_per_page=50, continuation_token=None):
+        rows = self._match(filter)
+        start = continuation_token or 0
+        page = rows[start:start + results_per_page]
+        self.fetched += len(page)
+        next_token = start + results_per_page if start + results_per_page < len(rows) else None
+        return page, next_token
+
+
+@pytest.fixture
+def table():
+    return FakeLogsTable()
+
+
+def _make_repo(table):
+    """Repository whose sync and async clients are both backed by the fake"""
+    with patch.object(execution_logs, "AsyncTableStorageService", return_value=table), \
+            patch.object(execution_logs.TableClient, "from_connection_string") as mock_from_conn:
+        sync_client = mock_from_conn.return_value
+        sync_client.submit_transaction.side_effect = table.submit_transaction
+        sync_client.get_entity.side_effect = table.get_entity_sync
+        return ExecutionLogsRepository()
+
+
+@pytest.fixture
+def repo(table, monkeypatch):
+    monkeypatch.setenv("AzureWebJobsStorage", "UseDevelopmentStorage=true")
+    return _make_repo(table)
+
+
+def _log_rows(table, execution_id):
+    return [rk for pk, rk in table.rows if pk == execution_id and not rk.startswith("~")]
+
+
+class TestAppend:
+    """Test rows maintained on append"""
+
+    def test_one_transaction_per_log(self, repo, table):
+        for i in range(3):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        assert table.transactions == 3
+        assert table.counter_reads == 0
+        assert len(_log_rows(table, "exec-1")) == 3
+        assert table.rows[("exec-1", "~count")]["Count"] == 3
+
+    def test_tail_ring_is_bounded(self, repo, table):
+        for i in range(execution_logs.TAIL_SIZE + 10):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        tail_rows = [rk for pk, rk in table.rows if rk.startswith("~tail:")]
+        assert len(tail_rows) == execution_logs.TAIL_SIZE
+
+    def test_sequence_cache_is_bounded_and_resumes(self, repo, table, monkeypatch):
+        monkeypatch.setattr(execution_logs, "MAX_TRACKED_EXECUTIONS", 2)
+        repo.append_log("exec-1", "info", "first")
+        repo.append_log("exec-2", "info", "x")
+        repo.append_log("exec-3", "info", "x")
+
+        assert list(repo._sequence_counters) == ["exec-2", "exec-3"]
+
+        # Evicted execution resumes from its counter row once its create conflicts
+        repo.append_log("exec-1", "info", "second")
+        assert table.rows[("exec-1", "~count")]["Count"] == 2
+        assert table.counter_reads == 1
+
+    def test_processes_get_distinct_increasing_sequences(self, repo, table):
+        # A second repository stands in for another worker process
+        other = _make_repo(table)
+        counts = []
+
+        for i in range(10):
+            (repo if i % 3 else other).append_log("exec-1", "info", f"line {i}")
+            counts.append(table.rows[("exec-1", "~count")]["Count"])
+
+        sequences = sorted(int(rk.rsplit("-", 1)[1]) for rk in _log_rows(table, "exec-1"))
+        assert sequences == list(range(1, 11))
+        assert counts == sorted(counts)
+
+    def test_stale_writer_does_not_move_counter_back(self, repo, table):
+        other = _make_repo(table)
+        for i in range(5):
+            repo.append_log("exec-1", "info", f"line {i}")
+        other.append_log("exec-1", "info", "other")
+        for i in range(5, 8):
+            other.append_log("exec-1", "info", f"line {i}")
+
+        # repo's cached ETag is stale: its write conflicts instead of resetting Count to 6
+        repo.append_log("exec-1", "info", "late")
+
+        assert table.rows[("exec-1", "~count")]["Count"] == 10
+        assert len(_log_rows(table, "exec-1")) == 10
+
+
+class TestReads:
+    """Test count, tail and paged reads"""
+
+    async def test_count_is_a_point_read(self, repo, table):
+        for i in range(20):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        assert await repo.count_logs("exec-1") == 20
+        assert table.fetched == 0
+
+    async def test_latest_logs_from_tail(self, repo, table):
+        for i in range(200):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        latest = await repo.get_latest_logs("exec-1", 5)
+
+        assert [log["Message"] for log in latest] == [f"line {i}" for i in range(195, 200)]
+        assert latest[-1]["RowKey"] == max(_log_rows(table, "exec-1"))
+        assert table.fetched == execution_logs.TAIL_SIZE
+
+    async def test_latest_logs_beyond_tail(self, repo, table):
+        for i in range(120):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        latest = await repo.get_latest_logs("exec-1", 70)
+
+        assert [log["Message"] for log in latest] == [f"line {i}" for i in range(50, 120)]
+
+    async def test_get_logs_stops_at_limit(self, repo, table):
+        for i in range(30):
+            repo.append_log("exec-1", "info", f"line {i}")
+
+        logs = await repo.get_logs("exec-1", limit=10)
+
+        assert [log["Message"] for log in logs] == [f"line {i}" for i in range(10)]
+        assert table.fetched == 10
+
+    async def test_legacy_execution_without_counter(self, repo, table):
+        for i in range(3):
+            row_key = f"2024-01-01T00:00:0{i}.000000Z-0001"
+            table.rows[("old-exec", row_key)] = {"PartitionKey": "old-exec", "RowKey": row_key, "Message": f"line {i}"}
+
+        assert await repo.count_logs("old-exec") == 3
+        assert [log["Message"] for log in await repo.get_latest_logs("old-exec", 2)] == ["line 1", "line 2"]
@@ -72,30 +72,32 @@ class TestCreateExecution:
         assert primary_entity["Status"] == ExecutionStatus.RUNNING.value
         assert json.loads(primary_entity["InputData"]) == input_data
 
-        # Verify 4 indexes created (user, workflow, form, status)
-        assert mock_relationships_service.insert_entity.call_count == 4
+        # Verify 4 indexes created (user, workflow, status, form) in one batch
+        assert mock_relationships_service.insert_entities_batch.call_count == 1
+        indexes = mock_relationships_service.insert_entities_batch.call_args[0][0]
+        assert len(indexes) == 4
 
         # Check user index
-        user_index = mock_relationships_service.insert_entity.call_args_list[0][0][0]
+        user_index = indexes[0]
         assert user_index["PartitionKey"] == "GLOBAL"
         assert user_index["RowKey"] == f"userexec:{user_id}:{execution_id}"
         assert user_index["WorkflowName"] == workflow_name
         assert user_index["Status"] == ExecutionStatus.RUNNING.value
 
         # Check workflow index
-        workflow_index = mock_relationships_service.insert_entity.call_args_list[1][0][0]
+        workflow_index = indexes[1]
         assert workflow_index["PartitionKey"] == "GLOBAL"
         assert workflow_index["RowKey"] == f"workflowexec:{workflow_name}:{org_id}:{execution_id}"
 
         # Check status index
-        status_index = mock_relationships_service.insert_entity.call_args_list[2][0][0]
+        status_index = indexes[2]
         assert status_index["PartitionKey"] == "GLOBAL"
         assert status_index["RowKey"] == f"status:{ExecutionStatus.RUNNING.value}:{execution_id}"
         assert status_index["WorkflowName"] == workflow_name
         assert "UpdatedAt" in status_index
 
         # Check form index
-        form_index = mock_relationships_service.insert_entity.call_args_list[3][0][0]
+        form_index = indexes[3]
         assert form_index["PartitionKey"] == "GLOBAL"
         assert form_index["RowKey"] == f"formexec:{form_id}:{execution_id}"
 
@@ -119,7 +121,8 @@ class TestCreateExecution:
         )
 
         # Should create only 3 indexes (user, workflow, status - no form)
-        assert mock_relationships_service.insert_entity.call_count == 3
+        indexes = mock_relationships_service.insert_entities_batch.call_args[0][0]
+        assert len(indexes) == 3
 
     async def test_uses_global_partition_when_org_id_none(self, execution_repo, mock_table_service):
         """Should use GLOBAL partition when org_id is None"""
@@ -137,6 +140,103 @@ class TestCreateExecution:
         primary_entity = mock_table_service.insert_entity.call_args[0][0]
         assert primary_entity["PartitionKey"] == "GLOBAL"
 
+    async def test_creates_execution_with_initial_status(self, execution_repo, mock_table_service, mock_relationships_service):
+        """Should write primary record and indexes directly in the requested status"""
+        execution_id = str(uuid4())
+
+        await execution_repo.create_execution(
+            execution_id=execution_id,
+            org_id="org-123",
+            user_id="user@example.com",
+            user_name="Test User",
+            workflow_name="TestWorkflow",
+            input_data={},
+            status=ExecutionStatus.PENDING
+        )
+
+        primary_entity = mock_table_service.insert_entity.call_args[0][0]
+        assert primary_entity["Status"] == ExecutionStatus.PENDING.value
+
+        indexes = mock_relationships_service.insert_entities_batch.call_args[0][0]
+        assert all(index["Status"] == ExecutionStatus.PENDING.value for index in indexes)
+        assert f"status:{ExecutionStatus.PENDING.value}:{execution_id}" in [i["RowKey"] for i in indexes]
+
+    async def test_indexes_written_after_primary_record(self, execution_repo, mock_table_service, mock_relationships_service):
+        """Should not write index rows when the primary record fails"""
+        mock_table_service.insert_entity.side_effect = Exception("storage unavailable")
+
+        with pytest.raises(Exception, match="storage unavailable"):
+            await execution_repo.create_execution(
+                execution_id=str(uuid4()),
+                org_id="org-123",
+                user_id="user@example.com",
+                user_name="Test User",
+                workflow_name="TestWorkflow",
+                input_data={}
+            )
+
+        assert not mock_relationships_service.insert_entities_batch.called
+
+
+class TestCreateExecutions:
+    """Tests for create_executions bulk method"""
+
+    async def test_batches_primary_records_and_indexes(self, execution_repo, mock_table_service, mock_relationships_service):
+        """Should write all records with one batch call per table"""
+        executions = [
+            {
+                "execution_id": str(uuid4()),
+                "org_id": org_id,
+                "user_id": "user@example.com",
+                "user_name": "Test User",
+                "workflow_name": "TestWorkflow",
+                "input_data": {"index": i},
+            }
+            for i, org_id in enumerate(["org-1", "org-2", None])
+        ]
+
+        results = await execution_repo.create_executions(executions)
+
+        primary_entities = mock_table_service.insert_entities_batch.call_args[0][0]
+        assert [e["PartitionKey"] for e in primary_entities] == ["org-1", "org-2", "GLOBAL"]
+        assert all(e["Status"] == ExecutionStatus.PENDING.value for e in primary_entities)
+
+        indexes = mock_relationships_service.insert_entities_batch.call_args[0][0]
+        assert len(indexes) == 9
+        assert all(index["PartitionKey"] == "GLOBAL" for index in indexes)
+
+        assert [r.executionId for r in results] == [e["execution_id"] for e in executions]
+        assert not mock_table_service.insert_entity.called
+
+    async def test_batch_index_written_for_batch_launch(self, execution_repo, mock_table_service, mock_relationships_service):
+        """Should tag records with the batch and add a batch index row"""
+        execution_id = str(uuid4())
+
+        await execution_repo.create_executions([{
+            "execution_id": execution_id,
+            "org_id": "org-1",
+            "user_id": "user@example.com",
+            "user_name": "Test User",
+            "workflow_name": "TestWorkflow",
+            "input_data": {},
+            "batch_id": "batch-1",
+        }])
+
+        primary_entities = mock_table_service.insert_entities_batch.call_args[0][0]
+        assert primary_entities[0]["BatchId"] == "batch-1"
+
+        indexes = mock_relationships_service.insert_entities_batch.call_args[0][0]
+        batch_index = next(i for i in indexes if i["RowKey"].startswith("batchexec:"))
+        assert batch_index["RowKey"] == f"batchexec:batch-1:{execution_id}"
+        assert batch_index["OrganizationId"] == "org-1"
+        assert batch_index["Status"] == ExecutionStatus.PENDING.value
+
+    async def test_empty_list_writes_nothing(self, execution_repo, mock_table_service, mock_relationships_service):
+        """Should not touch storage for an empty request"""
+        assert await execution_repo.create_executions([]) == []
+        assert not mock_table_service.insert_entities_batch.called
+        assert not mock_relationships_service.insert_entities_batch.called
+
 
 class TestUpdateExecution:
     """Tests for update_execution method"""
@@ -161,6 +261,7 @@ class TestUpdateExecution:
             "StartedAt": datetime.utcnow().isoformat()
         }
         mock_table_service.query_entities.return_value = [existing_entity]
+        mock_table_service.get_entity.return_value = {**existing_entity, "etag": "W/\"1\""}
 
         # Mock index entities
         mock_relationships_service.get_entity.side_effect = [
@@ -179,9 +280,9 @@ class TestUpdateExecution:
             duration_ms=5000
         )
 
-        # Verify primary record updated
-        assert mock_table_service.update_entity.called
-        updated_entity = mock_table_service.update_entity.call_args[0][0]
+        # Verify primary record updated (ETag-conditional, since it finishes the execution)
+        assert mock_table_service.update_entity_with_etag.called
+        updated_entity = mock_table_service.update_entity_with_etag.call_args_list[0][0][0]
         assert updated_entity["Status"] == ExecutionStatus.SUCCESS.value
         assert updated_entity["DurationMs"] == 5000
         assert "CompletedAt" in updated_entity
@@ -239,6 +340,65 @@ class TestUpdateExecution:
         status_index = mock_relationships_service.insert_entity.call_args[0][0]
         assert status_index["RowKey"] == f"status:{ExecutionStatus.PENDING.value}:{execution_id}"
 
+    @patch("shared.repositories.executions.record_execution_rollup", new_callable=AsyncMock)
+    async def test_finishing_write_counts_rollup_once(self, mock_rollup, execution_repo, mock_table_service, mock_relationships_service):
+        """Should count the rollup when the ETag-matched write moves the row to a terminal status"""
+        running = {
+            "PartitionKey": "org-123",
+            "RowKey": "execution:12345_exec-1",
+            "ExecutionId": "exec-1",
+            "WorkflowName": "TestWorkflow",
+            "Status": ExecutionStatus.RUNNING.value,
+        }
+        mock_table_service.query_entities.return_value = [dict(running)]
+        mock_table_service.get_entity.return_value = {**running, "etag": "W/\"1\""}
+        mock_relationships_service.get_entity.return_value = None
+
+        await execution_repo.update_execution(
+            execution_id="exec-1",
+            org_id="org-123",
+            user_id="user@example.com",
+            status=ExecutionStatus.SUCCESS,
+            duration_ms=1000
+        )
+
+        mock_rollup.assert_awaited_once()
+        assert mock_rollup.call_args.args[1] == ExecutionStatus.SUCCESS.value
+        assert not mock_table_service.update_entity.called
+
+    @patch("shared.repositories.executions.record_execution_rollup", new_callable=AsyncMock)
+    async def test_lost_finishing_race_does_not_count_rollup(self, mock_rollup, execution_repo, mock_table_service, mock_relationships_service):
+        """Should not count the rollup when a concurrent update finished the execution first"""
+        from azure.core.exceptions import ResourceModifiedError
+
+        running = {
+            "PartitionKey": "org-123",
+            "RowKey": "execution:12345_exec-2",
+            "ExecutionId": "exec-2",
+            "WorkflowName": "TestWorkflow",
+            "Status": ExecutionStatus.RUNNING.value,
+        }
+        mock_table_service.query_entities.return_value = [dict(running)]
+        mock_table_service.get_entity.side_effect = [
+            {**running, "etag": "W/\"1\""},
+            {**running, "Status": ExecutionStatus.TIMEOUT.value, "etag": "W/\"2\""},
+        ]
+        mock_table_service.update_entity_with_etag.side_effect = ResourceModifiedError("modified")
+        mock_relationships_service.get_entity.return_value = None
+
+        await execution_repo.update_execution(
+            execution_id="exec-2",
+            org_id="org-123",
+            user_id="user@example.com",
+            status=ExecutionStatus.FAILED,
+            error_message="boom"
+        )
+
+        mock_rollup.assert_not_awaited()
+        updated_entity = mock_table_service.update_entity.call_args[0][0]
+        assert updated_entity["Status"] == ExecutionStatus.FAILED.value
+        assert "etag" not in updated_entity
+
     async def test_raises_error_when_execution_not_found(self, execution_repo, mock_table_service):
         """Should raise ValueError when execution doesn't exist"""
         mock_table_service.query_entities.return_value = []
@@ -0,0 +1,203 @@
+"""
+Unit tests for execution metrics rollups
+
+Tests the duration sketch, sharded rollup increments (including ETag
+conflicts), the one-time backfill and summarizing rollup rows. Table storage is replaced by an
+in-memory fake.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+from azure.core.exceptions import ResourceModifiedError
+
+from shared import metrics_rollups
+from shared.metrics_rollups import (
+    BACKFILL_MARKER_ROW_KEY,
+    ROLLUP_SHARDS,
+    DurationSketch,
+    backfill_rollups,
+    get_rollups,
+    record_execution_rollup,
+    summarize_rollups,
+)
+
+COMPLETED_AT = datetime(2024, 1, 15, 10, 30)
+
+
+class FakeRollupTable:
+    """In-memory stand-in for the Entities table service"""
+
+    def __init__(self, conflicts: int = 0):
+        self.rows: dict[str, dict] = {}
+        self.versions: dict[str, int] = {}
+        self.conflicts = conflicts
+
+    async def get_entity(self, partition_key, row_key):
+        if row_key not in self.rows:
+            return None
+        return {**self.rows[row_key], "etag": self.versions[row_key]}
+
+    async def insert_entity(self, entity):
+        self.rows[entity["RowKey"]] = dict(entity)
+        self.versions[entity["RowKey"]] = 1
+
+    async def update_entity_with_etag(self, entity):
+        entity = dict(entity)
+        etag = entity.pop("etag")
+        if self.conflicts:
+            # Another worker updated the row between our read and write
+            self.conflicts -= 1
+            self.versions[entity["RowKey"]] += 1
+        if self.versions[entity["RowKey"]] != etag:
+            raise ResourceModifiedError("modified")
+        self.rows[entity["RowKey"]] = entity
+        self.versions[entity["RowKey"]] += 1
+
+    async def query_entities(self, filter, select=None):
+        self.last_filter = filter
+        return [row for _, row in sorted(self.rows.items())]
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(metrics_rollups.asyncio, "sleep", sleep)
+    return sleeps
+
+
+class TestDurationSketch:
+    """Test quantile accuracy and merging"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(7, 1.5) for _ in range(5000))
+        sketch = DurationSketch()
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.03
+
+    def test_merge_and_round_trip(self):
+        first, second = DurationSketch(), DurationSketch()
+        for value in (10, 20, 30):
+            first.add(value)
+        for value in (0, 1000):
+            second.add(value)
+
+        first.merge(DurationSketch.from_json(second.to_json()))
+
+        assert first.count == 5
+        assert first.quantile(0) == 0.0
+        assert 980 <= first.quantile(1) <= 1020
+
+    def test_empty_and_malformed(self):
+        assert DurationSketch().quantile(0.5) is None
+        assert DurationSketch.from_json("not json").count == 0
+
+
+class TestRecordRollup:
+    """Test rollup increments"""
+
+    async def test_spreads_increments_over_day_shards(self):
+        table = FakeRollupTable()
+
+        for _ in range(64):
+            await record_execution_rollup(table, "Success", 100, COMPLETED_AT)
+
+        assert len(table.rows) > 1
+        assert all(key.startswith("all:day:2024-01-15:") for key in table.rows)
+        assert len(table.rows) <= ROLLUP_SHARDS
+        summary = summarize_rollups(list(table.rows.values()))
+        assert summary["statusCounts"]["Success"] == 64
+        assert summary["avgDurationSeconds"] == 0.1
+
+    async def test_retries_on_etag_conflict_with_backoff(self, monkeypatch, no_retry_delay):
+        # A single shard, so every attempt contends for the same row
+        monkeypatch.setattr(metrics_rollups, "ROLLUP_SHARDS", 1)
+        table = FakeRollupTable()
+        for _ in range(32):
+            await record_execution_rollup(table, "Success", 10, COMPLETED_AT)
+        table.conflicts = 2
+
+        await record_execution_rollup(table, "Failed", 10, COMPLETED_AT, failure={
+            "executionId": "exec-1", "workflowName": "wf", "errorMessage": "boom", "startedAt": "2024-01-15T10:29:00"
+        })
+
+        summary = summarize_rollups(list(table.rows.values()))
+        assert (summary["statusCounts"]["Success"], summary["statusCounts"]["Failed"]) == (32, 1)
+        assert summary["recentFailures"][0]["executionId"] == "exec-1"
+        assert len(no_retry_delay) == 2
+        assert no_retry_delay[1] <= 2 * metrics_rollups._RETRY_BASE_DELAY_SECONDS
+
+
+class TestBackfill:
+    """Test backfilling days finished before rollups were recorded"""
+
+    async def test_counts_terminal_executions_before_cutoff(self):
+        table = FakeRollupTable()
+        executions = [
+            {"Status": "Success", "DurationMs": 2000, "CompletedAt": datetime(2024, 1, 14, 9, 0)},
+            {"Status": "Failed", "DurationMs": 1000, "CompletedAt": "2024-01-13T08:00:00",
+             "StartedAt": "2024-01-13T07:59:00", "ExecutionId": "exec-old", "ErrorMessage": "boom"},
+            {"Status": "Running", "StartedAt": datetime(2024, 1, 14, 10, 0)},
+            # Counted by live rollups from the cutoff day on
+            {"Status": "Success", "DurationMs": 500, "CompletedAt": datetime(2024, 1, 15, 0, 5)},
+        ]
+
+        counted = await backfill_rollups(table, executions, datetime(2024, 1, 15))
+
+        assert counted == 2
+        assert set(table.rows) == {
+            "all:day:2024-01-13:backfill", "all:day:2024-01-14:backfill", BACKFILL_MARKER_ROW_KEY
+        }
+        summary = summarize_rollups([row for key, row in table.rows.items() if key.startswith("all:day:")])
+        assert (summary["statusCounts"]["Success"], summary["statusCounts"]["Failed"]) == (1, 1)
+        assert summary["avgDurationSeconds"] == 1.5
+        assert summary["recentFailures"][0]["executionId"] == "exec-old"
+
+    async def test_keeps_newest_failures_of_the_day(self):
+        table = FakeRollupTable()
+        executions = [
+            {"Status": "Failed", "CompletedAt": f"2024-01-14T{hour:02d}:30:00",
+             "StartedAt": f"2024-01-14T{hour:02d}:00:00", "ExecutionId": f"exec-{hour}"}
+            for hour in range(23, -1, -1)
+        ]
+
+        await backfill_rollups(table, executions, datetime(2024, 1, 15))
+
+        failures = summarize_rollups([table.rows["all:day:2024-01-14:backfill"]])["recentFailures"]
+        assert [failure["executionId"] for failure in failures] == [f"exec-{hour}" for hour in range(23, 13, -1)]
+
+    async def test_writes_marker_when_nothing_to_backfill(self):
+        table = FakeRollupTable()
+
+        assert await backfill_rollups(table, [], datetime(2024, 1, 15)) == 0
+        assert table.rows[BACKFILL_MARKER_ROW_KEY]["BackfilledBefore"] == "2024-01-15T00:00:00"
+
+
+class TestSummarize:
+    """Test combining rollup rows"""
+
+    async def test_summarize_days(self):
+        table = FakeRollupTable()
+        for minute, status in enumerate(["Success", "Success", "Failed", "Timeout"]):
+            completed_at = datetime(2024, 1, 14 + minute % 2, 9, minute)
+            failure = {"executionId": f"exec-{minute}", "startedAt": completed_at.isoformat()} if status == "Failed" else None
+            await record_execution_rollup(table, status, 1000 * (minute + 1), completed_at, failure)
+
+        rows = await get_rollups(table, datetime(2024, 1, 1), datetime(2024, 1, 31))
+        summary = summarize_rollups(rows)
+
+        assert "RowKey ge 'all:day:2024-01-01' and RowKey lt 'all:day:2024-01-31;'" in table.last_filter
+        assert summary["statusCounts"]["Success"] == 2
+        assert summary["statusCounts"]["Timeout"] == 1
+        assert summary["avgDurationSeconds"] == 2.5
+        assert 1.9 <= summary["p50DurationSeconds"] <= 2.1
+        assert summary["recentFailures"][0]["executionId"] == "exec-2"
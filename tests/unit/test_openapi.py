@@ -9,10 +9,15 @@ Tests the OpenAPI specification generation including:
 
 import json
 import yaml
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import azure.functions as func
+import pytest
 
 from functions.http.openapi import generate_openapi_spec, get_openapi_json, get_openapi_yaml, swagger_ui
+from shared.discovery import WorkflowMetadata
+from shared.handlers import openapi_handlers
+from shared.handlers.openapi_handlers import clear_openapi_cache
+from shared.handlers.response_helpers import etag_matches
 
 
 class TestOpenAPISpecGeneration:
@@ -258,3 +263,70 @@ class TestOpenAPISchemas:
         # At least one enum should exist in models
         # (ExecutionStatus has enum values)
         assert found_enum or len(schemas) > 0
+
+
+class TestOpenAPISpecCache:
+    """Test spec caching and conditional requests"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        clear_openapi_cache()
+        yield
+        clear_openapi_cache()
+
+    def _index(self, fingerprint, names):
+        workflows = [
+            WorkflowMetadata(name=name, description=name, endpoint_enabled=True) for name in names
+        ]
+        return patch.object(openapi_handlers, "get_workflow_index", return_value=(fingerprint, workflows))
+
+    def test_spec_is_built_once(self):
+        """Unchanged models and workflows should reuse the cached spec"""
+        with self._index("fp-1", ["wf_a"]), \
+                patch.object(openapi_handlers, "collect_pydantic_models",
+                             wraps=openapi_handlers.collect_pydantic_models) as mock_collect:
+            first = generate_openapi_spec()
+            second = generate_openapi_spec()
+
+        assert first is second
+        mock_collect.assert_called_once()
+
+    def test_workflow_change_only_rebuilds_endpoints(self):
+        """A new workflow index should regenerate /endpoints without rebuilding schemas"""
+        with patch.object(openapi_handlers, "collect_pydantic_models",
+                          wraps=openapi_handlers.collect_pydantic_models) as mock_collect:
+            with self._index("fp-1", ["wf_a"]):
+                before = generate_openapi_spec()
+            with self._index("fp-2", ["wf_b"]):
+                after = generate_openapi_spec()
+
+        mock_collect.assert_called_once()
+        assert "/endpoints/wf_a" in before["paths"] and "/endpoints/wf_b" not in before["paths"]
+        assert "/endpoints/wf_b" in after["paths"] and "/endpoints/wf_a" not in after["paths"]
+        assert after["components"] is before["components"]
+
+    def test_etag_and_not_modified(self):
+        """Responses should carry an ETag and honour If-None-Match"""
+        with self._index("fp-1", []):
+            first = get_openapi_json(Mock(spec=func.HttpRequest, headers={}))
+            etag = first.headers["ETag"]
+            cached = get_openapi_json(Mock(spec=func.HttpRequest, headers={"If-None-Match": etag}))
+            yaml_response = get_openapi_yaml(Mock(spec=func.HttpRequest, headers={"If-None-Match": etag}))
+
+        with self._index("fp-2", []):
+            changed = get_openapi_json(Mock(spec=func.HttpRequest, headers={"If-None-Match": etag}))
+
+        assert first.status_code == 200
+        assert cached.status_code == 304 and cached.get_body() == b""
+        assert yaml_response.status_code == 200
+        assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+    def test_etag_matching(self):
+        assert etag_matches('"abc-json"', '"abc-json"')
+        assert etag_matches('W/"abc-json", "other"', '"abc-json"')
+        assert etag_matches("*", '"abc-json"')
+        assert not etag_matches('"old-json"', '"abc-json"')
+        assert not etag_matches(None, '"abc-json"')
+        # Bare ETags (editor files) compare by their opaque tag
+        assert etag_matches('W/"abc123"', "abc123")
+        assert not etag_matches('"abc"', "abc123")
@@ -3,6 +3,7 @@ Unit tests for WorkspacePackageManager
 """
 
 import json
+import shutil
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -179,3 +180,259 @@ class TestWorkspacePackageManager:
         # Clean up
         if path_str in sys.path:
             sys.path.remove(path_str)
+
+
+class TestPackageCache:
+    """Tests for the local package cache and incremental workspace sync"""
+
+    @pytest.fixture
+    def cached_manager(self, pkg_manager, tmp_path):
+        """Package manager with its local caches redirected into tmp_path"""
+        pkg_manager.package_cache_dir = tmp_path / "package_cache"
+        pkg_manager.pip_cache_dir = tmp_path / "pip_cache"
+        return pkg_manager
+
+    def _populate_cache(self, pkg_manager, specs):
+        """Create a completed cache slot for a requirement set"""
+        from shared.package_manager import _cache_key
+
+        cache_dir = pkg_manager.package_cache_dir / _cache_key(specs)
+        (cache_dir / "requests").mkdir(parents=True)
+        (cache_dir / "requests" / "__init__.py").write_text("VERSION = '2.31.0'\n")
+        (cache_dir / "requests-2.31.0.dist-info").mkdir()
+        (cache_dir / "requests-2.31.0.dist-info" / "METADATA").write_text("Name: requests\n")
+        (cache_dir / ".complete").touch()
+        return cache_dir
+
+    def test_is_pinned(self):
+        """Test only exact pins are treated as cacheable"""
+        from shared.package_manager import _is_pinned
+
+        assert _is_pinned(["requests==2.31.0", "pandas==2.0.3"]) is True
+        assert _is_pinned(["requests"]) is False
+        assert _is_pinned(["requests>=2.0"]) is False
+        assert _is_pinned(["-r other.txt"]) is False
+        assert _is_pinned([]) is False
+
+    @pytest.mark.asyncio
+    async def test_install_package_uses_cached_pinned_install(self, cached_manager):
+        """Test a pinned package already in the cache is synced without running pip"""
+        self._populate_cache(cached_manager, ["requests==2.31.0"])
+
+        cached_manager.get_package_info = AsyncMock(
+            return_value=PackageInfo("requests", "2.31.0", "HTTP")
+        )
+        cached_manager.list_installed_packages = AsyncMock(return_value=[])
+
+        with patch('asyncio.create_subprocess_exec') as mock_exec:
+            await cached_manager.install_package(
+                "requests", "2.31.0", append_to_requirements=False
+            )
+
+        mock_exec.assert_not_called()
+        installed = cached_manager.packages_dir / "requests" / "__init__.py"
+        assert installed.read_text() == "VERSION = '2.31.0'\n"
+        assert not (cached_manager.packages_dir / ".complete").exists()
+
+    @pytest.mark.asyncio
+    async def test_install_requirements_skips_unchanged_pinned_requirements(self, cached_manager):
+        """Test unchanged pinned requirements are not reinstalled"""
+        cached_manager.requirements_file.write_text("requests==2.31.0\n")
+        self._populate_cache(cached_manager, ["requests==2.31.0"])
+
+        logs = []
+
+        async def log_callback(msg):
+            logs.append(msg)
+
+        with patch('asyncio.create_subprocess_exec') as mock_exec:
+            await cached_manager.install_requirements_streaming(log_callback=log_callback)
+            first_run_logs = list(logs)
+            logs.clear()
+            await cached_manager.install_requirements_streaming(log_callback=log_callback)
+
+        mock_exec.assert_not_called()
+        assert any("Using cached packages" in msg for msg in first_run_logs)
+        assert any("nothing to do" in msg for msg in logs)
+
+    @pytest.mark.asyncio
+    async def test_install_requirements_repairs_unchanged_requirements(self, cached_manager):
+        """Test files deleted from .packages are restored even when requirements are unchanged"""
+        cached_manager.requirements_file.write_text("requests==2.31.0\n")
+        self._populate_cache(cached_manager, ["requests==2.31.0"])
+        installed = cached_manager.packages_dir / "requests" / "__init__.py"
+
+        logs = []
+
+        async def log_callback(msg):
+            logs.append(msg)
+
+        with patch('asyncio.create_subprocess_exec') as mock_exec:
+            await cached_manager.install_requirements_streaming()
+            installed.unlink()
+            await cached_manager.install_requirements_streaming(log_callback=log_callback)
+
+        mock_exec.assert_not_called()
+        assert installed.read_text() == "VERSION = '2.31.0'\n"
+        assert any("repaired 1 changed files" in msg for msg in logs)
+
+    @pytest.mark.asyncio
+    async def test_install_requirements_reinstalls_when_cache_is_gone(self, cached_manager):
+        """Test a new instance without the package cache reinstalls if .packages was changed"""
+        cached_manager.requirements_file.write_text("requests==2.31.0\n")
+        cache_dir = self._populate_cache(cached_manager, ["requests==2.31.0"])
+        await cached_manager.install_requirements_streaming()
+
+        shutil.rmtree(cache_dir)
+        (cached_manager.packages_dir / "requests" / "__init__.py").write_text("edited\n")
+        cached_manager._install_and_sync = AsyncMock()
+
+        await cached_manager.install_requirements_streaming()
+
+        cached_manager._install_and_sync.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_install_removes_superseded_dist_info(self, cached_manager):
+        """Test upgrading a package removes the old version's metadata"""
+        old_dist_info = cached_manager.packages_dir / "requests-2.30.0.dist-info"
+        old_dist_info.mkdir(parents=True)
+        (old_dist_info / "METADATA").write_text("Name: requests\n")
+        self._populate_cache(cached_manager, ["requests==2.31.0"])
+
+        cached_manager.get_package_info = AsyncMock(
+            return_value=PackageInfo("requests", "2.31.0", "HTTP")
+        )
+        cached_manager.list_installed_packages = AsyncMock(
+            return_value=[{"name": "requests", "version": "2.30.0"}]
+        )
+
+        await cached_manager.install_package("requests", "2.31.0", append_to_requirements=False)
+
+        assert not old_dist_info.exists()
+        assert (cached_manager.packages_dir / "requests-2.31.0.dist-info").exists()
+
+    @pytest.mark.asyncio
+    async def test_install_removes_only_replaced_package_files(self, cached_manager):
+        """Test a single install keeps other packages' files and drops the old version's"""
+        packages = cached_manager.packages_dir
+        (packages / "requests").mkdir(parents=True)
+        (packages / "requests" / "legacy.py").write_text("old\n")
+        (packages / "bin").mkdir()
+        (packages / "bin" / "other-tool").write_text("#!/bin/sh\n")
+        old_dist_info = packages / "requests-2.30.0.dist-info"
+        old_dist_info.mkdir()
+        (old_dist_info / "METADATA").write_text("Name: requests\n")
+        (old_dist_info / "RECORD").write_text(
+            "requests/legacy.py,,\nrequests-2.30.0.dist-info/METADATA,,\n../outside.py,,\n"
+        )
+        outside = packages.parent / "outside.py"
+        outside.write_text("keep\n")
+        self._populate_cache(cached_manager, ["requests==2.31.0"])
+
+        cached_manager.get_package_info = AsyncMock(
+            return_value=PackageInfo("requests", "2.31.0", "HTTP")
+        )
+        cached_manager.list_installed_packages = AsyncMock(return_value=[])
+
+        await cached_manager.install_package("requests", "2.31.0", append_to_requirements=False)
+
+        assert not (packages / "requests" / "legacy.py").exists()
+        assert (packages / "bin" / "other-tool").exists()
+        assert outside.exists()
+
+
+class TestSyncTree:
+    """Tests for incremental tree sync"""
+
+    def test_sync_tree_writes_only_changed_files(self, tmp_path):
+        """Test re-syncing skips files whose content is unchanged"""
+        from shared.utils.file_operations import sync_tree
+
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        (src / "pkg").mkdir(parents=True)
+        (src / "pkg" / "a.py").write_text("a = 1\n")
+        (src / "pkg" / "b.py").write_text("b = 1\n")
+
+        manifest, written = sync_tree(src, dst, {})
+        assert written == 2
+
+        (src / "pkg" / "b.py").write_text("b = 2\n")
+        manifest, written = sync_tree(src, dst, manifest)
+
+        assert written == 1
+        assert (dst / "pkg" / "b.py").read_text() == "b = 2\n"
+
+    def test_sync_tree_removes_files_dropped_from_source(self, tmp_path):
+        """Test removable files missing from the source are removed from the destination"""
+        from shared.utils.file_operations import sync_tree
+
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        (src / "pkg").mkdir(parents=True)
+        (src / "pkg" / "old.py").write_text("old\n")
+        (src / "pkg" / "keep.py").write_text("keep\n")
+
+        manifest, _ = sync_tree(src, dst, {})
+        (src / "pkg" / "old.py").unlink()
+        manifest, _ = sync_tree(src, dst, manifest, removable={"pkg/old.py", "pkg/keep.py"})
+
+        assert not (dst / "pkg" / "old.py").exists()
+        assert (dst / "pkg" / "keep.py").exists()
+        assert "pkg/old.py" not in manifest
+
+    def test_sync_tree_keeps_files_not_removable(self, tmp_path):
+        """Test files of other packages sharing a top-level directory are kept"""
+        from shared.utils.file_operations import sync_tree
+
+        other = tmp_path / "other"
+        dst = tmp_path / "dst"
+        (other / "azure" / "storage").mkdir(parents=True)
+        (other / "azure" / "storage" / "blob.py").write_text("blob\n")
+        manifest, _ = sync_tree(other, dst, {})
+
+        src = tmp_path / "src"
+        (src / "azure" / "identity").mkdir(parents=True)
+        (src / "azure" / "identity" / "cred.py").write_text("cred\n")
+        manifest, _ = sync_tree(src, dst, manifest, removable=set())
+
+        assert (dst / "azure" / "storage" / "blob.py").exists()
+        assert "azure/storage/blob.py" in manifest
+
+    def test_sync_tree_repairs_files_changed_out_of_band(self, tmp_path):
+        """Test deleted or edited destination files are rewritten despite a matching hash"""
+        from shared.utils.file_operations import sync_tree
+
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        src.mkdir()
+        (src / "a.py").write_text("a = 1\n")
+        (src / "b.py").write_text("b = 1\n")
+        manifest, _ = sync_tree(src, dst, {})
+
+        (dst / "a.py").unlink()
+        (dst / "b.py").unlink()
+        (dst / "b.py").write_text("edited = True\n")
+        manifest, written = sync_tree(src, dst, manifest)
+
+        assert written == 2
+        assert (dst / "a.py").read_text() == "a = 1\n"
+        assert (dst / "b.py").read_text() == "b = 1\n"
+
+    def test_sync_tree_does_not_write_through_hard_links(self, tmp_path):
+        """Test updating a hard-linked file never modifies the source copy"""
+        from shared.utils.file_operations import sync_tree
+
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        src.mkdir()
+        (src / "mod.py").write_text("v1\n")
+        manifest, _ = sync_tree(src, dst, {})
+
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "mod.py").write_text("v2\n")
+        sync_tree(other, dst, manifest)
+
+        assert (src / "mod.py").read_text() == "v1\n"
+        assert (dst / "mod.py").read_text() == "v2\n"
@@ -2,6 +2,7 @@
 Unit tests for package installation worker
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,18 +24,15 @@ async def test_handle_package_install_specific_package(tmp_path):
 
     # Mock WorkspacePackageManager
     with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
-         patch('functions.queue.package_worker.WebPubSubBroadcaster') as MockBroadcaster, \
+         patch('functions.queue.package_worker.get_publisher') as mock_get_publisher, \
          patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
 
         mock_pkg_manager = MagicMock()
         mock_pkg_manager.install_package = AsyncMock()
         MockPkgManager.return_value = mock_pkg_manager
 
-        mock_broadcaster = MagicMock()
-        mock_broadcaster.enabled = True
-        mock_client = MagicMock()
-        mock_broadcaster.client = mock_client
-        MockBroadcaster.return_value = mock_broadcaster
+        mock_publisher = _publisher()
+        mock_get_publisher.return_value = mock_publisher
 
         # Execute
         await handle_package_install(message_data)
@@ -47,14 +45,11 @@ async def test_handle_package_install_specific_package(tmp_path):
         assert call_args.kwargs['append_to_requirements'] is True
         assert callable(call_args.kwargs['log_callback'])
 
-        # Verify completion message was sent
-        assert mock_client.send_to_connection.called
-        completion_calls = [
-            call for call in mock_client.send_to_connection.call_args_list
-            if call.kwargs.get('message', {}).get('type') == 'complete'
-        ]
-        assert len(completion_calls) == 1
-        assert completion_calls[0].kwargs['message']['status'] == 'success'
+        # Verify completion message was sent and flushed
+        completion_messages = _sent(mock_publisher, 'complete')
+        assert len(completion_messages) == 1
+        assert completion_messages[0]['status'] == 'success'
+        mock_publisher.flush.assert_awaited()
 
 
 @pytest.mark.asyncio
@@ -70,18 +65,15 @@ async def test_handle_package_install_from_requirements(tmp_path):
     }
 
     with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
-         patch('functions.queue.package_worker.WebPubSubBroadcaster') as MockBroadcaster, \
+         patch('functions.queue.package_worker.get_publisher') as mock_get_publisher, \
          patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
 
         mock_pkg_manager = MagicMock()
         mock_pkg_manager.install_requirements_streaming = AsyncMock()
         MockPkgManager.return_value = mock_pkg_manager
 
-        mock_broadcaster = MagicMock()
-        mock_broadcaster.enabled = True
-        mock_client = MagicMock()
-        mock_broadcaster.client = mock_client
-        MockBroadcaster.return_value = mock_broadcaster
+        mock_publisher = _publisher()
+        mock_get_publisher.return_value = mock_publisher
 
         # Execute
         await handle_package_install(message_data)
@@ -92,7 +84,7 @@ async def test_handle_package_install_from_requirements(tmp_path):
         assert callable(call_args.kwargs['log_callback'])
 
         # Verify completion message was sent
-        assert mock_client.send_to_connection.called
+        assert _sent(mock_publisher, 'complete')
 
 
 @pytest.mark.asyncio
@@ -108,7 +100,7 @@ async def test_handle_package_install_error_handling(tmp_path):
     }
 
     with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
-         patch('functions.queue.package_worker.WebPubSubBroadcaster') as MockBroadcaster, \
+         patch('functions.queue.package_worker.get_publisher') as mock_get_publisher, \
          patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
 
         mock_pkg_manager = MagicMock()
@@ -116,24 +108,18 @@ async def test_handle_package_install_error_handling(tmp_path):
         mock_pkg_manager.install_package = AsyncMock(side_effect=Exception("Package not found"))
         MockPkgManager.return_value = mock_pkg_manager
 
-        mock_broadcaster = MagicMock()
-        mock_broadcaster.enabled = True
-        mock_client = MagicMock()
-        mock_broadcaster.client = mock_client
-        MockBroadcaster.return_value = mock_broadcaster
+        mock_publisher = _publisher()
+        mock_get_publisher.return_value = mock_publisher
 
         # Execute - should raise to trigger retry/poison queue
         with pytest.raises(Exception, match="Package not found"):
             await handle_package_install(message_data)
 
         # Verify error completion message was sent
-        completion_calls = [
-            call for call in mock_client.send_to_connection.call_args_list
-            if call.kwargs.get('message', {}).get('type') == 'complete'
-        ]
-        assert len(completion_calls) == 1
-        assert completion_calls[0].kwargs['message']['status'] == 'error'
-        assert 'Package not found' in completion_calls[0].kwargs['message']['message']
+        completion_messages = _sent(mock_publisher, 'complete')
+        assert len(completion_messages) == 1
+        assert completion_messages[0]['status'] == 'error'
+        assert 'Package not found' in completion_messages[0]['message']
 
 
 @pytest.mark.asyncio
@@ -149,20 +135,119 @@ async def test_handle_package_install_no_webpubsub(tmp_path):
     }
 
     with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
-         patch('functions.queue.package_worker.WebPubSubBroadcaster') as MockBroadcaster, \
+         patch('functions.queue.package_worker.get_publisher') as mock_get_publisher, \
          patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
 
         mock_pkg_manager = MagicMock()
         mock_pkg_manager.install_package = AsyncMock()
         MockPkgManager.return_value = mock_pkg_manager
 
-        mock_broadcaster = MagicMock()
-        mock_broadcaster.enabled = False  # WebPubSub disabled
-        mock_broadcaster.client = None
-        MockBroadcaster.return_value = mock_broadcaster
+        mock_publisher = _publisher(enabled=False)  # WebPubSub disabled
+        mock_get_publisher.return_value = mock_publisher
 
         # Execute - should work without WebPubSub
         await handle_package_install(message_data)
 
         # Verify install_package was called
         mock_pkg_manager.install_package.assert_called_once()
+        mock_publisher.publish.assert_not_called()
+
+
+def _publisher(enabled=True):
+    publisher = MagicMock()
+    publisher.enabled = enabled
+    publisher.flush = AsyncMock()
+    return publisher
+
+
+def _sent(publisher, message_type):
+    return [
+        call.args[0] for call in publisher.publish.call_args_list
+        if call.args[0]['type'] == message_type
+    ]
+
+
+@pytest.mark.asyncio
+async def test_log_lines_are_batched():
+    """Lines should be sent in batches by size and on close, not one request per line"""
+    from functions.queue.package_worker import BatchedLogSender
+
+    publisher = _publisher()
+    sender = BatchedLogSender(publisher, "conn-1", interval_seconds=60, max_lines=3)
+
+    for i in range(7):
+        await sender.log(f"line {i}")
+    await sender.close()
+
+    batches = _sent(publisher, 'log')
+    assert [len(batch['lines']) for batch in batches] == [3, 3, 1]
+    assert batches[0]['message'] == "line 0\nline 1\nline 2"
+    assert publisher.publish.call_count == 3
+    assert all(call.kwargs['connection_id'] == "conn-1" for call in publisher.publish.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_log_lines_flush_on_interval():
+    """Buffered lines should be sent once the flush interval passes"""
+    from functions.queue.package_worker import BatchedLogSender
+
+    publisher = _publisher()
+    sender = BatchedLogSender(publisher, "conn-1", interval_seconds=0.01, max_lines=50)
+
+    await sender.log("only line")
+    await asyncio.sleep(0.1)
+
+    assert [batch['lines'] for batch in _sent(publisher, 'log')] == [["only line"]]
+    await sender.close()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_installs_are_deduplicated(tmp_path):
+    """A second request for the same package/version should wait for the first install"""
+    release = asyncio.Event()
+
+    async def slow_install(**kwargs):
+        await release.wait()
+
+    message = {"job_id": "job-1", "package": "requests", "version": "2.31.0", "connection_id": "conn-1"}
+
+    with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
+         patch('functions.queue.package_worker.get_publisher', side_effect=lambda: _publisher()), \
+         patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
+        MockPkgManager.return_value.install_package = AsyncMock(side_effect=slow_install)
+
+        first = asyncio.create_task(handle_package_install(message))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(handle_package_install({**message, "job_id": "job-2", "package": "Requests"}))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(first, second)
+
+        MockPkgManager.return_value.install_package.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_installs_in_same_workspace_are_serialized(tmp_path):
+    """Different packages in one workspace should install one at a time"""
+    running = 0
+    max_running = 0
+
+    async def install(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    with patch('functions.queue.package_worker.WorkspacePackageManager') as MockPkgManager, \
+         patch('functions.queue.package_worker.get_publisher', side_effect=lambda: _publisher(False)), \
+         patch.dict('os.environ', {'BIFROST_WORKSPACE_LOCATION': str(tmp_path)}):
+        MockPkgManager.return_value.install_package = AsyncMock(side_effect=install)
+
+        await asyncio.gather(*(
+            handle_package_install({"job_id": f"job-{name}", "package": name})
+            for name in ("requests", "httpx", "pyyaml")
+        ))
+
+    assert MockPkgManager.return_value.install_package.call_count == 3
+    assert max_running == 1
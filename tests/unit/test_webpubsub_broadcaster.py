@@ -0,0 +1,206 @@
+"""
+Unit tests for the Web PubSub publisher
+
+Tests the bounded queue's drop policy, background sending from other
+threads, the no-op publisher and routing of broadcasts and git job
+terminal messages. The async Web PubSub client is replaced by an in-memory
+fake.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from shared import webpubsub_broadcaster
+from shared.webpubsub_broadcaster import (
+    NoOpPublisher,
+    WebPubSubBroadcaster,
+    WebPubSubPublisher,
+    get_publisher,
+    set_publisher,
+)
+
+
+class FakeAsyncClient:
+    """Records sends instead of calling Web PubSub"""
+
+    def __init__(self, fail: bool = False):
+        self.sent: list[tuple[str, dict]] = []
+        self.fail = fail
+        self.closed = False
+
+    async def send_to_group(self, group, message, content_type=None):
+        if self.fail:
+            raise ConnectionError("unreachable")
+        self.sent.append((group, message))
+
+    async def send_to_connection(self, connection_id, message, content_type=None):
+        self.sent.append((connection_id, message))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_publisher():
+    set_publisher(None)
+    yield
+    set_publisher(None)
+
+
+class TestPublisherQueue:
+    """Test the bounded queue and drop policy"""
+
+    def test_full_queue_drops_oldest_progress_message(self):
+        publisher = WebPubSubPublisher(client_factory=FakeAsyncClient, max_queue_size=2)
+
+        # No running loop: messages wait in the queue
+        publisher.publish({"n": 1}, group="g", droppable=True)
+        publisher.publish({"n": 2}, group="g")
+        publisher.publish({"n": 3}, group="g")
+
+        assert [item.message["n"] for item in publisher._queue] == [2, 3]
+        assert publisher.get_stats()["dropped"] == 1
+
+    def test_progress_message_dropped_when_queue_holds_only_final_updates(self):
+        publisher = WebPubSubPublisher(client_factory=FakeAsyncClient, max_queue_size=2)
+        publisher.publish({"n": 1}, group="g")
+        publisher.publish({"n": 2}, group="g")
+
+        publisher.publish({"n": 3}, group="g", droppable=True)
+        assert [item.message["n"] for item in publisher._queue] == [1, 2]
+
+        publisher.publish({"n": 4}, group="g")
+        assert [item.message["n"] for item in publisher._queue] == [2, 4]
+        assert publisher.get_stats()["dropped"] == 2
+
+
+class TestPublisherSending:
+    """Test background sending"""
+
+    async def test_sends_in_order_and_flushes(self):
+        client = FakeAsyncClient()
+        publisher = WebPubSubPublisher(client_factory=lambda: client)
+
+        publisher.publish({"n": 1}, group="execution:a", droppable=True)
+        publisher.publish({"n": 2}, connection_id="conn-1")
+        await publisher.flush(timeout=2)
+
+        assert client.sent == [("execution:a", {"n": 1}), ("conn-1", {"n": 2})]
+        assert publisher.get_stats() == {"queued": 0, "sent": 2, "dropped": 0, "failed": 0}
+
+        await publisher.aclose()
+        assert client.closed
+
+    async def test_publish_from_other_thread(self):
+        client = FakeAsyncClient()
+        publisher = WebPubSubPublisher(client_factory=lambda: client)
+        publisher.publish({"n": 0}, group="g")  # binds to this loop
+
+        thread = threading.Thread(target=lambda: publisher.publish({"n": 1}, group="g"))
+        thread.start()
+        thread.join()
+        await publisher.flush(timeout=2)
+
+        assert [message["n"] for _, message in client.sent] == [0, 1]
+        await publisher.aclose()
+
+    async def test_send_failures_are_counted_not_raised(self):
+        publisher = WebPubSubPublisher(client_factory=lambda: FakeAsyncClient(fail=True))
+
+        publisher.publish({"n": 1}, group="g")
+        await publisher.flush(timeout=2)
+
+        assert publisher.get_stats()["failed"] == 1
+        await publisher.aclose()
+
+    def test_rebinds_to_new_event_loop(self):
+        clients: list[FakeAsyncClient] = []
+
+        def factory():
+            clients.append(FakeAsyncClient())
+            return clients[-1]
+
+        publisher = WebPubSubPublisher(client_factory=factory)
+
+        async def job(n):
+            publisher.publish({"n": n}, group="g")
+            await publisher.aclose()
+
+        asyncio.run(job(1))
+        asyncio.run(job(2))
+
+        assert [client.sent for client in clients] == [[("g", {"n": 1})], [("g", {"n": 2})]]
+
+    def test_rebind_closes_previous_loops_client(self):
+        clients: list[FakeAsyncClient] = []
+
+        def factory():
+            clients.append(FakeAsyncClient())
+            return clients[-1]
+
+        publisher = WebPubSubPublisher(client_factory=factory)
+
+        async def job(n):
+            publisher.publish({"n": n}, group="g")
+            await publisher.flush(timeout=2)
+
+        asyncio.run(job(1))
+        assert not clients[0].closed
+
+        asyncio.run(job(2))
+
+        assert clients[0].closed
+        assert not clients[1].closed
+        assert clients[1].sent == [("g", {"n": 2})]
+
+
+class TestBroadcaster:
+    """Test that broadcasts go through the process-wide publisher"""
+
+    def test_unconfigured_process_uses_noop_publisher(self, monkeypatch):
+        monkeypatch.delenv("AZURE_WEBPUBSUB_ENDPOINT", raising=False)
+        monkeypatch.delenv("WebPubSubConnectionString", raising=False)
+
+        assert isinstance(get_publisher(), NoOpPublisher)
+        assert get_publisher() is get_publisher()
+
+    async def test_updates_are_queued_with_drop_policy(self, monkeypatch):
+        monkeypatch.setattr(
+            webpubsub_broadcaster, "_webpubsub_settings", lambda: ("bifrost", None, "Endpoint=https://x;AccessKey=k;")
+        )
+        publisher = NoOpPublisher()
+        set_publisher(publisher)
+        broadcaster = WebPubSubBroadcaster()
+
+        broadcaster.publish_execution_update("exec-1", "Running", latest_logs=[{"message": "hi"}])
+        await broadcaster.broadcast_execution_update("exec-1", "Success", "user-1", "GLOBAL", is_complete=True)
+        await broadcaster.broadcast_execution_to_history(
+            "exec-1", "wf", "Success", "user-1", "User", "org-1", started_at=datetime(2026, 1, 1)
+        )
+
+        progress, final, history = publisher.published
+        assert (progress.group, progress.droppable) == ("execution:exec-1", True)
+        assert progress.message["data"]["latestLogs"] == [{"message": "hi"}]
+        assert (final.group, final.droppable) == ("execution:exec-1", False)
+        assert (history.group, history.droppable) == ("history:org-1", False)
+        assert history.message["target"] == "executionHistoryUpdate"
+
+    async def test_git_jobs_stream_to_connection_through_publisher(self, monkeypatch):
+        from functions.queue import git_sync_worker
+
+        class FailingGitService:
+            async def refresh_status(self, context):
+                return {"success": False, "error": "fetch failed"}
+
+        publisher = NoOpPublisher()
+        set_publisher(publisher)
+        monkeypatch.setattr(git_sync_worker, "GitIntegrationService", FailingGitService)
+
+        await git_sync_worker.handle_git_refresh({"job_id": "job-1", "org_id": "org-1", "connection_id": "conn-1"})
+
+        assert {item.connection_id for item in publisher.published} == {"conn-1"}
+        assert [item.message["type"] for item in publisher.published][-1] == "complete"
+        assert publisher.published[-1].message["status"] == "error"
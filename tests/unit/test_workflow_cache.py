@@ -0,0 +1,126 @@
+"""
+Unit tests for the warm workflow cache in load_workflow()
+
+Cached workflows are reused until the source of the workflow module or one
+of its transitive workspace imports changes.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from shared.discovery import clear_workflow_cache, get_workflow_cache_stats, load_workflow
+
+WORKFLOW_SOURCE = '''
+from shared.decorators import workflow
+from helpers.greeting import GREETING
+
+
+@workflow(name="cached_greeting", description="Uses a helper module")
+async def cached_greeting(context):
+    return GREETING
+'''
+
+
+def _write(path, content):
+    """Write a file with an mtime outside the racy window"""
+    path.write_text(content)
+    old = time.time() - 60
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Workspace with a workflow importing a helper package"""
+    (tmp_path / "helpers").mkdir()
+    _write(tmp_path / "helpers" / "__init__.py", "")
+    _write(tmp_path / "helpers" / "greeting.py", 'GREETING = "hello"\n')
+    _write(tmp_path / "greeting_workflow.py", WORKFLOW_SOURCE)
+
+    monkeypatch.setenv("BIFROST_WORKSPACE_LOCATION", str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    clear_workflow_cache()
+    yield tmp_path
+    clear_workflow_cache()
+
+    # Helper modules from this workspace must not leak into the next test's imports
+    for name in [m for m in sys.modules if m == "helpers" or m.startswith("helpers.")]:
+        del sys.modules[name]
+
+
+def _stats_delta(before):
+    after = get_workflow_cache_stats()
+    return after["hits"] - before["hits"], after["misses"] - before["misses"]
+
+
+class TestWorkflowCache:
+    """Test warm workflow reuse and invalidation"""
+
+    def test_reuses_loaded_workflow(self, workspace):
+        """Should return the same callable without re-importing"""
+        before = get_workflow_cache_stats()
+
+        first = load_workflow("cached_greeting")
+        second = load_workflow("cached_greeting")
+
+        assert first is not None and second is not None
+        assert second[0] is first[0]
+        assert _stats_delta(before) == (1, 1)
+
+    def test_touch_without_change_is_a_hit(self, workspace):
+        """Should key on source hashes, not mtimes"""
+        first = load_workflow("cached_greeting")
+        os.utime(workspace / "greeting_workflow.py", None)
+
+        assert load_workflow("cached_greeting")[0] is first[0]
+
+    def test_module_change_reloads(self, workspace):
+        """Should re-import when the workflow module changes"""
+        first = load_workflow("cached_greeting")
+        _write(workspace / "greeting_workflow.py", WORKFLOW_SOURCE + "\n# changed\n")
+
+        second = load_workflow("cached_greeting")
+
+        assert second[0] is not first[0]
+
+    async def test_transitive_import_change_reloads(self, workspace):
+        """Should re-import when a workspace module it imports changes"""
+        assert await load_workflow("cached_greeting")[0](None) == "hello"
+
+        _write(workspace / "helpers" / "greeting.py", 'GREETING = "hi"\n')
+
+        assert await load_workflow("cached_greeting")[0](None) == "hi"
+
+    def test_bypass_cache(self, workspace):
+        """Should import fresh when use_cache is False"""
+        first = load_workflow("cached_greeting")
+
+        assert load_workflow("cached_greeting", use_cache=False)[0] is not first[0]
+
+    def test_unknown_workflow(self, workspace):
+        """Should return None for workflows that do not exist"""
+        assert load_workflow("does_not_exist") is None
+
+
+class TestWorkflowIndex:
+    """Test the cached workflow index used for schedules and listings"""
+
+    def test_rescans_only_on_change(self, workspace, monkeypatch):
+        """Should reuse the index until a workspace source file changes"""
+        from shared import discovery
+
+        scans = []
+        real_scan = discovery.scan_all_workflows
+        monkeypatch.setattr(discovery, "scan_all_workflows", lambda: scans.append(1) or real_scan())
+
+        fingerprint, workflows = discovery.get_workflow_index()
+        assert "cached_greeting" in [w.name for w in workflows]
+        assert discovery.get_workflow_index()[0] == fingerprint
+        assert len(scans) == 1
+
+        _write(workspace / "helpers" / "greeting.py", 'GREETING = "hi"\n')
+
+        assert discovery.get_workflow_index()[0] != fingerprint
+        assert len(scans) == 2